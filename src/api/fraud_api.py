@@ -1,12 +1,47 @@
-from fastapi import APIRouter
-from pydantic import BaseModel
-from typing import Dict, Any
+import json
+from contextlib import asynccontextmanager
+from typing import Dict, Any, AsyncIterator, List, Optional, Tuple
 
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ValidationError
+
+from workflows.fraud_triage_runtime import FraudTriageRuntime
 from workflows.fraud_triage_workflow import (
+    BATCH_SIZE,
+    run_fraud_triage_batch,
     run_fraud_triage_workflow,
 )
 
-router = APIRouter(prefix="/fraud", tags=["fraud"])
+
+# -----------------------------
+# Application Runtime
+# -----------------------------
+
+@asynccontextmanager
+async def fraud_triage_lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    One FraudTriageRuntime per application: created at startup,
+    pending traces flushed at shutdown.
+    """
+    runtime = FraudTriageRuntime()
+    app.state.fraud_triage_runtime = runtime
+    try:
+        yield
+    finally:
+        runtime.close()
+
+
+def get_triage_runtime(request: Request) -> FraudTriageRuntime:
+    return request.app.state.fraud_triage_runtime
+
+
+router = APIRouter(
+    prefix="/fraud",
+    tags=["fraud"],
+    lifespan=fraud_triage_lifespan,
+)
 
 
 # -----------------------------
@@ -34,6 +69,7 @@ class FraudTriageResponse(BaseModel):
 )
 def fraud_triage(
     request: FraudTriageRequest,
+    runtime: FraudTriageRuntime = Depends(get_triage_runtime),
 ):
     """
     Run fraud triage workflow.
@@ -44,6 +80,151 @@ def fraud_triage(
         **request.context,
     }
 
-    result = run_fraud_triage_workflow(inputs)
+    result = run_fraud_triage_workflow(inputs, runtime=runtime)
 
     return FraudTriageResponse(**result)
+
+
+# -----------------------------
+# Batch Endpoint
+# -----------------------------
+
+NDJSON_MEDIA_TYPES = ("application/x-ndjson", "application/ndjson")
+
+# (input index, merged inputs or None, validation error or None)
+BatchItem = Tuple[int, Optional[Dict[str, Any]], Optional[str]]
+
+
+def _parse_item(index: int, raw: Any) -> BatchItem:
+    try:
+        if isinstance(raw, bytes):
+            raw = json.loads(raw)
+        item = FraudTriageRequest.model_validate(raw)
+    except (ValueError, ValidationError) as e:
+        return index, None, str(e)
+
+    return index, {**item.transaction, **item.context}, None
+
+
+async def _read_ndjson(request: Request) -> List[BatchItem]:
+    """
+    Parse NDJSON line by line as the body arrives.
+    """
+    items: List[BatchItem] = []
+    buffer = b""
+
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                items.append(_parse_item(len(items), line))
+
+    if buffer.strip():
+        items.append(_parse_item(len(items), buffer))
+
+    return items
+
+
+def _score_chunk(chunk: List[BatchItem], runtime: FraudTriageRuntime) -> str:
+    """
+    Score one chunk; returns its NDJSON lines in input order.
+
+    Valid items are scored together. If that fails (an item that
+    passed the schema but cannot be scored, e.g. a non-numeric
+    tx_count), the items not yet scored are retried one by one so
+    only the failing ones become error lines.
+    """
+    valid = [inputs for _, inputs, error in chunk if error is None]
+    results: List[Dict[str, Any]] = []
+
+    try:
+        for result in run_fraud_triage_batch(
+            valid,
+            batch_size=max(1, len(valid)),
+            runtime=runtime,
+        ):
+            results.append(result)
+    except Exception:
+        results.extend(_score_each(valid[len(results):], runtime))
+
+    scored = iter(results)
+    lines = []
+    for index, _, error in chunk:
+        if error is None:
+            record = {"index": index, **next(scored)}
+        else:
+            record = {"index": index, "error": error}
+        lines.append(json.dumps(record))
+
+    return "\n".join(lines) + "\n"
+
+
+def _score_each(
+    items: List[Dict[str, Any]],
+    runtime: FraudTriageRuntime,
+) -> List[Dict[str, Any]]:
+    """
+    Score items one at a time; a failing item gives {"error": ...}.
+    """
+    results = []
+    for inputs in items:
+        try:
+            results.extend(
+                run_fraud_triage_batch([inputs], batch_size=1, runtime=runtime)
+            )
+        except Exception as e:
+            results.append({"error": str(e)})
+    return results
+
+
+async def _stream_results(
+    items: List[BatchItem],
+    runtime: FraudTriageRuntime,
+) -> AsyncIterator[str]:
+    for start in range(0, len(items), BATCH_SIZE):
+        chunk = items[start:start + BATCH_SIZE]
+        yield await run_in_threadpool(_score_chunk, chunk, runtime)
+
+
+@router.post("/triage/batch")
+async def fraud_triage_batch(
+    request: Request,
+    runtime: FraudTriageRuntime = Depends(get_triage_runtime),
+):
+    """
+    Run fraud triage over many transactions.
+
+    Body: a JSON array of triage requests, or NDJSON (one request per
+    line, Content-Type application/x-ndjson) parsed line by line as it
+    streams in. The body is read before scoring starts (the server
+    cannot interleave reading the request with a streaming response).
+
+    Results stream back as NDJSON in input order, chunk by chunk, one
+    line per input: {"index", "decision", "confidence",
+    "workflow_execution_id"} or {"index", "error"} for items that are
+    invalid or fail to score.
+    """
+
+    media_type = request.headers.get("content-type", "").split(";")[0].strip()
+
+    if media_type in NDJSON_MEDIA_TYPES:
+        items = await _read_ndjson(request)
+    else:
+        try:
+            body = await request.json()
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid JSON body")
+
+        if not isinstance(body, list):
+            raise HTTPException(
+                status_code=422,
+                detail="Expected a JSON array of triage requests",
+            )
+
+        items = [_parse_item(index, raw) for index, raw in enumerate(body)]
+
+    return StreamingResponse(
+        _stream_results(items, runtime),
+        media_type="application/x-ndjson",
+    )
@@ -1,11 +1,34 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 
 from api.fraud_api import router as fraud_router
+from platform10.governance.audit_log import get_audit_log, set_audit_log
+from platform10.governance.audit_sink import AsyncAuditSink
+from platform10.observability.metrics import get_metrics_registry
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Audit writes go through an async sink while the app runs; it is
+    flushed into the audit backend at shutdown.
+    """
+    sink = AsyncAuditSink(get_audit_log())
+    previous = set_audit_log(sink)
+    try:
+        yield
+    finally:
+        sink.close()
+        set_audit_log(previous)
+
 
 app = FastAPI(
     title="AgenticAIPlatform10",
     description="Enterprise Agentic AI Platform",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Register routers
@@ -15,3 +38,14 @@ app.include_router(fraud_router)
 @app.get("/health")
 def health():
     return {"status": "ok"}
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    """
+    Prometheus scrape endpoint (text exposition format 0.0.4).
+    """
+    return PlainTextResponse(
+        get_metrics_registry().render_prometheus(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
@@ -0,0 +1,78 @@
+# src/platform10/_dev/audit_sink_benchmark.py
+
+"""
+Audit write latency on the decision path.
+
+Records N audit events straight into a SQLiteAuditLog (one
+transaction per event) and through an AsyncAuditSink over the same
+backend, reporting the caller-side latency and the time the sink
+needed to drain at close.
+
+Usage:
+    PYTHONPATH=src python -m platform10._dev.audit_sink_benchmark --events 20000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from platform10.governance.audit_log import SQLiteAuditLog
+from platform10.governance.audit_sink import AsyncAuditSink
+from platform10.observability.metrics import LatencyHistogram
+
+
+def _record(log, events: int) -> LatencyHistogram:
+    histogram = LatencyHistogram()
+
+    for i in range(events):
+        start = time.perf_counter()
+        log.record_event(
+            trace_id=f"exec-{i % 1000}",
+            component="executor",
+            action="AGENT_FAILURE",
+            input_data={},
+            output_data={"agent": "VelocitySignalAgent", "error": "boom"},
+        )
+        histogram.record((time.perf_counter() - start) * 1000)
+
+    return histogram
+
+
+def _report(label: str, histogram: LatencyHistogram) -> None:
+    s = histogram.summary()
+    print(
+        f"{label:<22}{s['sum_ms'] / s['count']:>9.3f}{s['p50']:>9.3f}"
+        f"{s['p99']:>9.3f}{s['max']:>9.2f}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--synchronous", default="FULL")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print("\n=== AUDIT SINK BENCHMARK ===")
+        print(f"events      : {args.events}")
+        print(f"synchronous : {args.synchronous}")
+        print(f"{'(ms)':<22}{'mean':>9}{'p50':>9}{'p99':>9}{'max':>9}")
+
+        inline = SQLiteAuditLog(os.path.join(tmp, "inline.db"), args.synchronous)
+        _report("inline sqlite", _record(inline, args.events))
+        inline.close()
+
+        backend = SQLiteAuditLog(os.path.join(tmp, "sink.db"), args.synchronous)
+        sink = AsyncAuditSink(backend, capacity=args.events)
+        _report("async sink", _record(sink, args.events))
+
+        start = time.perf_counter()
+        sink.close()
+        print(f"sink drain at close : {(time.perf_counter() - start) * 1000:.0f}ms")
+        assert len(backend.all_events()) == args.events
+        backend.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+# src/platform10/_dev/engine_snapshot_benchmark.py
+
+"""
+ExecutionEngine step snapshot benchmark.
+
+Runs K signal-style agents over a ~1 MB case with the previous
+deepcopy-per-step implementation and with structurally shared
+snapshots; reports wall time and peak traced allocation.
+Replay recording is disabled so only snapshotting is measured.
+
+Usage:
+    PYTHONPATH=src python -m platform10._dev.engine_snapshot_benchmark --agents 20
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from copy import deepcopy
+
+from platform10.runtime.engine import ExecutionEngine
+
+
+class _SignalAgent:
+    def __init__(self, index: int):
+        self.name = f"signal-agent-{index}"
+
+    def run(self, context):
+        history = context["case"]["history"]
+        context["signals"].append({
+            "agent": self.name,
+            "risk": "HIGH" if len(history) % 7 == 0 else "LOW",
+        })
+        return context
+
+
+def _legacy_execute(agents, initial_input):
+    """
+    The pre-snapshot engine loop (deepcopy after every agent).
+    """
+    current_data = deepcopy(initial_input)
+    input_snapshot = deepcopy(initial_input)
+    steps = []
+
+    for index, agent in enumerate(agents, start=1):
+        current_data = agent.run(current_data)
+        steps.append({
+            "step": index,
+            "agent": agent.name,
+            "output_snapshot": deepcopy(current_data),
+        })
+
+    final_context = deepcopy(current_data)
+    return input_snapshot, steps, final_context
+
+
+def _case(target_bytes: int) -> dict:
+    history = []
+    case = {
+        "case_id": "CASE-BENCH",
+        "transaction": {"amount": 25000, "currency": "INR", "tx_count": 35},
+        "context": {"location_mismatch": True},
+        "history": history,
+    }
+    i = 0
+    while i % 500 or len(json.dumps(case)) < target_bytes:
+        history.append({
+            "tx_id": f"tx-{i}",
+            "amount": i * 3.5,
+            "merchant": f"merchant-{i % 97}",
+            "tags": ["card", "online"],
+        })
+        i += 1
+    return {"case": case, "signals": [], "trace_id": "bench"}
+
+
+def _measure(fn, repeats: int):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    elapsed_ms = (time.perf_counter() - start) * 1000 / repeats
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return round(elapsed_ms, 1), round(peak / 1024 / 1024, 1)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--agents", type=int, default=20)
+    parser.add_argument("--case-bytes", type=int, default=1_000_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    initial_input = _case(args.case_bytes)
+    agents = [_SignalAgent(i) for i in range(args.agents)]
+    engine = ExecutionEngine(regulator_mode=False)
+
+    legacy = _measure(lambda: _legacy_execute(agents, initial_input), args.repeats)
+    shared = _measure(
+        lambda: engine.execute_sequence(agents, initial_input, "bench"),
+        args.repeats,
+    )
+
+    print("\n=== ENGINE SNAPSHOT BENCHMARK ===")
+    print(f"case size        : {len(json.dumps(initial_input)) / 1e6:.2f} MB")
+    print(f"agents           : {args.agents}")
+    print(f"deepcopy / step  : {legacy[0]} ms, peak {legacy[1]} MiB")
+    print(f"shared snapshots : {shared[0]} ms, peak {shared[1]} MiB")
+
+
+if __name__ == "__main__":
+    main()
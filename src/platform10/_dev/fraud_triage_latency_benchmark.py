@@ -0,0 +1,70 @@
+# src/platform10/_dev/fraud_triage_latency_benchmark.py
+
+"""
+Fraud triage request-path latency benchmark.
+
+Compares the previous per-call behaviour (new TraceStore and agent
+per request, two inline JSON writes) with a shared FraudTriageRuntime
+whose traces are written by the background writer. Reports the
+latency seen by the caller, plus the time to drain the writer.
+
+Usage:
+    PYTHONPATH=src python -m platform10._dev.fraud_triage_latency_benchmark --requests 5000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from platform10.observability.metrics import LatencyHistogram
+from workflows.fraud_triage_runtime import FraudTriageConfig, FraudTriageRuntime
+from workflows.fraud_triage_workflow import run_fraud_triage_workflow
+
+
+def _measure(requests: int, runtime=None) -> LatencyHistogram:
+    histogram = LatencyHistogram()
+
+    for i in range(requests):
+        inputs = {"transaction_id": f"txn_{i}", "tx_count": i % 70}
+        start = time.perf_counter()
+        run_fraud_triage_workflow(inputs, runtime=runtime)
+        histogram.record((time.perf_counter() - start) * 1000)
+
+    return histogram
+
+
+def _report(label: str, histogram: LatencyHistogram) -> None:
+    s = histogram.summary()
+    print(
+        f"{label:<28}{s['sum_ms'] / s['count']:>9.3f}{s['p50']:>9.3f}"
+        f"{s['p95']:>9.3f}{s['p99']:>9.3f}{s['max']:>9.2f}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+
+        print("\n=== FRAUD TRIAGE LATENCY BENCHMARK ===")
+        print(f"requests : {args.requests}")
+        print(f"{'(ms)':<28}{'mean':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}")
+
+        _report("per-call (before)", _measure(args.requests))
+
+        runtime = FraudTriageRuntime(
+            FraudTriageConfig(trace_dir=os.path.join(tmp, "shared"))
+        )
+        _report("shared runtime (after)", _measure(args.requests, runtime))
+
+        start = time.perf_counter()
+        runtime.close()
+        print(f"background drain after run : {(time.perf_counter() - start) * 1000:.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+# src/platform10/_dev/memory_benchmark.py
+
+"""
+MemoryManager micro-benchmark.
+
+Compares the pooled / WAL MemoryManager against the previous
+connect-per-call behaviour for decision writes and recalls.
+
+Usage:
+    PYTHONPATH=src python -m platform10._dev.memory_benchmark --writes 5000
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import tempfile
+import time
+
+from platform10.memory.group_commit import GroupCommitWriter
+from platform10.memory.memory_manager import MemoryManager
+
+
+class ConnectPerCallMemory:
+    """
+    Baseline: the original open / execute / commit / close per call.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+        CREATE TABLE IF NOT EXISTS episodic_memory (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            event_type TEXT,
+            data TEXT,
+            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+        """)
+        conn.commit()
+        conn.close()
+
+    def store_decision(self, event_type, payload):
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(
+            "INSERT INTO episodic_memory (event_type, data) VALUES (?, ?)",
+            (event_type, json.dumps(payload)),
+        )
+        conn.commit()
+        conn.close()
+
+    def recall_recent(self, limit=5):
+        conn = sqlite3.connect(self.db_path)
+        rows = conn.execute(
+            "SELECT event_type, data, timestamp FROM episodic_memory "
+            "ORDER BY timestamp DESC LIMIT ?",
+            (limit,),
+        ).fetchall()
+        conn.close()
+        return rows
+
+
+def _run(memory, writes: int, recalls: int) -> dict:
+    payload = {"score": 0.42, "verdict": "REVIEW", "case_id": "CASE-001"}
+
+    start = time.perf_counter()
+    for _ in range(writes):
+        memory.store_decision("fraud_assessment", payload)
+    write_sec = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(recalls):
+        memory.recall_recent(limit=5)
+    recall_sec = time.perf_counter() - start
+
+    return {
+        "writes_per_sec": round(writes / write_sec, 1),
+        "recalls_per_sec": round(recalls / recall_sec, 1),
+    }
+
+
+def _run_group_commit(memory, writes: int, batch_size: int) -> dict:
+    payload = {"score": 0.42, "verdict": "REVIEW", "case_id": "CASE-001"}
+
+    start = time.perf_counter()
+    with GroupCommitWriter(memory, max_batch_size=batch_size) as writer:
+        for _ in range(writes):
+            writer.submit("fraud_assessment", payload)
+        writer.flush()
+    write_sec = time.perf_counter() - start
+
+    return {"writes_per_sec": round(writes / write_sec, 1)}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--writes", type=int, default=2000)
+    parser.add_argument("--recalls", type=int, default=2000)
+    parser.add_argument("--synchronous", default="NORMAL")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        baseline = ConnectPerCallMemory(os.path.join(tmp, "baseline.db"))
+        baseline_result = _run(baseline, args.writes, args.recalls)
+
+        pooled = MemoryManager(
+            db_path=os.path.join(tmp, "pooled.db"),
+            synchronous=args.synchronous,
+        )
+        pooled_result = _run(pooled, args.writes, args.recalls)
+        pooled.close()
+
+        grouped = MemoryManager(
+            db_path=os.path.join(tmp, "grouped.db"),
+            synchronous=args.synchronous,
+        )
+        grouped_result = _run_group_commit(
+            grouped, args.writes, args.batch_size
+        )
+        grouped.close()
+
+    print("\n=== MEMORY MANAGER BENCHMARK ===")
+    print(f"connect-per-call : {baseline_result}")
+    print(f"pooled ({args.synchronous:<6}) : {pooled_result}")
+    print(f"group commit     : {grouped_result}")
+    print(
+        "speedup          : "
+        f"writes x{pooled_result['writes_per_sec'] / baseline_result['writes_per_sec']:.1f}, "
+        f"recalls x{pooled_result['recalls_per_sec'] / baseline_result['recalls_per_sec']:.1f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+# src/platform10/_dev/memory_index_benchmark.py
+
+"""
+episodic_memory index benchmark.
+
+Builds a synthetic database at schema version 1 (no indexes),
+times recall_by_type / recall_recent, applies the remaining
+migrations and times the same queries again.
+
+Usage:
+    PYTHONPATH=src python -m platform10._dev.memory_index_benchmark --rows 10000000
+"""
+
+import argparse
+import json
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from platform10.memory.memory_manager import MemoryManager
+from platform10.memory.migrations import apply_migrations, current_version
+
+
+EVENT_TYPES = [
+    "fraud_assessment",
+    "vendor_review",
+    "regulatory_change",
+    "human_review",
+]
+
+CHUNK_SIZE = 100_000
+
+
+def _build_unindexed_db(db_path: str, rows: int) -> None:
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=OFF")
+    apply_migrations(conn, target_version=1)
+
+    rng = random.Random(42)
+    start = datetime(2025, 1, 1)
+    payload = json.dumps({"score": 0.5, "verdict": "REVIEW"})
+
+    written = 0
+    while written < rows:
+        n = min(CHUNK_SIZE, rows - written)
+        batch = [
+            (
+                rng.choice(EVENT_TYPES),
+                payload,
+                (start + timedelta(seconds=written + i)).strftime("%Y-%m-%d %H:%M:%S"),
+            )
+            for i in range(n)
+        ]
+        with conn:
+            conn.executemany(
+                "INSERT INTO episodic_memory (event_type, data, timestamp) "
+                "VALUES (?, ?, ?)",
+                batch,
+            )
+        written += n
+
+    conn.close()
+
+
+def _time_queries(memory: MemoryManager, repeats: int) -> dict:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        memory.recall_by_type("fraud_assessment", limit=100)
+    by_type_ms = (time.perf_counter() - start) * 1000 / repeats
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        memory.recall_recent(limit=5)
+    recent_ms = (time.perf_counter() - start) * 1000 / repeats
+
+    return {
+        "recall_by_type_limit_100_ms": round(by_type_ms, 3),
+        "recall_recent_ms": round(recent_ms, 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "synthetic.db")
+
+        start = time.perf_counter()
+        _build_unindexed_db(db_path, args.rows)
+        build_sec = time.perf_counter() - start
+
+        conn = sqlite3.connect(db_path)
+        assert current_version(conn) == 1
+
+        # Query the v1 schema as-is
+        unindexed = MemoryManager(db_path=db_path, migrate=False)
+        before = _time_queries(unindexed, args.repeats)
+        unindexed.close()
+
+        start = time.perf_counter()
+        apply_migrations(conn)
+        migrate_sec = time.perf_counter() - start
+        conn.close()
+
+        indexed = MemoryManager(db_path=db_path)
+        after = _time_queries(indexed, args.repeats)
+        indexed.close()
+
+    print("\n=== EPISODIC MEMORY INDEX BENCHMARK ===")
+    print(f"rows             : {args.rows:,}")
+    print(f"build            : {build_sec:.1f}s")
+    print(f"schema v1        : {before}")
+    print(f"migration to v2  : {migrate_sec:.1f}s")
+    print(f"schema v2        : {after}")
+
+
+if __name__ == "__main__":
+    main()
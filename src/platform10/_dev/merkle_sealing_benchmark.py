@@ -0,0 +1,72 @@
+# src/platform10/_dev/merkle_sealing_benchmark.py
+
+"""
+Replay sealing benchmark.
+
+Records N traces on a ledger with per-record signatures and with
+Merkle batch sealing, then times verify_signatures over all of them.
+
+Usage:
+    PYTHONPATH=src python -m platform10._dev.merkle_sealing_benchmark --traces 20000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from platform10.governance.replay.ledger import SegmentedLedger
+from platform10.governance.replay.regulator_replay import RegulatorReplay
+from platform10.governance.signing.key_manager import KeyManager
+
+
+def _run(tmp: str, sealing: str, traces: int, window: int) -> dict:
+    storage_dir = os.path.join(tmp, sealing)
+    replay = RegulatorReplay(
+        storage_dir=storage_dir,
+        store=SegmentedLedger(os.path.join(storage_dir, "ledger"), fsync=False),
+        sealing=sealing,
+        seal_window=window,
+    )
+    trace_ids = [f"trace-{i}" for i in range(traces)]
+
+    start = time.perf_counter()
+    for trace_id in trace_ids:
+        replay.record(trace_id, {"case_id": trace_id}, [], {"risk": "LOW"})
+    replay.seal()
+    record_sec = time.perf_counter() - start
+
+    start = time.perf_counter()
+    ok = all(replay.verify_signatures(trace_ids).values())
+    verify_sec = time.perf_counter() - start
+
+    assert ok
+    return {
+        "records_per_sec": round(traces / record_sec),
+        "verified_per_sec": round(traces / verify_sec),
+        "signatures": traces if sealing == "record" else len(replay.sealer.batches()),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--traces", type=int, default=20_000)
+    parser.add_argument("--window", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        KeyManager.PRIVATE_KEY_PATH = os.path.join(tmp, "private.pem")
+        KeyManager.PUBLIC_KEY_PATH = os.path.join(tmp, "public.pem")
+        KeyManager.generate_keys()
+
+        per_record = _run(tmp, "record", args.traces, args.window)
+        merkle = _run(tmp, "merkle", args.traces, args.window)
+
+    print("\n=== REPLAY SEALING BENCHMARK ===")
+    print(f"traces          : {args.traces:,} (window {args.window})")
+    print(f"per-record      : {per_record}")
+    print(f"merkle batches  : {merkle}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+# src/platform10/_dev/reflection_batch_benchmark.py
+
+"""
+ReflectionPattern batch benchmark.
+
+Compares reflect_batch() against a per-decision Python loop over
+the same in-memory history (the loop re-weights history per call,
+as reflect() did before the accumulator).
+
+Usage:
+    PYTHONPATH=src python -m platform10._dev.reflection_batch_benchmark --decisions 5000
+"""
+
+import argparse
+import math
+import random
+import time
+from datetime import datetime, timedelta
+
+from platform10.patterns.reflection_pattern import ReflectionPattern
+
+
+def _loop_reflect(decisions, history, decay_lambda):
+    parsed = [
+        (datetime.fromisoformat(e["timestamp"]), e["data"]["score"])
+        for e in history
+    ]
+    results = []
+
+    for decision in decisions:
+        now = datetime.fromisoformat(decision["timestamp"])
+        weighted_total = weighted_high = 0.0
+
+        for event_time, score in parsed:
+            if event_time > now:
+                continue
+            weight = math.exp(
+                -decay_lambda * (now - event_time).total_seconds() / 3600.0
+            )
+            weighted_total += weight
+            if score >= 0.8:
+                weighted_high += weight
+
+        results.append(weighted_high / weighted_total if weighted_total else None)
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--decisions", type=int, default=5000)
+    parser.add_argument("--history", type=int, default=5000)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    base = datetime(2026, 1, 1)
+
+    history = [
+        {
+            "data": {"score": rng.random()},
+            "timestamp": (base + timedelta(minutes=i)).isoformat(),
+        }
+        for i in range(args.history)
+    ]
+    decisions = [
+        {
+            "confidence": rng.random(),
+            "timestamp": (
+                base + timedelta(minutes=rng.randrange(args.history))
+            ).isoformat(),
+        }
+        for _ in range(args.decisions)
+    ]
+
+    reflection = ReflectionPattern()
+
+    start = time.perf_counter()
+    reflection.reflect_batch(decisions, history)
+    batch_sec = time.perf_counter() - start
+
+    start = time.perf_counter()
+    _loop_reflect(decisions, history, reflection.DECAY_LAMBDA)
+    loop_sec = time.perf_counter() - start
+
+    print("\n=== REFLECTION BATCH BENCHMARK ===")
+    print(f"decisions x history : {args.decisions:,} x {args.history:,}")
+    print(f"python loop         : {loop_sec:.2f}s")
+    print(f"reflect_batch       : {batch_sec:.3f}s")
+    print(f"speedup             : x{loop_sec / batch_sec:.0f}")
+
+
+if __name__ == "__main__":
+    main()
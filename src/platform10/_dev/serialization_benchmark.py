@@ -0,0 +1,111 @@
+# src/platform10/_dev/serialization_benchmark.py
+
+"""
+Record serialization benchmark.
+
+Encodes / decodes N AuditEvents, AgentTraces and WorkflowTraces with
+today's path (dataclasses.asdict + json.dumps(indent=2)), canonical
+compact JSON (asdict + sort_keys, no whitespace) and the binary
+records of core/codec.py, reporting throughput and size.
+
+Usage:
+    PYTHONPATH=src python -m platform10._dev.serialization_benchmark --records 20000
+"""
+
+import argparse
+import json
+import time
+from dataclasses import asdict
+from datetime import datetime
+
+from platform10.governance.audit_log import AuditEvent
+from tracing.agent_trace import AgentTrace
+from tracing.workflow_trace import WorkflowTrace
+
+
+def _records(n: int):
+    events, agents, workflows = [], [], []
+
+    for i in range(n):
+        events.append(AuditEvent(
+            event_id=f"evt-{i:08d}",
+            trace_id=f"trace-{i % 1000:06d}",
+            timestamp=datetime.utcnow(),
+            component="agent",
+            action="AGENT_COMPLETED",
+            input_data={"transaction_id": f"txn_{i}", "tx_count": i % 70},
+            output_data={"risk": "HIGH", "confidence": 0.9, "latency_ms": 1.25},
+            metadata={"workflow": "fraud-triage-workflow"},
+        ))
+
+        agent = AgentTrace.start(
+            "velocity-signal-agent",
+            "fraud_signal_detection",
+            {"transaction_id": f"txn_{i}", "tx_count": i % 70, "country": "US"},
+        )
+        agent.record_signals({"signal_type": "velocity_risk", "risk": "LOW"})
+        agent.finalize("LOW", f"Transaction count = {i % 70}", 0.3)
+        agents.append(agent)
+
+        workflow = WorkflowTrace.start("fraud-triage-workflow")
+        workflow.record_agent_result("velocity-signal-agent", agent.execution_id, "LOW", 0.3)
+        workflow.finalize("APPROVE", 0.3, {"aggregation": "weighted_mean"})
+        workflows.append(workflow)
+
+    return [
+        ("AuditEvent", AuditEvent, events),
+        ("AgentTrace", AgentTrace, agents),
+        ("WorkflowTrace", WorkflowTrace, workflows),
+    ]
+
+
+def _json_today(record) -> bytes:
+    return json.dumps(asdict(record), indent=2, default=str).encode()
+
+
+def _json_compact(record) -> bytes:
+    return json.dumps(
+        asdict(record), sort_keys=True, separators=(",", ":"), default=str
+    ).encode()
+
+
+def _time(fn, items):
+    start = time.perf_counter()
+    results = [fn(item) for item in items]
+    return time.perf_counter() - start, results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, default=20000)
+    args = parser.parse_args()
+
+    print("\n=== SERIALIZATION BENCHMARK ===")
+    print(f"records : {args.records} per type")
+    print(
+        f"{'':<15}{'format':<14}{'encode/s':>11}{'decode/s':>11}{'bytes':>8}"
+    )
+
+    for name, cls, records in _records(args.records):
+        n = len(records)
+        formats = [
+            ("json indent", _json_today, json.loads),
+            ("json compact", _json_compact, json.loads),
+            ("binary", cls.to_bytes, cls.from_bytes),
+        ]
+
+        for label, encode, decode in formats:
+            encode_s, encoded = _time(encode, records)
+            decode_s, _ = _time(decode, encoded)
+            size = sum(map(len, encoded)) / n
+            print(
+                f"{name:<15}{label:<14}{n / encode_s:>11,.0f}"
+                f"{n / decode_s:>11,.0f}{size:>8.0f}"
+            )
+
+        if [cls.from_bytes(cls.to_bytes(r)) for r in records[:100]] != records[:100]:
+            raise SystemExit(f"{name}: binary round trip differs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+# src/platform10/_dev/signal_batch_benchmark.py
+
+"""
+Signal agent evaluate() vs evaluate_batch() benchmark.
+
+Builds N synthetic fraud cases, evaluates every signal agent row by
+row and through its NumPy evaluate_batch, checks the outputs are
+identical and reports throughput.
+
+"batch" is evaluate_batch() plus reading the risk column; "+rows"
+additionally materialises every signal dict, as a row-oriented
+consumer would.
+
+Usage:
+    PYTHONPATH=src python -m platform10._dev.signal_batch_benchmark --cases 1000000
+"""
+
+import argparse
+import random
+import time
+
+from platform10.agents.customer_tenure_signal_agent import CustomerTenureSignalAgent
+from platform10.agents.location_signal_agent import LocationSignalAgent
+from platform10.agents.time_window_signal_agent import TimeWindowSignalAgent
+from platform10.agents.time_window_velocity_signal_agent import (
+    TimeWindowVelocitySignalAgent,
+)
+from platform10.agents.velocity_signal_agent import VelocitySignalAgent
+from platform10.contracts.case_batch import CaseBatch
+
+
+COUNTRIES = ["US", "GB", "IN", "DE", "RU", "IR", "KP", "FR", "BR", "SG"]
+
+
+def _batch(n: int, seed: int) -> CaseBatch:
+    rng = random.Random(seed)
+    transactions = []
+    contexts = []
+
+    for _ in range(n):
+        transactions.append({
+            "tx_count": rng.randint(0, 80),
+            "country": rng.choice(COUNTRIES),
+        })
+        contexts.append({
+            "timestamp": (
+                f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+                f"T{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:00"
+            ),
+            "tx_count_last_10_min": rng.randint(0, 15),
+            "customer_tenure_days": rng.randint(0, 3650),
+        })
+
+    return CaseBatch(
+        case_ids=[f"case-{i}" for i in range(n)],
+        transactions=transactions,
+        contexts=contexts,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cases", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    batch = _batch(args.cases, args.seed)
+    cases = [batch.case(i) for i in range(len(batch))]
+
+    agents = [
+        VelocitySignalAgent(),
+        LocationSignalAgent(),
+        TimeWindowSignalAgent(),
+        TimeWindowVelocitySignalAgent(),
+        CustomerTenureSignalAgent(),
+    ]
+
+    print("\n=== SIGNAL BATCH BENCHMARK ===")
+    print(f"cases : {args.cases}")
+    print(
+        f"{'agent':<36}{'evaluate':>12}{'batch':>12}{'speedup':>10}"
+        f"{'+rows':>12}{'speedup':>10}"
+    )
+
+    for agent in agents:
+        start = time.perf_counter()
+        expected = [agent.evaluate(case) for case in cases]
+        row_s = time.perf_counter() - start
+
+        # Fresh batch so column extraction is included in the timing
+        fresh = CaseBatch(batch.case_ids, batch.transactions, batch.contexts)
+        start = time.perf_counter()
+        actual = agent.evaluate_batch(fresh)
+        risks = actual.risks
+        batch_s = time.perf_counter() - start
+        rows = list(actual)
+        rows_s = time.perf_counter() - start
+
+        if rows != expected or risks != [row["risk"] for row in expected]:
+            raise SystemExit(f"{agent.name}: evaluate_batch output differs")
+
+        print(
+            f"{agent.name:<36}{row_s * 1000:>10.0f}ms{batch_s * 1000:>10.0f}ms"
+            f"{row_s / batch_s:>9.1f}x{rows_s * 1000:>10.0f}ms"
+            f"{row_s / rows_s:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+# src/platform10/_dev/signing_benchmark.py
+
+"""
+Replay signing benchmark.
+
+1. Sign N integrity hashes: PEM re-parsed per signature (previous
+   RegulatorReplay._sign) vs the cached KeyManager key.
+2. Verify the same N signatures: public key re-parsed per record
+   (previous verify_signature) vs one loaded key.
+3. End to end on a ledger: verify_signature per trace vs
+   verify_signatures for the whole batch.
+
+Usage:
+    PYTHONPATH=src python -m platform10._dev.signing_benchmark --signatures 100000
+"""
+
+import argparse
+import hashlib
+import os
+import tempfile
+import time
+
+from cryptography.hazmat.primitives import serialization
+
+from platform10.governance.replay.ledger import SegmentedLedger
+from platform10.governance.replay.regulator_replay import RegulatorReplay
+from platform10.governance.signing.key_manager import KeyManager
+
+
+def _rate(count: int, seconds: float) -> str:
+    return f"{seconds:7.2f}s  ({count / seconds:,.0f}/s)"
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--signatures", type=int, default=100_000)
+    parser.add_argument("--traces", type=int, default=5_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        KeyManager.PRIVATE_KEY_PATH = os.path.join(tmp, "private.pem")
+        KeyManager.PUBLIC_KEY_PATH = os.path.join(tmp, "public.pem")
+        KeyManager.KEYRING_DIR = os.path.join(tmp, "keyring")
+        KeyManager.generate_keys()
+
+        messages = [
+            hashlib.sha256(str(i).encode()).hexdigest().encode("utf-8")
+            for i in range(args.signatures)
+        ]
+
+        # 1. Signing
+        start = time.perf_counter()
+        for message in messages:
+            with open(KeyManager.PRIVATE_KEY_PATH, "rb") as f:
+                key = serialization.load_pem_private_key(f.read(), password=None)
+            key.sign(message)
+        sign_uncached = time.perf_counter() - start
+
+        start = time.perf_counter()
+        signatures = []
+        for message in messages:
+            key, _ = KeyManager.signing_key()
+            signatures.append(key.sign(message))
+        sign_cached = time.perf_counter() - start
+
+        # 2. Verification
+        start = time.perf_counter()
+        for message, signature in zip(messages, signatures):
+            with open(KeyManager.PUBLIC_KEY_PATH, "rb") as f:
+                key = serialization.load_pem_public_key(f.read())
+            key.verify(signature, message)
+        verify_uncached = time.perf_counter() - start
+
+        start = time.perf_counter()
+        key = KeyManager.load_public_key()
+        for message, signature in zip(messages, signatures):
+            key.verify(signature, message)
+        verify_one_key = time.perf_counter() - start
+
+        # 3. End to end on stored records
+        storage_dir = os.path.join(tmp, "replay_logs")
+        replay = RegulatorReplay(
+            storage_dir=storage_dir,
+            store=SegmentedLedger(os.path.join(storage_dir, "ledger"), fsync=False),
+        )
+        trace_ids = [f"trace-{i}" for i in range(args.traces)]
+        for trace_id in trace_ids:
+            replay.record(trace_id, {"case_id": trace_id}, [], {"risk": "LOW"})
+
+        start = time.perf_counter()
+        single = all(replay.verify_signature(t) for t in trace_ids)
+        per_trace = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batch = all(replay.verify_signatures(trace_ids).values())
+        batched = time.perf_counter() - start
+
+    assert single and batch
+
+    n = args.signatures
+    print("\n=== REPLAY SIGNING BENCHMARK ===")
+    print(f"sign, PEM per call      : {_rate(n, sign_uncached)}")
+    print(f"sign, cached key        : {_rate(n, sign_cached)}")
+    print(f"verify, PEM per call    : {_rate(n, verify_uncached)}")
+    print(f"verify, one loaded key  : {_rate(n, verify_one_key)}")
+    print(f"verify_signature x{args.traces:<6}: {_rate(args.traces, per_trace)}")
+    print(f"verify_signatures batch : {_rate(args.traces, batched)}")
+
+
+if __name__ == "__main__":
+    main()
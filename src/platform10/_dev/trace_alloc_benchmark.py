@@ -0,0 +1,155 @@
+# src/platform10/_dev/trace_alloc_benchmark.py
+
+"""
+Trace allocation benchmark.
+
+Builds N in-flight AgentTraces / WorkflowTraces (started, one agent
+result recorded, not finalized) with the previous record shape
+(plain dataclass, uuid4 ids, ISO string captured at start) and with
+the slotted records of tracing/, reporting construction cost and
+retained memory (tracemalloc) scaled to 1M in-flight traces.
+
+Usage:
+    PYTHONPATH=src python -m platform10._dev.trace_alloc_benchmark --traces 200000
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from tracing.agent_trace import AgentTrace
+from tracing.workflow_trace import WorkflowTrace
+
+
+# --------------------------------
+# Previous record shape (baseline)
+# --------------------------------
+
+def _utc_now() -> str:
+    return datetime.utcnow().isoformat() + "Z"
+
+
+@dataclass
+class _LegacyAgentTrace:
+    execution_id: str
+    agent_name: str
+    task_type: Optional[str] = None
+    started_at: str = field(default_factory=_utc_now)
+    ended_at: Optional[str] = None
+    inputs: Dict[str, Any] = field(default_factory=dict)
+    signals: Dict[str, Any] = field(default_factory=dict)
+    decision: Optional[str] = None
+    reasoning: Optional[str] = None
+    confidence: Optional[float] = None
+    outcome: Optional[str] = None
+    status: str = "RUNNING"
+
+    @classmethod
+    def start(cls, agent_name, task_type=None, inputs=None):
+        return cls(str(uuid.uuid4()), agent_name, task_type, inputs=inputs or {})
+
+
+@dataclass
+class _LegacyInvocation:
+    agent: str
+    execution_id: str
+    decision: Optional[str]
+    confidence: Optional[float]
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class _LegacyWorkflowTrace:
+    workflow_execution_id: str
+    workflow_name: str
+    started_at: str = field(default_factory=_utc_now)
+    ended_at: Optional[str] = None
+    agents_invoked: List[_LegacyInvocation] = field(default_factory=list)
+    final_decision: Optional[str] = None
+    final_confidence: Optional[float] = None
+    explainability: Dict[str, Any] = field(default_factory=dict)
+    human_review_required: bool = False
+    status: str = "RUNNING"
+
+    @classmethod
+    def start(cls, workflow_name):
+        return cls(str(uuid.uuid4()), workflow_name)
+
+    def record_agent_result(self, agent_name, execution_id, decision, confidence):
+        self.agents_invoked.append(
+            _LegacyInvocation(agent_name, execution_id, decision, confidence)
+        )
+
+
+# --------------------------------
+# Measurement
+# --------------------------------
+
+_INPUTS = {"transaction_id": "txn_1", "tx_count": 12, "country": "US"}
+
+
+def _build(agent_cls, workflow_cls, n: int):
+    traces = []
+    append = traces.append
+    for _ in range(n):
+        agent = agent_cls.start("velocity-signal-agent", "fraud_signal_detection", _INPUTS)
+        workflow = workflow_cls.start("fraud-triage-workflow")
+        workflow.record_agent_result(
+            "velocity-signal-agent", agent.execution_id, "LOW", 0.3
+        )
+        append((agent, workflow))
+    return traces
+
+
+def _construction_us(agent_cls, workflow_cls, n: int, rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        gc.collect()
+        start = time.perf_counter()
+        _build(agent_cls, workflow_cls, n)
+        best = min(best, time.perf_counter() - start)
+    return best / n * 1e6
+
+
+def _retained_bytes(agent_cls, workflow_cls, n: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    traces = _build(agent_cls, workflow_cls, n)
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    del traces
+    return retained / n
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--traces", type=int, default=200000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    variants = [
+        ("dataclass", _LegacyAgentTrace, _LegacyWorkflowTrace),
+        ("slotted", AgentTrace, WorkflowTrace),
+    ]
+
+    print("\n=== TRACE ALLOCATION BENCHMARK ===")
+    print(f"traces : {args.traces} (agent + workflow trace pairs)")
+    print(f"{'variant':<12}{'build us/pair':>15}{'bytes/pair':>12}{'MB per 1M':>11}")
+
+    for label, agent_cls, workflow_cls in variants:
+        build_us = _construction_us(agent_cls, workflow_cls, args.traces, args.rounds)
+        per_pair = _retained_bytes(agent_cls, workflow_cls, args.traces)
+        print(
+            f"{label:<12}{build_us:>15.2f}{per_pair:>12.0f}"
+            f"{per_pair * 1_000_000 / 2**20:>11.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+# src/platform10/_dev/trace_query_benchmark.py
+
+"""
+Trace query benchmark.
+
+Writes N fraud triage workflow traces spread over 24 hours through
+TraceStore (without the index, with it inline, and behind
+BackgroundTraceWriter which indexes per batch), then answers "every
+HOLD_TRANSACTION decision in the last hour" by scanning the JSON files
+and through TraceStore.query, reporting write overhead and query
+latency.
+
+Usage:
+    PYTHONPATH=src python -m platform10._dev.trace_query_benchmark --traces 20000
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import tempfile
+import time
+
+from tracing.stamps import now_ns, ns_from_iso
+from tracing.trace_store import TraceStore
+from tracing.trace_writer import BackgroundTraceWriter
+from tracing.workflow_trace import WorkflowTrace
+
+
+HOUR_NS = 3600 * 10**9
+DECISIONS = [("APPROVE", 0.3), ("REVIEW", 0.6), ("HOLD_TRANSACTION", 0.9)]
+
+
+def _payloads(n: int, now: int):
+    rng = random.Random(7)
+    payloads = []
+    for _ in range(n):
+        trace = WorkflowTrace.start("fraud-triage-workflow")
+        trace.started_ns = now - rng.randrange(24 * HOUR_NS)
+        decision, confidence = rng.choice(DECISIONS)
+        trace.record_agent_result("velocity-signal-agent", "a", "LOW", confidence)
+        trace.finalize(decision, confidence, {"aggregation": "weighted_mean"})
+        payloads.append((trace.workflow_execution_id, trace.to_dict()))
+    return payloads
+
+
+def _write(sink, payloads) -> float:
+    start = time.perf_counter()
+    for execution_id, payload in payloads:
+        sink.write_workflow_trace(execution_id, payload)
+    sink.flush()
+    return (time.perf_counter() - start) / len(payloads) * 1e6
+
+
+def _scan(store: TraceStore, since: int):
+    matches = []
+    for name in os.listdir(store.workflow_dir):
+        with open(os.path.join(store.workflow_dir, name)) as f:
+            payload = json.load(f)
+        if (
+            payload["final_decision"] == "HOLD_TRANSACTION"
+            and ns_from_iso(payload["started_at"]) >= since
+        ):
+            matches.append(payload["workflow_execution_id"])
+    return matches
+
+
+def _best_ms(fn, rounds: int):
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--traces", type=int, default=20000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    now = now_ns()
+    since = now - HOUR_NS
+    payloads = _payloads(args.traces, now)
+
+    dirs = [tempfile.mkdtemp(prefix="trace-query-") for _ in range(3)]
+    try:
+        plain_us = _write(TraceStore(dirs[0], index=False), payloads)
+        inline_us = _write(TraceStore(dirs[1]), payloads)
+
+        store = TraceStore(dirs[2])
+        with BackgroundTraceWriter(store) as writer:
+            background_us = _write(writer, payloads)
+
+        scan_ms, scanned = _best_ms(lambda: _scan(store, since), rounds=1)
+        query_ms, summaries = _best_ms(
+            lambda: store.query(decision="HOLD_TRANSACTION", since=since),
+            rounds=args.rounds,
+        )
+        if sorted(scanned) != sorted(s["workflow_execution_id"] for s in summaries):
+            raise SystemExit("query and scan disagree")
+
+        print("\n=== TRACE QUERY BENCHMARK ===")
+        print(f"traces  : {args.traces} over 24h, {len(summaries)} HOLD in the last hour")
+        print(
+            f"write   : {plain_us:.1f} us/trace without index, "
+            f"{inline_us:.1f} indexed inline, {background_us:.1f} background"
+        )
+        print(f"scan    : {scan_ms:.1f} ms (read + parse every JSON file)")
+        print(f"query   : {query_ms:.2f} ms (index range scan)")
+        store.close()
+    finally:
+        for directory in dirs:
+            shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
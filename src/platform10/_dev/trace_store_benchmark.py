@@ -0,0 +1,98 @@
+# src/platform10/_dev/trace_store_benchmark.py
+
+"""
+Trace persistence benchmark.
+
+Writes N agent + workflow trace pairs (fraud triage shaped) through
+the file-per-trace TraceStore (inline and behind
+BackgroundTraceWriter) and through SegmentTraceStore under each fsync
+policy, reporting caller-side cost per pair, end-to-end throughput
+(until flushed) and the number of files left on disk.
+
+Usage:
+    PYTHONPATH=src python -m platform10._dev.trace_store_benchmark --traces 20000
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from tracing.agent_trace import AgentTrace
+from tracing.segment_store import SegmentTraceStore
+from tracing.trace_store import TraceStore
+from tracing.trace_writer import BackgroundTraceWriter
+from tracing.workflow_trace import WorkflowTrace
+
+
+def _payloads(n: int):
+    pairs = []
+    for i in range(n):
+        agent = AgentTrace.start(
+            "velocity-signal-agent",
+            "fraud_signal_detection",
+            {"transaction_id": f"txn_{i}", "tx_count": i % 70},
+        )
+        agent.record_signals({"signal_type": "velocity_risk", "risk": "LOW"})
+        agent.finalize("LOW", f"Transaction count = {i % 70}", 0.3)
+
+        workflow = WorkflowTrace.start("fraud-triage-workflow")
+        workflow.record_agent_result("velocity-signal-agent", agent.execution_id, "LOW", 0.3)
+        workflow.finalize("APPROVE", 0.3, {"aggregation": "weighted_mean"})
+
+        pairs.append((
+            agent.execution_id, agent.to_dict(),
+            workflow.workflow_execution_id, workflow.to_dict(),
+        ))
+    return pairs
+
+
+# label -> factory(base_dir)
+SINKS = [
+    ("files inline", TraceStore),
+    ("files background", lambda d: BackgroundTraceWriter(TraceStore(d))),
+    ("segments never", lambda d: SegmentTraceStore(d, fsync="never")),
+    ("segments interval", lambda d: SegmentTraceStore(d, fsync="interval")),
+    ("segments batch", lambda d: SegmentTraceStore(d, fsync="batch")),
+]
+
+
+def _count_files(base_dir: str) -> int:
+    return sum(len(files) for _, _, files in os.walk(base_dir))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--traces", type=int, default=20000)
+    args = parser.parse_args()
+
+    pairs = _payloads(args.traces)
+
+    print("\n=== TRACE STORE BENCHMARK ===")
+    print(f"traces : {args.traces} (agent + workflow trace pairs)")
+    print(f"{'sink':<20}{'submit us/pair':>16}{'pairs/s':>10}{'files':>8}")
+
+    for label, factory in SINKS:
+        base_dir = tempfile.mkdtemp(prefix="trace-bench-")
+        sink = factory(base_dir)
+        try:
+            start = time.perf_counter()
+            for agent_id, agent, workflow_id, workflow in pairs:
+                sink.write_agent_trace(agent_id, agent)
+                sink.write_workflow_trace(workflow_id, workflow)
+            submitted = time.perf_counter() - start
+
+            sink.close()
+            total = time.perf_counter() - start
+
+            print(
+                f"{label:<20}{submitted / len(pairs) * 1e6:>16.1f}"
+                f"{len(pairs) / total:>10,.0f}{_count_files(base_dir):>8}"
+            )
+        finally:
+            shutil.rmtree(base_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Async agent contract.
+
+Agents that wait on I/O (LLM calls, HTTP, databases) implement
+
+    async def arun(self, context: dict) -> dict
+
+so one event loop can keep thousands of executions in flight.
+Existing synchronous agents are wrapped with SyncAgentAdapter, which
+runs `run()` in a worker thread and never blocks the loop.
+"""
+
+import asyncio
+import contextvars
+import inspect
+from concurrent.futures import Executor
+from typing import Any, Dict, Optional, Protocol, runtime_checkable
+
+
+@runtime_checkable
+class AsyncAgent(Protocol):
+    async def arun(self, context: Dict[str, Any]) -> Dict[str, Any]: ...
+
+
+class SyncAgentAdapter:
+    """
+    Async view of a synchronous agent.
+    Declared attributes (name, reads, writes, ...) pass through.
+    """
+
+    def __init__(self, agent: Any, executor: Optional[Executor] = None):
+        self.agent = agent
+        # None = the event loop's default thread pool
+        self.executor = executor
+
+    def __getattr__(self, item: str) -> Any:
+        return getattr(self.agent, item)
+
+    async def arun(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        # Carry context variables (e.g. the active deadline) into the thread
+        call = contextvars.copy_context().run
+        return await loop.run_in_executor(self.executor, call, self.agent.run, context)
+
+
+def as_async(agent: Any, executor: Optional[Executor] = None) -> AsyncAgent:
+    """
+    The agent itself if it has a native `async def arun`, else an adapter.
+    """
+    if inspect.iscoroutinefunction(getattr(agent, "arun", None)):
+        return agent
+    return SyncAgentAdapter(agent, executor)
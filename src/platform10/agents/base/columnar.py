@@ -0,0 +1,262 @@
+"""
+Columnar helpers for SignalAgent.evaluate_batch.
+
+NumPy fast paths must be output-identical to evaluate(). Inputs whose
+Python semantics NumPy would not reproduce (numeric strings, None
+where evaluate() would raise, arbitrary objects) are detected up front
+and left to evaluate().
+"""
+
+from collections.abc import Sequence as SequenceABC
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+
+# bool is an int subclass; NumPy scalars come from array-backed inputs
+_REAL_TYPES = (int, float, np.integer, np.floating)
+
+
+def numeric_column(
+    values: Sequence[Any],
+    allow_none: bool = False,
+) -> Optional[np.ndarray]:
+    """
+    float64 array of `values` (None -> NaN when `allow_none`), or None
+    when any value is not a real number.
+    """
+    types = set(map(type, values))
+    if allow_none:
+        types.discard(type(None))
+
+    if not all(issubclass(t, _REAL_TYPES) for t in types):
+        return None
+
+    try:
+        return np.array(values, dtype=np.float64)
+    except OverflowError:
+        return None
+
+
+def none_mask(values: Sequence[Any]) -> np.ndarray:
+    return np.equal(np.array(values, dtype=object), None)
+
+
+def string_column(values: Sequence[Any]) -> Optional[np.ndarray]:
+    """
+    Unicode array of `values`, or None unless every value is a str.
+    """
+    if set(map(type, values)) - {str}:
+        return None
+
+    array = np.array(values, dtype=str)
+
+    # NumPy drops trailing NULs; such values are left to evaluate()
+    if np.char.str_len(array).sum() != sum(map(len, values)):
+        return None
+
+    return array
+
+
+# YYYY-MM-DD[T ]HH:MM[:SS] digit positions, in field order
+_ISO_DIGITS = [0, 1, 2, 3, 5, 6, 8, 9, 11, 12, 14, 15, 17, 18]
+_ISO_WIDTH = 19
+
+
+def iso_hours(values: Sequence[Any]) -> np.ndarray:
+    """
+    Hour of day for every value that is a canonical ISO timestamp
+    (YYYY-MM-DD, "T" or " ", HH:MM[:SS]), -1 for every other row.
+
+    Only forms datetime.fromisoformat reads exactly like this take the
+    fast path: no offsets, no fractions, no year 0, every field in
+    range and the day present in its month.
+
+    Digits are read from a code-point view rather than parsed with
+    np.datetime64: NumPy's parser accepts forms fromisoformat rejects
+    (signed, space-padded and zero years, text cut at an embedded NUL,
+    offsets), so the shape checks below would be needed anyway, and
+    parsing the str column alone takes ~0.22s per 1M rows, which left
+    the time-window batch no faster than evaluate(). The ~8x faster
+    bytes parse crashes the interpreter in NumPy 2.4 when a value is
+    rejected.
+    """
+    n = len(values)
+    hours = np.full(n, -1, dtype=np.int64)
+
+    if set(map(type, values)) == {str}:
+        rows = np.arange(n)
+        texts = values
+    else:
+        rows = np.flatnonzero(
+            np.fromiter((type(v) is str for v in values), dtype=bool, count=n)
+        )
+        texts = [values[i] for i in rows.tolist()]
+
+    if not len(texts):
+        return hours
+
+    strings = np.array(texts, dtype=str)
+    width = strings.itemsize // 4
+    if width < 16:
+        return hours
+
+    # Code points, one row per string (a view of `strings`)
+    chars = strings.view(np.uint32).reshape(len(texts), width)
+    if width < _ISO_WIDTH:
+        chars = np.pad(chars, ((0, 0), (0, _ISO_WIDTH - width)))
+
+    # Python lengths: NumPy would silently drop trailing NULs
+    lengths = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts))
+    with_seconds = lengths == 19
+
+    d = chars[:, _ISO_DIGITS].astype(np.int32) - ord("0")
+    is_digit = (d >= 0) & (d <= 9)
+
+    ok = (
+        ((lengths == 16) | with_seconds)
+        & is_digit[:, :10].all(axis=1)
+        & is_digit[:, 10]
+        & is_digit[:, 11]
+        & (chars[:, 4] == ord("-"))
+        & (chars[:, 7] == ord("-"))
+        & ((chars[:, 10] == ord("T")) | (chars[:, 10] == ord(" ")))
+        & (chars[:, 13] == ord(":"))
+        & (
+            ~with_seconds
+            | ((chars[:, 16] == ord(":")) & is_digit[:, 12] & is_digit[:, 13])
+        )
+    )
+
+    year = d[:, 0] * 1000 + d[:, 1] * 100 + d[:, 2] * 10 + d[:, 3]
+    month = d[:, 4] * 10 + d[:, 5]
+    day = d[:, 6] * 10 + d[:, 7]
+    hour = d[:, 8] * 10 + d[:, 9]
+    minute = d[:, 10] * 10 + d[:, 11]
+    second = np.where(with_seconds, d[:, 12] * 10 + d[:, 13], 0)
+
+    ok &= (year >= 1) & (month >= 1) & (month <= 12) & (day >= 1)
+    ok &= (hour <= 23) & (minute <= 59) & (second <= 59)
+
+    # Day must exist in that month (proleptic Gregorian, as datetime)
+    months = np.where(ok, (year - 1970) * 12 + month - 1, 0).astype("datetime64[M]")
+    days_in_month = (
+        (months + 1).astype("datetime64[D]") - months.astype("datetime64[D]")
+    ).astype(np.int64)
+    ok &= day <= days_in_month
+
+    hours[rows[ok]] = hour[ok]
+    return hours
+
+
+# --------------------------------
+# Results
+# --------------------------------
+
+class SignalBatch(SequenceABC):
+    """
+    Result of a columnar evaluate_batch.
+
+    Risk stays a column (`risk_codes` indexing `labels`); the per-row
+    signal dicts, with evaluate()'s keys and key order, are only built
+    when rows are read. `overrides` maps row index -> signal for rows
+    that were left to evaluate().
+    """
+
+    __slots__ = (
+        "agent",
+        "signal_type",
+        "key",
+        "values",
+        "risk_codes",
+        "labels",
+        "overrides",
+        "_risks",
+    )
+
+    def __init__(
+        self,
+        agent: str,
+        signal_type: str,
+        key: str,
+        values: Sequence[Any],
+        risk_codes: np.ndarray,
+        labels: Sequence[str],
+        overrides: Optional[Dict[int, Dict[str, Any]]] = None,
+    ):
+        self.agent = agent
+        self.signal_type = signal_type
+        self.key = key
+        self.values = values
+        self.risk_codes = risk_codes
+        self.labels = tuple(labels)
+        self.overrides = overrides or {}
+        self._risks: Optional[List[Any]] = None
+
+    @property
+    def risks(self) -> List[Any]:
+        """
+        Risk of every row, without building the signal dicts.
+        """
+        if self._risks is None:
+            risks = list(map(self.labels.__getitem__, self.risk_codes.tolist()))
+            for index, signal in self.overrides.items():
+                risks[index] = signal.get("risk")
+            self._risks = risks
+        return self._risks
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("SignalBatch index out of range")
+
+        if index in self.overrides:
+            return self.overrides[index]
+
+        return {
+            "agent": self.agent,
+            "signal_type": self.signal_type,
+            self.key: self.values[index],
+            "risk": self.labels[self.risk_codes[index]],
+        }
+
+    def __iter__(self):
+        agent, signal_type, key = self.agent, self.signal_type, self.key
+
+        if not self.overrides:
+            for value, risk in zip(self.values, self.risks):
+                yield {
+                    "agent": agent,
+                    "signal_type": signal_type,
+                    key: value,
+                    "risk": risk,
+                }
+            return
+
+        for index, (value, risk) in enumerate(zip(self.values, self.risks)):
+            signal = self.overrides.get(index)
+            if signal is None:
+                signal = {
+                    "agent": agent,
+                    "signal_type": signal_type,
+                    key: value,
+                    "risk": risk,
+                }
+            yield signal
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, tuple, SignalBatch)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"SignalBatch(agent={self.agent!r}, rows={len(self)})"
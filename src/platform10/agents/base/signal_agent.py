@@ -6,8 +6,9 @@ Agents operate on execution context, not raw dict chaining.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Sequence
 
+from platform10.contracts.case_batch import CaseBatch
 from platform10.contracts.fraud_case import FraudCase
 
 
@@ -25,6 +26,10 @@ class SignalAgent(ABC):
 
     name: str = "base-signal-agent"
 
+    # Context keys touched by run() (see runtime/dag.py)
+    reads = ("case",)
+    appends = ("signals",)
+
     def run(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Standard execution entry point expected by runtime engine.
@@ -56,9 +61,26 @@ class SignalAgent(ABC):
 
         return input_data
 
+    async def arun(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Async entry point. evaluate() is pure, in-memory logic, so it
+        runs inline on the event loop rather than in a worker thread.
+        """
+        return self.run(input_data)
+
     @abstractmethod
     def evaluate(self, case: FraudCase) -> Dict[str, Any]:
         """
         Deterministic business logic.
         """
-        pass
\ No newline at end of file
+        pass
+
+    def evaluate_batch(self, batch: CaseBatch) -> Sequence[Dict[str, Any]]:
+        """
+        evaluate() for every case in `batch`, in order.
+
+        Agents override this with a columnar implementation (returning a
+        columnar.SignalBatch); rows must be identical to calling
+        evaluate() row by row.
+        """
+        return [self.evaluate(batch.case(i)) for i in range(len(batch))]
\ No newline at end of file
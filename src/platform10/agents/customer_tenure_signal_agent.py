@@ -1,6 +1,10 @@
-from typing import Dict, Any
+from typing import Dict, Any, Sequence
 
+import numpy as np
+
+from platform10.agents.base.columnar import SignalBatch, none_mask, numeric_column
 from platform10.agents.base.signal_agent import SignalAgent
+from platform10.contracts.case_batch import CaseBatch
 from platform10.contracts.fraud_case import FraudCase
 
 
@@ -37,3 +41,23 @@ class CustomerTenureSignalAgent(SignalAgent):
             "risk": risk,
         }
 
+    def evaluate_batch(self, batch: CaseBatch) -> Sequence[Dict[str, Any]]:
+        tenures = batch.context_column("customer_tenure_days")
+
+        days = numeric_column(tenures, allow_none=True)
+        if days is None:
+            return super().evaluate_batch(batch)
+
+        # Missing tenure is HIGH; a genuine NaN compares False -> LOW
+        high = days < self.MIN_SAFE_TENURE_DAYS
+        if None in tenures:
+            high |= none_mask(tenures)
+
+        return SignalBatch(
+            self.name,
+            self.signal_type,
+            "customer_tenure_days",
+            tenures,
+            high.view(np.int8),
+            ("LOW", "HIGH"),
+        )
@@ -2,9 +2,13 @@
 Location / geography-based fraud signal agent.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Sequence
 
+import numpy as np
+
+from platform10.agents.base.columnar import SignalBatch, string_column
 from platform10.agents.base.signal_agent import SignalAgent
+from platform10.contracts.case_batch import CaseBatch
 from platform10.contracts.fraud_case import FraudCase
 
 
@@ -21,6 +25,7 @@ class LocationSignalAgent(SignalAgent):
     """
 
     name = "location-signal-agent"
+    signal_type = "geo_risk"
 
     def evaluate(self, case: FraudCase) -> Dict[str, Any]:
         transaction = case.transaction
@@ -35,7 +40,37 @@ class LocationSignalAgent(SignalAgent):
 
         return {
             "agent": self.name,
-            "signal_type": "geo_risk",
+            "signal_type": self.signal_type,
             "country": country,
             "risk": risk,
         }
+
+    def evaluate_batch(self, batch: CaseBatch) -> Sequence[Dict[str, Any]]:
+        countries = batch.column("country")
+
+        # Missing / None behaves like "" (falsy -> UNKNOWN)
+        normalized = countries
+        if None in countries:
+            normalized = ["" if c is None else c for c in countries]
+
+        values = string_column(normalized)
+        if values is None:
+            return super().evaluate_batch(batch)
+
+        # Codes into the distinct countries; membership is decided once
+        # per distinct value, then gathered back to rows
+        distinct, codes = np.unique(values, return_inverse=True)
+        distinct_risk = np.select(
+            [distinct == "", np.isin(distinct, sorted(HIGH_RISK_COUNTRIES))],
+            [2, 1],
+            default=0,
+        )
+
+        return SignalBatch(
+            self.name,
+            self.signal_type,
+            "country",
+            countries,
+            distinct_risk[codes],
+            ("LOW", "HIGH", "UNKNOWN"),
+        )
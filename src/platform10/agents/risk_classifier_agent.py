@@ -11,6 +11,10 @@ from typing import Dict, Any
 class RiskClassifierAgent:
     name = "risk-classifier-agent"
 
+    # Context keys touched by run() (see runtime/dag.py)
+    reads = ("signals",)
+    writes = ("risk", "risk_summary")
+
     def run(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Reads accumulated signals and assigns overall risk.
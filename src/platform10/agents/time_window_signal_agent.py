@@ -1,7 +1,11 @@
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Sequence
 
+import numpy as np
+
+from platform10.agents.base.columnar import SignalBatch, iso_hours
 from platform10.agents.base.signal_agent import SignalAgent
+from platform10.contracts.case_batch import CaseBatch
 from platform10.contracts.fraud_case import FraudCase
 
 
@@ -45,3 +49,35 @@ class TimeWindowSignalAgent(SignalAgent):
             "risk": risk,
         }
 
+    def evaluate_batch(self, batch: CaseBatch) -> Sequence[Dict[str, Any]]:
+        """
+        Canonical ISO timestamps are parsed column-wise in one pass.
+        Missing timestamps use the current hour (read once per batch);
+        anything else goes through evaluate().
+        """
+        timestamps = batch.context_column("timestamp")
+        hours = iso_hours(timestamps)
+
+        fallback = []
+        now_hour = None
+
+        for i in (hours < 0).nonzero()[0].tolist():
+            ts = timestamps[i]
+            if ts is None or (type(ts) is str and not ts):
+                if now_hour is None:
+                    now_hour = datetime.utcnow().hour
+                hours[i] = now_hour
+            else:
+                fallback.append(i)
+
+        high = (self.HIGH_RISK_START_HOUR <= hours) & (hours < self.HIGH_RISK_END_HOUR)
+
+        return SignalBatch(
+            self.name,
+            self.signal_type,
+            "hour",
+            hours.tolist(),
+            high.view(np.int8),
+            ("LOW", "HIGH"),
+            overrides={i: self.evaluate(batch.case(i)) for i in fallback},
+        )
@@ -1,6 +1,10 @@
-from typing import Dict, Any
+from typing import Dict, Any, Sequence
 
+import numpy as np
+
+from platform10.agents.base.columnar import SignalBatch, numeric_column
 from platform10.agents.base.signal_agent import SignalAgent
+from platform10.contracts.case_batch import CaseBatch
 from platform10.contracts.fraud_case import FraudCase
 
 
@@ -36,3 +40,21 @@ class TimeWindowVelocitySignalAgent(SignalAgent):
             "risk": risk,
         }
 
+    def evaluate_batch(self, batch: CaseBatch) -> Sequence[Dict[str, Any]]:
+        tx_counts = batch.context_column("tx_count_last_10_min")
+
+        # None -> NaN, which compares False exactly like the LOW branch
+        counts = numeric_column(tx_counts, allow_none=True)
+        if counts is None:
+            return super().evaluate_batch(batch)
+
+        high = counts >= self.HIGH_RISK_TX_COUNT
+
+        return SignalBatch(
+            self.name,
+            self.signal_type,
+            "tx_count_last_10_min",
+            tx_counts,
+            high.view(np.int8),
+            ("LOW", "HIGH"),
+        )
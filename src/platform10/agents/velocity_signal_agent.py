@@ -2,9 +2,13 @@
 Velocity-based fraud signal agent.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Sequence
 
+import numpy as np
+
+from platform10.agents.base.columnar import SignalBatch, numeric_column
 from platform10.agents.base.signal_agent import SignalAgent
+from platform10.contracts.case_batch import CaseBatch
 from platform10.contracts.fraud_case import FraudCase
 
 
@@ -14,21 +18,47 @@ class VelocitySignalAgent(SignalAgent):
     """
 
     name = "velocity-signal-agent"
+    signal_type = "velocity_risk"
+
+    HIGH_RISK_TX_COUNT = 50
+    MEDIUM_RISK_TX_COUNT = 20
+
+    RISK_LABELS = ("LOW", "MEDIUM", "HIGH")
 
     def evaluate(self, case: FraudCase) -> Dict[str, Any]:
         transaction = case.transaction
         tx_count = transaction.get("tx_count", 0)
 
-        if tx_count >= 50:
+        return self._signal(tx_count)
+
+    def evaluate_batch(self, batch: CaseBatch) -> Sequence[Dict[str, Any]]:
+        tx_counts = batch.column("tx_count", 0)
+        counts = numeric_column(tx_counts)
+
+        if counts is None:
+            return [self._signal(tx_count) for tx_count in tx_counts]
+
+        codes = np.select(
+            [counts >= self.HIGH_RISK_TX_COUNT, counts >= self.MEDIUM_RISK_TX_COUNT],
+            [2, 1],
+            default=0,
+        )
+
+        return SignalBatch(
+            self.name, self.signal_type, "tx_count", tx_counts, codes, self.RISK_LABELS
+        )
+
+    def _signal(self, tx_count) -> Dict[str, Any]:
+        if tx_count >= self.HIGH_RISK_TX_COUNT:
             risk = "HIGH"
-        elif tx_count >= 20:
+        elif tx_count >= self.MEDIUM_RISK_TX_COUNT:
             risk = "MEDIUM"
         else:
             risk = "LOW"
 
         return {
             "agent": self.name,
-            "signal_type": "velocity_risk",
+            "signal_type": self.signal_type,
             "tx_count": tx_count,
             "risk": risk,
         }
@@ -2,30 +2,42 @@
 Platform10 CLI
 
 Commands:
-    platform10 verify --trace-id <id>
-    platform10 export --trace-id <id>
+    platform10 verify [--trace-id <id>] [--backend files|ledger]
+                      [--full] [--workers N]
+    platform10 export --trace-id <id> [--backend files|ledger]
 """
 
 import argparse
 import sys
 
-from platform10.governance.replay.regulator_replay import RegulatorReplay
+from platform10.governance.replay.regulator_replay import (
+    REPLAY_BACKENDS,
+    RegulatorReplay,
+)
 from platform10.governance.replay.pdf_exporter import ReplayPDFExporter
 
 
-def verify_command(trace_id: str):
-    r = RegulatorReplay()
+def verify_command(
+    trace_id: str | None,
+    backend: str | None = None,
+    full: bool = False,
+    workers: int = 1,
+):
+    r = RegulatorReplay(backend=backend)
 
     try:
-        integrity = r.verify_integrity(trace_id)
-        signature = r.verify_signature(trace_id)
-        chain = r.verify_chain()
+        # Without a trace id only the chain is verified
+        integrity = r.verify_integrity(trace_id) if trace_id else True
+        signature = r.verify_signature(trace_id) if trace_id else True
+        chain = r.verify_chain(full=full, workers=workers)
 
         print("\n=== Platform10 Verification Report ===")
-        print(f"Trace ID      : {trace_id}")
-        print(f"Integrity     : {'OK' if integrity else 'FAILED'}")
-        print(f"Signature     : {'OK' if signature else 'FAILED'}")
+        if trace_id:
+            print(f"Trace ID      : {trace_id}")
+            print(f"Integrity     : {'OK' if integrity else 'FAILED'}")
+            print(f"Signature     : {'OK' if signature else 'FAILED'}")
         print(f"Chain Status  : {'OK' if chain else 'FAILED'}")
+        print(f"Chain Tip     : {r.chain_tip()['sequence']}")
 
         if integrity and signature and chain:
             print("\nStatus: VERIFICATION SUCCESSFUL")
@@ -37,9 +49,9 @@ def verify_command(trace_id: str):
         sys.exit(1)
 
 
-def export_command(trace_id: str):
+def export_command(trace_id: str, backend: str | None = None):
     try:
-        exporter = ReplayPDFExporter()
+        exporter = ReplayPDFExporter(RegulatorReplay(backend=backend))
         path = exporter.export(trace_id)
         print(f"\nCompliance PDF generated:")
         print(path)
@@ -54,18 +66,28 @@ def main():
 
     # verify
     verify_parser = subparsers.add_parser("verify")
-    verify_parser.add_argument("--trace-id", required=True)
+    verify_parser.add_argument("--trace-id")
+    verify_parser.add_argument("--backend", choices=REPLAY_BACKENDS)
+    verify_parser.add_argument(
+        "--full", action="store_true",
+        help="re-verify from GENESIS instead of the last checkpoint",
+    )
+    verify_parser.add_argument(
+        "--workers", type=int, default=1,
+        help="processes used to re-hash records",
+    )
 
     # export
     export_parser = subparsers.add_parser("export")
     export_parser.add_argument("--trace-id", required=True)
+    export_parser.add_argument("--backend", choices=REPLAY_BACKENDS)
 
     args = parser.parse_args()
 
     if args.command == "verify":
-        verify_command(args.trace_id)
+        verify_command(args.trace_id, args.backend, args.full, args.workers)
     elif args.command == "export":
-        export_command(args.trace_id)
+        export_command(args.trace_id, args.backend)
     else:
         parser.print_help()
 
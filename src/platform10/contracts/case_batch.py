@@ -0,0 +1,77 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Sequence, Tuple
+
+from platform10.contracts.fraud_case import FraudCase
+
+
+_MISSING = object()
+
+
+@dataclass
+class CaseBatch:
+    """
+    Columnar view over many fraud cases, used by
+    SignalAgent.evaluate_batch.
+
+    Rows keep the FraudCase shape (case_id, transaction, context);
+    `column(key)` / `context_column(key)` return one transaction /
+    context field for every row, built once and cached.
+    """
+    case_ids: List[str]
+    transactions: List[Dict[str, Any]]
+    contexts: List[Dict[str, Any]] = field(default_factory=list)
+
+    _columns: Dict[Tuple[str, str], Tuple[List[Any], bool]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        if len(self.case_ids) != len(self.transactions):
+            raise ValueError("case_ids and transactions must have the same length")
+        if not self.contexts:
+            self.contexts = [{} for _ in self.transactions]
+
+    def __len__(self) -> int:
+        return len(self.case_ids)
+
+    @classmethod
+    def from_cases(cls, cases: Sequence[FraudCase]) -> "CaseBatch":
+        return cls(
+            case_ids=[case.case_id for case in cases],
+            transactions=[case.transaction for case in cases],
+            contexts=[case.context for case in cases],
+        )
+
+    def column(self, key: str, default: Any = None) -> List[Any]:
+        """
+        transaction[key] for every row (`default` where missing).
+        """
+        return self._column("transaction", self.transactions, key, default)
+
+    def context_column(self, key: str, default: Any = None) -> List[Any]:
+        """
+        context[key] for every row (`default` where missing).
+        """
+        return self._column("context", self.contexts, key, default)
+
+    def _column(self, source: str, rows, key: str, default: Any) -> List[Any]:
+        # Cached by name only, so defaults need not be hashable; rows
+        # missing the key are marked and get `default` per call
+        cached = self._columns.get((source, key))
+        if cached is None:
+            values = [row.get(key, _MISSING) for row in rows]
+            cached = self._columns[(source, key)] = (
+                values,
+                any(value is _MISSING for value in values),
+            )
+        values, has_missing = cached
+        if not has_missing:
+            return values
+        return [default if value is _MISSING else value for value in values]
+
+    def case(self, index: int) -> FraudCase:
+        return FraudCase(
+            case_id=self.case_ids[index],
+            transaction=self.transactions[index],
+            context=self.contexts[index],
+        )
@@ -0,0 +1,330 @@
+"""
+Compact Binary Codec
+--------------------
+Canonical MessagePack encoding (stdlib only) for audit events and
+trace records.
+
+Canonical form, so equal values always give equal bytes (and equal
+hashes) regardless of dict insertion order:
+- integers in their shortest MessagePack form
+- every float as float64, NaN as the single quiet NaN 0x7ff8000000000000
+- map entries ordered by the bytes of their encoded keys
+- tuples encode as arrays (and decode as lists)
+
+Records (see `pack_record`) are MessagePack arrays
+[tag, version, field, ...] with fields in a fixed schema order, so
+no field names are stored. Any MessagePack reader can decode them.
+"""
+
+import hashlib
+import struct
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+
+class CodecError(ValueError):
+    pass
+
+
+_CANONICAL_NAN = b"\xcb\x7f\xf8\x00\x00\x00\x00\x00\x00"
+
+_pack_float = struct.Struct(">d").pack
+_pack_u16 = struct.Struct(">H").pack
+_pack_u32 = struct.Struct(">I").pack
+_pack_u64 = struct.Struct(">Q").pack
+_pack_i8 = struct.Struct(">b").pack
+_pack_i16 = struct.Struct(">h").pack
+_pack_i32 = struct.Struct(">i").pack
+_pack_i64 = struct.Struct(">q").pack
+
+
+# --------------------------------
+# Encoding
+# --------------------------------
+
+def packb(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """
+    Canonical MessagePack bytes for `obj`.
+
+    Supports None, bool, int (64-bit range), float, str, bytes, list,
+    tuple and dict. Other values go through `default` (whose result
+    is encoded instead) or raise TypeError.
+    """
+    out = bytearray()
+    _encode(obj, out, default)
+    return bytes(out)
+
+
+def _encode(obj: Any, out: bytearray, default) -> None:
+    t = type(obj)
+
+    if t is str:
+        data = obj.encode("utf-8")
+        n = len(data)
+        if n < 32:
+            out.append(0xA0 | n)
+        elif n < 0x100:
+            out += b"\xd9" + bytes((n,))
+        elif n < 0x10000:
+            out += b"\xda" + _pack_u16(n)
+        else:
+            out += b"\xdb" + _pack_u32(n)
+        out += data
+
+    elif obj is None:
+        out.append(0xC0)
+
+    elif t is bool:
+        out.append(0xC3 if obj else 0xC2)
+
+    elif t is int:
+        _encode_int(obj, out)
+
+    elif t is float:
+        if obj != obj:
+            out += _CANONICAL_NAN
+        else:
+            out += b"\xcb" + _pack_float(obj)
+
+    elif t is dict:
+        n = len(obj)
+        if n < 16:
+            out.append(0x80 | n)
+        elif n < 0x10000:
+            out += b"\xde" + _pack_u16(n)
+        else:
+            out += b"\xdf" + _pack_u32(n)
+
+        entries = []
+        for key, value in obj.items():
+            key_bytes = bytearray()
+            _encode(key, key_bytes, default)
+            entries.append((bytes(key_bytes), value))
+        entries.sort(key=_first)
+
+        previous = None
+        for key_bytes, value in entries:
+            if key_bytes == previous:
+                raise CodecError("Duplicate map key after encoding")
+            previous = key_bytes
+            out += key_bytes
+            _encode(value, out, default)
+
+    elif t is list or t is tuple:
+        n = len(obj)
+        if n < 16:
+            out.append(0x90 | n)
+        elif n < 0x10000:
+            out += b"\xdc" + _pack_u16(n)
+        else:
+            out += b"\xdd" + _pack_u32(n)
+        for item in obj:
+            _encode(item, out, default)
+
+    elif t is bytes or t is bytearray:
+        n = len(obj)
+        if n < 0x100:
+            out += b"\xc4" + bytes((n,))
+        elif n < 0x10000:
+            out += b"\xc5" + _pack_u16(n)
+        else:
+            out += b"\xc6" + _pack_u32(n)
+        out += obj
+
+    elif isinstance(obj, (str, int, float, dict, list, tuple, bytes)):
+        # Subclasses (IntEnum, OrderedDict, ...) encode as their base
+        for base in (bool, int, float, str, bytes, dict, list, tuple):
+            if isinstance(obj, base):
+                _encode(base(obj), out, default)
+                return
+
+    elif default is not None:
+        _encode(default(obj), out, None)
+
+    else:
+        raise TypeError(f"Cannot encode {t.__name__} values")
+
+
+def _first(entry: Tuple[bytes, Any]) -> bytes:
+    return entry[0]
+
+
+def _encode_int(n: int, out: bytearray) -> None:
+    if n >= 0:
+        if n < 0x80:
+            out.append(n)
+        elif n < 0x100:
+            out += b"\xcc" + bytes((n,))
+        elif n < 0x10000:
+            out += b"\xcd" + _pack_u16(n)
+        elif n < 0x100000000:
+            out += b"\xce" + _pack_u32(n)
+        elif n < 0x10000000000000000:
+            out += b"\xcf" + _pack_u64(n)
+        else:
+            raise OverflowError("int too large for MessagePack")
+    elif n >= -32:
+        out.append(n & 0xFF)
+    elif n >= -0x80:
+        out += b"\xd0" + _pack_i8(n)
+    elif n >= -0x8000:
+        out += b"\xd1" + _pack_i16(n)
+    elif n >= -0x80000000:
+        out += b"\xd2" + _pack_i32(n)
+    elif n >= -0x8000000000000000:
+        out += b"\xd3" + _pack_i64(n)
+    else:
+        raise OverflowError("int too large for MessagePack")
+
+
+# --------------------------------
+# Decoding
+# --------------------------------
+
+_unpack_from = struct.unpack_from
+
+# Fixed-size scalars: tag -> (struct format, size)
+_SCALARS = {
+    0xCA: (">f", 4),
+    0xCB: (">d", 8),
+    0xCC: (">B", 1),
+    0xCD: (">H", 2),
+    0xCE: (">I", 4),
+    0xCF: (">Q", 8),
+    0xD0: (">b", 1),
+    0xD1: (">h", 2),
+    0xD2: (">i", 4),
+    0xD3: (">q", 8),
+}
+
+# Variable-length headers: tag -> (kind, length format, length size)
+_SIZED = {
+    0xD9: ("str", ">B", 1),
+    0xDA: ("str", ">H", 2),
+    0xDB: ("str", ">I", 4),
+    0xC4: ("bin", ">B", 1),
+    0xC5: ("bin", ">H", 2),
+    0xC6: ("bin", ">I", 4),
+    0xDC: ("array", ">H", 2),
+    0xDD: ("array", ">I", 4),
+    0xDE: ("map", ">H", 2),
+    0xDF: ("map", ">I", 4),
+}
+
+
+def unpackb(data: bytes) -> Any:
+    """
+    Decode one MessagePack value; trailing bytes are an error.
+    """
+    data = bytes(data)
+    try:
+        value, offset = _decode(data, 0)
+    except (IndexError, struct.error):
+        raise CodecError("Truncated MessagePack data") from None
+
+    if offset != len(data):
+        raise CodecError(f"{len(data) - offset} trailing bytes")
+    return value
+
+
+def _decode(data: bytes, offset: int) -> Tuple[Any, int]:
+    tag = data[offset]
+    offset += 1
+
+    # Most frequent first: short strings, small ints, small containers
+    if 0xA0 <= tag <= 0xBF:
+        return _text(data, offset, offset + (tag & 0x1F))
+    if tag <= 0x7F:
+        return tag, offset
+    if 0x90 <= tag <= 0x9F:
+        return _array(data, offset, tag & 0x0F)
+    if 0x80 <= tag <= 0x8F:
+        return _map(data, offset, tag & 0x0F)
+    if tag == 0xC0:
+        return None, offset
+    if tag == 0xCB:
+        return _unpack_from(">d", data, offset)[0], offset + 8
+    if tag >= 0xE0:
+        return tag - 0x100, offset
+    if tag == 0xC2:
+        return False, offset
+    if tag == 0xC3:
+        return True, offset
+
+    scalar = _SCALARS.get(tag)
+    if scalar is not None:
+        fmt, size = scalar
+        return _unpack_from(fmt, data, offset)[0], offset + size
+
+    sized = _SIZED.get(tag)
+    if sized is None:
+        raise CodecError(f"Unsupported MessagePack type 0x{tag:02x}")
+
+    kind, fmt, size = sized
+    n = _unpack_from(fmt, data, offset)[0]
+    offset += size
+
+    if kind == "str":
+        return _text(data, offset, offset + n)
+    if kind == "bin":
+        if offset + n > len(data):
+            raise IndexError
+        return data[offset:offset + n], offset + n
+    if kind == "array":
+        return _array(data, offset, n)
+    return _map(data, offset, n)
+
+
+def _text(data: bytes, start: int, end: int) -> Tuple[str, int]:
+    if end > len(data):
+        raise IndexError
+    return data[start:end].decode("utf-8"), end
+
+
+def _array(data: bytes, offset: int, n: int) -> Tuple[List[Any], int]:
+    items = []
+    for _ in range(n):
+        item, offset = _decode(data, offset)
+        items.append(item)
+    return items, offset
+
+
+def _map(data: bytes, offset: int, n: int) -> Tuple[dict, int]:
+    result = {}
+    for _ in range(n):
+        key, offset = _decode(data, offset)
+        if isinstance(key, list):
+            key = tuple(key)
+        result[key], offset = _decode(data, offset)
+    return result, offset
+
+
+# --------------------------------
+# Records
+# --------------------------------
+
+def pack_record(tag: str, version: int, fields: Sequence[Any], default=None) -> bytes:
+    """
+    Encode a schema'd record: [tag, version, *fields].
+    """
+    return packb([tag, version, *fields], default)
+
+
+def unpack_record(data: bytes, tag: str, versions: Sequence[int]) -> Tuple[int, List[Any]]:
+    """
+    Decode a record written by pack_record; returns (version, fields).
+    """
+    record = unpackb(data)
+
+    if not isinstance(record, list) or len(record) < 2 or record[0] != tag:
+        raise CodecError(f"Not a {tag} record")
+    if record[1] not in versions:
+        raise CodecError(f"Unsupported {tag} record version {record[1]}")
+
+    return record[1], record[2:]
+
+
+def record_hash(data: bytes) -> str:
+    """
+    SHA256 (hex) of canonical record bytes.
+    """
+    return hashlib.sha256(data).hexdigest()
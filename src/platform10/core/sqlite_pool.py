@@ -0,0 +1,83 @@
+"""
+Per-Thread SQLite Connections
+-----------------------------
+sqlite3 connections must not be shared between threads, and opening
+one per operation costs more than most of the statements run on it.
+ThreadConnectionPool keeps one long-lived connection per thread,
+opened on first use, and closes all of them at once.
+
+Used by MemoryManager, SQLiteAuditLog, TraceIndex and
+SegmentTraceStore.
+"""
+
+import sqlite3
+import threading
+from typing import Any, Callable, List
+
+
+def connect(
+    db_path: str,
+    synchronous: str = "NORMAL",
+    journal_mode: str = "WAL",
+    busy_timeout_ms: int = 5000,
+    **kwargs: Any,
+) -> sqlite3.Connection:
+    """
+    Open a connection for a ThreadConnectionPool: journal mode and
+    synchronous level applied, usable by close() from another thread.
+    Extra keyword arguments go to sqlite3.connect.
+    """
+    conn = sqlite3.connect(
+        db_path,
+        timeout=busy_timeout_ms / 1000.0,
+        # Each connection is only used by its owning thread;
+        # this just lets close() release all of them.
+        check_same_thread=False,
+        **kwargs,
+    )
+    conn.execute(f"PRAGMA journal_mode={journal_mode}")
+    conn.execute(f"PRAGMA synchronous={synchronous}")
+    return conn
+
+
+class ThreadConnectionPool:
+    """
+    One connection per thread from `connect`, opened on first get().
+    """
+
+    def __init__(self, connect: Callable[[], sqlite3.Connection]):
+        self._connect = connect
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+    def get(self) -> sqlite3.Connection:
+        """
+        Returns the calling thread's connection.
+        """
+        conn = getattr(self._local, "conn", None)
+
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+
+            with self._lock:
+                self._connections.append(conn)
+
+        return conn
+
+    def close(self) -> None:
+        """
+        Close every connection (all threads). The next get() on any
+        thread opens a new one.
+        """
+        with self._lock:
+            connections = self._connections
+            self._connections = []
+            self._local = threading.local()
+
+        for conn in connections:
+            conn.close()
+
+    def __len__(self) -> int:
+        return len(self._connections)
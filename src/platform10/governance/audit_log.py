@@ -4,19 +4,37 @@ Audit Log
 Purpose:
 - Persist immutable events for every agentic decision
 - Serve as the single source of truth for regulator-mode replay
+
+Backends:
+- InMemoryAuditLog   indexed by trace_id and (component, action)
+- SQLiteAuditLog     durable, same indexes as SQLite indexes
 """
 
+from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass, field, asdict
-from typing import Any, Dict, List, Optional
-from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+from datetime import datetime, timedelta, timezone
+import bisect
+import heapq
+import json
+import sqlite3
+import threading
 import uuid
 
+from platform10.core.codec import pack_record, unpack_record
+from platform10.core.sqlite_pool import ThreadConnectionPool, connect
+
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
 
 # -----------------------------
 # Audit Event Model
 # -----------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AuditEvent:
     """
     Immutable audit event.
@@ -30,23 +48,71 @@ class AuditEvent:
     output_data: Dict[str, Any]
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    # ---------- binary encoding (see core/codec.py) ----------
+
+    RECORD_TAG = "AuditEvent"
+    RECORD_VERSION = 1
+
+    def to_bytes(self) -> bytes:
+        """
+        Canonical binary record. The timestamp is stored as UTC
+        microseconds (aware datetimes are converted); payload values
+        the codec cannot represent are stored as their str().
+        """
+        timestamp = self.timestamp
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+
+        return pack_record(
+            self.RECORD_TAG,
+            self.RECORD_VERSION,
+            (
+                self.event_id,
+                self.trace_id,
+                (timestamp - _EPOCH) // _MICROSECOND,
+                self.component,
+                self.action,
+                self.input_data,
+                self.output_data,
+                self.metadata,
+            ),
+            default=str,
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "AuditEvent":
+        _, fields = unpack_record(data, cls.RECORD_TAG, (cls.RECORD_VERSION,))
+        (event_id, trace_id, micros, component, action,
+         input_data, output_data, metadata) = fields
+
+        return cls(
+            event_id=event_id,
+            trace_id=trace_id,
+            timestamp=_EPOCH + micros * _MICROSECOND,
+            component=component,
+            action=action,
+            input_data=input_data,
+            output_data=output_data,
+            metadata=metadata,
+        )
+
 
 # -----------------------------
-# Audit Log Backend (In-Memory v1)
+# Audit Log Backends
 # -----------------------------
 
-class InMemoryAuditLog:
+class AuditLogBackend(ABC):
     """
-    Simple in-memory audit log backend.
+    Storage for audit events.
 
-    NOTE:
-    - This will later be replaced by DB / file / S3
-    - Interface must remain stable
+    Interface (stable across backends):
+    - record_event(...)            append one event
+    - fetch_events(trace_id)       one trace, ordered by time
+    - fetch_by_action(component, action=None)
+                                   one component (/ action), by time
+    - all_events()                 every retained event, in record order
     """
 
-    def __init__(self):
-        self._events: List[AuditEvent] = []
-
     def record_event(
         self,
         trace_id: str,
@@ -66,30 +132,366 @@ class InMemoryAuditLog:
             output_data=output_data,
             metadata=metadata or {},
         )
-        self._events.append(event)
+        self.append(event)
 
+    @abstractmethod
+    def append(self, event: AuditEvent) -> None:
+        ...
+
+    def append_many(self, events: List[AuditEvent]) -> None:
+        for event in events:
+            self.append(event)
+
+    @abstractmethod
     def fetch_events(self, trace_id: str) -> List[AuditEvent]:
         """
         Fetch all events for a trace_id, ordered by time.
         """
-        return sorted(
-            [e for e in self._events if e.trace_id == trace_id],
-            key=lambda e: e.timestamp,
+
+    @abstractmethod
+    def fetch_by_action(
+        self,
+        component: str,
+        action: Optional[str] = None,
+    ) -> List[AuditEvent]:
+        """
+        Events of one component (and action), ordered by time.
+        """
+
+    @abstractmethod
+    def all_events(self) -> List[AuditEvent]:
+        ...
+
+
+def _by_time(event: AuditEvent) -> datetime:
+    return event.timestamp
+
+
+class InMemoryAuditLog(AuditLogBackend):
+    """
+    In-memory audit log backend.
+
+    Events are kept in record order, plus per-trace_id and
+    per-(component, action) lists kept ordered by timestamp, so a
+    lookup costs the size of its answer rather than of the whole log.
+
+    `max_events` bounds memory in long-running processes: beyond it
+    the oldest events are dropped (None = unbounded).
+    """
+
+    def __init__(self, max_events: Optional[int] = None):
+        self.max_events = max_events
+
+        self._events: Deque[AuditEvent] = deque()
+        self._by_trace: Dict[str, List[AuditEvent]] = {}
+        self._by_action: Dict[Tuple[str, str], List[AuditEvent]] = {}
+        self._lock = threading.Lock()
+
+    def append(self, event: AuditEvent) -> None:
+        with self._lock:
+            self._events.append(event)
+            _insert(self._by_trace.setdefault(event.trace_id, []), event)
+            _insert(
+                self._by_action.setdefault((event.component, event.action), []),
+                event,
+            )
+
+            if self.max_events is not None:
+                while len(self._events) > self.max_events:
+                    self._evict(self._events.popleft())
+
+    def _evict(self, event: AuditEvent) -> None:
+        _remove(self._by_trace, event.trace_id, event)
+        _remove(self._by_action, (event.component, event.action), event)
+
+    def fetch_events(self, trace_id: str) -> List[AuditEvent]:
+        with self._lock:
+            return list(self._by_trace.get(trace_id, ()))
+
+    def fetch_by_action(
+        self,
+        component: str,
+        action: Optional[str] = None,
+    ) -> List[AuditEvent]:
+        with self._lock:
+            if action is not None:
+                return list(self._by_action.get((component, action), ()))
+
+            # Each list is time-ordered; merge keeps the result so
+            return list(heapq.merge(
+                *(
+                    events
+                    for (c, _), events in self._by_action.items()
+                    if c == component
+                ),
+                key=_by_time,
+            ))
+
+    def all_events(self) -> List[AuditEvent]:
+        with self._lock:
+            return list(self._events)
+
+
+def _insert(events: List[AuditEvent], event: AuditEvent) -> None:
+    # Nearly always an append: events arrive in time order
+    if not events or events[-1].timestamp <= event.timestamp:
+        events.append(event)
+    else:
+        bisect.insort_right(events, event, key=_by_time)
+
+
+def _remove(index: Dict[Any, List[AuditEvent]], key: Any, event: AuditEvent) -> None:
+    events = index[key]
+    if events[0] is event:
+        del events[0]
+    else:
+        events.remove(event)
+    if not events:
+        del index[key]
+
+
+# -----------------------------
+# Audit Log Backend (SQLite)
+# -----------------------------
+
+AUDIT_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS audit_events (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        event_id TEXT NOT NULL UNIQUE,
+        trace_id TEXT NOT NULL,
+        timestamp TEXT NOT NULL,
+        component TEXT NOT NULL,
+        action TEXT NOT NULL,
+        input_data TEXT NOT NULL,
+        output_data TEXT NOT NULL,
+        metadata TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_audit_trace_timestamp
+    ON audit_events (trace_id, timestamp)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_audit_component_action
+    ON audit_events (component, action, timestamp)
+    """,
+]
+
+_EVENT_COLUMNS = (
+    "event_id, trace_id, timestamp, component, action, "
+    "input_data, output_data, metadata"
+)
+
+INSERT_EVENT_SQL = f"""
+INSERT INTO audit_events ({_EVENT_COLUMNS})
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+FETCH_BY_TRACE_SQL = f"""
+SELECT {_EVENT_COLUMNS}
+FROM audit_events
+WHERE trace_id = ?
+ORDER BY timestamp, seq
+"""
+
+FETCH_BY_COMPONENT_SQL = f"""
+SELECT {_EVENT_COLUMNS}
+FROM audit_events
+WHERE component = ?
+ORDER BY timestamp, seq
+"""
+
+FETCH_BY_ACTION_SQL = f"""
+SELECT {_EVENT_COLUMNS}
+FROM audit_events
+WHERE component = ? AND action = ?
+ORDER BY timestamp, seq
+"""
+
+FETCH_ALL_SQL = f"SELECT {_EVENT_COLUMNS} FROM audit_events ORDER BY seq"
+
+
+class SQLiteAuditLog(AuditLogBackend):
+    """
+    Durable audit log backend (SQLite).
+
+    Indexed on (trace_id, timestamp) for replay and on
+    (component, action) for compliance queries. Same connection
+    model as MemoryManager: one long-lived connection per thread,
+    WAL journal, configurable synchronous level.
+
+    input_data / output_data / metadata are stored as JSON; values
+    JSON cannot represent are stored as their str().
+    """
+
+    def __init__(
+        self,
+        db_path: str = "platform10_audit.db",
+        synchronous: str = "NORMAL",
+        busy_timeout_ms: int = 5000,
+    ):
+        self.db_path = db_path
+        self.synchronous = synchronous.upper()
+        self.busy_timeout_ms = busy_timeout_ms
+
+        self._pool = ThreadConnectionPool(
+            lambda: connect(
+                db_path,
+                synchronous=self.synchronous,
+                busy_timeout_ms=busy_timeout_ms,
+            )
         )
 
+        conn = self._connection()
+        with conn:
+            for statement in AUDIT_SCHEMA:
+                conn.execute(statement)
+
+    def _connection(self) -> sqlite3.Connection:
+        return self._pool.get()
+
+    def close(self) -> None:
+        self._pool.close()
+
+    def append(self, event: AuditEvent) -> None:
+        self.append_many([event])
+
+    def append_many(self, events: List[AuditEvent]) -> None:
+        """
+        Insert many events in one transaction.
+        """
+        conn = self._connection()
+        with conn:
+            conn.executemany(INSERT_EVENT_SQL, [event_to_row(e) for e in events])
+
+    def fetch_events(self, trace_id: str) -> List[AuditEvent]:
+        return self._query(FETCH_BY_TRACE_SQL, (trace_id,))
+
+    def fetch_by_action(
+        self,
+        component: str,
+        action: Optional[str] = None,
+    ) -> List[AuditEvent]:
+        if action is None:
+            return self._query(FETCH_BY_COMPONENT_SQL, (component,))
+        return self._query(FETCH_BY_ACTION_SQL, (component, action))
+
     def all_events(self) -> List[AuditEvent]:
-        return list(self._events)
+        return self._query(FETCH_ALL_SQL, ())
+
+    def _query(self, sql: str, params: Tuple) -> List[AuditEvent]:
+        rows = self._connection().execute(sql, params).fetchall()
+        return [event_from_row(row) for row in rows]
+
+
+def event_to_row(event: AuditEvent) -> Tuple:
+    """
+    Flat, JSON-encodable row for `event` (SQLite, spill files).
+    """
+    return (
+        event.event_id,
+        event.trace_id,
+        # Fixed width so text order is time order
+        event.timestamp.isoformat(timespec="microseconds"),
+        event.component,
+        event.action,
+        json.dumps(event.input_data, default=str),
+        json.dumps(event.output_data, default=str),
+        json.dumps(event.metadata, default=str),
+    )
+
+
+def event_from_row(row: Sequence[Any]) -> AuditEvent:
+    return AuditEvent(
+        event_id=row[0],
+        trace_id=row[1],
+        timestamp=datetime.fromisoformat(row[2]),
+        component=row[3],
+        action=row[4],
+        input_data=json.loads(row[5]),
+        output_data=json.loads(row[6]),
+        metadata=json.loads(row[7]),
+    )
 
 
 # -----------------------------
 # Global Default Audit Log
 # -----------------------------
 
-_default_audit_log = InMemoryAuditLog()
+_default_audit_log: AuditLogBackend = InMemoryAuditLog()
 
 
-def get_audit_log() -> InMemoryAuditLog:
+def get_audit_log() -> AuditLogBackend:
     """
     Accessor for the default audit log.
     """
     return _default_audit_log
+
+
+def set_audit_log(backend: AuditLogBackend) -> AuditLogBackend:
+    """
+    Install `backend` as the default audit log (e.g. a SQLiteAuditLog
+    at application startup); returns the previous one.
+    """
+    global _default_audit_log
+    previous, _default_audit_log = _default_audit_log, backend
+    return previous
+
+
+# -----------------------------
+# Runtime Executor Facade
+# -----------------------------
+
+class AuditLog:
+    """
+    Execution-event facade used by the runtime executor.
+    Events land in the audit log backend (default: the global one,
+    resolved at write time so facades built before set_audit_log
+    follow the installed backend).
+    """
+
+    COMPONENT = "executor"
+
+    def __init__(self, backend: Optional[AuditLogBackend] = None):
+        self._backend = backend
+
+    @property
+    def backend(self) -> AuditLogBackend:
+        return self._backend or get_audit_log()
+
+    @backend.setter
+    def backend(self, backend: Optional[AuditLogBackend]) -> None:
+        self._backend = backend
+
+    def record(
+        self,
+        execution_id: Optional[str],
+        event_type: str,
+        details: Dict[str, Any],
+    ) -> None:
+        self.backend.record_event(
+            trace_id=execution_id or "",
+            component=self.COMPONENT,
+            action=event_type,
+            input_data={},
+            output_data=details,
+        )
+
+
+def record_audit_log(
+    execution_id: Optional[str],
+    event_type: str,
+    details: Dict[str, Any],
+    component: str = "workflow",
+) -> None:
+    """
+    Record a workflow-level event on the default audit log.
+    """
+    get_audit_log().record_event(
+        trace_id=execution_id or "",
+        component=component,
+        action=event_type,
+        input_data={},
+        output_data=details,
+    )
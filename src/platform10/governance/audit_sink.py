@@ -0,0 +1,389 @@
+"""
+Asynchronous Audit Sink
+-----------------------
+Takes audit writes off the decision path.
+
+record_event / append only put the event into a bounded in-memory
+ring buffer; a background thread drains it and hands batches to the
+wrapped backend (append_many, one transaction for SQLite).
+
+When the buffer is full the backpressure policy decides:
+    block   the caller waits for space (nothing is lost)
+    drop    the event is discarded and counted in `dropped`
+    spill   the event is appended to a JSONL spill file and replayed
+            into the backend once the buffer has drained
+
+Spilling is sticky until the worker has taken the spill file, so
+record order is preserved under every policy. Spill files left in
+spill_dir by a process that died before replaying them are replayed
+by the next sink started on that directory, ahead of new events. A
+spill file that cannot be replayed (e.g. a torn last line) is renamed
+to *.failed, its unreplayed events count as failed and the error
+surfaces on flush().
+
+flush() returns once everything recorded before it reached the
+backend; close() flushes and stops the thread, and runs at
+interpreter exit for sinks that were never closed.
+"""
+
+import atexit
+import json
+import os
+import re
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from platform10.governance.audit_log import (
+    AuditEvent,
+    AuditLogBackend,
+    event_from_row,
+    event_to_row,
+)
+
+
+BACKPRESSURE_POLICIES = {"block", "drop", "spill"}
+
+# audit-spill-<pid>-<sink id>-<seq>.jsonl
+SPILL_FILE_PATTERN = re.compile(r"^audit-spill-(\d+)-\d+-\d+\.jsonl$")
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class AsyncAuditSink(AuditLogBackend):
+    """
+    AuditLogBackend that buffers writes for a background writer.
+
+    Reads (fetch_events, fetch_by_action, all_events) flush first,
+    then read the wrapped backend.
+    """
+
+    def __init__(
+        self,
+        backend: AuditLogBackend,
+        capacity: int = 10000,
+        batch_size: int = 500,
+        max_delay_ms: int = 50,
+        policy: str = "block",
+        spill_dir: str = "data/traces/audit",
+    ):
+        if policy not in BACKPRESSURE_POLICIES:
+            raise ValueError(f"Unsupported backpressure policy: {policy}")
+        if capacity < 1 or batch_size < 1:
+            raise ValueError("capacity and batch_size must be >= 1")
+
+        self.backend = backend
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.max_delay_ms = max_delay_ms
+        self.policy = policy
+        self.spill_dir = spill_dir
+
+        self.dropped = 0
+        self.spilled = 0
+        self.written = 0
+        self.failed = 0
+
+        self._buffer: Deque[AuditEvent] = deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._progress = threading.Condition(self._lock)
+
+        # Events accepted (buffered or spilled) / handed to the backend
+        self._submitted = 0
+        self._processed = 0
+        self._flush_requested = False
+        self._error: Optional[BaseException] = None
+
+        self._spill_file = None
+        self._spill_path: Optional[str] = None
+        self._spill_seq = 0
+        self._spill_count = 0
+
+        # (path, events) left behind by dead processes; replayed first
+        self._orphans = self._orphaned_spills()
+        self._submitted += sum(count for _, count in self._orphans)
+
+        self._closed = False
+        self._worker = threading.Thread(
+            target=self._run,
+            name="platform10-audit-sink",
+            daemon=True,
+        )
+        self._worker.start()
+        atexit.register(self.close)
+
+    # --------------------------------------------------
+    # Producer API
+    # --------------------------------------------------
+
+    def append(self, event: AuditEvent) -> None:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("AsyncAuditSink is closed")
+
+            if self._spill_file is None and len(self._buffer) < self.capacity:
+                self._push(event)
+                return
+
+            if self.policy == "drop":
+                self.dropped += 1
+                return
+
+            if self.policy == "spill":
+                self._spill(event)
+                return
+
+            while len(self._buffer) >= self.capacity and not self._closed:
+                self._not_full.wait()
+            if self._closed:
+                raise RuntimeError("AsyncAuditSink is closed")
+            self._push(event)
+
+    def _push(self, event: AuditEvent) -> None:
+        self._buffer.append(event)
+        self._submitted += 1
+        self._not_empty.notify()
+
+    def _spill(self, event: AuditEvent) -> None:
+        if self._spill_file is None:
+            os.makedirs(self.spill_dir, exist_ok=True)
+            self._spill_seq += 1
+            self._spill_path = os.path.join(
+                self.spill_dir,
+                f"audit-spill-{os.getpid()}-{id(self)}-{self._spill_seq}.jsonl",
+            )
+            self._spill_file = open(self._spill_path, "a")
+
+        self._spill_file.write(json.dumps(event_to_row(event)) + "\n")
+        self.spilled += 1
+        self._spill_count += 1
+        self._submitted += 1
+        self._not_empty.notify()
+
+    # --------------------------------------------------
+    # Lifecycle
+    # --------------------------------------------------
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            return self._submitted - self._processed
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every event recorded before this call reached the
+        backend. Returns False if the timeout expired; raises
+        RuntimeError if a batch failed to append.
+        """
+        with self._lock:
+            target = self._submitted
+            self._flush_requested = True
+            self._not_empty.notify()
+
+            done = self._progress.wait_for(
+                lambda: self._processed >= target or not self._worker.is_alive(),
+                timeout=timeout,
+            )
+
+            if self._error is not None:
+                error, self._error = self._error, None
+                raise RuntimeError("Audit sink append failed") from error
+
+        return done
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Write every buffered and spilled event, then stop the worker.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._not_empty.notify()
+            self._not_full.notify_all()
+
+        self._worker.join(timeout)
+        atexit.unregister(self.close)
+
+    def __enter__(self) -> "AsyncAuditSink":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    # --------------------------------------------------
+    # Reads
+    # --------------------------------------------------
+
+    def fetch_events(self, trace_id: str) -> List[AuditEvent]:
+        self.flush()
+        return self.backend.fetch_events(trace_id)
+
+    def fetch_by_action(
+        self,
+        component: str,
+        action: Optional[str] = None,
+    ) -> List[AuditEvent]:
+        self.flush()
+        return self.backend.fetch_by_action(component, action)
+
+    def all_events(self) -> List[AuditEvent]:
+        self.flush()
+        return self.backend.all_events()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "policy": self.policy,
+                "buffered": len(self._buffer),
+                "pending": self._submitted - self._processed,
+                "written": self.written,
+                "dropped": self.dropped,
+                "spilled": self.spilled,
+                "failed": self.failed,
+            }
+
+    # --------------------------------------------------
+    # Background Worker
+    # --------------------------------------------------
+
+    def _orphaned_spills(self) -> List[Tuple[str, int]]:
+        """
+        Spill files whose writing process is gone, oldest first.
+        """
+        if not os.path.isdir(self.spill_dir):
+            return []
+
+        orphans = []
+        for name in os.listdir(self.spill_dir):
+            match = SPILL_FILE_PATTERN.match(name)
+            if match is None:
+                continue
+
+            pid = int(match.group(1))
+            if pid == os.getpid() or _pid_alive(pid):
+                continue
+
+            path = os.path.join(self.spill_dir, name)
+            with open(path, "rb") as f:
+                count = sum(1 for line in f if line.strip())
+            orphans.append((os.path.getmtime(path), path, count))
+
+        return [(path, count) for _, path, count in sorted(orphans)]
+
+    def _run(self) -> None:
+        for path, count in self._orphans:
+            self._replay(path, count)
+        self._orphans = []
+
+        while True:
+            with self._lock:
+                while not (
+                    self._buffer
+                    or self._spill_file is not None
+                    or self._closed
+                ):
+                    # Idle: every earlier flush is already satisfied
+                    self._flush_requested = False
+                    self._not_empty.wait()
+
+                # Let a batch fill up unless a flush / close is waiting
+                deadline = time.monotonic() + self.max_delay_ms / 1000.0
+                while (
+                    len(self._buffer) < self.batch_size
+                    and not (self._flush_requested or self._closed)
+                    and self._spill_file is None
+                ):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._not_empty.wait(remaining)
+
+                batch = [
+                    self._buffer.popleft()
+                    for _ in range(min(self.batch_size, len(self._buffer)))
+                ]
+                self._not_full.notify_all()
+
+                # The spill file is taken only once the buffer ahead of
+                # it has drained; new events then buffer normally again
+                spill_path = None
+                if not self._buffer and self._spill_file is not None:
+                    self._spill_file.close()
+                    spill_path, spill_count = self._spill_path, self._spill_count
+                    self._spill_file = self._spill_path = None
+                    self._spill_count = 0
+
+                if self._closed and not (self._buffer or batch or spill_path):
+                    self._progress.notify_all()
+                    return
+
+            if batch:
+                self._write(batch)
+            if spill_path is not None:
+                self._replay(spill_path, spill_count)
+
+    def _replay(self, path: str, count: int) -> None:
+        """
+        Hand the `count` events of a spill file to the backend. On any
+        failure the rest are accounted as failed (so flush() does not
+        wait for them) and the file is kept as *.failed.
+        """
+        batch: List[AuditEvent] = []
+        replayed = 0
+
+        try:
+            with open(path) as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    batch.append(event_from_row(json.loads(line)))
+                    if len(batch) >= self.batch_size:
+                        self._write(batch)
+                        replayed += len(batch)
+                        batch = []
+
+            if batch:
+                self._write(batch)
+                replayed += len(batch)
+            os.remove(path)
+        except Exception as e:
+            remaining = max(0, count - replayed)
+            with self._lock:
+                self._processed += remaining
+                self.failed += remaining
+                self._error = e
+                self._progress.notify_all()
+
+            try:
+                os.replace(path, f"{path}.failed")
+            except OSError:
+                pass
+
+    def _write(self, batch: List[AuditEvent]) -> None:
+        error: Optional[BaseException] = None
+
+        try:
+            self.backend.append_many(batch)
+        except Exception as e:
+            error = e
+
+        with self._lock:
+            self._processed += len(batch)
+            if error is None:
+                self.written += len(batch)
+            else:
+                self.failed += len(batch)
+                self._error = error
+            self._progress.notify_all()
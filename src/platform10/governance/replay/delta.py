@@ -0,0 +1,168 @@
+"""
+Delta Encoding for Replay Steps.
+
+JSON-patch style (RFC 6902 subset) diffs between consecutive step
+snapshots, so a replay record stores each agent's change instead of
+the full context after every step.
+
+Operations:
+    {"op": "add",     "path": "/signals/2", "value": {...}}
+    {"op": "replace", "path": "/risk",      "value": "HIGH"}
+    {"op": "remove",  "path": "/tmp"}
+
+Paths are RFC 6901 JSON pointers. Lists are diffed by position:
+shared indices recursively, then appends / trailing removals, which
+matches how agents grow `signals`.
+"""
+
+from copy import deepcopy
+from typing import Any, Dict, List
+
+
+Patch = List[Dict[str, Any]]
+
+
+def _escape(token: Any) -> str:
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def diff(old: Any, new: Any, path: str = "") -> Patch:
+    """
+    Operations turning `old` into `new`.
+    Identical (shared) subtrees are skipped without being walked.
+    """
+    if old is new:
+        return []
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops: Patch = []
+
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+
+        for key, value in new.items():
+            child = f"{path}/{_escape(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": deepcopy(value)})
+            else:
+                ops.extend(diff(old[key], value, child))
+
+        return ops
+
+    if isinstance(old, list) and isinstance(new, list):
+        ops = []
+        shared = min(len(old), len(new))
+
+        for i in range(shared):
+            ops.extend(diff(old[i], new[i], f"{path}/{i}"))
+
+        for i in range(shared, len(new)):
+            ops.append({
+                "op": "add",
+                "path": f"{path}/{i}",
+                "value": deepcopy(new[i]),
+            })
+
+        # Trailing removals, last index first so positions stay valid
+        for i in reversed(range(shared, len(old))):
+            ops.append({"op": "remove", "path": f"{path}/{i}"})
+
+        return ops
+
+    if type(old) is type(new) and old == new:
+        return []
+
+    return [{"op": "replace", "path": path, "value": deepcopy(new)}]
+
+
+def apply_patch(document: Any, ops: Patch) -> Any:
+    """
+    Apply `ops` to a mutable document in place; returns the document
+    (a new root when the whole document is replaced).
+    """
+    for op in ops:
+        if op["path"] == "":
+            if op["op"] == "remove":
+                raise ValueError("Cannot remove the document root")
+            document = deepcopy(op["value"])
+            continue
+
+        tokens = [_unescape(t) for t in op["path"].split("/")[1:]]
+        parent = document
+        for token in tokens[:-1]:
+            if isinstance(parent, list):
+                parent = parent[int(token)]
+            else:
+                parent = parent[token]
+
+        last = tokens[-1]
+
+        if isinstance(parent, list):
+            index = len(parent) if last == "-" else int(last)
+            if op["op"] == "add":
+                parent.insert(index, deepcopy(op["value"]))
+            elif op["op"] == "replace":
+                parent[index] = deepcopy(op["value"])
+            elif op["op"] == "remove":
+                del parent[index]
+            else:
+                raise ValueError(f"Unsupported patch op '{op['op']}'")
+        else:
+            if op["op"] in ("add", "replace"):
+                parent[last] = deepcopy(op["value"])
+            elif op["op"] == "remove":
+                del parent[last]
+            else:
+                raise ValueError(f"Unsupported patch op '{op['op']}'")
+
+    return document
+
+
+def encode_steps(
+    input_snapshot: Dict[str, Any],
+    steps: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """
+    Replace each step's `output_snapshot` with a `delta` against the
+    previous step (the input for step 1). Other step fields are kept.
+    """
+    previous = input_snapshot
+    encoded = []
+
+    for step in steps:
+        snapshot = step["output_snapshot"]
+        entry = {k: v for k, v in step.items() if k != "output_snapshot"}
+        entry["delta"] = diff(previous, snapshot)
+        encoded.append(entry)
+        previous = snapshot
+
+    return encoded
+
+
+def decode_step(
+    input_snapshot: Dict[str, Any],
+    steps: List[Dict[str, Any]],
+    step: int,
+) -> Dict[str, Any]:
+    """
+    Full context after `step` (1-based; 0 is the input). Accepts delta
+    steps and full `output_snapshot` steps (records written before
+    delta encoding).
+    """
+    if not 0 <= step <= len(steps):
+        raise IndexError(f"Step {step} out of range (0..{len(steps)})")
+
+    context = deepcopy(input_snapshot)
+
+    for entry in steps[:step]:
+        if "delta" in entry:
+            context = apply_patch(context, entry["delta"])
+        else:
+            context = deepcopy(entry["output_snapshot"])
+
+    return context
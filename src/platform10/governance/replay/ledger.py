@@ -0,0 +1,367 @@
+"""
+Segmented Append-Only Replay Ledger.
+
+Layout (inside the ledger directory):
+    segment-000001.log   framed records, append-only
+    segment-000001.idx   "<trace_id>\\t<offset>\\n" per record
+
+Record frame:
+    >I length | >I crc32(body) | body (compact, key-sorted JSON)
+
+Segments roll over at max_segment_bytes, so the directory holds a
+handful of large files instead of one file per trace. The index only
+maps trace_id -> (segment, offset); a single record is read with one
+seek, without parsing its neighbours.
+
+Appends are expected to be serialised by the caller
+(RegulatorReplay holds its chain lock while appending).
+"""
+
+import json
+import os
+import struct
+import threading
+import zlib
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from platform10.governance.replay.storage import ChainLink, chain_link
+
+
+FRAME_HEADER = struct.Struct(">II")
+
+SEGMENT_PREFIX = "segment-"
+SEGMENT_SUFFIX = ".log"
+INDEX_SUFFIX = ".idx"
+
+
+class LedgerCorruption(Exception):
+    """Raised when a framed record fails its length / CRC check."""
+    pass
+
+
+@dataclass(frozen=True)
+class LedgerPosition:
+    """
+    Physical location of one record.
+    """
+    segment: int
+    offset: int
+
+
+def encode_record(payload: Dict[str, Any]) -> bytes:
+    body = json.dumps(
+        payload,
+        sort_keys=True,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+    return FRAME_HEADER.pack(len(body), zlib.crc32(body)) + body
+
+
+def scan_ledger_partition(partition: Tuple[str, int, int]) -> List[ChainLink]:
+    """
+    Re-hash one segment from an offset (process-pool worker).
+    Raises LedgerCorruption for a bad frame outside the last segment.
+    """
+    directory, segment, start_offset = partition
+    ledger = SegmentedLedger(directory)
+
+    return [
+        chain_link(payload, (segment, offset), resume=[segment, next_offset])
+        for offset, payload, next_offset in ledger._scan_segment(segment, start_offset)
+    ]
+
+
+class SegmentedLedger:
+    """
+    ReplayStore backed by rolling segment files.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_segment_bytes: int = 64 * 1024 * 1024,
+        fsync: bool = True,
+    ):
+        self.directory = directory
+        self.max_segment_bytes = max_segment_bytes
+        self.fsync = fsync
+
+        os.makedirs(self.directory, exist_ok=True)
+
+        self._index: Dict[str, LedgerPosition] = {}
+        # segment -> bytes of its .idx file already loaded
+        self._index_loaded: Dict[int, int] = {}
+        # segment -> offset of its last indexed record
+        self._last_indexed: Dict[int, int] = {}
+        self._index_lock = threading.Lock()
+
+    # --------------------------------
+    # Paths
+    # --------------------------------
+    def _segment_path(self, segment: int) -> str:
+        return os.path.join(
+            self.directory, f"{SEGMENT_PREFIX}{segment:06d}{SEGMENT_SUFFIX}"
+        )
+
+    def _index_path(self, segment: int) -> str:
+        return os.path.join(
+            self.directory, f"{SEGMENT_PREFIX}{segment:06d}{INDEX_SUFFIX}"
+        )
+
+    def segments(self) -> List[int]:
+        return sorted(
+            int(f[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)])
+            for f in os.listdir(self.directory)
+            if f.startswith(SEGMENT_PREFIX) and f.endswith(SEGMENT_SUFFIX)
+        )
+
+    # --------------------------------
+    # Frame I/O
+    # --------------------------------
+    def _read_frame(self, f, offset: int) -> Tuple[Dict[str, Any], int]:
+        """
+        Read one record at `offset`; returns (payload, next_offset).
+        """
+        f.seek(offset)
+        header = f.read(FRAME_HEADER.size)
+
+        if len(header) < FRAME_HEADER.size:
+            raise LedgerCorruption(f"Truncated header at offset {offset}")
+
+        length, crc = FRAME_HEADER.unpack(header)
+        body = f.read(length)
+
+        if len(body) < length or zlib.crc32(body) != crc:
+            raise LedgerCorruption(f"Torn or corrupt record at offset {offset}")
+
+        return json.loads(body), offset + FRAME_HEADER.size + length
+
+    def read_at(self, position: LedgerPosition) -> Dict[str, Any]:
+        """
+        Read exactly one record by physical position.
+        """
+        with open(self._segment_path(position.segment), "rb") as f:
+            payload, _ = self._read_frame(f, position.offset)
+        return payload
+
+    def _scan_segment(
+        self,
+        segment: int,
+        start_offset: int = 0,
+    ) -> Iterator[Tuple[int, Dict[str, Any], int]]:
+        """
+        (offset, payload, next_offset) in append order.
+
+        A bad frame in the LAST segment is treated as a torn tail from
+        an interrupted append and ends the scan; anywhere else it is
+        corruption and raises.
+        """
+        path = self._segment_path(segment)
+        size = os.path.getsize(path)
+        is_last = segment == self.segments()[-1]
+
+        with open(path, "rb") as f:
+            offset = start_offset
+            while offset < size:
+                try:
+                    payload, next_offset = self._read_frame(f, offset)
+                except LedgerCorruption:
+                    if is_last:
+                        return
+                    raise
+                yield offset, payload, next_offset
+                offset = next_offset
+
+    def iter_segment(
+        self,
+        segment: int,
+    ) -> Iterator[Tuple[LedgerPosition, Dict[str, Any]]]:
+        for offset, payload, _ in self._scan_segment(segment):
+            yield LedgerPosition(segment, offset), payload
+
+    # --------------------------------
+    # Trace Index
+    # --------------------------------
+    def _refresh_index(self) -> None:
+        """
+        Load index lines not seen yet (other processes may have appended).
+        """
+        with self._index_lock:
+            for segment in self.segments():
+                path = self._index_path(segment)
+                if not os.path.exists(path):
+                    continue
+
+                loaded = self._index_loaded.get(segment, 0)
+                if os.path.getsize(path) <= loaded:
+                    continue
+
+                with open(path, "rb") as f:
+                    f.seek(loaded)
+                    chunk = f.read()
+
+                # Ignore a partially written last line
+                complete = chunk[: chunk.rfind(b"\n") + 1]
+
+                for line in complete.decode("utf-8").splitlines():
+                    trace_id, offset = line.rsplit("\t", 1)
+                    self._index[trace_id] = LedgerPosition(segment, int(offset))
+                    self._last_indexed[segment] = max(
+                        self._last_indexed.get(segment, 0), int(offset)
+                    )
+
+                self._index_loaded[segment] = loaded + len(complete)
+
+    def locate(self, trace_id: str) -> Optional[LedgerPosition]:
+        position = self._index.get(trace_id)
+
+        if position is None:
+            self._refresh_index()
+            position = self._index.get(trace_id)
+
+        return position
+
+    def recover(self) -> None:
+        """
+        Index records written without an index line and truncate a torn
+        partial record left by an interrupted append. Only the unindexed
+        tail of the last segment is read.
+
+        Must run with appends excluded (RegulatorReplay calls it under
+        its chain lock before reading the tip), since it may truncate.
+        Also runs before each append.
+        """
+        segments = self.segments()
+        if not segments:
+            return
+
+        segment = segments[-1]
+        self._refresh_index()
+
+        start = 0
+        if segment in self._last_indexed:
+            with open(self._segment_path(segment), "rb") as f:
+                _, start = self._read_frame(f, self._last_indexed[segment])
+
+        if os.path.getsize(self._segment_path(segment)) == start:
+            return
+
+        end = start
+        missing = []
+        for offset, payload, end in self._scan_segment(segment, start):
+            missing.append((payload["trace_id"], offset))
+
+        if missing:
+            with open(self._index_path(segment), "a") as idx:
+                for trace_id, offset in missing:
+                    idx.write(f"{trace_id}\t{offset}\n")
+            self._refresh_index()
+
+        if os.path.getsize(self._segment_path(segment)) > end:
+            with open(self._segment_path(segment), "r+b") as f:
+                f.truncate(end)
+
+    # --------------------------------
+    # ReplayStore API
+    # --------------------------------
+    def exists(self, trace_id: str) -> bool:
+        return self.locate(trace_id) is not None
+
+    def load(self, trace_id: str) -> Dict[str, Any]:
+        position = self.locate(trace_id)
+
+        if position is None:
+            raise FileNotFoundError(f"No replay found for {trace_id}")
+
+        return self.read_at(position)
+
+    def append(self, trace_id: str, payload: Dict[str, Any]) -> LedgerPosition:
+        self.recover()
+
+        frame = encode_record(payload)
+
+        segments = self.segments()
+        segment = segments[-1] if segments else 1
+
+        if (
+            segments
+            and os.path.getsize(self._segment_path(segment)) > 0
+            and os.path.getsize(self._segment_path(segment)) + len(frame)
+            > self.max_segment_bytes
+        ):
+            segment += 1
+
+        with open(self._segment_path(segment), "ab") as f:
+            offset = f.tell()
+            f.write(frame)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+
+        with open(self._index_path(segment), "a") as idx:
+            idx.write(f"{trace_id}\t{offset}\n")
+
+        position = LedgerPosition(segment, offset)
+        self._index[trace_id] = position
+        self._last_indexed[segment] = offset
+        return position
+
+    def iter_records(self) -> Iterator[Tuple[LedgerPosition, Dict[str, Any]]]:
+        for segment in self.segments():
+            yield from self.iter_segment(segment)
+
+    def iter_chain(self) -> Iterator[Dict[str, Any]]:
+        """
+        Physical order IS append order.
+        """
+        for _, payload in self.iter_records():
+            yield payload
+
+    # --------------------------------
+    # Partitioned verification
+    # --------------------------------
+    def chain_partitions(
+        self,
+        checkpoint: Optional[Dict[str, Any]],
+        parts: int,
+    ) -> List[Any]:
+        """
+        One partition per segment, starting right after the checkpoint.
+        Segments before it are never opened.
+        """
+        start_segment, start_offset = 1, 0
+
+        if checkpoint and checkpoint.get("resume"):
+            start_segment, start_offset = checkpoint["resume"]
+
+        return [
+            (
+                self.directory,
+                segment,
+                start_offset if segment == start_segment else 0,
+            )
+            for segment in self.segments()
+            if segment >= start_segment
+        ]
+
+    # Plain function, so it pickles for process pools
+    scan_partition = staticmethod(scan_ledger_partition)
+
+    def bootstrap_tip(self) -> Dict[str, Any]:
+        last = None
+        count = 0
+
+        for _, payload in self.iter_records():
+            last = payload
+            count += 1
+
+        if last is None:
+            return {"sequence": 0, "last_hash": "GENESIS"}
+
+        return {
+            "sequence": last.get("sequence", count),
+            "last_hash": last.get("integrity_hash", "GENESIS"),
+        }
+
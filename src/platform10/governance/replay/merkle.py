@@ -0,0 +1,390 @@
+"""
+Merkle Batch Sealing for Replay Records.
+
+Instead of one Ed25519 signature per record, integrity hashes are
+accumulated into a window; sealing builds a Merkle tree over them,
+signs only the root and stores an inclusion proof per trace.
+Checking one trace is then O(log N) hashes plus one root signature.
+
+Tree (RFC 6962 style domain separation):
+    leaf = sha256(0x00 || integrity_hash_bytes)
+    node = sha256(0x01 || left || right)
+    an unpaired last node is promoted to the next level unchanged
+
+Layout (inside the seal directory):
+    pending.jsonl        {"trace_id", "integrity_hash"} awaiting a seal
+    seal-000001.json     signed root header (written last = committed)
+    seal-000001.proofs   one {"trace_id", "integrity_hash", "index", "path"} per line
+    index.tsv            "<trace_id>\\t<batch>\\t<offset into .proofs>\\n"
+
+Sealing is expected to be serialised by the caller
+(RegulatorReplay holds its chain lock). A seal interrupted after its
+header but before its index lines is repaired by recover() from the
+batch's .proofs file; seal() always recovers first.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from platform10.governance.replay.storage import atomic_write_json
+
+
+LEAF_PREFIX = b"\x00"
+NODE_PREFIX = b"\x01"
+
+SEAL_PREFIX = "seal-"
+HEADER_SUFFIX = ".json"
+PROOFS_SUFFIX = ".proofs"
+PENDING_FILE = "pending.jsonl"
+INDEX_FILE = "index.tsv"
+
+
+# --------------------------------
+# Tree
+# --------------------------------
+def _hash_bytes(integrity_hash: str) -> bytes:
+    return bytes.fromhex(integrity_hash.replace("sha256:", ""))
+
+
+def leaf_hash(integrity_hash: str) -> bytes:
+    return hashlib.sha256(LEAF_PREFIX + _hash_bytes(integrity_hash)).digest()
+
+
+def node_hash(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(NODE_PREFIX + left + right).digest()
+
+
+def build_levels(integrity_hashes: List[str]) -> List[List[bytes]]:
+    """
+    All tree levels, leaves first; the last level holds the root.
+    """
+    if not integrity_hashes:
+        raise ValueError("Cannot build a Merkle tree without leaves")
+
+    levels = [[leaf_hash(h) for h in integrity_hashes]]
+
+    while len(levels[-1]) > 1:
+        level = levels[-1]
+        parents = [
+            node_hash(level[i], level[i + 1])
+            for i in range(0, len(level) - 1, 2)
+        ]
+        if len(level) % 2:
+            parents.append(level[-1])
+        levels.append(parents)
+
+    return levels
+
+
+def inclusion_proof(levels: List[List[bytes]], index: int) -> List[List[str]]:
+    """
+    Sibling path from leaf `index` to the root: [side, hex] pairs,
+    side "L" when the sibling is on the left.
+    """
+    path = []
+
+    for level in levels[:-1]:
+        sibling = index ^ 1
+        if sibling < len(level):
+            side = "L" if sibling < index else "R"
+            path.append([side, level[sibling].hex()])
+        index //= 2
+
+    return path
+
+
+def verify_inclusion(integrity_hash: str, path: List[List[str]], root: str) -> bool:
+    node = leaf_hash(integrity_hash)
+
+    for side, sibling_hex in path:
+        sibling = bytes.fromhex(sibling_hex)
+        node = node_hash(sibling, node) if side == "L" else node_hash(node, sibling)
+
+    return node.hex() == root
+
+
+# --------------------------------
+# Seal Storage
+# --------------------------------
+class MerkleSealer:
+    """
+    Pending window, signed roots and per-trace proofs on disk.
+    `signer(message) -> (base64 signature, key_id)`.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        signer: Callable[[bytes], Tuple[str, str]],
+    ):
+        self.directory = directory
+        self.signer = signer
+
+        # trace_id -> (batch, offset into its .proofs file)
+        self._index: Dict[str, Tuple[int, int]] = {}
+        # batch -> index lines read for it
+        self._indexed_counts: Dict[int, int] = {}
+        self._index_loaded = 0
+        self._recovered = False
+        # (pending file bytes read, entries counted)
+        self._pending_seen = (0, 0)
+        self._lock = threading.Lock()
+
+    # --------------------------------
+    # Paths
+    # --------------------------------
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def _header_path(self, batch: int) -> str:
+        return self._path(f"{SEAL_PREFIX}{batch:06d}{HEADER_SUFFIX}")
+
+    def _proofs_path(self, batch: int) -> str:
+        return self._path(f"{SEAL_PREFIX}{batch:06d}{PROOFS_SUFFIX}")
+
+    def batches(self) -> List[int]:
+        if not os.path.isdir(self.directory):
+            return []
+
+        return sorted(
+            int(f[len(SEAL_PREFIX):-len(HEADER_SUFFIX)])
+            for f in os.listdir(self.directory)
+            if f.startswith(SEAL_PREFIX) and f.endswith(HEADER_SUFFIX)
+        )
+
+    # --------------------------------
+    # Pending Window
+    # --------------------------------
+    def add(self, trace_id: str, integrity_hash: str) -> int:
+        """
+        Queue one sealed-later record; returns the pending count.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+
+        line = json.dumps({"trace_id": trace_id, "integrity_hash": integrity_hash})
+
+        with open(self._path(PENDING_FILE), "a") as f:
+            f.write(line + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+        return self.pending_count()
+
+    def ensure_pending(self, trace_id: str, integrity_hash: str) -> None:
+        """
+        add() unless the record is already pending or sealed; reconciles
+        a record committed by chain roll-forward before add() ran.
+        """
+        self._refresh_index()
+        if trace_id in self._index:
+            return
+        if any(e["trace_id"] == trace_id for e in self._read_pending()):
+            return
+        self.add(trace_id, integrity_hash)
+
+    def pending_count(self) -> int:
+        """
+        Entries awaiting a seal; only bytes appended since the last call
+        are read (the file is truncated by seal()).
+        """
+        path = self._path(PENDING_FILE)
+        if not os.path.exists(path):
+            return 0
+
+        seen_bytes, count = self._pending_seen
+        size = os.path.getsize(path)
+
+        if size < seen_bytes:
+            seen_bytes, count = 0, 0
+
+        with open(path, "rb") as f:
+            f.seek(seen_bytes)
+            chunk = f.read()
+
+        complete = chunk[: chunk.rfind(b"\n") + 1]
+        self._pending_seen = (seen_bytes + len(complete), count + complete.count(b"\n"))
+        return self._pending_seen[1]
+
+    def _read_pending(self) -> List[Dict[str, str]]:
+        path = self._path(PENDING_FILE)
+        if not os.path.exists(path):
+            return []
+
+        entries = []
+        with open(path, "r") as f:
+            for line in f:
+                if line.endswith("\n"):
+                    entries.append(json.loads(line))
+        return entries
+
+    # --------------------------------
+    # Sealing
+    # --------------------------------
+    def seal(self) -> Optional[Dict[str, Any]]:
+        """
+        Seal every pending record into one signed batch.
+        Returns the batch header, or None if nothing was pending.
+        """
+        self.recover(force=True)
+
+        # Entries already indexed were sealed by an interrupted seal()
+        entries = [
+            e for e in self._read_pending() if e["trace_id"] not in self._index
+        ]
+
+        if entries:
+            batches = self.batches()
+            batch = batches[-1] + 1 if batches else 1
+            header = self._write_batch(batch, entries)
+        else:
+            header = None
+
+        # Truncate the window only after the header is durable
+        pending = self._path(PENDING_FILE)
+        if os.path.exists(pending):
+            with open(pending, "r+b") as f:
+                f.truncate(0)
+        self._pending_seen = (0, 0)
+
+        return header
+
+    def _write_batch(self, batch: int, entries: List[Dict[str, str]]) -> Dict[str, Any]:
+        hashes = [e["integrity_hash"] for e in entries]
+        levels = build_levels(hashes)
+        root = levels[-1][0].hex()
+
+        index_lines = []
+        with open(self._proofs_path(batch), "w") as f:
+            for i, entry in enumerate(entries):
+                index_lines.append(f"{entry['trace_id']}\t{batch}\t{f.tell()}\n")
+                f.write(json.dumps({
+                    "trace_id": entry["trace_id"],
+                    "integrity_hash": entry["integrity_hash"],
+                    "index": i,
+                    "path": inclusion_proof(levels, i),
+                }) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+        signature, key_id = self.signer(root.encode("utf-8"))
+        header = {
+            "batch": batch,
+            "root": root,
+            "size": len(entries),
+            "signature": signature,
+            "key_id": key_id,
+            "signing_algorithm": "ed25519",
+        }
+
+        # Header is the commit point for the batch
+        atomic_write_json(self._header_path(batch), header, sort_keys=True)
+
+        with open(self._path(INDEX_FILE), "a") as idx:
+            idx.write("".join(index_lines))
+            idx.flush()
+            os.fsync(idx.fileno())
+
+        return header
+
+    # --------------------------------
+    # Recovery
+    # --------------------------------
+    def recover(self, force: bool = False) -> int:
+        """
+        Append the index lines of committed batches that index.tsv
+        lacks (a seal interrupted between its header and its index
+        lines), rebuilt from their .proofs files. Returns the number of
+        lines added. Must run with seals excluded; without `force` only
+        the first call per instance checks.
+        """
+        if self._recovered and not force:
+            return 0
+        self._recovered = True
+
+        self._refresh_index()
+
+        # Batches are indexed in order: walk back to the last complete one
+        incomplete = []
+        for batch in reversed(self.batches()):
+            with open(self._header_path(batch), "r") as f:
+                size = json.load(f)["size"]
+            if self._indexed_counts.get(batch, 0) >= size:
+                break
+            incomplete.append(batch)
+
+        lines = []
+        for batch in reversed(incomplete):
+            with open(self._proofs_path(batch), "rb") as f:
+                offset = 0
+                for raw in f:
+                    trace_id = json.loads(raw)["trace_id"]
+                    if self._index.get(trace_id) != (batch, offset):
+                        lines.append(f"{trace_id}\t{batch}\t{offset}\n")
+                    offset += len(raw)
+
+        if lines:
+            with open(self._path(INDEX_FILE), "a+b") as idx:
+                # Drop a torn last line so it cannot merge with ours
+                size = idx.seek(0, os.SEEK_END)
+                start = max(0, size - 4096)
+                idx.seek(start)
+                idx.truncate(start + idx.read().rfind(b"\n") + 1)
+                idx.write("".join(lines).encode("utf-8"))
+                idx.flush()
+                os.fsync(idx.fileno())
+            self._refresh_index()
+
+        return len(lines)
+
+    # --------------------------------
+    # Lookup
+    # --------------------------------
+    def _refresh_index(self) -> None:
+        path = self._path(INDEX_FILE)
+
+        with self._lock:
+            if not os.path.exists(path) or os.path.getsize(path) <= self._index_loaded:
+                return
+
+            with open(path, "rb") as f:
+                f.seek(self._index_loaded)
+                chunk = f.read()
+
+            # Ignore a partially written last line
+            complete = chunk[: chunk.rfind(b"\n") + 1]
+
+            for line in complete.decode("utf-8").splitlines():
+                trace_id, batch, offset = line.split("\t")
+                self._index[trace_id] = (int(batch), int(offset))
+                self._indexed_counts[int(batch)] = (
+                    self._indexed_counts.get(int(batch), 0) + 1
+                )
+
+            self._index_loaded += len(complete)
+
+    def lookup(self, trace_id: str) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """
+        (batch header, proof entry) for a sealed trace, else None.
+        Reads one header and one proof line.
+        """
+        location = self._index.get(trace_id)
+
+        if location is None:
+            self._refresh_index()
+            location = self._index.get(trace_id)
+
+        if location is None:
+            return None
+
+        batch, offset = location
+        with open(self._header_path(batch), "r") as f:
+            header = json.load(f)
+
+        with open(self._proofs_path(batch), "r") as f:
+            f.seek(offset)
+            proof = json.loads(f.readline())
+
+        return header, proof
@@ -3,7 +3,6 @@ Platform10 Regulator-Grade PDF Compliance Exporter
 """
 
 import os
-import json
 import hashlib
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
 from reportlab.lib.styles import getSampleStyleSheet
@@ -16,22 +15,21 @@ from platform10.governance.signing.key_manager import KeyManager
 
 class ReplayPDFExporter:
 
+    def __init__(self, replay: RegulatorReplay | None = None):
+        self.replay = replay or RegulatorReplay()
+
     def _public_key_fingerprint(self) -> str:
-        with open("replay_public_key.pem", "rb") as f:
+        with open(KeyManager.PUBLIC_KEY_PATH, "rb") as f:
             key_data = f.read()
         return hashlib.sha256(key_data).hexdigest()
 
     def export(self, trace_id: str) -> str:
-        r = RegulatorReplay()
-
-        file_path = os.path.join("replay_logs", f"{trace_id}.json")
-        if not os.path.exists(file_path):
-            raise FileNotFoundError("Replay not found")
+        r = self.replay
 
-        with open(file_path, "r") as f:
-            data = json.load(f)
+        # Single-record read (ledger backend: one indexed seek)
+        data = r.load_record(trace_id)
 
-        pdf_path = f"replay_logs/{trace_id}_compliance_report.pdf"
+        pdf_path = os.path.join(r.STORAGE_DIR, f"{trace_id}_compliance_report.pdf")
 
         doc = SimpleDocTemplate(pdf_path)
         elements = []
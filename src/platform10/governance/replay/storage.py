@@ -0,0 +1,225 @@
+"""
+Replay Record Storage.
+
+RegulatorReplay owns hashing, signing and the chain tip; a
+ReplayStore only persists and retrieves sealed records.
+
+Backends:
+- FileReplayStore: one pretty-printed JSON file per trace (original layout)
+- SegmentedLedger: rolling append-only segments (see ledger.py)
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Protocol, Tuple
+
+
+# Fields added when a record is sealed (excluded from its own hash)
+SEAL_FIELDS = ("integrity_hash", "signature", "signing_algorithm", "key_id")
+
+
+def compute_record_hash(payload: Dict[str, Any]) -> str:
+    """
+    Deterministic SHA256 over canonical JSON (hex digest).
+    """
+    serialized = json.dumps(
+        payload,
+        sort_keys=True,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+    return hashlib.sha256(serialized).hexdigest()
+
+
+@dataclass
+class ChainLink:
+    """
+    Per-record verification result, computed independently of the
+    rest of the chain so records can be re-hashed in parallel.
+    Link continuity (previous_hash) is checked afterwards, serially.
+    """
+    order_key: Tuple
+    sequence: Optional[int]
+    previous_hash: Optional[str]
+    integrity_hash: Optional[str]
+    hash_ok: bool
+    # Store-specific resume position AFTER this record (checkpoints)
+    resume: Optional[Any] = None
+
+
+def chain_link(
+    payload: Dict[str, Any],
+    order_key: Tuple,
+    resume: Optional[Any] = None,
+) -> ChainLink:
+    unsealed = {k: v for k, v in payload.items() if k not in SEAL_FIELDS}
+    stored_hash = payload.get("integrity_hash")
+
+    return ChainLink(
+        order_key=order_key,
+        sequence=payload.get("sequence"),
+        previous_hash=payload.get("previous_hash"),
+        integrity_hash=stored_hash,
+        hash_ok=stored_hash == f"sha256:{compute_record_hash(unsealed)}",
+        resume=resume,
+    )
+
+
+def atomic_write_json(path: str, payload: Dict[str, Any], **kwargs) -> None:
+    """
+    Write JSON via tmp file + fsync + os.replace.
+    """
+    tmp_path = f"{path}.tmp"
+
+    with open(tmp_path, "w") as f:
+        json.dump(payload, f, **kwargs)
+        f.flush()
+        os.fsync(f.fileno())
+
+    os.replace(tmp_path, path)
+
+
+def scan_file_partition(partition: Tuple[str, List[str], int]) -> List[ChainLink]:
+    """
+    Re-hash one chunk of record files (process-pool worker).
+    """
+    directory, files, after_sequence = partition
+    links = []
+
+    for name in files:
+        with open(os.path.join(directory, name), "r") as f:
+            payload = json.load(f)
+
+        sequence = payload.get("sequence")
+
+        # Legacy (unsequenced) records always precede a checkpoint
+        if after_sequence and (sequence is None or sequence <= after_sequence):
+            continue
+
+        # Same order as iter_chain: legacy records first, by file name
+        order_key = (sequence is not None, sequence or 0, name)
+        links.append(chain_link(payload, order_key))
+
+    return links
+
+
+class ReplayStore(Protocol):
+    # Repair state left by an interrupted append (chain lock held)
+    def recover(self) -> None: ...
+    def exists(self, trace_id: str) -> bool: ...
+    def load(self, trace_id: str) -> Dict[str, Any]: ...
+    def append(self, trace_id: str, payload: Dict[str, Any]) -> None: ...
+    def iter_chain(self) -> Iterator[Dict[str, Any]]: ...
+    def bootstrap_tip(self) -> Dict[str, Any]: ...
+    def chain_partitions(
+        self, checkpoint: Optional[Dict[str, Any]], parts: int
+    ) -> List[Any]: ...
+    # Must be a picklable callable (module-level function)
+    scan_partition: Callable[[Any], List[ChainLink]]
+
+
+class FileReplayStore:
+    """
+    One JSON file per trace in a flat directory.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, trace_id: str) -> str:
+        return os.path.join(self.directory, f"{trace_id}.json")
+
+    def record_files(self) -> List[str]:
+        """
+        Replay record file names (excludes manifests, PDFs, temp files).
+        """
+        return sorted(
+            f for f in os.listdir(self.directory)
+            if f.endswith(".json") and not f.startswith(".")
+        )
+
+    def recover(self) -> None:
+        """
+        Nothing to repair: records are written atomically.
+        """
+
+    def exists(self, trace_id: str) -> bool:
+        return os.path.exists(self._path(trace_id))
+
+    def load(self, trace_id: str) -> Dict[str, Any]:
+        path = self._path(trace_id)
+
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"No replay found for {trace_id}")
+
+        with open(path, "r") as f:
+            return json.load(f)
+
+    def append(self, trace_id: str, payload: Dict[str, Any]) -> None:
+        atomic_write_json(self._path(trace_id), payload, indent=2, sort_keys=True)
+
+    def iter_chain(self) -> Iterator[Dict[str, Any]]:
+        payloads = []
+
+        for file in self.record_files():
+            with open(os.path.join(self.directory, file), "r") as f:
+                payloads.append(json.load(f))
+
+        # Append order: legacy (unsequenced) records first, by file name,
+        # matching how the manifest was bootstrapped from them.
+        payloads.sort(
+            key=lambda p: (
+                "sequence" in p,
+                p.get("sequence", 0),
+            )
+        )
+
+        return iter(payloads)
+
+    # --------------------------------
+    # Partitioned verification
+    # --------------------------------
+    def chain_partitions(
+        self,
+        checkpoint: Optional[Dict[str, Any]],
+        parts: int,
+    ) -> List[Any]:
+        """
+        Split record files into `parts` picklable chunks.
+
+        File names carry no sequence, so every file is still read;
+        records at or before the checkpoint are just not re-hashed.
+        """
+        files = self.record_files()
+        after = checkpoint["sequence"] if checkpoint else 0
+        size = max(1, -(-len(files) // max(1, parts)))
+
+        return [
+            (self.directory, files[i:i + size], after)
+            for i in range(0, len(files), size)
+        ]
+
+    # Plain function, so it pickles for process pools
+    scan_partition = staticmethod(scan_file_partition)
+
+    def bootstrap_tip(self) -> Dict[str, Any]:
+        """
+        Pre-manifest tip lookup: last file by name. Only used once,
+        for a directory written by older versions.
+        """
+        files = self.record_files()
+
+        if not files:
+            return {"sequence": 0, "last_hash": "GENESIS"}
+
+        with open(os.path.join(self.directory, files[-1]), "r") as f:
+            data = json.load(f)
+
+        return {
+            "sequence": len(files),
+            "last_hash": data.get("integrity_hash", "GENESIS"),
+        }
+
@@ -1,17 +1,43 @@
 """
 Key Management for Replay Signing.
 Uses Ed25519 for deterministic digital signatures.
+
+Loaded keys are cached per path and reloaded only when the PEM file
+changes (mtime / size / inode), so signing and verifying do not
+re-parse PEM on every record.
+
+Rotation: rotate_keys() archives the current public key under
+KEYRING_DIR/<key_id>.pem and generates a new pair. Records carry the
+key_id they were signed with, so old records stay verifiable.
 """
 
+import hashlib
+import os
+import re
+import shutil
+import threading
+from typing import Any, Dict, Optional, Tuple
+
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
 from cryptography.hazmat.primitives import serialization
 
 
+# compute_key_id output; anything else never names a keyring file
+KEY_ID_PATTERN = re.compile(r"[0-9a-f]{16}")
+
+
 class KeyManager:
 
     PRIVATE_KEY_PATH = "replay_private_key.pem"
     PUBLIC_KEY_PATH = "replay_public_key.pem"
 
+    # Retired public keys, one "<key_id>.pem" per rotation
+    KEYRING_DIR = "replay_keys"
+
+    # path -> (file signature, loaded key, key id)
+    _cache: Dict[str, Tuple[Tuple[int, int, int], Any, str]] = {}
+    _cache_lock = threading.Lock()
+
     @classmethod
     def generate_keys(cls):
         private_key = Ed25519PrivateKey.generate()
@@ -36,13 +62,126 @@ class KeyManager:
                 )
             )
 
+        # Same-process rewrites may land within mtime granularity
+        with cls._cache_lock:
+            cls._cache.pop(cls.PRIVATE_KEY_PATH, None)
+            cls._cache.pop(cls.PUBLIC_KEY_PATH, None)
+
+    # --------------------------------
+    # Key Identity
+    # --------------------------------
+    @staticmethod
+    def compute_key_id(public_key) -> str:
+        """
+        Short fingerprint of the raw public key.
+        """
+        raw = public_key.public_bytes(
+            encoding=serialization.Encoding.Raw,
+            format=serialization.PublicFormat.Raw,
+        )
+        return hashlib.sha256(raw).hexdigest()[:16]
+
+    # --------------------------------
+    # Cached Loading
+    # --------------------------------
+    @classmethod
+    def _load_cached(cls, path: str, private: bool) -> Tuple[Any, str]:
+        """
+        (key, key_id) for a PEM file, re-parsed only if the file changed.
+        Raises FileNotFoundError if missing.
+        """
+        stat = os.stat(path)
+        file_signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+        with cls._cache_lock:
+            cached = cls._cache.get(path)
+            if cached and cached[0] == file_signature:
+                return cached[1], cached[2]
+
+        with open(path, "rb") as f:
+            data = f.read()
+
+        if private:
+            key = serialization.load_pem_private_key(data, password=None)
+            key_id = cls.compute_key_id(key.public_key())
+        else:
+            key = serialization.load_pem_public_key(data)
+            key_id = cls.compute_key_id(key)
+
+        with cls._cache_lock:
+            cls._cache[path] = (file_signature, key, key_id)
+
+        return key, key_id
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        with cls._cache_lock:
+            cls._cache.clear()
+
     @classmethod
     def load_private_key(cls):
-        with open(cls.PRIVATE_KEY_PATH, "rb") as f:
-            return serialization.load_pem_private_key(f.read(), password=None)
+        return cls._load_cached(cls.PRIVATE_KEY_PATH, private=True)[0]
 
     @classmethod
     def load_public_key(cls):
-        with open(cls.PUBLIC_KEY_PATH, "rb") as f:
-            return serialization.load_pem_public_key(f.read())
-            
\ No newline at end of file
+        return cls._load_cached(cls.PUBLIC_KEY_PATH, private=False)[0]
+
+    @classmethod
+    def signing_key(cls) -> Tuple[Any, str]:
+        """
+        (private key, key_id) used for new signatures.
+        """
+        return cls._load_cached(cls.PRIVATE_KEY_PATH, private=True)
+
+    @classmethod
+    def current_key_id(cls) -> str:
+        return cls._load_cached(cls.PUBLIC_KEY_PATH, private=False)[1]
+
+    @classmethod
+    def load_public_key_by_id(cls, key_id: Optional[str]):
+        """
+        Public key for `key_id`: the current key or a retired one.
+        None (records signed before key ids existed) means the current key.
+        Raises KeyError for an unknown key id.
+
+        key_id comes from the record being verified: only the 16 hex
+        digits compute_key_id produces are looked up, so it cannot
+        steer the keyring path, and the key found must carry that id.
+        """
+        public_key, current_id = cls._load_cached(cls.PUBLIC_KEY_PATH, private=False)
+
+        if key_id is None or key_id == current_id:
+            return public_key
+
+        if not isinstance(key_id, str) or not KEY_ID_PATTERN.fullmatch(key_id):
+            raise KeyError(f"Unknown signing key id {key_id!r}")
+
+        path = os.path.join(cls.KEYRING_DIR, f"{key_id}.pem")
+        if not os.path.exists(path):
+            raise KeyError(f"Unknown signing key id {key_id}")
+
+        retired_key, retired_id = cls._load_cached(path, private=False)
+        if retired_id != key_id:
+            raise KeyError(f"Keyring entry {key_id} holds key {retired_id}")
+
+        return retired_key
+
+    # --------------------------------
+    # Rotation
+    # --------------------------------
+    @classmethod
+    def rotate_keys(cls) -> str:
+        """
+        Retire the current public key into the keyring and generate a
+        new pair. Returns the new key id.
+        """
+        os.makedirs(cls.KEYRING_DIR, exist_ok=True)
+
+        if os.path.exists(cls.PUBLIC_KEY_PATH):
+            shutil.copyfile(
+                cls.PUBLIC_KEY_PATH,
+                os.path.join(cls.KEYRING_DIR, f"{cls.current_key_id()}.pem"),
+            )
+
+        cls.generate_keys()
+        return cls.current_key_id()
@@ -0,0 +1,122 @@
+# src/platform10/memory/decay_accumulator.py
+
+"""
+Incrementally maintained, exponentially decayed risk accumulator.
+
+Keeps two running sums relative to a reference time (the newest
+event seen):
+
+    weighted_total = sum(exp(-lambda * (reference - t_i)))
+    weighted_high  = same sum over events with score >= threshold
+
+Decay is a common factor of both sums, so
+
+    risk_density = weighted_high / weighted_total
+
+equals the full-history computation at ANY evaluation time, while
+each update and each read is O(1). State is a plain JSON dict so it
+can live in semantic memory.
+"""
+
+import math
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+
+def parse_timestamp(value: str) -> datetime:
+    return datetime.fromisoformat(value)
+
+
+class DecayedRiskAccumulator:
+    """
+    Pure update / read logic. Persistence is owned by MemoryManager.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        decay_lambda: float,
+        high_risk_threshold: float = 0.8,
+        score_field: str = "score",
+    ):
+        self.key = key
+        self.decay_lambda = decay_lambda
+        self.high_risk_threshold = high_risk_threshold
+        self.score_field = score_field
+
+    def _age_hours(self, later: datetime, earlier: datetime) -> float:
+        return (later - earlier).total_seconds() / 3600.0
+
+    def update(
+        self,
+        state: Optional[Dict[str, Any]],
+        payload: Dict[str, Any],
+        timestamp: Optional[str],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Fold one stored decision into the accumulator state.
+        """
+        if not timestamp:
+            return state
+
+        event_time = parse_timestamp(timestamp)
+        score = payload.get(self.score_field, 0.0)
+        is_high = 1.0 if score >= self.high_risk_threshold else 0.0
+
+        if state is None:
+            return {
+                "reference_time": event_time.isoformat(),
+                "weighted_total": 1.0,
+                "weighted_high": is_high,
+                "count": 1,
+            }
+
+        reference_time = parse_timestamp(state["reference_time"])
+        weighted_total = state["weighted_total"]
+        weighted_high = state["weighted_high"]
+
+        if event_time >= reference_time:
+            # Move the reference forward: decay existing mass, add new event
+            factor = math.exp(
+                -self.decay_lambda * self._age_hours(event_time, reference_time)
+            )
+            weighted_total = weighted_total * factor + 1.0
+            weighted_high = weighted_high * factor + is_high
+            reference_time = event_time
+        else:
+            # Late (out-of-order) event: add it at its decayed weight
+            weight = math.exp(
+                -self.decay_lambda * self._age_hours(reference_time, event_time)
+            )
+            weighted_total += weight
+            weighted_high += weight * is_high
+
+        return {
+            "reference_time": reference_time.isoformat(),
+            "weighted_total": weighted_total,
+            "weighted_high": weighted_high,
+            "count": state.get("count", 0) + 1,
+        }
+
+    def risk_density(
+        self,
+        state: Optional[Dict[str, Any]],
+        now: Optional[datetime] = None,
+    ) -> Optional[float]:
+        """
+        Decayed share of high-risk events, or None without usable history.
+        """
+        if not state:
+            return None
+
+        now = now or datetime.utcnow()
+        reference_time = parse_timestamp(state["reference_time"])
+
+        # Same underflow behaviour as summing weights at `now`
+        scale = math.exp(
+            -self.decay_lambda * max(0.0, self._age_hours(now, reference_time))
+        )
+        if state["weighted_total"] * scale <= 0:
+            return None
+
+        return state["weighted_high"] / state["weighted_total"]
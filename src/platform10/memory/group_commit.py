@@ -0,0 +1,214 @@
+# src/platform10/memory/group_commit.py
+
+"""
+Group-Commit Decision Writer
+
+Buffers episodic decisions and writes them through
+MemoryManager.store_decisions_bulk from a background thread,
+so many decisions share one transaction (and one fsync).
+
+A batch is committed when either:
+- max_batch_size decisions are buffered, or
+- the oldest buffered decision has waited max_delay_ms
+
+flush() is the durability hook: it returns only once every
+decision submitted before the call is committed.
+"""
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from platform10.memory.memory_manager import MemoryManager
+
+
+Decision = Tuple[str, Dict[str, Any]]
+
+_FLUSH = object()
+_STOP = object()
+
+
+class GroupCommitWriter:
+    """
+    Asynchronous, bounded-latency batch writer for episodic decisions.
+    """
+
+    def __init__(
+        self,
+        memory: MemoryManager,
+        max_batch_size: int = 500,
+        max_delay_ms: int = 50,
+        max_queue_size: int = 100_000,
+        on_commit: Optional[Callable[[int], None]] = None,
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1")
+
+        self.memory = memory
+        self.max_batch_size = max_batch_size
+        self.max_delay_ms = max_delay_ms
+        self.on_commit = on_commit
+
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue_size)
+
+        self._submitted = 0
+        self._processed = 0
+        self._committed = 0
+        self._error: Optional[BaseException] = None
+        self._progress = threading.Condition()
+        self._closed = False
+
+        self._worker = threading.Thread(
+            target=self._run,
+            name="platform10-group-commit",
+            daemon=True,
+        )
+        self._worker.start()
+
+    # --------------------------------------------------
+    # Producer API
+    # --------------------------------------------------
+
+    def submit(self, event_type: str, payload: Dict[str, Any]) -> None:
+        """
+        Enqueue one decision. Blocks only if the queue is full.
+        """
+        if self._closed:
+            raise RuntimeError("GroupCommitWriter is closed")
+
+        with self._progress:
+            self._submitted += 1
+
+        self._queue.put((event_type, payload))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Durability hook.
+
+        Blocks until every decision submitted before this call
+        is committed. Returns False if the timeout expired.
+        Raises RuntimeError if a batch failed to commit.
+        """
+        with self._progress:
+            target = self._submitted
+
+        self._queue.put(_FLUSH)
+
+        with self._progress:
+            done = self._progress.wait_for(
+                lambda: self._processed >= target,
+                timeout=timeout,
+            )
+
+            if self._error is not None:
+                error, self._error = self._error, None
+                raise RuntimeError("Group commit failed") from error
+
+        return done
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Flush outstanding decisions and stop the background thread.
+        """
+        if self._closed:
+            return
+
+        self._closed = True
+        self._queue.put(_STOP)
+        self._worker.join(timeout)
+
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise RuntimeError("Group commit failed") from error
+
+    @property
+    def committed(self) -> int:
+        return self._committed
+
+    def __enter__(self) -> "GroupCommitWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    # --------------------------------------------------
+    # Background Worker
+    # --------------------------------------------------
+
+    def _run(self) -> None:
+        stopping = False
+
+        while not stopping:
+            item = self._queue.get()
+
+            batch: List[Decision] = []
+
+            if item is _STOP:
+                stopping = True
+            elif item is not _FLUSH:
+                batch.append(item)
+
+                deadline = time.monotonic() + self.max_delay_ms / 1000.0
+
+                # Collect until size or time threshold (or explicit flush)
+                while len(batch) < self.max_batch_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+
+                    try:
+                        item = self._queue.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+
+                    if item is _FLUSH:
+                        break
+                    if item is _STOP:
+                        stopping = True
+                        break
+
+                    batch.append(item)
+
+            if stopping:
+                batch.extend(self._drain())
+
+            if batch:
+                self._commit(batch)
+
+    def _drain(self) -> List[Decision]:
+        drained: List[Decision] = []
+
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return drained
+
+            if item is not _FLUSH and item is not _STOP:
+                drained.append(item)
+
+    def _commit(self, batch: List[Decision]) -> None:
+        error: Optional[BaseException] = None
+        committed = False
+
+        try:
+            self.memory.store_decisions_bulk(batch)
+            committed = True
+            # Before progress is published, so a failing callback is
+            # reported by the flush() waiting on this batch (and never
+            # kills the worker)
+            if self.on_commit:
+                self.on_commit(len(batch))
+        except Exception as e:
+            error = e
+
+        with self._progress:
+            self._processed += len(batch)
+
+            if committed:
+                self._committed += len(batch)
+            if error is not None:
+                self._error = error
+
+            self._progress.notify_all()
@@ -7,11 +7,108 @@ Provides:
 - Episodic memory storage (decision history)
 - Semantic knowledge storage
 - Durable storage across restarts
+
+Connection model:
+- One long-lived connection per thread (sqlite3 objects are not
+  shareable across threads by default)
+- WAL journal so readers never block the writer
+- Configurable synchronous level (durability vs. write latency)
+- Statements are module constants, so sqlite3's per-connection
+  statement cache keeps them prepared between calls
+
+NOTE:
+- ":memory:" databases are per-connection, hence per-thread here
 """
 
 import sqlite3
 import json
-from typing import Any, Dict, List
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from platform10.core.sqlite_pool import ThreadConnectionPool, connect
+from platform10.memory.migrations import apply_migrations
+
+
+SYNCHRONOUS_LEVELS = {"OFF", "NORMAL", "FULL", "EXTRA"}
+
+# Prepared statement cache size per connection
+STATEMENT_CACHE_SIZE = 128
+
+
+# --------------------------------------------------
+# SQL Statements
+# --------------------------------------------------
+
+INSERT_DECISION_SQL = """
+INSERT INTO episodic_memory (event_type, data, timestamp)
+VALUES (?, ?, ?)
+"""
+
+REPLAY_BY_TYPE_SQL = """
+SELECT data, timestamp
+FROM episodic_memory
+WHERE event_type = ?
+ORDER BY timestamp ASC
+"""
+
+RECALL_RECENT_SQL = """
+SELECT event_type, data, timestamp
+FROM episodic_memory
+ORDER BY timestamp DESC
+LIMIT ?
+"""
+
+RECALL_BY_TYPE_SQL = """
+SELECT data, timestamp, id
+FROM episodic_memory
+WHERE event_type = ?
+ORDER BY timestamp DESC, id DESC
+LIMIT ?
+"""
+
+# Keyset cursor: rows after (timestamp, id), oldest first
+RECALL_BY_TYPE_SINCE_SQL = """
+SELECT data, timestamp, id
+FROM episodic_memory
+WHERE event_type = ? AND (timestamp, id) > (?, ?)
+ORDER BY timestamp ASC, id ASC
+LIMIT ?
+"""
+
+# Cursor id for a bare timestamp: strictly after that second
+_AFTER_EVERY_ID = 2**63 - 1
+
+# Rows an accumulator has not folded yet. "+event_type" keeps the
+# planner on the rowid range instead of the event_type index (which
+# would walk the type's whole history)
+FOLD_NEWER_SQL = """
+SELECT id, data, timestamp
+FROM episodic_memory
+WHERE id > ? AND +event_type = ?
+ORDER BY id
+"""
+
+MAX_EPISODIC_ID_SQL = "SELECT MAX(id) FROM episodic_memory"
+
+UPSERT_KNOWLEDGE_SQL = """
+INSERT OR REPLACE INTO semantic_memory (key, value)
+VALUES (?, ?)
+"""
+
+RECALL_KNOWLEDGE_SQL = "SELECT value FROM semantic_memory WHERE key = ?"
+
+KNOWLEDGE_SUMMARY_SQL = "SELECT key, value FROM semantic_memory"
+
+# Same text format as SQLite's CURRENT_TIMESTAMP (UTC)
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def _utc_timestamp() -> str:
+    return datetime.utcnow().strftime(TIMESTAMP_FORMAT)
+
+
+def _last_id(state: Optional[Dict[str, Any]]) -> int:
+    return 0 if state is None else state.get("last_id", 0)
 
 
 class MemoryManager:
@@ -19,68 +116,126 @@ class MemoryManager:
     Unified persistent memory interface for Platform10 agents.
     """
 
-    def __init__(self, db_path: str = "platform10_memory.db"):
+    def __init__(
+        self,
+        db_path: str = "platform10_memory.db",
+        synchronous: str = "NORMAL",
+        journal_mode: str = "WAL",
+        busy_timeout_ms: int = 5000,
+        migrate: bool = True,
+    ):
+        synchronous = synchronous.upper()
+        if synchronous not in SYNCHRONOUS_LEVELS:
+            raise ValueError(
+                f"Unsupported synchronous level: {synchronous}"
+            )
+
         self.db_path = db_path
-        self._initialize_database()
+        self.synchronous = synchronous
+        self.journal_mode = journal_mode.upper()
+        self.busy_timeout_ms = busy_timeout_ms
+
+        self._pool = ThreadConnectionPool(self._connect)
+
+        # event_type -> accumulators maintained on every store
+        self._accumulators: Dict[str, List[Any]] = {}
+
+        self.schema_version: Optional[int] = None
+        if migrate:
+            self._initialize_database()
 
     # --------------------------------------------------
-    # Database Setup
+    # Connection Pool
     # --------------------------------------------------
 
-    def _initialize_database(self):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        # Episodic Memory Table
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS episodic_memory (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            event_type TEXT,
-            data TEXT,
-            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+    def _connect(self) -> sqlite3.Connection:
+        return connect(
+            self.db_path,
+            synchronous=self.synchronous,
+            journal_mode=self.journal_mode,
+            busy_timeout_ms=self.busy_timeout_ms,
+            cached_statements=STATEMENT_CACHE_SIZE,
         )
-        """)
 
-        # Semantic Memory Table
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS semantic_memory (
-            key TEXT PRIMARY KEY,
-            value TEXT
-        )
-        """)
+    def _connection(self) -> sqlite3.Connection:
+        """
+        Returns the calling thread's long-lived connection.
+        """
+        return self._pool.get()
 
-        conn.commit()
-        conn.close()
+    def close(self) -> None:
+        """
+        Close every pooled connection (all threads).
+        """
+        self._pool.close()
+
+    def __enter__(self) -> "MemoryManager":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    # --------------------------------------------------
+    # Database Setup
+    # --------------------------------------------------
+
+    def _initialize_database(self):
+        """
+        Bring the schema up to date (see memory/migrations.py).
+        """
+        self.schema_version = apply_migrations(self._connection())
 
     # --------------------------------------------------
     # Episodic Memory
     # --------------------------------------------------
 
     def store_decision(self, event_type: str, payload: Dict[str, Any]) -> None:
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        conn = self._connection()
+        timestamp = _utc_timestamp()
+
+        with conn:
+            conn.execute(
+                INSERT_DECISION_SQL,
+                (event_type, json.dumps(payload), timestamp),
+            )
+            self._update_accumulators(conn, [(event_type, payload, timestamp)])
+
+    def store_decisions_bulk(
+        self,
+        decisions: Iterable[Tuple[str, Dict[str, Any]]],
+    ) -> int:
+        """
+        Store many (event_type, payload) decisions in ONE transaction.
+
+        Returns number of rows written.
+        """
+        timestamp = _utc_timestamp()
+        events = [
+            (event_type, payload, timestamp)
+            for event_type, payload in decisions
+        ]
 
-        cursor.execute("""
-        INSERT INTO episodic_memory (event_type, data)
-        VALUES (?, ?)
-        """, (event_type, json.dumps(payload)))
+        if not events:
+            return 0
 
-        conn.commit()
-        conn.close()
+        conn = self._connection()
 
-    def recall_recent(self, limit: int = 5) -> List[Dict[str, Any]]:
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with conn:
+            conn.executemany(
+                INSERT_DECISION_SQL,
+                [
+                    (event_type, json.dumps(payload), ts)
+                    for event_type, payload, ts in events
+                ],
+            )
+            self._update_accumulators(conn, events)
 
-        cursor.execute("""
-        SELECT event_type, data, timestamp
-        FROM episodic_memory
-        ORDER BY timestamp DESC
-        LIMIT ?
-        """, (limit,))
+        return len(events)
 
-        rows = cursor.fetchall()
-        conn.close()
+    def recall_recent(self, limit: int = 5) -> List[Dict[str, Any]]:
+        rows = self._connection().execute(
+            RECALL_RECENT_SQL, (limit,)
+        ).fetchall()
 
         return [
             {
@@ -91,65 +246,197 @@ class MemoryManager:
             for row in rows
         ]
 
-    def recall_by_type(self, event_type: str) -> List[Dict[str, Any]]:
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-        SELECT data, timestamp
-        FROM episodic_memory
-        WHERE event_type = ?
-        ORDER BY timestamp DESC
-        """, (event_type,))
-
-        rows = cursor.fetchall()
-        conn.close()
+    def recall_by_type(
+        self,
+        event_type: str,
+        since: Optional[Union[str, Tuple[str, int]]] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Decisions of one type; each row carries its "id".
+
+        Without `since`: newest first.
+        With `since`: a keyset cursor, rows after it OLDEST first, so
+        paging never skips rows:
+        - since=(timestamp, id) of the last row seen: rows after it,
+          including later rows written in the same second
+        - since=timestamp: rows strictly after that second
+        - limit: maximum number of rows (None = all)
+        """
+        sql_limit = -1 if limit is None else limit
+
+        if since is None:
+            rows = self._connection().execute(
+                RECALL_BY_TYPE_SQL, (event_type, sql_limit)
+            ).fetchall()
+        else:
+            if isinstance(since, str):
+                since = (since, _AFTER_EVERY_ID)
+            timestamp, row_id = since
+            rows = self._connection().execute(
+                RECALL_BY_TYPE_SINCE_SQL,
+                (event_type, timestamp, row_id, sql_limit),
+            ).fetchall()
 
         return [
             {
                 "data": json.loads(row[0]),
                 "timestamp": row[1],
+                "id": row[2],
             }
             for row in rows
         ]
 
     # --------------------------------------------------
-    # Semantic Memory
+    # Incremental Accumulators
     # --------------------------------------------------
 
-    def learn_pattern(self, key: str, value: Any):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-        INSERT OR REPLACE INTO semantic_memory (key, value)
-        VALUES (?, ?)
-        """, (key, json.dumps(value)))
+    def register_accumulator(self, event_type: str, accumulator) -> None:
+        """
+        Maintain `accumulator` (see memory/decay_accumulator.py) in
+        semantic memory under `accumulator.key`, updated in the same
+        transaction as every stored `event_type` decision.
+
+        The stored state records the highest episodic row id folded in
+        ("last_id"), so rows written by processes that do not maintain
+        the accumulator are folded in later (next store or
+        recall_accumulator). Existing history is folded in once if no
+        such state is stored yet.
+        """
+        registered = self._accumulators.setdefault(event_type, [])
+        if any(a.key == accumulator.key for a in registered):
+            return
+
+        registered.append(accumulator)
+
+        state = self.recall_knowledge(accumulator.key)
+        if state is None or "last_id" not in state:
+            self.rebuild_accumulator(event_type, accumulator)
+
+    def recall_accumulator(self, event_type: str, accumulator) -> Optional[Dict[str, Any]]:
+        """
+        Accumulator state including every `event_type` row stored so
+        far, by any process. Rows missing from the stored state are
+        folded in and the state written back.
+        """
+        conn = self._connection()
+        state = self.recall_knowledge(accumulator.key)
+        latest = conn.execute(MAX_EPISODIC_ID_SQL).fetchone()[0] or 0
+
+        if latest <= _last_id(state):
+            return state
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(RECALL_KNOWLEDGE_SQL, (accumulator.key,)).fetchone()
+            state = self._fold_newer(
+                conn, event_type, accumulator, json.loads(row[0]) if row else None
+            )
+            if state is not None:
+                conn.execute(
+                    UPSERT_KNOWLEDGE_SQL, (accumulator.key, json.dumps(state))
+                )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+        return state
+
+    def rebuild_accumulator(self, event_type: str, accumulator) -> None:
+        """
+        Recompute accumulator state from the full episodic history.
+        """
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+
+        try:
+            state = None
+            for data, timestamp in conn.execute(REPLAY_BY_TYPE_SQL, (event_type,)):
+                state = accumulator.update(state, json.loads(data), timestamp)
+
+            if state is not None:
+                state["last_id"] = conn.execute(MAX_EPISODIC_ID_SQL).fetchone()[0]
+                conn.execute(
+                    UPSERT_KNOWLEDGE_SQL, (accumulator.key, json.dumps(state))
+                )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    def _update_accumulators(
+        self,
+        conn: sqlite3.Connection,
+        events: List[Tuple[str, Dict[str, Any], str]],
+    ) -> None:
+        """
+        Called inside the write transaction (write lock already held),
+        after `events` were inserted: folding every row past the
+        state's high-water id covers them and any rows other processes
+        stored meanwhile.
+        """
+        if not self._accumulators:
+            return
+
+        for event_type, accumulators in self._accumulators.items():
+            if not any(e[0] == event_type for e in events):
+                continue
+
+            for accumulator in accumulators:
+                row = conn.execute(
+                    RECALL_KNOWLEDGE_SQL, (accumulator.key,)
+                ).fetchone()
+                state = self._fold_newer(
+                    conn, event_type, accumulator, json.loads(row[0]) if row else None
+                )
+
+                conn.execute(
+                    UPSERT_KNOWLEDGE_SQL, (accumulator.key, json.dumps(state))
+                )
+
+    def _fold_newer(
+        self,
+        conn: sqlite3.Connection,
+        event_type: str,
+        accumulator,
+        state: Optional[Dict[str, Any]],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Fold `event_type` rows past the state's "last_id" into it.
+        """
+        last_id = _last_id(state)
+
+        for row_id, data, timestamp in conn.execute(
+            FOLD_NEWER_SQL, (last_id, event_type)
+        ):
+            state = accumulator.update(state, json.loads(data), timestamp)
+            last_id = row_id
+
+        if state is not None:
+            state["last_id"] = last_id
+        return state
 
-        conn.commit()
-        conn.close()
+    # --------------------------------------------------
+    # Semantic Memory
+    # --------------------------------------------------
 
-    def recall_knowledge(self, key: str) -> Any:
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+    def learn_pattern(self, key: str, value: Any):
+        conn = self._connection()
 
-        cursor.execute("""
-        SELECT value FROM semantic_memory WHERE key = ?
-        """, (key,))
+        with conn:
+            conn.execute(UPSERT_KNOWLEDGE_SQL, (key, json.dumps(value)))
 
-        row = cursor.fetchone()
-        conn.close()
+    def recall_knowledge(self, key: str) -> Optional[Any]:
+        row = self._connection().execute(
+            RECALL_KNOWLEDGE_SQL, (key,)
+        ).fetchone()
 
         if row:
             return json.loads(row[0])
         return None
 
     def knowledge_summary(self) -> Dict[str, Any]:
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT key, value FROM semantic_memory")
-        rows = cursor.fetchall()
-        conn.close()
+        rows = self._connection().execute(KNOWLEDGE_SUMMARY_SQL).fetchall()
 
-        return {row[0]: json.loads(row[1]) for row in rows}
\ No newline at end of file
+        return {row[0]: json.loads(row[1]) for row in rows}
@@ -0,0 +1,101 @@
+# src/platform10/memory/migrations.py
+
+"""
+Versioned schema migrations for the MemoryManager SQLite store.
+
+The applied version is tracked in SQLite's PRAGMA user_version.
+Migrations are append-only: never edit a released migration,
+add a new one with the next version number instead.
+"""
+
+import sqlite3
+from dataclasses import dataclass
+from typing import List, Optional
+
+
+@dataclass(frozen=True)
+class Migration:
+    """
+    One forward-only schema change.
+    """
+    version: int
+    description: str
+    statements: List[str]
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(
+        version=1,
+        description="Episodic and semantic memory tables",
+        statements=[
+            """
+            CREATE TABLE IF NOT EXISTS episodic_memory (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                event_type TEXT,
+                data TEXT,
+                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS semantic_memory (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            )
+            """,
+        ],
+    ),
+    Migration(
+        version=2,
+        description="Indexes for recall_by_type and recall_recent",
+        statements=[
+            """
+            CREATE INDEX IF NOT EXISTS idx_episodic_type_timestamp
+            ON episodic_memory (event_type, timestamp)
+            """,
+            """
+            CREATE INDEX IF NOT EXISTS idx_episodic_timestamp
+            ON episodic_memory (timestamp)
+            """,
+        ],
+    ),
+]
+
+
+def current_version(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def apply_migrations(
+    conn: sqlite3.Connection,
+    migrations: List[Migration] = MIGRATIONS,
+    target_version: Optional[int] = None,
+) -> int:
+    """
+    Apply every pending migration up to target_version (default: latest).
+
+    Runs under BEGIN IMMEDIATE so concurrent processes opening the
+    same database migrate exactly once. Returns the resulting version.
+    """
+    conn.execute("BEGIN IMMEDIATE")
+
+    try:
+        version = current_version(conn)
+
+        for migration in sorted(migrations, key=lambda m: m.version):
+            if migration.version <= version:
+                continue
+            if target_version is not None and migration.version > target_version:
+                break
+
+            for statement in migration.statements:
+                conn.execute(statement)
+
+            conn.execute(f"PRAGMA user_version = {int(migration.version)}")
+            version = migration.version
+
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+    return version
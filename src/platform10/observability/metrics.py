@@ -0,0 +1,262 @@
+"""
+Runtime Metrics
+---------------
+In-process latency histograms, token counters and error rates per
+workflow and per agent, exported in Prometheus text format.
+
+Latencies go into HDR-style histograms: values (in microseconds) are
+exact below 2^SUB_BUCKET_BITS and above that fall into log-linear
+buckets, so recording is O(1), memory is bounded by the value range
+rather than the sample count, and every percentile is within
+1 / 2^(SUB_BUCKET_BITS - 1) (~1.6%) of the true value.
+
+Used by:
+- Executor.execute / AsyncExecutor.aexecute
+- ExecutionEngine.execute_sequence / execute_graph
+- GET /metrics (src/main.py)
+"""
+
+import math
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+SUB_BUCKET_BITS = 7
+_SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+_HALF = _SUB_BUCKETS >> 1
+
+
+def _bucket_index(value: int) -> int:
+    if value < _SUB_BUCKETS:
+        return value
+    shift = value.bit_length() - SUB_BUCKET_BITS
+    return _SUB_BUCKETS + (shift - 1) * _HALF + ((value >> shift) - _HALF)
+
+
+def _bucket_high(index: int) -> int:
+    """
+    Highest value that maps to bucket `index`.
+    """
+    if index < _SUB_BUCKETS:
+        return index
+    shift, offset = divmod(index - _SUB_BUCKETS, _HALF)
+    shift += 1
+    return ((offset + _HALF + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """
+    HDR-style latency histogram (thread-safe).
+    """
+
+    QUANTILES = (0.5, 0.95, 0.99)
+
+    def __init__(self):
+        self._counts: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self.count = 0
+        self.sum_us = 0
+        self.max_us = 0
+
+    def record(self, latency_ms: float) -> None:
+        value = max(0, int(latency_ms * 1000))
+        index = _bucket_index(value)
+
+        with self._lock:
+            self._counts[index] = self._counts.get(index, 0) + 1
+            self.count += 1
+            self.sum_us += value
+            if value > self.max_us:
+                self.max_us = value
+
+    def percentile(self, q: float) -> float:
+        """
+        Latency (ms) at quantile `q` (0..1); 0.0 when empty.
+        """
+        with self._lock:
+            if not self.count:
+                return 0.0
+            target = max(1, math.ceil(q * self.count))
+            seen = 0
+            for index in sorted(self._counts):
+                seen += self._counts[index]
+                if seen >= target:
+                    return min(_bucket_high(index), self.max_us) / 1000
+            return self.max_us / 1000
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "sum_ms": self.sum_us / 1000,
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+            "max": self.max_us / 1000,
+        }
+
+
+@dataclass
+class SeriesStats:
+    """
+    Latency, tokens and errors of one (workflow, agent) series.
+    """
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    runs: int = 0
+    errors: int = 0
+    tokens: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def observe(self, latency_ms: float, tokens: int, error: bool) -> None:
+        self.latency.record(latency_ms)
+        with self._lock:
+            self.runs += 1
+            self.errors += bool(error)
+            self.tokens += int(tokens or 0)
+
+    def snapshot(self) -> Dict[str, float]:
+        return {
+            **self.latency.summary(),
+            "runs": self.runs,
+            "errors": self.errors,
+            "error_rate": self.errors / self.runs if self.runs else 0.0,
+            "tokens": self.tokens,
+        }
+
+
+# Series key: (workflow, agent); agent is None for the workflow itself
+SeriesKey = Tuple[str, Optional[str]]
+
+
+class MetricsRegistry:
+    """
+    Process-wide registry of workflow / agent series.
+    """
+
+    PREFIX = "platform10"
+
+    def __init__(self, prefix: Optional[str] = None):
+        self.prefix = prefix or self.PREFIX
+        self._series: Dict[SeriesKey, SeriesStats] = {}
+        self._lock = threading.Lock()
+
+    def _stats(self, key: SeriesKey) -> SeriesStats:
+        stats = self._series.get(key)
+        if stats is None:
+            with self._lock:
+                stats = self._series.setdefault(key, SeriesStats())
+        return stats
+
+    def observe_agent(
+        self,
+        workflow: str,
+        agent: str,
+        latency_ms: float,
+        tokens: int = 0,
+        error: bool = False,
+    ) -> None:
+        self._stats((workflow, agent)).observe(latency_ms, tokens, error)
+
+    def observe_workflow(
+        self,
+        workflow: str,
+        latency_ms: float,
+        tokens: int = 0,
+        error: bool = False,
+    ) -> None:
+        self._stats((workflow, None)).observe(latency_ms, tokens, error)
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """
+        {"workflows": {name: stats}, "agents": {(workflow, agent): stats}}
+        """
+        with self._lock:
+            series = list(self._series.items())
+
+        result: Dict[str, Dict] = {"workflows": {}, "agents": {}}
+        for (workflow, agent), stats in series:
+            if agent is None:
+                result["workflows"][workflow] = stats.snapshot()
+            else:
+                result["agents"][(workflow, agent)] = stats.snapshot()
+        return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+    # --------------------------------
+    # Prometheus text format (0.0.4)
+    # --------------------------------
+    def render_prometheus(self) -> str:
+        snapshot = self.snapshot()
+        lines: List[str] = []
+
+        for scope, series in (
+            ("workflow", snapshot["workflows"].items()),
+            ("agent", snapshot["agents"].items()),
+        ):
+            series = sorted(
+                ((_labels(scope, key), stats) for key, stats in series),
+                key=lambda item: item[0],
+            )
+            lines.extend(self._render_scope(scope, series))
+
+        return "\n".join(lines) + "\n"
+
+    def _render_scope(self, scope: str, series: List) -> Iterable[str]:
+        name = f"{self.prefix}_{scope}"
+
+        yield f"# HELP {name}_latency_seconds {scope} latency"
+        yield f"# TYPE {name}_latency_seconds summary"
+        for labels, stats in series:
+            for q in LatencyHistogram.QUANTILES:
+                value = _seconds(stats[f"p{int(q * 100)}"])
+                yield f'{name}_latency_seconds{{{labels},quantile="{q}"}} {value}'
+            yield f"{name}_latency_seconds_sum{{{labels}}} {_seconds(stats['sum_ms'])}"
+            yield f"{name}_latency_seconds_count{{{labels}}} {stats['count']}"
+
+        for metric, kind, help_text, key in _SCALAR_METRICS:
+            yield f"# HELP {name}_{metric} {scope} {help_text}"
+            yield f"# TYPE {name}_{metric} {kind}"
+            for labels, stats in series:
+                value = _seconds(stats[key]) if key == "max" else stats[key]
+                yield f"{name}_{metric}{{{labels}}} {value}"
+
+
+# (metric suffix, type, help, snapshot key)
+_SCALAR_METRICS = (
+    ("latency_max_seconds", "gauge", "slowest run", "max"),
+    ("runs_total", "counter", "runs (successful and failed)", "runs"),
+    ("errors_total", "counter", "failed runs", "errors"),
+    ("tokens_total", "counter", "tokens consumed", "tokens"),
+)
+
+
+def _seconds(ms: float) -> str:
+    return f"{ms / 1000:.6f}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(scope: str, key) -> str:
+    if scope == "workflow":
+        return f'workflow="{_escape(key)}"'
+    workflow, agent = key
+    return f'workflow="{_escape(workflow)}",agent="{_escape(agent)}"'
+
+
+# -----------------------------
+# Global Default Registry
+# -----------------------------
+
+_default_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """
+    Accessor for the default metrics registry.
+    """
+    return _default_registry
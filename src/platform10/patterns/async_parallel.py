@@ -0,0 +1,58 @@
+# src/platform10/patterns/async_parallel.py
+
+import asyncio
+from typing import Dict, Any, List
+
+from platform10.patterns.parallel import ParallelStep
+from platform10.runtime.async_executor import AsyncExecutor
+from platform10.runtime.executor import ExecutionResult
+
+
+class AsyncParallelFanOut:
+    """
+    asyncio counterpart of ParallelFanOut.
+
+    All steps are awaited concurrently (optionally capped by
+    max_concurrency); outputs are merged in declared step order, so
+    the aggregated context does not depend on completion order.
+    """
+
+    def __init__(
+        self,
+        executor: AsyncExecutor,
+        steps: List[ParallelStep],
+        max_concurrency: int | None = None,
+    ):
+        self.executor = executor
+        self.steps = steps
+        self.max_concurrency = max_concurrency
+
+    async def arun(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        aggregated_context = dict(context)
+
+        semaphore = (
+            asyncio.Semaphore(self.max_concurrency)
+            if self.max_concurrency
+            else None
+        )
+
+        async def run_step(step: ParallelStep) -> ExecutionResult:
+            if semaphore is None:
+                return await self.executor.arun_agent(step.agent, aggregated_context)
+            async with semaphore:
+                return await self.executor.arun_agent(step.agent, aggregated_context)
+
+        results: List[ExecutionResult] = list(
+            await asyncio.gather(*(run_step(step) for step in self.steps))
+        )
+
+        for step, result in zip(self.steps, results):
+            if result.status == "SUCCESS":
+                aggregated_context[f"{step.name}_output"] = result.output
+            else:
+                aggregated_context[f"{step.name}_error"] = result.output
+
+        return {
+            "final_context": aggregated_context,
+            "results": results,
+        }
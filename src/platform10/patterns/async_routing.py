@@ -0,0 +1,47 @@
+# src/platform10/patterns/async_routing.py
+
+from typing import Dict, Callable, Any
+from dataclasses import dataclass
+
+from platform10.patterns.async_sequence import AsyncAgentPipeline
+from platform10.runtime.async_executor import AsyncExecutor
+
+
+@dataclass
+class AsyncRoute:
+    """
+    A conditional route to an async pipeline.
+    """
+    name: str
+    condition: Callable[[Dict[str, Any]], bool]
+    pipeline: AsyncAgentPipeline
+
+
+class AsyncConditionalRouter:
+    """
+    asyncio counterpart of ConditionalRouter.
+    """
+
+    def __init__(
+        self,
+        executor: AsyncExecutor,
+        routes: Dict[str, AsyncRoute],
+        default_pipeline: AsyncAgentPipeline | None = None,
+    ):
+        self.executor = executor
+        self.routes = routes
+        self.default_pipeline = default_pipeline
+
+    async def arun(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        for route in self.routes.values():
+            if route.condition(context):
+                result = await route.pipeline.arun(context)
+                result["selected_route"] = route.name
+                return result
+
+        if self.default_pipeline:
+            result = await self.default_pipeline.arun(context)
+            result["selected_route"] = "default"
+            return result
+
+        raise RuntimeError("No routing condition matched and no default pipeline provided")
@@ -0,0 +1,67 @@
+# src/platform10/patterns/async_sequence.py
+
+import asyncio
+from typing import Dict, Any, List, Optional
+
+from platform10.patterns.sequence import PipelineStep
+from platform10.runtime.async_executor import AsyncExecutor
+from platform10.runtime.executor import ExecutionResult
+
+
+class AsyncAgentPipeline:
+    """
+    asyncio counterpart of AgentPipeline: same retry, fallback and
+    context-propagation semantics; retry delays do not block the loop.
+    """
+
+    def __init__(self, executor: AsyncExecutor, steps: List[PipelineStep]):
+        self.executor = executor
+        self.steps = steps
+
+    async def arun(self, initial_context: Dict[str, Any]) -> Dict[str, Any]:
+        context = dict(initial_context)
+        results: List[ExecutionResult] = []
+
+        for step in self.steps:
+            policy = step.retry_policy
+            attempt = 0
+            last_result: Optional[ExecutionResult] = None
+
+            # ---------- Retry loop ----------
+            while True:
+                last_result = await self.executor.arun_agent(step.agent, context)
+                results.append(last_result)
+
+                if last_result.status == "SUCCESS":
+                    break
+
+                if policy is None or attempt >= policy.retries:
+                    break
+
+                attempt += 1
+                if policy.retry_delay_sec > 0:
+                    await asyncio.sleep(policy.retry_delay_sec)
+
+            # ---------- Fallback ----------
+            if last_result and last_result.status != "SUCCESS":
+                if policy and policy.fallback_agent:
+                    fallback_result = await self.executor.arun_agent(
+                        policy.fallback_agent, context
+                    )
+                    results.append(fallback_result)
+
+                    if fallback_result.status == "SUCCESS":
+                        context[f"{step.name}_output"] = fallback_result.output
+                        continue
+
+                if step.stop_on_failure:
+                    break
+
+            # ---------- Context propagation ----------
+            if last_result and last_result.status == "SUCCESS":
+                context[f"{step.name}_output"] = last_result.output
+
+        return {
+            "final_context": context,
+            "results": results,
+        }
@@ -7,22 +7,207 @@ Enterprise purpose:
 - Prevent runaway LLM / agent execution
 - Enforce SLAs
 - Enable per-tenant / per-workflow budgets
+
+Budgets are checked twice:
+- admit()   before an agent starts, against its predicted cost
+- enforce() after it completes, against measured metrics
+
+Predictions come from what the agent declares
+(`expected_latency_ms`, `expected_tokens`) or, failing that, from a
+percentile of its observed history (AgentCostHistory). An agent that
+would blow the remaining budget is skipped, degraded to its
+`fallback_agent`, or the execution is aborted before it starts.
 """
 
+import threading
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Optional, Tuple
+
 
 class ExecutionBudgetExceeded(Exception):
     """Raised when execution exceeds allowed budget."""
     pass
 
 
+BREACH_ACTIONS = ("skip", "degrade", "abort")
+
+
+@dataclass
+class AgentEstimate:
+    """
+    Predicted cost of one agent run.
+    """
+    latency_ms: float = 0.0
+    tokens: float = 0.0
+    source: str = "declared"     # declared / learned
+
+
+@dataclass
+class Admission:
+    """
+    Governor verdict for an agent about to start.
+    """
+    action: str                  # RUN / SKIP / DEGRADE / ABORT
+    agent: Any = None            # what to run (the fallback when degrading)
+    estimate: Optional[AgentEstimate] = None
+    reason: str = ""
+
+
+class AgentCostHistory:
+    """
+    Rolling per-agent latency / token samples, shared across executions
+    so the governor can learn percentiles.
+    """
+
+    WINDOW = 256
+    MIN_SAMPLES = 20
+
+    def __init__(self, window: int | None = None, min_samples: int | None = None):
+        self.window = window or self.WINDOW
+        self.min_samples = min_samples or self.MIN_SAMPLES
+        self._samples: Dict[str, Deque[Tuple[float, float]]] = defaultdict(
+            lambda: deque(maxlen=self.window)
+        )
+        self._lock = threading.Lock()
+
+    def observe(self, agent: str, latency_ms: float, tokens: float = 0) -> None:
+        with self._lock:
+            self._samples[agent].append((latency_ms, tokens or 0))
+
+    def count(self, agent: str) -> int:
+        with self._lock:
+            return len(self._samples.get(agent, ()))
+
+    def estimate(self, agent: str, percentile: float) -> Optional[AgentEstimate]:
+        """
+        Nearest-rank percentile of latency and tokens, or None until
+        `min_samples` runs have been seen.
+        """
+        with self._lock:
+            samples = list(self._samples.get(agent, ()))
+
+        if len(samples) < self.min_samples:
+            return None
+
+        rank = max(0, min(len(samples) - 1, int(len(samples) * percentile / 100)))
+        latencies = sorted(latency for latency, _ in samples)
+        tokens = sorted(used for _, used in samples)
+
+        return AgentEstimate(
+            latency_ms=latencies[rank],
+            tokens=tokens[rank],
+            source="learned",
+        )
+
+
 class ExecutionGovernor:
     def __init__(
         self,
         max_tokens: int | None = None,
         max_latency_ms: int | None = None,
+        history: AgentCostHistory | None = None,
+        on_breach: str = "abort",
+        percentile: float = 95,
     ):
+        if on_breach not in BREACH_ACTIONS:
+            raise ValueError(
+                f"Unknown breach action '{on_breach}', expected one of {BREACH_ACTIONS}"
+            )
+
         self.max_tokens = max_tokens
         self.max_latency_ms = max_latency_ms
+        self.history = history
+        self.on_breach = on_breach
+        self.percentile = percentile
+
+    # --------------------------------
+    # Before an agent starts
+    # --------------------------------
+    def estimate(self, agent: Any, name: str | None = None) -> Optional[AgentEstimate]:
+        """
+        Declared expectations win; otherwise the learned percentile.
+        None when nothing is known about the agent.
+        """
+        latency = getattr(agent, "expected_latency_ms", None)
+        tokens = getattr(agent, "expected_tokens", None)
+
+        if latency is not None or tokens is not None:
+            return AgentEstimate(latency_ms=latency or 0, tokens=tokens or 0)
+
+        if self.history is None:
+            return None
+
+        # Same default as Executor's resolve_agent_name, which records
+        # the history
+        return self.history.estimate(
+            name or getattr(agent, "name", agent.__class__.__name__),
+            self.percentile,
+        )
+
+    def predict_breach(self, estimate: Optional[AgentEstimate], metrics: dict) -> str:
+        """
+        Reason the estimate would exceed a budget ("" if it fits).
+        """
+        if estimate is None:
+            return ""
+
+        tokens = metrics.get("tokens", 0) + estimate.tokens
+        latency = metrics.get("latency_ms", 0) + estimate.latency_ms
+
+        if self.max_tokens is not None and tokens > self.max_tokens:
+            return (
+                f"Predicted token budget breach: {tokens:.0f} > {self.max_tokens}"
+            )
+
+        if self.max_latency_ms is not None and latency > self.max_latency_ms:
+            return (
+                f"Predicted latency budget breach: "
+                f"{latency:.0f}ms > {self.max_latency_ms}ms"
+            )
+
+        return ""
+
+    def admit(self, agent: Any, metrics: dict, name: str | None = None) -> Admission:
+        """
+        Decide whether `agent` may start given current metrics.
+        Agents may override the policy with `on_budget_breach`.
+        """
+        estimate = self.estimate(agent, name)
+        reason = self.predict_breach(estimate, metrics)
+
+        if not reason:
+            return Admission(action="RUN", agent=agent, estimate=estimate)
+
+        action = getattr(agent, "on_budget_breach", None) or self.on_breach
+
+        if action == "skip":
+            return Admission(action="SKIP", estimate=estimate, reason=reason)
+
+        if action == "degrade":
+            fallback = getattr(agent, "fallback_agent", None)
+            if fallback is not None:
+                fallback_estimate = self.estimate(fallback)
+                if not self.predict_breach(fallback_estimate, metrics):
+                    return Admission(
+                        action="DEGRADE",
+                        agent=fallback,
+                        estimate=fallback_estimate,
+                        reason=reason,
+                    )
+                reason += " (fallback would breach too)"
+            else:
+                reason += " (no fallback_agent)"
+
+        return Admission(action="ABORT", estimate=estimate, reason=reason)
+
+    def observe(self, name: str, latency_ms: float, tokens: float = 0) -> None:
+        if self.history is not None:
+            self.history.observe(name, latency_ms, tokens)
+
+    # --------------------------------
+    # After an agent completes
+    # --------------------------------
 
     def enforce(self, metrics: dict):
         """
@@ -4,8 +4,7 @@ from typing import Dict, Any, List
 from dataclasses import dataclass
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from platform10.runtime.engine import WorkflowEngine
-from platform10.runtime.executor import ExecutionResult
+from platform10.runtime.executor import Executor, ExecutionResult
 
 
 @dataclass
@@ -24,7 +23,7 @@ class ParallelFanOut:
 
     def __init__(
         self,
-        engine: WorkflowEngine,
+        engine: Executor,
         steps: List[ParallelStep],
         max_workers: int | None = None,
     ):
@@ -3,11 +3,33 @@
 """
 Reflection Pattern
 Upgraded with Exponential Temporal Decay Weighting
+
+Risk density is read from an incrementally maintained accumulator
+(memory/decay_accumulator.py) instead of re-scanning every
+fraud_assessment row, so each reflection is O(1).
+
+reflect_batch() is the vectorised (NumPy) path for back-testing
+and recalibration over historical windows.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime
-import math
+
+import numpy as np
+
+from platform10.memory.decay_accumulator import DecayedRiskAccumulator
+
+
+def _to_datetime64(timestamps: List[Optional[str]], default: datetime) -> np.ndarray:
+    """
+    Parse ISO timestamps ONCE into a datetime64[us] array.
+    Missing values fall back to `default`; a trailing 'Z' is ignored.
+    """
+    cleaned = [
+        ts[:-1] if ts and ts.endswith("Z") else (ts or default.isoformat())
+        for ts in timestamps
+    ]
+    return np.array(cleaned, dtype="datetime64[us]")
 
 
 class ReflectionPattern:
@@ -20,58 +42,144 @@ class ReflectionPattern:
     # Decay rate per hour (tunable)
     DECAY_LAMBDA = 0.15
 
+    HIGH_RISK_SCORE = 0.8
+    EVENT_TYPE = "fraud_assessment"
+    RISK_DENSITY_KEY = "reflection:fraud_assessment:decayed_risk"
+
     def __init__(self, memory_manager=None):
         self.memory = memory_manager
 
-    def reflect(self, decision: Dict[str, Any]) -> Dict[str, Any]:
-
-        fraud_score = decision.get("fraud_score", 0.0)
-        confidence = decision.get("confidence", 0.0)
-        verdict = decision.get("verdict", "UNKNOWN")
-
-        historical_adjustment = 0.0
-        pattern_flag = None
+        self.accumulator = DecayedRiskAccumulator(
+            key=self.RISK_DENSITY_KEY,
+            decay_lambda=self.DECAY_LAMBDA,
+            high_risk_threshold=self.HIGH_RISK_SCORE,
+        )
 
-        # --------------------------------------------------
-        # Exponential Temporal Decay Risk Density
-        # --------------------------------------------------
         if self.memory:
-
-            recent_events: List[Dict[str, Any]] = (
-                self.memory.recall_by_type("fraud_assessment")
+            self.memory.register_accumulator(self.EVENT_TYPE, self.accumulator)
+
+    def risk_density(self, now: Optional[datetime] = None) -> Optional[float]:
+        """
+        Exponentially decayed share of high-risk assessments.
+        """
+        if not self.memory:
+            return None
+
+        state = self.memory.recall_accumulator(self.EVENT_TYPE, self.accumulator)
+        return self.accumulator.risk_density(state, now)
+
+    def reflect_batch(
+        self,
+        decisions: List[Dict[str, Any]],
+        history: Optional[List[Dict[str, Any]]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Vectorised reflection for many decisions at once.
+
+        - history: recall_by_type()-shaped events ({"data", "timestamp"});
+          loaded once from memory when omitted
+        - each decision is evaluated at its own "timestamp" (default: now)
+          against history events at or before that time, i.e. a
+          point-in-time back-test
+
+        Output matches reflect() element-wise.
+        """
+        if not decisions:
+            return []
+
+        if history is None:
+            history = (
+                self.memory.recall_by_type(self.EVENT_TYPE)
+                if self.memory else []
             )
 
-            now = datetime.utcnow()
+        now = datetime.utcnow()
+        history = [e for e in history if e.get("timestamp")]
 
-            weighted_high_risk = 0.0
-            weighted_total = 0.0
+        decision_times = _to_datetime64(
+            [d.get("timestamp") for d in decisions], now
+        )
+        confidence = np.array(
+            [d.get("confidence", 0.0) for d in decisions], dtype=np.float64
+        )
 
-            for event in recent_events:
+        density = np.full(len(decisions), np.nan)
 
-                score = event["data"].get("score", 0.0)
-                timestamp_str = event.get("timestamp")
+        if history:
+            event_times = _to_datetime64([e["timestamp"] for e in history], now)
+            scores = np.array(
+                [e["data"].get("score", 0.0) for e in history], dtype=np.float64
+            )
+
+            order = np.argsort(event_times, kind="stable")
+            event_times = event_times[order]
+            scores = scores[order]
 
-                if not timestamp_str:
-                    continue
+            origin = event_times[0]
+            hour = np.timedelta64(3600, "s")
+            event_hours = (event_times - origin) / hour
+            decision_hours = (decision_times - origin) / hour
+
+            # log of cumulative sum(exp(lambda * t_i)), overflow-free
+            log_weights = self.DECAY_LAMBDA * event_hours
+            log_total = np.logaddexp.accumulate(log_weights)
+            log_high = np.logaddexp.accumulate(
+                np.where(scores >= self.HIGH_RISK_SCORE, log_weights, -np.inf)
+            )
 
-                event_time = datetime.fromisoformat(timestamp_str)
-                age_hours = (now - event_time).total_seconds() / 3600.0
+            # Number of history events visible to each decision
+            visible = np.searchsorted(event_times, decision_times, side="right")
+            has_history = visible > 0
+            last = np.maximum(visible - 1, 0)
+
+            # Total weight at evaluation time must be representable,
+            # exactly like the scalar path.
+            with np.errstate(over="ignore", under="ignore"):
+                total_now = np.exp(
+                    log_total[last] - self.DECAY_LAMBDA * decision_hours
+                )
+                ratio = np.exp(log_high[last] - log_total[last])
+
+            usable = has_history & (total_now > 0)
+            density[usable] = ratio[usable]
+
+        has_density = ~np.isnan(density)
+        adjustment = np.where(has_density, -0.25 * density, 0.0)
+        adjusted = np.clip(confidence + adjustment, 0.0, 1.0)
+        flagged = has_density & (np.nan_to_num(density) >= 0.5)
+
+        return [
+            {
+                "fraud_score": decision.get("fraud_score", 0.0),
+                "original_confidence": decision.get("confidence", 0.0),
+                "adjusted_confidence": float(adjusted[i]),
+                "verdict": decision.get("verdict", "UNKNOWN"),
+                "reflection_flag": (
+                    "High Systemic Risk Environment" if flagged[i] else None
+                ),
+            }
+            for i, decision in enumerate(decisions)
+        ]
 
-                # Exponential decay
-                weight = math.exp(-self.DECAY_LAMBDA * age_hours)
+    def reflect(self, decision: Dict[str, Any]) -> Dict[str, Any]:
 
-                weighted_total += weight
+        fraud_score = decision.get("fraud_score", 0.0)
+        confidence = decision.get("confidence", 0.0)
+        verdict = decision.get("verdict", "UNKNOWN")
 
-                if score >= 0.8:
-                    weighted_high_risk += weight
+        historical_adjustment = 0.0
+        pattern_flag = None
 
-            if weighted_total > 0:
-                risk_density = weighted_high_risk / weighted_total
+        # --------------------------------------------------
+        # Exponential Temporal Decay Risk Density
+        # --------------------------------------------------
+        risk_density = self.risk_density()
 
-                historical_adjustment = -0.25 * risk_density
+        if risk_density is not None:
+            historical_adjustment = -0.25 * risk_density
 
-                if risk_density >= 0.5:
-                    pattern_flag = "High Systemic Risk Environment"
+            if risk_density >= 0.5:
+                pattern_flag = "High Systemic Risk Environment"
 
         # --------------------------------------------------
         # Apply Adjustment
@@ -4,7 +4,7 @@ from typing import Dict, Callable, Any
 from dataclasses import dataclass
 
 from platform10.patterns.sequence import AgentPipeline
-from platform10.runtime.engine import WorkflowEngine
+from platform10.runtime.executor import Executor
 
 
 @dataclass
@@ -24,7 +24,7 @@ class ConditionalRouter:
 
     def __init__(
         self,
-        engine: WorkflowEngine,
+        engine: Executor,
         routes: Dict[str, Route],
         default_pipeline: AgentPipeline | None = None,
     ):
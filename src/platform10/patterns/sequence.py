@@ -4,8 +4,7 @@ from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 import time
 
-from platform10.runtime.engine import WorkflowEngine
-from platform10.runtime.executor import ExecutionResult
+from platform10.runtime.executor import Executor, ExecutionResult
 from platform10.patterns.retry import RetryPolicy
 
 
@@ -26,7 +25,7 @@ class AgentPipeline:
     Supports retry and fallback semantics.
     """
 
-    def __init__(self, engine: WorkflowEngine, steps: List[PipelineStep]):
+    def __init__(self, engine: Executor, steps: List[PipelineStep]):
         self.engine = engine
         self.steps = steps
 
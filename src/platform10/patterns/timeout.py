@@ -1,27 +1,314 @@
+"""
+Timeout Pattern
+---------------
+Pre-emptive execution budgets.
+
+FinTech relevance:
+- Fraud decisions must complete under SLA
+- A hung agent must not hold the request past its deadline
+
+Three ways of bounding work:
+    with_timeout          pooled thread + future deadline; slow work is
+                          abandoned (and its worker replaced)
+    awith_timeout         asyncio.wait_for; the coroutine is cancelled
+    with_process_timeout  child process; killed when the deadline passes
+
+Deadlines propagate: a Deadline installed with `deadline_scope` is
+visible to everything running inside it (threads started by
+with_timeout and asyncio tasks included), tightens every nested
+timeout, and lets agents read their remaining budget with
+`remaining_budget_ms()`.
+"""
+
+import asyncio
+import contextvars
+import multiprocessing
+import queue
+import threading
 import time
-from typing import Callable
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Iterator, Optional
+
+
+class TimeoutExceeded(TimeoutError):
+    def __init__(self, message: str, timeout_ms: Optional[float] = None):
+        super().__init__(message)
+        self.timeout_ms = timeout_ms
+
+
+class Deadline:
+    """
+    Absolute point in (monotonic) time by which work must finish.
+    """
+
+    __slots__ = ("at",)
+
+    def __init__(self, timeout_ms: float):
+        self.at = time.monotonic() + timeout_ms / 1000
+
+    def remaining_ms(self) -> float:
+        return max(0.0, (self.at - time.monotonic()) * 1000)
+
+    def expired(self) -> bool:
+        return time.monotonic() >= self.at
+
+    def __repr__(self) -> str:
+        return f"Deadline(remaining_ms={self.remaining_ms():.1f})"
+
+
+_current_deadline: contextvars.ContextVar[Optional[Deadline]] = (
+    contextvars.ContextVar("platform10_deadline", default=None)
+)
+
+
+def current_deadline() -> Optional[Deadline]:
+    return _current_deadline.get()
+
+
+def remaining_budget_ms() -> Optional[float]:
+    """
+    Budget left under the active deadline (None = unbounded).
+    """
+    deadline = _current_deadline.get()
+    return None if deadline is None else deadline.remaining_ms()
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[Deadline]) -> Iterator[Optional[Deadline]]:
+    """
+    Install `deadline` for the enclosed block. A scope can only
+    tighten: an earlier enclosing deadline stays in force.
+    """
+    outer = _current_deadline.get()
+    if deadline is None or (outer is not None and outer.at <= deadline.at):
+        deadline = outer
+
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def _effective_deadline(timeout_ms: Optional[float]) -> Optional[Deadline]:
+    outer = _current_deadline.get()
+    if timeout_ms is None:
+        return outer
+
+    deadline = Deadline(timeout_ms)
+    if outer is not None and outer.at <= deadline.at:
+        return outer
+    return deadline
+
+
+def _exceeded(deadline: Deadline, timeout_ms: Optional[float]) -> TimeoutExceeded:
+    budget = timeout_ms if timeout_ms is not None else deadline.remaining_ms()
+    return TimeoutExceeded(f"Execution exceeded {budget:.0f}ms", timeout_ms=budget)
 
 
-class TimeoutExceeded(Exception):
-    pass
+def _call_within(deadline: Deadline, fn: Callable, args, kwargs):
+    _current_deadline.set(deadline)
+    return fn(*args, **kwargs)
 
 
-def with_timeout(fn: Callable, timeout_ms: int, *args, **kwargs):
+# --------------------------------
+# Threads
+# --------------------------------
+TIMEOUT_WORKERS = 32
+
+
+class _Task:
+    __slots__ = ("fn", "done", "abandoned")
+
+    def __init__(self, fn: Callable[[], None]):
+        self.fn = fn
+        self.done = False
+        self.abandoned = False
+
+
+class _DaemonPool:
+    """
+    Pool of daemon threads behind with_timeout, started on demand up
+    to `max_workers`.
+
+    An abandoned (timed-out) run keeps its thread until it returns,
+    but that thread stops counting towards `max_workers` and exits
+    afterwards, so a replacement can start: hung runs cost one thread
+    each instead of draining the pool. With `max_workers` runs
+    genuinely in flight, further calls queue and time out (without
+    running) if no worker frees up before their deadline. Daemon
+    threads never block interpreter exit (concurrent.futures workers
+    are joined at exit).
+    """
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._tasks: "queue.SimpleQueue[_Task]" = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._started = 0
+        self._workers = 0
+        self._idle = 0
+
+    def submit(self, fn: Callable[[], None]) -> _Task:
+        task = _Task(fn)
+        self._tasks.put(task)
+        with self._lock:
+            self._grow()
+        return task
+
+    def abandon(self, task: _Task) -> None:
+        """
+        Release the worker running `task` from the pool.
+        """
+        with self._lock:
+            if task.done or task.abandoned:
+                return
+            task.abandoned = True
+            self._workers -= 1
+            self._grow()
+
+    def _grow(self) -> None:
+        # Called with the lock held
+        if self._idle < self._tasks.qsize() and self._workers < self.max_workers:
+            self._workers += 1
+            self._started += 1
+            threading.Thread(
+                target=self._work,
+                name=f"timeout-worker-{self._started}",
+                daemon=True,
+            ).start()
+
+    def _work(self) -> None:
+        while True:
+            with self._lock:
+                self._idle += 1
+            task = self._tasks.get()
+            with self._lock:
+                self._idle -= 1
+            task.fn()
+            with self._lock:
+                task.done = True
+                if task.abandoned:
+                    return
+
+
+_pool = _DaemonPool(TIMEOUT_WORKERS)
+
+
+def with_timeout(fn: Callable, timeout_ms: Optional[float], *args, **kwargs):
     """
-    Enforces strict execution budget.
+    Run `fn` and return its result, or raise TimeoutExceeded as soon as
+    `timeout_ms` (or the enclosing deadline, if sooner) has passed.
 
-    FinTech relevance:
-    - Fraud decisions must complete under SLA
+    `fn` runs on a shared pool of daemon threads (see _DaemonPool).
+    Python threads cannot be killed: on timeout the work is abandoned
+    (its result discarded), never waited for, and keeps running on its
+    own thread; pass it arguments it cannot use to change state the
+    caller still reads. Use with_process_timeout when it must be
+    stopped. With no timeout and no enclosing deadline `fn` runs
+    inline.
+    """
+    deadline = _effective_deadline(timeout_ms)
+    if deadline is None:
+        return fn(*args, **kwargs)
+    if deadline.expired():
+        raise _exceeded(deadline, timeout_ms)
+
+    future: Future = Future()
+    context = contextvars.copy_context()
+
+    def target():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(context.run(_call_within, deadline, fn, args, kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+
+    task = _pool.submit(target)
+
+    try:
+        return future.result(timeout=deadline.remaining_ms() / 1000)
+    except FutureTimeout:
+        # Not started yet: it never will. Otherwise it is running.
+        if not future.cancel():
+            _pool.abandon(task)
+        raise _exceeded(deadline, timeout_ms) from None
+
+
+# --------------------------------
+# asyncio
+# --------------------------------
+async def awith_timeout(awaitable: Awaitable, timeout_ms: Optional[float]) -> Any:
+    """
+    Await `awaitable`; on timeout it is cancelled and TimeoutExceeded
+    is raised.
+    """
+    deadline = _effective_deadline(timeout_ms)
+    if deadline is None:
+        return await awaitable
+
+    async def scoped():
+        _current_deadline.set(deadline)
+        return await awaitable
+
+    try:
+        return await asyncio.wait_for(scoped(), deadline.remaining_ms() / 1000)
+    except asyncio.TimeoutError:
+        raise _exceeded(deadline, timeout_ms) from None
+
+
+# --------------------------------
+# Processes
+# --------------------------------
+def _process_entry(conn, fn: Callable, args, kwargs):
+    try:
+        conn.send((True, fn(*args, **kwargs)))
+    except BaseException as e:
+        try:
+            conn.send((False, e))
+        except Exception:
+            conn.send((False, RuntimeError(repr(e))))
+    finally:
+        conn.close()
+
+
+def with_process_timeout(fn: Callable, timeout_ms: Optional[float], *args, **kwargs):
+    """
+    Run `fn` in a child process and kill it when the deadline passes.
+    `fn`, its arguments and its result must be picklable.
     """
+    deadline = _effective_deadline(timeout_ms)
+    if deadline is not None and deadline.expired():
+        raise _exceeded(deadline, timeout_ms)
 
-    start = time.time()
-    result = fn(*args, **kwargs)
-    elapsed_ms = (time.time() - start) * 1000
+    parent, child = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(
+        target=_process_entry,
+        args=(child, fn, args, kwargs),
+        daemon=True,
+    )
+    process.start()
+    child.close()
 
-    if elapsed_ms > timeout_ms:
-        raise TimeoutExceeded(
-            f"Execution exceeded {timeout_ms}ms (actual={elapsed_ms:.2f}ms)"
-        )
+    try:
+        wait = None if deadline is None else deadline.remaining_ms() / 1000
+        if not parent.poll(wait):
+            process.kill()
+            raise _exceeded(deadline, timeout_ms)
 
-    return result
+        try:
+            ok, value = parent.recv()
+        except EOFError:
+            process.join()
+            raise RuntimeError(
+                f"Isolated agent process exited with code {process.exitcode}"
+            ) from None
+    finally:
+        parent.close()
+        process.join()
 
+    if not ok:
+        raise value
+    return value
@@ -19,3 +19,7 @@ class ExecutionPolicy:
     """
     max_tokens: int | None = None
     max_latency_ms: int | None = None
+    # Predicted breach before an agent starts: skip / degrade / abort
+    on_predicted_breach: str = "abort"
+    # Percentile of observed agent latency / tokens used as prediction
+    prediction_percentile: float = 95
@@ -0,0 +1,130 @@
+"""
+Async Executor
+--------------
+asyncio counterpart of Executor.
+
+Same policy, governor and audit semantics; agents are awaited through
+their `arun` (sync agents via SyncAgentAdapter), so a single process
+can multiplex many workflow executions.
+"""
+
+import asyncio
+import contextvars
+import time
+from concurrent.futures import Executor as PoolExecutor
+from functools import partial
+from typing import Any, Dict, Optional
+
+from platform10.agents.base.async_agent import as_async
+from platform10.patterns.timeout import (
+    TimeoutExceeded,
+    awith_timeout,
+    with_process_timeout,
+)
+from platform10.runtime.executor import (
+    ExecutionResult,
+    Executor,
+    resolve_agent_name,
+)
+
+
+class AsyncExecutor(Executor):
+    def __init__(self, sync_pool: Optional[PoolExecutor] = None):
+        super().__init__()
+        # Thread pool for adapted sync agents (None = loop default)
+        self.sync_pool = sync_pool
+
+    async def _ainvoke(self, agent, context: dict):
+        """
+        Awaitable counterpart of Executor._invoke: native coroutines are
+        cancelled on timeout, process-isolated agents are killed.
+        """
+        timeout_ms = getattr(agent, "timeout_ms", None)
+
+        if getattr(agent, "isolation", None) == "process":
+            loop = asyncio.get_running_loop()
+            call = partial(
+                contextvars.copy_context().run,
+                with_process_timeout,
+                agent.run,
+                timeout_ms,
+                context,
+            )
+            return await loop.run_in_executor(self.sync_pool, call)
+
+        return await awith_timeout(
+            as_async(agent, self.sync_pool).arun(context),
+            timeout_ms,
+        )
+
+    async def aexecute(self, workflow, context: dict):
+        execution_id, policy, governor, execution_context = self._begin(workflow)
+        current_context = context
+
+        with self._running(execution_context):
+            for agent in workflow.agents:
+                agent = self._admit(
+                    execution_id, agent, policy, governor, execution_context
+                )
+                if agent is None:
+                    continue
+
+                agent_name = resolve_agent_name(agent)
+                start = time.perf_counter()
+
+                try:
+                    result = await self._ainvoke(agent, current_context)
+                except TimeoutExceeded as e:
+                    self._record_failed_agent(
+                        governor, execution_context, agent_name, start
+                    )
+                    self._agent_timed_out(execution_id, agent_name, e)
+                except Exception as e:
+                    self._record_failed_agent(
+                        governor, execution_context, agent_name, start
+                    )
+                    self._agent_failed(execution_id, agent_name, e)
+
+                current_context = self._agent_completed(
+                    execution_id,
+                    agent_name,
+                    policy,
+                    governor,
+                    execution_context,
+                    current_context,
+                    result,
+                    start,
+                )
+
+        return current_context
+
+    async def arun_agent(self, agent, context: Dict[str, Any]) -> ExecutionResult:
+        """
+        Run one agent; failures are audited and returned, not raised.
+        """
+        start = time.perf_counter()
+
+        try:
+            output: Any = await self._ainvoke(agent, context)
+            status = "SUCCESS"
+        except TimeoutExceeded as e:
+            self._audit_timeout(
+                context.get("execution_id"), resolve_agent_name(agent), e
+            )
+            output = {"error": str(e), "timeout_ms": e.timeout_ms}
+            status = "TIMEOUT"
+        except Exception as e:
+            self.audit_log.record(
+                execution_id=context.get("execution_id"),
+                event_type="AGENT_FAILURE",
+                details={"agent": resolve_agent_name(agent), "error": str(e)},
+            )
+            output = {"error": str(e)}
+            status = "FAILURE"
+
+        return ExecutionResult(
+            agent=resolve_agent_name(agent),
+            status=status,
+            output=output,
+            latency_ms=(time.perf_counter() - start) * 1000,
+        )
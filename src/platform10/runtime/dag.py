@@ -0,0 +1,70 @@
+"""
+Agent Dependency Graph.
+
+Agents may declare which top-level context keys they touch:
+
+    reads   = ("case",)        keys the agent looks at
+    writes  = ("risk",)        keys the agent sets / replaces
+    appends = ("signals",)     lists the agent only appends to
+
+Agent j (later in the declared order) depends on an earlier agent i
+when their keys overlap in any way other than read/read or
+append/append. Appends to the same list commute, because results
+are committed in declared order (see ExecutionEngine.execute_graph).
+
+An agent that declares nothing is a barrier: it depends on every
+earlier agent and every later agent depends on it.
+"""
+
+from dataclasses import dataclass
+from typing import Any, FrozenSet, List, Optional, Set
+
+
+@dataclass(frozen=True)
+class AgentAccess:
+    reads: FrozenSet[str]
+    writes: FrozenSet[str]
+    appends: FrozenSet[str]
+
+    def conflicts_with(self, later: "AgentAccess") -> bool:
+        return bool(
+            self.writes & (later.reads | later.writes | later.appends)
+            or self.appends & (later.reads | later.writes)
+            or self.reads & (later.writes | later.appends)
+        )
+
+
+def agent_access(agent: Any) -> Optional[AgentAccess]:
+    """
+    Declared access of an agent, or None if it declares nothing.
+    """
+    reads = getattr(agent, "reads", None)
+    writes = getattr(agent, "writes", None)
+    appends = getattr(agent, "appends", None)
+
+    if reads is None and writes is None and appends is None:
+        return None
+
+    return AgentAccess(
+        reads=frozenset(reads or ()),
+        writes=frozenset(writes or ()),
+        appends=frozenset(appends or ()),
+    )
+
+
+def build_dependency_graph(agents: List[Any]) -> List[Set[int]]:
+    """
+    deps[j] = indices of earlier agents that agent j must wait for.
+    """
+    accesses = [agent_access(agent) for agent in agents]
+    deps: List[Set[int]] = []
+
+    for j, later in enumerate(accesses):
+        deps.append({
+            i for i, earlier in enumerate(accesses[:j])
+            if earlier is None
+            or later is None
+            or earlier.conflicts_with(later)
+        })
+
+    return deps
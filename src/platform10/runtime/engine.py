@@ -1,12 +1,38 @@
 """
 Execution Engine with Step-Level Deterministic Replay.
 Compliance-grade isolation.
+
+Step snapshots share unchanged subtrees (see runtime/snapshot.py):
+the input is copied once, and each step only allocates what its
+agent actually changed.
+
+execute_graph runs agents that declare their context keys
+(see runtime/dag.py) concurrently, while steps are still committed
+and recorded in the declared, canonical order.
 """
 
-from typing import List, Dict, Any
-from copy import deepcopy
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import List, Dict, Any, Optional
 
 from platform10.governance.replay.regulator_replay import RegulatorReplay
+from platform10.observability.metrics import MetricsRegistry, get_metrics_registry
+from platform10.runtime.dag import AgentAccess, agent_access, build_dependency_graph
+from platform10.runtime.snapshot import FrozenDict, freeze, thaw, working_copy
+
+
+_MISSING = object()
+
+
+def _agent_name(agent) -> str:
+    return getattr(agent, "name", agent.__class__.__name__)
+
+
+def _tokens(context: Any) -> int:
+    if isinstance(context, dict):
+        return context.get("tokens") or 0
+    return 0
 
 
 class ExecutionEngine:
@@ -14,43 +40,206 @@ class ExecutionEngine:
     Core execution engine with regulator replay support.
     """
 
-    def __init__(self, regulator_mode: bool = True):
+    def __init__(
+        self,
+        regulator_mode: bool = True,
+        replay: RegulatorReplay | None = None,
+        metrics: MetricsRegistry | None = None,
+    ):
         self.regulator_mode = regulator_mode
-        self.replay = RegulatorReplay() if regulator_mode else None
+        self.metrics = metrics or get_metrics_registry()
+
+        if regulator_mode:
+            self.replay = replay or RegulatorReplay()
+        else:
+            self.replay = None
 
     def execute_sequence(
         self,
         agents: List,
         initial_input: Dict[str, Any],
         trace_id: str,
+        workflow_name: str = "default",
     ) -> Dict[str, Any]:
 
-        # Strict isolation
-        current_data = deepcopy(initial_input)
-        input_snapshot = deepcopy(initial_input)
+        # Strict isolation: the only full copy of the input
+        input_snapshot = freeze(initial_input)
+        snapshot = input_snapshot
 
         steps = []
 
-        for index, agent in enumerate(agents, start=1):
-            current_data = agent.run(current_data)
+        with self._observed(workflow_name):
+            for index, agent in enumerate(agents, start=1):
+                output = self._run_agent(
+                    workflow_name, agent, working_copy(snapshot)
+                )
+
+                # Unchanged subtrees are shared with the previous snapshot
+                snapshot = freeze(output, previous=snapshot)
 
-            step_snapshot = {
-                "step": index,
-                "agent": getattr(agent, "name", agent.__class__.__name__),
-                "output_snapshot": deepcopy(current_data),
-            }
+                step_snapshot = {
+                    "step": index,
+                    "agent": _agent_name(agent),
+                    "output_snapshot": snapshot,
+                }
 
-            steps.append(step_snapshot)
+                steps.append(step_snapshot)
 
-        final_context = deepcopy(current_data)
+        return self._finish(trace_id, input_snapshot, steps, snapshot)
+
+    def execute_graph(
+        self,
+        agents: List,
+        initial_input: Dict[str, Any],
+        trace_id: str,
+        max_workers: Optional[int] = None,
+        workflow_name: str = "default",
+    ) -> Dict[str, Any]:
+        """
+        Dependency-driven variant of execute_sequence.
+
+        An agent starts as soon as the agents it depends on have been
+        committed; results are committed strictly in declared order.
+        With correct declarations, steps and final context are
+        identical to execute_sequence.
+        """
+        input_snapshot = freeze(initial_input)
+        snapshot = input_snapshot
+
+        deps = build_dependency_graph(agents)
+        accesses = [agent_access(agent) for agent in agents]
+
+        steps = []
+        launched: Dict[int, Any] = {}
+        workers = max_workers or len(agents) or 1
 
+        with self._observed(workflow_name):
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for index, agent in enumerate(agents):
+                    # Everything before `index` is committed: start every
+                    # pending agent whose dependencies are satisfied
+                    for candidate in range(index, len(agents)):
+                        if candidate not in launched and all(
+                            d < index for d in deps[candidate]
+                        ):
+                            launched[candidate] = (
+                                snapshot,
+                                pool.submit(
+                                    self._run_agent,
+                                    workflow_name,
+                                    agents[candidate],
+                                    working_copy(snapshot),
+                                ),
+                            )
+
+                    launch_state, future = launched.pop(index)
+                    output = future.result()
+
+                    snapshot = self._commit(
+                        agent, accesses[index], snapshot, launch_state, output
+                    )
+
+                    steps.append({
+                        "step": index + 1,
+                        "agent": _agent_name(agent),
+                        "output_snapshot": snapshot,
+                    })
+
+        return self._finish(trace_id, input_snapshot, steps, snapshot)
+
+    # --------------------------------
+    # Metrics
+    # --------------------------------
+    def _run_agent(self, workflow_name: str, agent, context: Dict[str, Any]):
+        """
+        agent.run with per-agent latency / token / error metrics.
+        """
+        name = _agent_name(agent)
+        tokens_before = _tokens(context)
+        start = time.perf_counter()
+
+        try:
+            output = agent.run(context)
+        except Exception:
+            latency_ms = (time.perf_counter() - start) * 1000
+            self.metrics.observe_agent(workflow_name, name, latency_ms, error=True)
+            raise
+
+        latency_ms = (time.perf_counter() - start) * 1000
+        self.metrics.observe_agent(
+            workflow_name, name, latency_ms, _tokens(output) - tokens_before
+        )
+        return output
+
+    @contextmanager
+    def _observed(self, workflow_name: str):
+        start = time.perf_counter()
+        failed = True
+        try:
+            yield
+            failed = False
+        finally:
+            self.metrics.observe_workflow(
+                workflow_name,
+                (time.perf_counter() - start) * 1000,
+                error=failed,
+            )
+
+    def _commit(
+        self,
+        agent,
+        access: Optional[AgentAccess],
+        state: FrozenDict,
+        launch_state: FrozenDict,
+        output: Dict[str, Any],
+    ) -> FrozenDict:
+        """
+        Apply one agent's declared effects to the committed state.
+        """
+        if access is None:
+            # Barrier agent: ran on the fully committed state
+            return freeze(output, previous=state)
+
+        for key in set(output) | set(launch_state):
+            if key in access.writes or key in access.appends:
+                continue
+            if output.get(key, _MISSING) != launch_state.get(key, _MISSING):
+                raise ValueError(
+                    f"Agent '{_agent_name(agent)}' changed undeclared "
+                    f"context key '{key}'"
+                )
+
+        merged = dict(state)
+
+        for key in access.writes:
+            if key in output:
+                merged[key] = output[key]
+            else:
+                merged.pop(key, None)
+
+        for key in access.appends:
+            if key not in output and key not in state:
+                continue
+            base = len(launch_state.get(key, ()))
+            appended = list(output.get(key, ()))[base:]
+            merged[key] = list(state.get(key, ())) + appended
+
+        return freeze(merged, previous=state)
+
+    def _finish(
+        self,
+        trace_id: str,
+        input_snapshot: FrozenDict,
+        steps: List[Dict[str, Any]],
+        snapshot: FrozenDict,
+    ) -> Dict[str, Any]:
         if self.regulator_mode and self.replay:
             self.replay.record(
                 trace_id=trace_id,
                 input_snapshot=input_snapshot,
                 steps=steps,
-                final_context=final_context,
+                final_context=snapshot,
             )
 
-        return final_context
-        
\ No newline at end of file
+        # Callers get a plain, fully mutable context
+        return thaw(snapshot)
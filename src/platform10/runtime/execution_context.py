@@ -11,12 +11,54 @@ Used by:
 
 import time
 
+from platform10.patterns.timeout import Deadline
+
 
 class ExecutionContext:
-    def __init__(self, execution_id: str | None = None):
+    def __init__(
+        self,
+        execution_id: str | None = None,
+        deadline: Deadline | None = None,
+        workflow: str | None = None,
+    ):
         self.execution_id = execution_id
+        self.workflow = workflow
         self.start_time = time.time()
+        self._started = time.perf_counter()
         self.tokens_used = 0
+        self.deadline = deadline
+        self.agent_runs: list[dict] = []
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self._started) * 1000
+
+    def record_agent(
+        self,
+        agent: str,
+        latency_ms: float,
+        tokens: int = 0,
+        error: bool = False,
+    ):
+        """
+        Per-agent breakdown of this execution.
+        """
+        self.agent_runs.append({
+            "agent": agent,
+            "latency_ms": latency_ms,
+            "tokens": tokens,
+            "error": error,
+        })
+
+    def agent_metrics(self) -> list[dict]:
+        return list(self.agent_runs)
+
+    def remaining_ms(self) -> float | None:
+        """
+        Budget left before the workflow deadline (None = unbounded).
+        """
+        if self.deadline is None:
+            return None
+        return self.deadline.remaining_ms()
 
     def record_tokens(self, tokens: int):
         """
@@ -6,18 +6,70 @@ Central runtime executor for workflows.
 Policy-driven, auditable, deterministic.
 """
 
+import copy
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict
+
 from platform10.patterns.governor import (
+    AgentCostHistory,
     ExecutionGovernor,
     ExecutionBudgetExceeded,
 )
+from platform10.patterns.timeout import (
+    Deadline,
+    TimeoutExceeded,
+    current_deadline,
+    deadline_scope,
+    remaining_budget_ms,
+    with_process_timeout,
+    with_timeout,
+)
 from platform10.runtime.execution_context import ExecutionContext
 from platform10.governance.audit_log import AuditLog
+from platform10.observability.metrics import get_metrics_registry
 from platform10.policies.execution_policy import ExecutionPolicy
 
 
+@dataclass
+class ExecutionResult:
+    """
+    Outcome of one agent run (see Executor.run_agent).
+    """
+    agent: str
+    status: str          # SUCCESS / FAILURE / TIMEOUT
+    output: Any
+    latency_ms: float = 0.0
+
+
+def resolve_agent_name(agent) -> str:
+    return getattr(agent, "name", agent.__class__.__name__)
+
+
+def _isolated(context: dict) -> dict:
+    """
+    Deep copy of `context`; values that cannot be copied (connections,
+    locks) are shared.
+    """
+    try:
+        return copy.deepcopy(context)
+    except Exception:
+        isolated = {}
+        for key, value in context.items():
+            try:
+                isolated[key] = copy.deepcopy(value)
+            except Exception:
+                isolated[key] = value
+        return isolated
+
+
 class Executor:
     def __init__(self):
         self.audit_log = AuditLog()
+        # Learned per-agent cost, shared by every execution of this executor
+        self.cost_history = AgentCostHistory()
+        self.metrics = get_metrics_registry()
 
     def _resolve_policy(self, workflow) -> ExecutionPolicy:
         policy = getattr(workflow, "execution_policy", None)
@@ -25,51 +77,291 @@ class Executor:
             return ExecutionPolicy(max_tokens=1000, max_latency_ms=5000)
         return policy
 
-    def execute(self, workflow, context: dict):
+    # --------------------------------
+    # Shared by sync / async execution
+    # --------------------------------
+    def _begin(self, workflow):
         execution_id = getattr(workflow, "execution_id", None)
         policy = self._resolve_policy(workflow)
 
         governor = ExecutionGovernor(
             max_tokens=policy.max_tokens,
             max_latency_ms=policy.max_latency_ms,
+            history=self.cost_history,
+            on_breach=policy.on_predicted_breach,
+            percentile=policy.prediction_percentile,
         )
 
-        execution_context = ExecutionContext(execution_id=execution_id)
-        current_context = context
+        # The latency budget doubles as the workflow deadline
+        deadline = None
+        if policy.max_latency_ms is not None:
+            deadline = Deadline(policy.max_latency_ms)
+
+        execution_context = ExecutionContext(
+            execution_id=execution_id,
+            deadline=deadline,
+            workflow=getattr(workflow, "name", workflow.__class__.__name__),
+        )
 
-        for agent in workflow.agents:
-            agent_name = agent.__class__.__name__
+        return execution_id, policy, governor, execution_context
 
-            try:
-                result = agent.run(current_context)
-            except Exception as e:
-                self.audit_log.record(
-                    execution_id=execution_id,
-                    event_type="AGENT_FAILURE",
-                    details={"agent": agent_name, "error": str(e)},
+    @contextmanager
+    def _running(self, execution_context: ExecutionContext):
+        """
+        Deadline scope plus workflow-level metrics for one execution.
+        """
+        failed = True
+        try:
+            with deadline_scope(execution_context.deadline):
+                yield
+            failed = False
+        finally:
+            self.metrics.observe_workflow(
+                execution_context.workflow,
+                execution_context.elapsed_ms(),
+                tokens=execution_context.tokens_used,
+                error=failed,
+            )
+
+    def _record_agent(
+        self,
+        execution_context: ExecutionContext,
+        agent_name: str,
+        start: float,
+        tokens: int = 0,
+        error: bool = False,
+    ) -> float:
+        latency_ms = (time.perf_counter() - start) * 1000
+        execution_context.record_agent(agent_name, latency_ms, tokens, error)
+        self.metrics.observe_agent(
+            execution_context.workflow, agent_name, latency_ms, tokens, error
+        )
+        return latency_ms
+
+    def _record_failed_agent(
+        self,
+        governor: ExecutionGovernor,
+        execution_context: ExecutionContext,
+        agent_name: str,
+        start: float,
+    ) -> None:
+        # Timeouts and failures feed the learned cost too; otherwise an
+        # agent that always times out is never predicted to breach
+        latency_ms = self._record_agent(
+            execution_context, agent_name, start, error=True
+        )
+        governor.observe(agent_name, latency_ms)
+
+    def _admit(
+        self,
+        execution_id,
+        agent,
+        policy: ExecutionPolicy,
+        governor: ExecutionGovernor,
+        execution_context: ExecutionContext,
+    ):
+        """
+        Predictive budget check before `agent` starts. Returns the agent
+        to run (its fallback when degraded) or None to skip it; raises
+        when the execution must stop.
+        """
+        agent_name = resolve_agent_name(agent)
+        metrics = execution_context.metrics()
+        admission = governor.admit(agent, metrics, agent_name)
+
+        if admission.action == "RUN":
+            return agent
+
+        details = {
+            "agent": agent_name,
+            "estimate": admission.estimate.__dict__,
+            "metrics": metrics,
+            "reason": admission.reason,
+        }
+
+        if admission.action == "SKIP":
+            self.audit_log.record(
+                execution_id=execution_id,
+                event_type="AGENT_SKIPPED",
+                details=details,
+            )
+            return None
+
+        if admission.action == "DEGRADE":
+            self.audit_log.record(
+                execution_id=execution_id,
+                event_type="AGENT_DEGRADED",
+                details={
+                    **details,
+                    "fallback": resolve_agent_name(admission.agent),
+                },
+            )
+            return admission.agent
+
+        self.audit_log.record(
+            execution_id=execution_id,
+            event_type="EXECUTION_POLICY_VIOLATION",
+            details={**details, "policy": policy.__dict__, "predicted": True},
+        )
+        raise RuntimeError("Execution stopped by policy")
+
+    def _invoke(self, agent, context: dict):
+        """
+        agent.run bounded by the agent's own `timeout_ms` and the active
+        deadline. Agents declaring `isolation = "process"` run in a
+        child process that is killed on timeout.
+
+        Agents without a `timeout_ms` are bounded by the workflow
+        deadline alone, and run inline only when there is none.
+        Pre-emptible runs get a deep copy of the context: a run
+        abandoned on timeout keeps going and must not change state the
+        next agent is reading.
+        """
+        timeout_ms = getattr(agent, "timeout_ms", None)
+        if getattr(agent, "isolation", None) == "process":
+            return with_process_timeout(agent.run, timeout_ms, context)
+        if timeout_ms is None and current_deadline() is None:
+            return agent.run(context)
+        return with_timeout(agent.run, timeout_ms, _isolated(context))
+
+    def _audit_timeout(self, execution_id, agent_name: str, error: TimeoutExceeded):
+        self.audit_log.record(
+            execution_id=execution_id,
+            event_type="AGENT_TIMEOUT",
+            details={
+                "agent": agent_name,
+                "timeout_ms": error.timeout_ms,
+                "remaining_budget_ms": remaining_budget_ms(),
+                "error": str(error),
+            },
+        )
+
+    def _agent_timed_out(self, execution_id, agent_name: str, error: TimeoutExceeded):
+        self._audit_timeout(execution_id, agent_name, error)
+        raise RuntimeError(f"Agent '{agent_name}' timed out") from error
+
+    def _agent_failed(self, execution_id, agent_name: str, error: Exception):
+        self.audit_log.record(
+            execution_id=execution_id,
+            event_type="AGENT_FAILURE",
+            details={"agent": agent_name, "error": str(error)},
+        )
+        raise RuntimeError(f"Agent '{agent_name}' failed") from error
+
+    def _agent_completed(
+        self,
+        execution_id,
+        agent_name: str,
+        policy: ExecutionPolicy,
+        governor: ExecutionGovernor,
+        execution_context: ExecutionContext,
+        current_context: dict,
+        result,
+        start: float,
+    ) -> dict:
+        if isinstance(result, dict):
+            current_context = {**current_context, **result}
+
+        tokens = result.get("tokens") if isinstance(result, dict) else None
+        if tokens:
+            execution_context.record_tokens(tokens)
+
+        latency_ms = self._record_agent(
+            execution_context, agent_name, start, tokens or 0
+        )
+        governor.observe(agent_name, latency_ms, tokens or 0)
+
+        try:
+            governor.enforce(execution_context.metrics())
+        except ExecutionBudgetExceeded as e:
+            self.audit_log.record(
+                execution_id=execution_id,
+                event_type="EXECUTION_POLICY_VIOLATION",
+                details={
+                    "agent": agent_name,
+                    "policy": policy.__dict__,
+                    "metrics": execution_context.metrics(),
+                    "reason": str(e),
+                },
+            )
+            raise RuntimeError("Execution stopped by policy") from e
+
+        return current_context
+
+    # --------------------------------
+    # Workflow execution
+    # --------------------------------
+    def execute(self, workflow, context: dict):
+        execution_id, policy, governor, execution_context = self._begin(workflow)
+        current_context = context
+
+        with self._running(execution_context):
+            for agent in workflow.agents:
+                agent = self._admit(
+                    execution_id, agent, policy, governor, execution_context
                 )
-                raise RuntimeError(f"Agent '{agent_name}' failed") from e
+                if agent is None:
+                    continue
 
-            if isinstance(result, dict):
-                current_context = {**current_context, **result}
+                agent_name = resolve_agent_name(agent)
+                start = time.perf_counter()
 
-            tokens = result.get("tokens") if isinstance(result, dict) else None
-            if tokens:
-                execution_context.record_tokens(tokens)
+                try:
+                    result = self._invoke(agent, current_context)
+                except TimeoutExceeded as e:
+                    self._record_failed_agent(
+                        governor, execution_context, agent_name, start
+                    )
+                    self._agent_timed_out(execution_id, agent_name, e)
+                except Exception as e:
+                    self._record_failed_agent(
+                        governor, execution_context, agent_name, start
+                    )
+                    self._agent_failed(execution_id, agent_name, e)
 
-            try:
-                governor.enforce(execution_context.metrics())
-            except ExecutionBudgetExceeded as e:
-                self.audit_log.record(
-                    execution_id=execution_id,
-                    event_type="EXECUTION_POLICY_VIOLATION",
-                    details={
-                        "agent": agent_name,
-                        "policy": policy.__dict__,
-                        "metrics": execution_context.metrics(),
-                        "reason": str(e),
-                    },
+                current_context = self._agent_completed(
+                    execution_id,
+                    agent_name,
+                    policy,
+                    governor,
+                    execution_context,
+                    current_context,
+                    result,
+                    start,
                 )
-                raise RuntimeError("Execution stopped by policy") from e
 
         return current_context
+
+    # --------------------------------
+    # Single agent (used by patterns)
+    # --------------------------------
+    def run_agent(self, agent, context: Dict[str, Any]) -> ExecutionResult:
+        """
+        Run one agent; failures are audited and returned, not raised.
+        """
+        start = time.perf_counter()
+
+        try:
+            output = self._invoke(agent, context)
+            status = "SUCCESS"
+        except TimeoutExceeded as e:
+            self._audit_timeout(
+                context.get("execution_id"), resolve_agent_name(agent), e
+            )
+            output = {"error": str(e), "timeout_ms": e.timeout_ms}
+            status = "TIMEOUT"
+        except Exception as e:
+            self.audit_log.record(
+                execution_id=context.get("execution_id"),
+                event_type="AGENT_FAILURE",
+                details={"agent": resolve_agent_name(agent), "error": str(e)},
+            )
+            output = {"error": str(e)}
+            status = "FAILURE"
+
+        return ExecutionResult(
+            agent=resolve_agent_name(agent),
+            status=status,
+            output=output,
+            latency_ms=(time.perf_counter() - start) * 1000,
+        )
@@ -0,0 +1,149 @@
+"""
+Structurally Shared Step Snapshots.
+
+Replay snapshots are frozen (immutable) dict / list subclasses, so an
+unchanged subtree can be shared between consecutive steps instead of
+deep-copied after every agent. Isolation comes from immutability:
+once frozen, a snapshot cannot be changed by any later agent.
+
+Agents receive a working context whose top level (and the direct
+containers under it, e.g. `signals`) are fresh mutable copies; deeper
+values are shared frozen snapshots. Mutating those in place raises
+TypeError instead of silently rewriting replay history.
+
+FrozenDict / FrozenList stay real dict / list instances, so JSON
+serialisation, hashing and equality are unchanged.
+"""
+
+from copy import deepcopy
+from typing import Any, Optional
+
+
+_SCALARS = (str, int, float, bool, bytes, type(None))
+
+
+def _immutable(*_args, **_kwargs):
+    raise TypeError("Replay snapshots are immutable")
+
+
+class FrozenDict(dict):
+    """
+    Read-only dict snapshot.
+    """
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+    __ior__ = _immutable
+
+    def copy(self) -> dict:
+        return dict(self)
+
+    def __copy__(self) -> dict:
+        return dict(self)
+
+    def __deepcopy__(self, memo) -> dict:
+        return thaw(self)
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+
+class FrozenList(list):
+    """
+    Read-only list snapshot.
+    """
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = _immutable
+    append = extend = insert = pop = remove = _immutable
+    clear = reverse = sort = _immutable
+    __iadd__ = __imul__ = _immutable
+
+    def copy(self) -> list:
+        return list(self)
+
+    def __copy__(self) -> list:
+        return list(self)
+
+    def __deepcopy__(self, memo) -> list:
+        return thaw(self)
+
+    def __reduce__(self):
+        return (FrozenList, (list(self),))
+
+
+def freeze(value: Any, previous: Optional[Any] = None) -> Any:
+    """
+    Immutable snapshot of `value`.
+
+    Already-frozen subtrees are reused as-is. When `previous` (the
+    prior snapshot of the same position) compares equal, it is reused
+    instead of building a new object.
+    """
+    if isinstance(value, (FrozenDict, FrozenList)) or isinstance(value, _SCALARS):
+        return value
+
+    if isinstance(value, dict):
+        if isinstance(previous, FrozenDict) and value == previous:
+            return previous
+
+        prior = previous if isinstance(previous, dict) else {}
+        return FrozenDict(
+            (key, freeze(item, prior.get(key))) for key, item in value.items()
+        )
+
+    if isinstance(value, list):
+        if isinstance(previous, FrozenList) and value == previous:
+            return previous
+
+        prior = previous if isinstance(previous, list) else []
+        return FrozenList(
+            freeze(item, prior[i] if i < len(prior) else None)
+            for i, item in enumerate(value)
+        )
+
+    if isinstance(value, tuple):
+        return tuple(freeze(item) for item in value)
+
+    # Unknown (possibly mutable) object: isolate by copying
+    return deepcopy(value)
+
+
+def working_copy(snapshot: FrozenDict) -> dict:
+    """
+    Mutable context for the next agent: top level and its direct
+    containers are fresh; everything deeper stays shared and frozen.
+    """
+    working = {}
+
+    for key, value in snapshot.items():
+        if isinstance(value, FrozenDict):
+            working[key] = dict(value)
+        elif isinstance(value, FrozenList):
+            working[key] = list(value)
+        else:
+            working[key] = value
+
+    return working
+
+
+def thaw(value: Any) -> Any:
+    """
+    Fully mutable deep copy (plain dict / list) of a snapshot.
+    """
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+
+    if isinstance(value, list):
+        return [thaw(item) for item in value]
+
+    if isinstance(value, tuple):
+        return tuple(thaw(item) for item in value)
+
+    if isinstance(value, _SCALARS):
+        return value
+
+    return deepcopy(value)
@@ -53,7 +53,8 @@ def run_demo():
 
     engine = ExecutionEngine()
 
-    final_context = engine.execute_sequence(
+    # Signal agents run concurrently; the classifier waits for all three
+    final_context = engine.execute_graph(
         agents=agents,
         initial_input=initial_input,
         trace_id=trace_id,
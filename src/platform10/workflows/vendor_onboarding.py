@@ -62,6 +62,14 @@ def run_vendor_onboarding(vendor: dict) -> dict:
     # ------------------------------------------------------------------
     # Audit Log (mandatory for regulated workflows)
     # ------------------------------------------------------------------
-    state = record_audit_log(state)
+    state["audit_log"] = {
+        key: state[key]
+        for key in ("analysis", "recommendation", "decision", "reason", "status")
+    }
+    record_audit_log(
+        execution_id=vendor.get("name"),
+        event_type="VENDOR_ONBOARDING_DECISION",
+        details=state["audit_log"],
+    )
 
     return state
@@ -1,23 +1,46 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
-from datetime import datetime
+import copy
+from dataclasses import InitVar, dataclass, field
 from typing import Dict, Any, Optional
-import uuid
+
+from platform10.core.codec import pack_record, unpack_record
+from tracing.stamps import iso_from_ns, new_id, now_ns, ns_from_iso
 
 
 def utc_now() -> str:
-    return datetime.utcnow().isoformat() + "Z"
+    return iso_from_ns(now_ns())
+
+
+def copy_payload(value: Any) -> Any:
+    """
+    Deep copy of a JSON-shaped payload (dicts, lists, tuples, scalars),
+    as dataclasses.asdict made for to_dict; other objects go through
+    copy.deepcopy.
+    """
+    if isinstance(value, dict):
+        return {key: copy_payload(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(copy_payload(item) for item in value)
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    return copy.deepcopy(value)
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentTrace:
+    """
+    Slotted: no per-instance __dict__. Start / end times are kept as
+    epoch ns (tracing/stamps.py); `started_at` / `ended_at` render the
+    ISO strings on demand (to_dict, to_bytes v1 readers, callers) and
+    are still accepted as constructor keywords.
+    """
     execution_id: str
     agent_name: str
     task_type: Optional[str] = None
 
-    started_at: str = field(default_factory=utc_now)
-    ended_at: Optional[str] = None
+    started_ns: int = field(default_factory=now_ns)
+    ended_ns: Optional[int] = None
 
     inputs: Dict[str, Any] = field(default_factory=dict)
     signals: Dict[str, Any] = field(default_factory=dict)
@@ -29,6 +52,17 @@ class AgentTrace:
     outcome: Optional[str] = None
     status: str = "RUNNING"
 
+    started_at: InitVar[Optional[str]] = None
+    ended_at: InitVar[Optional[str]] = None
+
+    def __post_init__(self, started_at, ended_at) -> None:
+        # ISO keywords of the pre-ns records. Unset, these InitVars
+        # default to the properties of the same name; only str converts
+        if isinstance(started_at, str):
+            self.started_ns = ns_from_iso(started_at)
+        if isinstance(ended_at, str):
+            self.ended_ns = ns_from_iso(ended_at)
+
     # ---------- lifecycle ----------
 
     @classmethod
@@ -39,7 +73,7 @@ class AgentTrace:
         inputs: Optional[Dict[str, Any]] = None,
     ) -> "AgentTrace":
         return cls(
-            execution_id=str(uuid.uuid4()),
+            execution_id=new_id(),
             agent_name=agent_name,
             task_type=task_type,
             inputs=inputs or {},
@@ -60,11 +94,67 @@ class AgentTrace:
         self.confidence = confidence
         self.outcome = outcome
 
-        self.ended_at = utc_now()
+        self.ended_ns = now_ns()
         self.status = "COMPLETED"
 
+    # ---------- timestamps ----------
+
+    @property
+    def started_at(self) -> str:
+        return iso_from_ns(self.started_ns)
+
+    @property
+    def ended_at(self) -> Optional[str]:
+        return None if self.ended_ns is None else iso_from_ns(self.ended_ns)
+
     # ---------- serialization ----------
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        """
+        JSON-ready dict (ISO timestamps). Payloads are deep-copied, so
+        the dict does not change with the trace (queued sinks encode it
+        later).
+        """
+        return {
+            "execution_id": self.execution_id,
+            "agent_name": self.agent_name,
+            "task_type": self.task_type,
+            "started_at": self.started_at,
+            "ended_at": self.ended_at,
+            "inputs": copy_payload(self.inputs),
+            "signals": copy_payload(self.signals),
+            "decision": self.decision,
+            "reasoning": self.reasoning,
+            "confidence": self.confidence,
+            "outcome": self.outcome,
+            "status": self.status,
+        }
+
+    # Binary record layout (see platform10/core/codec.py).
+    # v1 stored started_at / ended_at as ISO strings; v2 stores ns.
+    RECORD_TAG = "AgentTrace"
+    RECORD_VERSION = 2
+    RECORD_FIELDS = (
+        "execution_id", "agent_name", "task_type", "started_ns", "ended_ns",
+        "inputs", "signals", "decision", "reasoning", "confidence",
+        "outcome", "status",
+    )
+
+    def to_bytes(self) -> bytes:
+        """
+        Canonical binary encoding: same bytes for equal traces.
+        """
+        return pack_record(
+            self.RECORD_TAG,
+            self.RECORD_VERSION,
+            [getattr(self, name) for name in self.RECORD_FIELDS],
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "AgentTrace":
+        version, values = unpack_record(data, cls.RECORD_TAG, (1, 2))
+        if version == 1:
+            values[3] = ns_from_iso(values[3])
+            values[4] = None if values[4] is None else ns_from_iso(values[4])
+        return cls(**dict(zip(cls.RECORD_FIELDS, values)))
 
@@ -2,7 +2,7 @@ from typing import List, Optional
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfidenceSignal:
     agent: str
     confidence: float
@@ -0,0 +1,512 @@
+"""
+Segmented Trace Store
+---------------------
+Append-only NDJSON persistence for agent and workflow traces, for
+volumes where one file per trace (TraceStore) means too many files
+and too many syscalls.
+
+Layout, partitioned by the UTC hour the trace was submitted:
+    <base_dir>/workflows/YYYY-MM-DD/HH-NNNN.ndjson
+    <base_dir>/agents/YYYY-MM-DD/HH-NNNN.ndjson
+    <base_dir>/index.db     execution id -> (segment, offset, length),
+                            plus workflow summaries for query()
+                            (see trace_index.py)
+
+A segment rolls over to the next NNNN once it holds max_segment_bytes
+(checked per batch, so a segment may overshoot by one batch); a new
+hour starts a new partition.
+
+write_workflow_trace / write_agent_trace have the TraceStore
+signatures but only enqueue (callers block once `max_pending` traces
+are queued). A background thread drains the queue in batches: one
+write() per segment and one index transaction per batch. fsync policy:
+    never      leave it to the OS page cache (a crash may lose the
+               most recent traces)
+    batch      fsync every segment written in a batch
+    interval   fsync dirty segments at most every fsync_interval_s
+Index rows (locations and summaries, one transaction) are committed
+after the lines they point to are written (and fsynced, if the policy
+says so).
+
+One writing process per base_dir. rebuild_index() re-derives the
+index from the segments, e.g. after a crash between a segment write
+and its index commit.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from platform10.core.sqlite_pool import ThreadConnectionPool, connect
+from tracing.stamps import iso_from_ns, now_ns
+from tracing.trace_index import (
+    INSERT_SUMMARY_SQL,
+    SUMMARY_SCHEMA,
+    TimeBound,
+    query_summaries,
+    summary_row,
+)
+
+
+FSYNC_POLICIES = {"never", "batch", "interval"}
+
+# kind -> (directory, id field in the payload)
+TRACE_KINDS = {
+    "workflow": ("workflows", "workflow_execution_id"),
+    "agent": ("agents", "execution_id"),
+}
+
+SEGMENT_SUFFIX = ".ndjson"
+
+_HOUR_NS = 3600 * 10**9
+
+
+INDEX_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS trace_locations (
+        execution_id TEXT PRIMARY KEY,
+        kind TEXT NOT NULL,
+        segment TEXT NOT NULL,
+        offset INTEGER NOT NULL,
+        length INTEGER NOT NULL
+    ) WITHOUT ROWID
+    """,
+]
+
+INSERT_LOCATION_SQL = """
+INSERT OR REPLACE INTO trace_locations (execution_id, kind, segment, offset, length)
+VALUES (?, ?, ?, ?, ?)
+"""
+
+FETCH_LOCATION_SQL = """
+SELECT segment, offset, length
+FROM trace_locations
+WHERE execution_id = ? AND kind = ?
+"""
+
+
+class _Segment:
+    """
+    The open segment a kind is currently appending to.
+    """
+
+    __slots__ = ("partition", "seq", "path", "file", "size", "dirty")
+
+    def __init__(self, partition: str, seq: int, path: str):
+        self.partition = partition
+        self.seq = seq
+        self.path = path
+        self.file = open(path, "ab")
+        self.size = self.file.tell()
+        self.dirty = False
+
+
+class SegmentTraceStore:
+    """
+    Partitioned, append-only trace store with a background batch
+    writer and an execution id index (see module docstring).
+    """
+
+    def __init__(
+        self,
+        base_dir: str = "data/traces",
+        max_pending: int = 10000,
+        batch_size: int = 1000,
+        max_segment_bytes: int = 64 * 2**20,
+        fsync: str = "never",
+        fsync_interval_s: float = 1.0,
+        index_synchronous: str = "NORMAL",
+    ):
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"Unsupported fsync policy: {fsync}")
+        if batch_size < 1 or max_segment_bytes < 1:
+            raise ValueError("batch_size and max_segment_bytes must be >= 1")
+
+        self.base_dir = base_dir
+        self.batch_size = batch_size
+        self.max_segment_bytes = max_segment_bytes
+        self.fsync = fsync
+        self.fsync_interval_s = fsync_interval_s
+        self.index_path = os.path.join(base_dir, "index.db")
+        self.index_synchronous = index_synchronous.upper()
+
+        self.written = 0
+        self.failed = 0
+        self.last_error: Optional[BaseException] = None
+
+        for directory, _ in TRACE_KINDS.values():
+            os.makedirs(os.path.join(base_dir, directory), exist_ok=True)
+
+        self._pool = ThreadConnectionPool(
+            lambda: connect(self.index_path, synchronous=self.index_synchronous)
+        )
+
+        conn = self._connection()
+        with conn:
+            for statement in INDEX_SCHEMA + SUMMARY_SCHEMA:
+                conn.execute(statement)
+
+        # (hour, partition) of the latest submit, swapped as one tuple
+        self._current_partition: Tuple[int, str] = (-1, "")
+
+        # Writer-thread state
+        self._segments: Dict[str, _Segment] = {}
+        self._last_fsync = time.monotonic()
+
+        self._queue: "queue.Queue[Optional[Tuple[str, str, Dict[str, Any], str]]]" = (
+            queue.Queue(maxsize=max_pending)
+        )
+        # Held across the closed check and the put, so nothing is
+        # queued behind the stop sentinel
+        self._submit_lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run,
+            name="trace-segment-writer",
+            daemon=True,
+        )
+        self._thread.start()
+
+    # ---------- TraceStore interface ----------
+
+    def write_workflow_trace(
+        self,
+        workflow_execution_id: str,
+        payload: Dict[str, Any],
+    ) -> str:
+        """
+        Queue a workflow trace; returns the partition directory it
+        will be appended to.
+        """
+        return self._submit("workflow", workflow_execution_id, payload)
+
+    def write_agent_trace(
+        self,
+        execution_id: str,
+        payload: Dict[str, Any],
+    ) -> str:
+        """
+        Queue an agent trace; returns the partition directory it will
+        be appended to.
+        """
+        return self._submit("agent", execution_id, payload)
+
+    # ---------- reads ----------
+
+    def read_workflow_trace(self, workflow_execution_id: str) -> Optional[Dict[str, Any]]:
+        return self._read("workflow", workflow_execution_id)
+
+    def read_agent_trace(self, execution_id: str) -> Optional[Dict[str, Any]]:
+        return self._read("agent", execution_id)
+
+    def query(
+        self,
+        workflow_name: Optional[str] = None,
+        decision: Optional[str] = None,
+        since: Optional[TimeBound] = None,
+        until: Optional[TimeBound] = None,
+        min_confidence: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Workflow trace summaries matching every given filter, oldest
+        first (see trace_index.query_summaries). Flushes first.
+        """
+        self.flush()
+        return query_summaries(
+            self._connection(),
+            workflow_name=workflow_name,
+            decision=decision,
+            since=since,
+            until=until,
+            min_confidence=min_confidence,
+            limit=limit,
+        )
+
+    def segments(self, kind: str) -> Iterator[str]:
+        """
+        Segment paths of a kind, oldest first.
+        """
+        root = os.path.join(self.base_dir, TRACE_KINDS[kind][0])
+        for day in sorted(os.listdir(root)):
+            day_dir = os.path.join(root, day)
+            if not os.path.isdir(day_dir):
+                continue    # a per-trace file of TraceStore's layout
+            for name in sorted(os.listdir(day_dir)):
+                if name.endswith(SEGMENT_SUFFIX):
+                    yield os.path.join(day_dir, name)
+
+    def rebuild_index(self) -> int:
+        """
+        Re-index (locations and workflow summaries) every line of every
+        segment. Returns the number of traces indexed.
+        """
+        self.flush()
+
+        count = 0
+        conn = self._connection()
+        with conn:
+            for kind, (_, id_field) in TRACE_KINDS.items():
+                for path in self.segments(kind):
+                    rows = []
+                    summaries = []
+                    offset = 0
+                    with open(path, "rb") as f:
+                        for line in f:
+                            if line.endswith(b"\n"):
+                                payload = json.loads(line)
+                                rows.append((
+                                    payload[id_field],
+                                    kind,
+                                    os.path.relpath(path, self.base_dir),
+                                    offset,
+                                    len(line),
+                                ))
+                                if kind == "workflow":
+                                    summaries.append(summary_row(payload))
+                            offset += len(line)
+                    conn.executemany(INSERT_LOCATION_SQL, rows)
+                    conn.executemany(
+                        INSERT_SUMMARY_SQL,
+                        [row for row in summaries if row is not None],
+                    )
+                    count += len(rows)
+        return count
+
+    # ---------- lifecycle ----------
+
+    @property
+    def pending(self) -> int:
+        return self._queue.unfinished_tasks
+
+    def flush(self) -> None:
+        """
+        Block until every queued trace is written and indexed.
+        """
+        self._queue.join()
+
+    def close(self) -> None:
+        """
+        Flush, fsync (unless the policy is "never"), stop the writer
+        and close the index. Idempotent.
+        """
+        with self._submit_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._thread.join()
+        self._pool.close()
+
+    def __enter__(self) -> "SegmentTraceStore":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    # ---------- internals ----------
+
+    def _connection(self) -> sqlite3.Connection:
+        return self._pool.get()
+
+    def _submit(self, kind: str, trace_id: str, payload: Dict[str, Any]) -> str:
+        hour = now_ns() // _HOUR_NS
+        current_hour, partition = self._current_partition
+        if hour != current_hour:
+            stamp = iso_from_ns(hour * _HOUR_NS)
+            partition = f"{stamp[:10]}/{stamp[11:13]}"
+            self._current_partition = (hour, partition)
+
+        with self._submit_lock:
+            if self._closed:
+                raise RuntimeError("SegmentTraceStore is closed")
+            self._queue.put((kind, trace_id, payload, partition))
+        day, _ = partition.split("/")
+        return os.path.join(self.base_dir, TRACE_KINDS[kind][0], day)
+
+    def _read(self, kind: str, trace_id: str) -> Optional[Dict[str, Any]]:
+        self.flush()
+
+        row = self._connection().execute(
+            FETCH_LOCATION_SQL, (trace_id, kind)
+        ).fetchone()
+        if row is None:
+            return None
+
+        segment, offset, length = row
+        with open(os.path.join(self.base_dir, segment), "rb") as f:
+            f.seek(offset)
+            line = f.read(length)
+
+        # Index committed but the lines were lost (fsync="never" + crash)
+        if len(line) != length:
+            return None
+        return json.loads(line)
+
+    def _run(self) -> None:
+        stop = False
+
+        while not stop:
+            timeout = None
+            if self.fsync == "interval" and self._has_dirty_segments():
+                timeout = self.fsync_interval_s
+
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                self._sync_segments()
+                continue
+
+            # Whatever is already queued joins this batch, up to the
+            # stop sentinel
+            batch: List[Tuple[str, str, Dict[str, Any], str]] = []
+            while True:
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            try:
+                if batch:
+                    self._write_batch(batch)
+                if stop and self.fsync != "never":
+                    self._sync_segments()
+            finally:
+                for _ in range(len(batch) + stop):
+                    self._queue.task_done()
+
+        for segment in self._segments.values():
+            segment.file.close()
+        self._segments.clear()
+
+    def _write_batch(self, batch: List[Tuple[str, str, Dict[str, Any], str]]) -> None:
+        # (kind, partition) -> encoded lines and their ids
+        groups: Dict[Tuple[str, str], Tuple[List[bytes], List[str]]] = {}
+        summaries: List[Tuple[Any, ...]] = []
+
+        for item in batch:
+            try:
+                kind, trace_id, payload, partition = item
+                line = json.dumps(payload, separators=(",", ":")).encode() + b"\n"
+                summary = summary_row(payload) if kind == "workflow" else None
+            except Exception as e:
+                # A trace that cannot be encoded must not sink its batch
+                self.failed += 1
+                self.last_error = e
+                continue
+
+            lines, ids = groups.setdefault((kind, partition), ([], []))
+            lines.append(line)
+            ids.append(trace_id)
+            if summary is not None:
+                summaries.append(summary)
+
+        rows = []
+        try:
+            for (kind, partition), (lines, ids) in groups.items():
+                segment = self._segment(kind, partition)
+                relative = os.path.relpath(segment.path, self.base_dir)
+
+                offset = segment.size
+                for trace_id, line in zip(ids, lines):
+                    rows.append((trace_id, kind, relative, offset, len(line)))
+                    offset += len(line)
+
+                segment.file.write(b"".join(lines))
+                segment.file.flush()
+                segment.size = offset
+                segment.dirty = True
+
+            if self.fsync == "batch":
+                self._sync_segments()
+            elif (
+                self.fsync == "interval"
+                and time.monotonic() - self._last_fsync >= self.fsync_interval_s
+            ):
+                self._sync_segments()
+
+            conn = self._connection()
+            with conn:
+                conn.executemany(INSERT_LOCATION_SQL, rows)
+                conn.executemany(INSERT_SUMMARY_SQL, summaries)
+
+            self.written += len(rows)
+        except Exception as e:
+            # A failed batch must not stop the writer
+            self.failed += sum(len(ids) for _, ids in groups.values())
+            self.last_error = e
+
+    def _segment(self, kind: str, partition: str) -> _Segment:
+        """
+        The segment to append to, rolling by partition and size.
+        """
+        segment = self._segments.get(kind)
+
+        if segment is not None and segment.partition == partition:
+            if segment.size < self.max_segment_bytes:
+                return segment
+            seq = segment.seq + 1
+        else:
+            # Resume the newest segment of the hour (e.g. after a restart)
+            seq = self._newest_seq(kind, partition)
+
+        if segment is not None:
+            self._close_segment(segment)
+
+        while True:
+            segment = _Segment(partition, seq, self._segment_path(kind, partition, seq))
+            if segment.size < self.max_segment_bytes:
+                break
+            segment.file.close()
+            seq += 1
+
+        self._segments[kind] = segment
+        return segment
+
+    def _segment_path(self, kind: str, partition: str, seq: int) -> str:
+        day, hour = partition.split("/")
+        return os.path.join(
+            self.base_dir,
+            TRACE_KINDS[kind][0],
+            day,
+            f"{hour}-{seq:04d}{SEGMENT_SUFFIX}",
+        )
+
+    def _newest_seq(self, kind: str, partition: str) -> int:
+        day_dir = os.path.dirname(self._segment_path(kind, partition, 0))
+        os.makedirs(day_dir, exist_ok=True)
+
+        hour = partition.split("/")[1]
+        existing = [
+            int(name[3:-len(SEGMENT_SUFFIX)])
+            for name in os.listdir(day_dir)
+            if name.startswith(f"{hour}-") and name.endswith(SEGMENT_SUFFIX)
+        ]
+        return max(existing, default=0)
+
+    def _close_segment(self, segment: _Segment) -> None:
+        if segment.dirty and self.fsync != "never":
+            os.fsync(segment.file.fileno())
+        segment.file.close()
+
+    def _has_dirty_segments(self) -> bool:
+        return any(segment.dirty for segment in self._segments.values())
+
+    def _sync_segments(self) -> None:
+        for segment in self._segments.values():
+            if segment.dirty:
+                os.fsync(segment.file.fileno())
+                segment.dirty = False
+        self._last_fsync = time.monotonic()
@@ -0,0 +1,83 @@
+"""
+Cheap timestamps and identifiers for trace records.
+
+Timestamps are captured as integer epoch nanoseconds read from the
+monotonic clock (anchored to wall-clock time once per process), and
+only rendered as ISO strings when a trace is serialized.
+
+Identifiers are random version-4 UUID strings, formatted from pooled
+os.urandom bytes instead of building a uuid.UUID per trace.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+# epoch ns = monotonic ns + anchor (re-anchored in forked children)
+_anchor_ns = time.time_ns() - time.monotonic_ns()
+
+
+def now_ns() -> int:
+    """
+    Current UTC time in epoch nanoseconds, from the monotonic clock.
+    """
+    return time.monotonic_ns() + _anchor_ns
+
+
+def iso_from_ns(ns: int) -> str:
+    """
+    Same format as datetime.utcnow().isoformat() + "Z".
+    """
+    return (_EPOCH + (ns // 1000) * _MICROSECOND).isoformat() + "Z"
+
+
+def ns_from_iso(value: str) -> int:
+    """
+    Inverse of iso_from_ns (microsecond precision).
+    """
+    parsed = datetime.fromisoformat(value.rstrip("Z"))
+    return (parsed - _EPOCH) // _MICROSECOND * 1000
+
+
+# --------------------------------
+# Identifiers
+# --------------------------------
+
+_POOL_IDS = 256
+_local = threading.local()
+
+
+def new_id() -> str:
+    """
+    Random UUID4 string (same format and entropy as str(uuid.uuid4())).
+    """
+    pool = getattr(_local, "pool", None)
+    offset = getattr(_local, "offset", _POOL_IDS * 16)
+
+    if pool is None or offset >= len(pool):
+        pool = _local.pool = os.urandom(_POOL_IDS * 16)
+        offset = 0
+    _local.offset = offset + 16
+
+    h = pool[offset:offset + 16].hex()
+    # Version 4, RFC 4122 variant
+    return (
+        f"{h[:8]}-{h[8:12]}-4{h[13:16]}-"
+        f"{'89ab'[int(h[16], 16) & 3]}{h[17:20]}-{h[20:]}"
+    )
+
+
+def _after_fork() -> None:
+    # A child must neither reuse the parent's random bytes nor its anchor
+    global _anchor_ns, _local
+    _local = threading.local()
+    _anchor_ns = time.time_ns() - time.monotonic_ns()
+
+
+os.register_at_fork(after_in_child=_after_fork)
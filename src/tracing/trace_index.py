@@ -0,0 +1,234 @@
+"""
+Trace Query Index
+-----------------
+SQLite secondary index over persisted workflow traces, maintained
+incrementally as traces are written, so questions like "every
+HOLD_TRANSACTION decision in the last hour" are index range scans
+instead of a walk over the trace files.
+
+One summary row per workflow trace:
+    workflow_execution_id, workflow_name, final_decision,
+    final_confidence, started_ns, ended_ns, human_review_required,
+    status
+indexed on (final_decision, started_ns), (workflow_name, started_ns)
+and started_ns.
+
+Used by TraceStore (TraceIndex below, <base_dir>/index.db) and by
+SegmentTraceStore, which keeps the summaries in its location index
+and updates both in the same transaction.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from platform10.core.sqlite_pool import ThreadConnectionPool, connect
+from tracing.stamps import iso_from_ns, ns_from_iso
+
+
+# datetime (naive = UTC), ISO string or epoch nanoseconds
+TimeBound = Union[datetime, str, int]
+
+
+SUMMARY_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS workflow_summaries (
+        workflow_execution_id TEXT PRIMARY KEY,
+        workflow_name TEXT NOT NULL,
+        final_decision TEXT,
+        final_confidence REAL,
+        started_ns INTEGER NOT NULL,
+        ended_ns INTEGER,
+        human_review_required INTEGER NOT NULL,
+        status TEXT
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_summary_decision_started
+    ON workflow_summaries (final_decision, started_ns)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_summary_name_started
+    ON workflow_summaries (workflow_name, started_ns)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_summary_started
+    ON workflow_summaries (started_ns)
+    """,
+]
+
+_SUMMARY_COLUMNS = (
+    "workflow_execution_id, workflow_name, final_decision, final_confidence, "
+    "started_ns, ended_ns, human_review_required, status"
+)
+
+INSERT_SUMMARY_SQL = f"""
+INSERT OR REPLACE INTO workflow_summaries ({_SUMMARY_COLUMNS})
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+# --------------------------------
+# Rows
+# --------------------------------
+
+def summary_row(payload: Dict[str, Any]) -> Optional[Tuple[Any, ...]]:
+    """
+    Index row for a WorkflowTrace.to_dict() payload; None for payloads
+    without an id, name or start time (they are stored, not indexed).
+    """
+    try:
+        execution_id = payload["workflow_execution_id"]
+        workflow_name = payload["workflow_name"]
+        started_at = payload["started_at"]
+    except KeyError:
+        return None
+
+    ended_at = payload.get("ended_at")
+    return (
+        execution_id,
+        workflow_name,
+        payload.get("final_decision"),
+        payload.get("final_confidence"),
+        ns_from_iso(started_at),
+        None if ended_at is None else ns_from_iso(ended_at),
+        int(bool(payload.get("human_review_required"))),
+        payload.get("status"),
+    )
+
+
+def _summary_from_row(row: Tuple[Any, ...]) -> Dict[str, Any]:
+    (
+        execution_id, workflow_name, decision, confidence,
+        started_ns, ended_ns, review, status,
+    ) = row
+    return {
+        "workflow_execution_id": execution_id,
+        "workflow_name": workflow_name,
+        "final_decision": decision,
+        "final_confidence": confidence,
+        "started_at": iso_from_ns(started_ns),
+        "ended_at": None if ended_ns is None else iso_from_ns(ended_ns),
+        "human_review_required": bool(review),
+        "status": status,
+    }
+
+
+def _to_ns(value: TimeBound) -> int:
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        return ns_from_iso(value)
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return ns_from_iso(value.isoformat())
+
+
+# --------------------------------
+# Queries
+# --------------------------------
+
+def query_summaries(
+    conn: sqlite3.Connection,
+    workflow_name: Optional[str] = None,
+    decision: Optional[str] = None,
+    since: Optional[TimeBound] = None,
+    until: Optional[TimeBound] = None,
+    min_confidence: Optional[float] = None,
+    limit: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Summaries matching every given filter, oldest first. `since` is
+    inclusive and `until` exclusive, both on the trace start time.
+    """
+    conditions: List[str] = []
+    params: List[Any] = []
+
+    if workflow_name is not None:
+        conditions.append("workflow_name = ?")
+        params.append(workflow_name)
+    if decision is not None:
+        conditions.append("final_decision = ?")
+        params.append(decision)
+    if since is not None:
+        conditions.append("started_ns >= ?")
+        params.append(_to_ns(since))
+    if until is not None:
+        conditions.append("started_ns < ?")
+        params.append(_to_ns(until))
+    if min_confidence is not None:
+        conditions.append("final_confidence >= ?")
+        params.append(min_confidence)
+
+    sql = f"SELECT {_SUMMARY_COLUMNS} FROM workflow_summaries"
+    if conditions:
+        sql += " WHERE " + " AND ".join(conditions)
+    sql += " ORDER BY started_ns, workflow_execution_id"
+    if limit is not None:
+        sql += " LIMIT ?"
+        params.append(limit)
+
+    return [_summary_from_row(row) for row in conn.execute(sql, params)]
+
+
+# --------------------------------
+# Standalone index
+# --------------------------------
+
+class TraceIndex:
+    """
+    Summary index in its own SQLite file. One long-lived connection
+    per thread (opened on first use), WAL journal.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        synchronous: str = "NORMAL",
+        busy_timeout_ms: int = 5000,
+    ):
+        self.db_path = db_path
+        self.synchronous = synchronous.upper()
+        self.busy_timeout_ms = busy_timeout_ms
+
+        self._pool = ThreadConnectionPool(self._connect)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = connect(
+            self.db_path,
+            synchronous=self.synchronous,
+            busy_timeout_ms=self.busy_timeout_ms,
+        )
+        with conn:
+            for statement in SUMMARY_SCHEMA:
+                conn.execute(statement)
+        return conn
+
+    def _connection(self) -> sqlite3.Connection:
+        return self._pool.get()
+
+    def add(self, payload: Dict[str, Any]) -> None:
+        self.add_many([payload])
+
+    def add_many(self, payloads: Iterable[Dict[str, Any]]) -> int:
+        """
+        Index many workflow payloads in one transaction. Returns the
+        number indexed.
+        """
+        rows = [row for row in map(summary_row, payloads) if row is not None]
+        if rows:
+            conn = self._connection()
+            with conn:
+                conn.executemany(INSERT_SUMMARY_SQL, rows)
+        return len(rows)
+
+    def query(self, **filters: Any) -> List[Dict[str, Any]]:
+        """
+        See query_summaries for the filters.
+        """
+        return query_summaries(self._connection(), **filters)
+
+    def close(self) -> None:
+        self._pool.close()
@@ -2,7 +2,17 @@ from __future__ import annotations
 
 import json
 import os
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
+
+from platform10.core.codec import packb, unpackb
+from tracing.trace_index import TimeBound, TraceIndex
+
+
+# encoding -> file extension
+ENCODINGS = {
+    "json": ".json",          # pretty-printed JSON (original format)
+    "msgpack": ".msgpack",    # canonical MessagePack (core/codec.py)
+}
 
 
 class TraceStore:
@@ -11,36 +21,63 @@ class TraceStore:
 
     This is intentionally simple and deterministic.
     Can later be swapped with DB / OpenTelemetry exporters.
+
+    Workflow traces are also summarised into a query index
+    (<base_dir>/index.db, see trace_index.py) as they are written;
+    pass index=False to skip it.
     """
 
-    def __init__(self, base_dir: str = "data/traces"):
+    def __init__(
+        self,
+        base_dir: str = "data/traces",
+        encoding: str = "json",
+        index: bool = True,
+    ):
+        if encoding not in ENCODINGS:
+            raise ValueError(f"Unsupported trace encoding: {encoding}")
+
         self.base_dir = base_dir
+        self.encoding = encoding
+        self.extension = ENCODINGS[encoding]
         self.workflow_dir = os.path.join(base_dir, "workflows")
         self.agent_dir = os.path.join(base_dir, "agents")
 
         os.makedirs(self.workflow_dir, exist_ok=True)
         os.makedirs(self.agent_dir, exist_ok=True)
 
+        self.index: Optional[TraceIndex] = None
+        if index:
+            self.index = TraceIndex(os.path.join(base_dir, "index.db"))
+
     # ---------- workflow traces ----------
 
     def write_workflow_trace(
         self,
         workflow_execution_id: str,
         payload: Dict[str, Any],
+        index: bool = True,
     ) -> str:
         """
         Persist a workflow trace as JSON.
 
+        index=False leaves the query index to the caller
+        (BackgroundTraceWriter indexes whole batches).
+
         Returns path to the written file.
         """
-        path = os.path.join(
-            self.workflow_dir,
-            f"{workflow_execution_id}.json",
-        )
+        path = self.workflow_path(workflow_execution_id)
 
         self._atomic_write(path, payload)
+        if index and self.index is not None:
+            self.index.add(payload)
         return path
 
+    def workflow_path(self, workflow_execution_id: str) -> str:
+        return os.path.join(
+            self.workflow_dir,
+            f"{workflow_execution_id}{self.extension}",
+        )
+
     # ---------- agent traces ----------
 
     def write_agent_trace(
@@ -51,23 +88,109 @@ class TraceStore:
         """
         Persist an agent trace as JSON.
         """
-        path = os.path.join(
-            self.agent_dir,
-            f"{execution_id}.json",
-        )
+        path = self.agent_path(execution_id)
 
         self._atomic_write(path, payload)
         return path
 
+    def agent_path(self, execution_id: str) -> str:
+        return os.path.join(
+            self.agent_dir,
+            f"{execution_id}{self.extension}",
+        )
+
+    # ---------- reads & queries ----------
+
+    def read_workflow_trace(self, workflow_execution_id: str) -> Optional[Dict[str, Any]]:
+        return self._read(self.workflow_path(workflow_execution_id))
+
+    def read_agent_trace(self, execution_id: str) -> Optional[Dict[str, Any]]:
+        return self._read(self.agent_path(execution_id))
+
+    def query(
+        self,
+        workflow_name: Optional[str] = None,
+        decision: Optional[str] = None,
+        since: Optional[TimeBound] = None,
+        until: Optional[TimeBound] = None,
+        min_confidence: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Workflow trace summaries matching every given filter, oldest
+        first (see trace_index.query_summaries). Traces still queued
+        in a BackgroundTraceWriter show up once it has flushed.
+        """
+        if self.index is None:
+            raise RuntimeError("TraceStore was created with index=False")
+
+        return self.index.query(
+            workflow_name=workflow_name,
+            decision=decision,
+            since=since,
+            until=until,
+            min_confidence=min_confidence,
+            limit=limit,
+        )
+
+    def rebuild_index(self) -> int:
+        """
+        Index every workflow trace on disk (e.g. ones written before
+        the index existed). Returns the number indexed.
+        """
+        if self.index is None:
+            raise RuntimeError("TraceStore was created with index=False")
+
+        return self.index.add_many(
+            payload
+            for payload in map(self._read, self._workflow_files())
+            if payload is not None
+        )
+
+    # ---------- lifecycle ----------
+
+    def flush(self) -> None:
+        """
+        Writes are synchronous; nothing to flush. Same lifecycle as the
+        queued sinks (trace_writer.py, segment_store.py).
+        """
+
+    def close(self) -> None:
+        if self.index is not None:
+            self.index.close()
+
     # ---------- internals ----------
 
     def _atomic_write(self, path: str, payload: Dict[str, Any]) -> None:
         """
-        Write JSON atomically to avoid partial writes.
+        Write the encoded payload atomically to avoid partial writes.
         """
         tmp_path = f"{path}.tmp"
 
-        with open(tmp_path, "w") as f:
-            json.dump(payload, f, indent=2)
+        if self.encoding == "msgpack":
+            with open(tmp_path, "wb") as f:
+                f.write(packb(payload))
+        else:
+            with open(tmp_path, "w") as f:
+                json.dump(payload, f, indent=2)
 
         os.replace(tmp_path, path)
+
+    def _read(self, path: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+
+        if path.endswith(ENCODINGS["msgpack"]):
+            return unpackb(data)
+        return json.loads(data)
+
+    def _workflow_files(self) -> List[str]:
+        extensions = tuple(ENCODINGS.values())
+        return [
+            os.path.join(self.workflow_dir, name)
+            for name in sorted(os.listdir(self.workflow_dir))
+            if name.endswith(extensions)
+        ]
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import queue
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from tracing.trace_store import TraceStore
+
+
+class BackgroundTraceWriter:
+    """
+    TraceStore front-end that persists traces on a background thread.
+
+    write_workflow_trace / write_agent_trace have the TraceStore
+    signatures but only enqueue: JSON encoding and file I/O happen on
+    the writer thread, off the request path. Writes are applied in
+    order; when `max_pending` writes are queued, callers block until
+    the writer catches up.
+
+    Queued writes are drained in batches of up to `batch_size`; the
+    workflow traces of a batch go into the store's query index in one
+    transaction.
+
+    flush() waits for every queued write; close() flushes, stops the
+    thread and closes the store (and its index).
+    """
+
+    def __init__(
+        self,
+        store: TraceStore,
+        max_pending: int = 10000,
+        batch_size: int = 500,
+    ):
+        self.store = store
+        self.batch_size = batch_size
+
+        self.written = 0
+        self.failed = 0
+        self.last_error: Optional[BaseException] = None
+
+        self._queue: "queue.Queue[Optional[Tuple[str, str, Dict[str, Any]]]]" = (
+            queue.Queue(maxsize=max_pending)
+        )
+        # Held across the closed check and the put, so nothing is
+        # queued behind the stop sentinel
+        self._submit_lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run,
+            name="trace-writer",
+            daemon=True,
+        )
+        self._thread.start()
+
+    # ---------- TraceStore interface ----------
+
+    def write_workflow_trace(
+        self,
+        workflow_execution_id: str,
+        payload: Dict[str, Any],
+    ) -> str:
+        """
+        Queue a workflow trace; returns the path it will be written to.
+        """
+        self._submit("workflow", workflow_execution_id, payload)
+        return self.store.workflow_path(workflow_execution_id)
+
+    def write_agent_trace(
+        self,
+        execution_id: str,
+        payload: Dict[str, Any],
+    ) -> str:
+        """
+        Queue an agent trace; returns the path it will be written to.
+        """
+        self._submit("agent", execution_id, payload)
+        return self.store.agent_path(execution_id)
+
+    # ---------- lifecycle ----------
+
+    @property
+    def pending(self) -> int:
+        return self._queue.unfinished_tasks
+
+    def flush(self) -> None:
+        """
+        Block until every queued trace has been written.
+        """
+        self._queue.join()
+
+    def close(self) -> None:
+        """
+        Flush, stop the writer thread and close the store. Idempotent.
+        """
+        with self._submit_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._thread.join()
+        self.store.close()
+
+    def __enter__(self) -> "BackgroundTraceWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    # ---------- internals ----------
+
+    def _submit(self, kind: str, trace_id: str, payload: Dict[str, Any]) -> None:
+        with self._submit_lock:
+            if self._closed:
+                raise RuntimeError("BackgroundTraceWriter is closed")
+            self._queue.put((kind, trace_id, payload))
+
+    def _run(self) -> None:
+        stop = False
+
+        while not stop:
+            # Whatever is already queued joins this batch, up to the
+            # stop sentinel
+            batch: List[Tuple[str, str, Dict[str, Any]]] = []
+            item = self._queue.get()
+            while True:
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            try:
+                self._write_batch(batch)
+            finally:
+                for _ in range(len(batch) + stop):
+                    self._queue.task_done()
+
+    def _write_batch(self, batch: List[Tuple[str, str, Dict[str, Any]]]) -> None:
+        # Workflow summaries are indexed once per batch, in one transaction
+        summaries: List[Dict[str, Any]] = []
+
+        for kind, trace_id, payload in batch:
+            try:
+                if kind == "workflow":
+                    self.store.write_workflow_trace(trace_id, payload, index=False)
+                    summaries.append(payload)
+                else:
+                    self.store.write_agent_trace(trace_id, payload)
+                self.written += 1
+            except Exception as e:
+                # A failed write must not stop the writer
+                self.failed += 1
+                self.last_error = e
+
+        if summaries and self.store.index is not None:
+            try:
+                self.store.index.add_many(summaries)
+            except Exception as e:
+                # The traces are on disk; store.rebuild_index() recovers them
+                self.last_error = e
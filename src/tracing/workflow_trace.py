@@ -1,16 +1,18 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
-from datetime import datetime
+from dataclasses import InitVar, dataclass, field
 from typing import List, Dict, Any, Optional
-import uuid
+
+from platform10.core.codec import pack_record, unpack_record
+from tracing.agent_trace import copy_payload
+from tracing.stamps import iso_from_ns, new_id, now_ns, ns_from_iso
 
 
 def utc_now() -> str:
-    return datetime.utcnow().isoformat() + "Z"
+    return iso_from_ns(now_ns())
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentInvocation:
     agent: str
     execution_id: str
@@ -19,13 +21,16 @@ class AgentInvocation:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowTrace:
+    """
+    Slotted, with lazily rendered timestamps (see AgentTrace).
+    """
     workflow_execution_id: str
     workflow_name: str
 
-    started_at: str = field(default_factory=utc_now)
-    ended_at: Optional[str] = None
+    started_ns: int = field(default_factory=now_ns)
+    ended_ns: Optional[int] = None
 
     agents_invoked: List[AgentInvocation] = field(default_factory=list)
 
@@ -37,6 +42,17 @@ class WorkflowTrace:
 
     status: str = "RUNNING"
 
+    started_at: InitVar[Optional[str]] = None
+    ended_at: InitVar[Optional[str]] = None
+
+    def __post_init__(self, started_at, ended_at) -> None:
+        # ISO keywords of the pre-ns records. Unset, these InitVars
+        # default to the properties of the same name; only str converts
+        if isinstance(started_at, str):
+            self.started_ns = ns_from_iso(started_at)
+        if isinstance(ended_at, str):
+            self.ended_ns = ns_from_iso(ended_at)
+
     # ---------- lifecycle ----------
 
     @classmethod
@@ -45,7 +61,7 @@ class WorkflowTrace:
         Start a new workflow trace.
         """
         return cls(
-            workflow_execution_id=str(uuid.uuid4()),
+            workflow_execution_id=new_id(),
             workflow_name=workflow_name,
         )
 
@@ -85,10 +101,79 @@ class WorkflowTrace:
         self.explainability = explainability or {}
         self.human_review_required = human_review_required
 
-        self.ended_at = utc_now()
+        self.ended_ns = now_ns()
         self.status = "COMPLETED"
 
+    # ---------- timestamps ----------
+
+    @property
+    def started_at(self) -> str:
+        return iso_from_ns(self.started_ns)
+
+    @property
+    def ended_at(self) -> Optional[str]:
+        return None if self.ended_ns is None else iso_from_ns(self.ended_ns)
+
     # ---------- serialization ----------
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        """
+        JSON-ready dict (ISO timestamps), same shape and deep copy as
+        dataclasses.asdict.
+        """
+        return {
+            "workflow_execution_id": self.workflow_execution_id,
+            "workflow_name": self.workflow_name,
+            "started_at": self.started_at,
+            "ended_at": self.ended_at,
+            "agents_invoked": [
+                {
+                    "agent": a.agent,
+                    "execution_id": a.execution_id,
+                    "decision": a.decision,
+                    "confidence": a.confidence,
+                    "metadata": copy_payload(a.metadata),
+                }
+                for a in self.agents_invoked
+            ],
+            "final_decision": self.final_decision,
+            "final_confidence": self.final_confidence,
+            "explainability": copy_payload(self.explainability),
+            "human_review_required": self.human_review_required,
+            "status": self.status,
+        }
+
+    # Binary record layout (see platform10/core/codec.py);
+    # agents_invoked entries are [agent, execution_id, decision,
+    # confidence, metadata]. v1 stored started_at / ended_at as ISO
+    # strings; v2 stores ns.
+    RECORD_TAG = "WorkflowTrace"
+    RECORD_VERSION = 2
+    RECORD_FIELDS = (
+        "workflow_execution_id", "workflow_name", "started_ns", "ended_ns",
+        "agents_invoked", "final_decision", "final_confidence",
+        "explainability", "human_review_required", "status",
+    )
+
+    def to_bytes(self) -> bytes:
+        """
+        Canonical binary encoding: same bytes for equal traces.
+        """
+        values = [getattr(self, name) for name in self.RECORD_FIELDS]
+        values[4] = [
+            (a.agent, a.execution_id, a.decision, a.confidence, a.metadata)
+            for a in self.agents_invoked
+        ]
+        return pack_record(self.RECORD_TAG, self.RECORD_VERSION, values)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "WorkflowTrace":
+        version, values = unpack_record(data, cls.RECORD_TAG, (1, 2))
+        if version == 1:
+            values[2] = ns_from_iso(values[2])
+            values[3] = None if values[3] is None else ns_from_iso(values[3])
+        fields = dict(zip(cls.RECORD_FIELDS, values))
+        fields["agents_invoked"] = [
+            AgentInvocation(*invocation) for invocation in fields["agents_invoked"]
+        ]
+        return cls(**fields)
@@ -0,0 +1,100 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Union
+
+from tracing.segment_store import SegmentTraceStore
+from tracing.trace_store import TraceStore
+from tracing.trace_writer import BackgroundTraceWriter
+from platform10.agents.velocity_signal_agent import VelocitySignalAgent
+
+
+# Anything with TraceStore's write_workflow_trace / write_agent_trace
+TraceSink = Union[TraceStore, BackgroundTraceWriter, SegmentTraceStore]
+
+TRACE_LAYOUTS = {"files", "segments"}
+
+
+@dataclass(frozen=True)
+class FraudTriageConfig:
+    trace_dir: str = "data/traces"
+
+    # files     one file per trace (tracing/trace_store.py)
+    # segments  hourly NDJSON segments + id index (tracing/segment_store.py)
+    trace_layout: str = "files"
+    trace_encoding: str = "json"   # files only; or "msgpack"
+
+    # Persist traces on a background thread (False = inline writes).
+    # The segment layout always writes in the background.
+    background_traces: bool = True
+    max_pending_traces: int = 10000
+
+    # segments only: "never" | "batch" | "interval"
+    trace_fsync: str = "never"
+
+
+class FraudTriageRuntime:
+    """
+    Long-lived state of the fraud triage workflow.
+
+    Created once per process (the API creates it at startup, see
+    api/fraud_api.py) and shared by every request: agents, the trace
+    store and its background writer are built once instead of per
+    call. Agents are stateless, so sharing them across threads is safe.
+    """
+
+    def __init__(self, config: Optional[FraudTriageConfig] = None):
+        self.config = config or FraudTriageConfig()
+
+        self.velocity_agent = VelocitySignalAgent()
+
+        if self.config.trace_layout not in TRACE_LAYOUTS:
+            raise ValueError(f"Unsupported trace layout: {self.config.trace_layout}")
+
+        self.trace_store: Union[TraceStore, SegmentTraceStore]
+        if self.config.trace_layout == "segments":
+            self.trace_store = SegmentTraceStore(
+                self.config.trace_dir,
+                max_pending=self.config.max_pending_traces,
+                fsync=self.config.trace_fsync,
+            )
+        else:
+            self.trace_store = TraceStore(
+                self.config.trace_dir,
+                encoding=self.config.trace_encoding,
+            )
+
+        self.trace_writer: Optional[BackgroundTraceWriter] = None
+        if self.config.background_traces and isinstance(self.trace_store, TraceStore):
+            self.trace_writer = BackgroundTraceWriter(
+                self.trace_store,
+                max_pending=self.config.max_pending_traces,
+            )
+
+    @property
+    def trace_sink(self) -> TraceSink:
+        """
+        Where the workflow sends traces.
+        """
+        return self.trace_writer or self.trace_store
+
+    def flush(self) -> None:
+        self.trace_sink.flush()
+
+    def query_traces(self, **filters: Any) -> List[Dict[str, Any]]:
+        """
+        Flush pending traces, then query the store's workflow index
+        (filters as TraceStore.query).
+        """
+        self.flush()
+        return self.trace_store.query(**filters)
+
+    def close(self) -> None:
+        """
+        Write every pending trace and stop the background writer.
+        """
+        self.trace_sink.close()
+
+    def __enter__(self) -> "FraudTriageRuntime":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
@@ -1,4 +1,5 @@
-from typing import Dict, Any
+from itertools import islice
+from typing import Dict, Any, Iterable, Iterator, List, Optional
 
 # ----------------------------
 # Tracing & workflow infra
@@ -6,6 +7,11 @@ from typing import Dict, Any
 from tracing.workflow_trace import WorkflowTrace
 from tracing.agent_trace import AgentTrace
 from tracing.trace_store import TraceStore
+from workflows.fraud_triage_runtime import (
+    FraudTriageConfig,
+    FraudTriageRuntime,
+    TraceSink,
+)
 from tracing.confidence_aggregator import (
     ConfidenceAggregator,
     ConfidenceSignal,
@@ -15,39 +21,52 @@ from tracing.confidence_aggregator import (
 # Legacy agents & contracts
 # ----------------------------
 from platform10.agents.velocity_signal_agent import VelocitySignalAgent
+from platform10.contracts.case_batch import CaseBatch
 from platform10.contracts.fraud_case import FraudCase
 
 
+WORKFLOW_NAME = "fraud-triage-workflow"
+BATCH_SIZE = 1000
+
+
 def run_fraud_triage_workflow(
-    inputs: Dict[str, Any]
+    inputs: Dict[str, Any],
+    runtime: Optional[FraudTriageRuntime] = None,
 ) -> Dict[str, Any]:
     """
     Fraud triage workflow using real legacy agents
     with canonical tracing and confidence aggregation.
+
+    `runtime` supplies the shared agents and trace sink (the API passes
+    its application runtime). Without one, a standalone runtime with
+    inline trace writes is built for this call and closed before
+    returning.
     """
 
-    trace_store = TraceStore()
+    if runtime is None:
+        with FraudTriageRuntime(FraudTriageConfig(background_traces=False)) as runtime:
+            return _triage(inputs, runtime)
+
+    return _triage(inputs, runtime)
+
 
+def _triage(inputs: Dict[str, Any], runtime: FraudTriageRuntime) -> Dict[str, Any]:
     # -------------------------------------------------
     # 1️⃣ Start workflow trace
     # -------------------------------------------------
     workflow_trace = WorkflowTrace.start(
-        workflow_name="fraud-triage-workflow"
+        workflow_name=WORKFLOW_NAME
     )
 
     # -------------------------------------------------
-    # 2️⃣ Instantiate agents (REAL)
+    # 2️⃣ Agents (REAL, shared through the runtime)
     # -------------------------------------------------
-    velocity_agent = VelocitySignalAgent()
+    velocity_agent = runtime.velocity_agent
 
     # -------------------------------------------------
     # 3️⃣ Velocity Signal Agent (REAL)
     # -------------------------------------------------
-    velocity_trace = AgentTrace.start(
-        agent_name="velocity-signal-agent",
-        task_type="fraud_signal_detection",
-        inputs=inputs,
-    )
+    velocity_trace = _start_velocity_trace(inputs)
 
     fraud_case = FraudCase(
         case_id=workflow_trace.workflow_execution_id,
@@ -57,6 +76,105 @@ def run_fraud_triage_workflow(
 
     velocity_signal = velocity_agent.evaluate(fraud_case)
 
+    return _complete_triage(
+        runtime.trace_sink,
+        workflow_trace,
+        velocity_trace,
+        velocity_signal,
+    )
+
+
+def run_fraud_triage_batch(
+    items: Iterable[Dict[str, Any]],
+    trace_store: Optional[TraceSink] = None,
+    batch_size: int = BATCH_SIZE,
+    runtime: Optional[FraudTriageRuntime] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Batch variant for bulk re-scoring.
+
+    One trace sink and one agent serve every input (the runtime's when
+    given, `trace_store` overriding its sink); signals are evaluated
+    per chunk of `batch_size` through evaluate_batch. Results are
+    yielded in input order as each chunk completes and are identical
+    to run_fraud_triage_workflow for the same input.
+
+    A TraceStore built here (no runtime, no `trace_store`) is closed
+    when the generator finishes or is closed.
+    """
+
+    owned_store: Optional[TraceStore] = None
+
+    if runtime is not None:
+        trace_store = trace_store or runtime.trace_sink
+        velocity_agent = runtime.velocity_agent
+    else:
+        if trace_store is None:
+            trace_store = owned_store = TraceStore()
+        velocity_agent = VelocitySignalAgent()
+
+    try:
+        yield from _triage_chunks(items, trace_store, velocity_agent, batch_size)
+    finally:
+        if owned_store is not None:
+            owned_store.close()
+
+
+def _triage_chunks(
+    items: Iterable[Dict[str, Any]],
+    trace_store: TraceSink,
+    velocity_agent: VelocitySignalAgent,
+    batch_size: int,
+) -> Iterator[Dict[str, Any]]:
+    iterator = iter(items)
+
+    while True:
+        chunk: List[Dict[str, Any]] = list(islice(iterator, batch_size))
+        if not chunk:
+            return
+
+        workflow_traces = [
+            WorkflowTrace.start(workflow_name=WORKFLOW_NAME) for _ in chunk
+        ]
+        velocity_traces = [_start_velocity_trace(inputs) for inputs in chunk]
+
+        batch = CaseBatch(
+            case_ids=[t.workflow_execution_id for t in workflow_traces],
+            transactions=chunk,
+        )
+
+        velocity_signals = velocity_agent.evaluate_batch(batch)
+
+        for workflow_trace, velocity_trace, velocity_signal in zip(
+            workflow_traces, velocity_traces, velocity_signals
+        ):
+            yield _complete_triage(
+                trace_store,
+                workflow_trace,
+                velocity_trace,
+                velocity_signal,
+            )
+
+
+def _start_velocity_trace(inputs: Dict[str, Any]) -> AgentTrace:
+    return AgentTrace.start(
+        agent_name="velocity-signal-agent",
+        task_type="fraud_signal_detection",
+        inputs=inputs,
+    )
+
+
+def _complete_triage(
+    trace_store: TraceSink,
+    workflow_trace: WorkflowTrace,
+    velocity_trace: AgentTrace,
+    velocity_signal: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    Decision, confidence aggregation and trace persistence for one
+    evaluated transaction.
+    """
+
     velocity_risk = velocity_signal.get("risk", "LOW")
 
     if velocity_risk == "HIGH":
@@ -0,0 +1,118 @@
+import random
+
+import numpy as np
+import pytest
+
+from platform10.agents.customer_tenure_signal_agent import CustomerTenureSignalAgent
+from platform10.agents.location_signal_agent import LocationSignalAgent
+from platform10.agents.time_window_signal_agent import TimeWindowSignalAgent
+from platform10.agents.time_window_velocity_signal_agent import (
+    TimeWindowVelocitySignalAgent,
+)
+from platform10.agents.velocity_signal_agent import VelocitySignalAgent
+from platform10.contracts.case_batch import CaseBatch
+
+
+AGENTS = [
+    VelocitySignalAgent(),
+    LocationSignalAgent(),
+    TimeWindowSignalAgent(),
+    TimeWindowVelocitySignalAgent(),
+    CustomerTenureSignalAgent(),
+]
+
+TIMESTAMPS = [
+    "2024-01-01T03:04:05",
+    "2024-02-29 23:59",
+    "2023-02-29T01:00",        # no such day
+    "0000-01-01T01:00",        # year 0
+    "2024-01-01T24:00",        # hour 24
+    "2024-01-01T03:00+05:00",  # offset
+    "2024-01-01T03:00:00.5",   # fraction
+    "2024-01-01T03:00\x00",    # trailing NUL
+    "2024-01-01T03:0\x005",    # embedded NUL
+    "+024-01-01T03:00",        # signed year
+    " 024-01-01T03:00",        # padded year
+    "2024-01-01t03:00",
+    "9999-12-31T04:59:59",
+    "garbage",
+]
+
+
+def _numbers(rng):
+    return rng.choice([
+        0, 9, 10, 19, 20, 29, 30, 49, 50, 51, 10**30, -1, 2.5,
+        float("nan"), True, False, np.int64(60), np.float32(25.0),
+    ])
+
+
+def _case(rng):
+    transaction = {}
+    context = {}
+
+    if rng.random() < 0.9:
+        transaction["tx_count"] = _numbers(rng)
+    if rng.random() < 0.9:
+        transaction["country"] = rng.choice(["RU", "IR", "KP", "US", "GB", "", None])
+    if rng.random() < 0.9:
+        context["timestamp"] = rng.choice(TIMESTAMPS + [
+            f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+            f"T{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}"
+        ])
+    if rng.random() < 0.8:
+        context["tx_count_last_10_min"] = rng.choice([_numbers(rng), None])
+    if rng.random() < 0.8:
+        context["customer_tenure_days"] = rng.choice([_numbers(rng), None])
+
+    return transaction, context
+
+
+def _batch(rows):
+    return CaseBatch(
+        case_ids=[f"case-{i}" for i in range(len(rows))],
+        transactions=[tx for tx, _ in rows],
+        contexts=[ctx for _, ctx in rows],
+    )
+
+
+def _row_by_row(agent, batch):
+    return [agent.evaluate(batch.case(i)) for i in range(len(batch))]
+
+
+@pytest.mark.parametrize("agent", AGENTS, ids=lambda a: a.name)
+def test_evaluate_batch_is_output_identical(agent):
+    rng = random.Random(7)
+    batch = _batch([_case(rng) for _ in range(5000)])
+
+    expected = _row_by_row(agent, batch)
+    actual = agent.evaluate_batch(batch)
+
+    # NaN != NaN: compare through repr
+    assert repr(list(actual)) == repr(expected)
+    assert [list(row) for row in actual] == [list(row) for row in expected]
+
+    # Column access and random access agree with the rows
+    assert list(actual.risks) == [row["risk"] for row in expected]
+    assert repr(actual[-1]) == repr(expected[-1])
+    assert repr(actual[10:13]) == repr(expected[10:13])
+
+
+@pytest.mark.parametrize("agent", AGENTS, ids=lambda a: a.name)
+def test_empty_batch(agent):
+    assert agent.evaluate_batch(_batch([])) == []
+
+
+def test_unsupported_values_fall_back_to_evaluate():
+    # evaluate() raises on str vs int comparison; so must the batch
+    batch = _batch([({"tx_count": "60"}, {}), ({"tx_count": 1}, {})])
+    with pytest.raises(TypeError):
+        VelocitySignalAgent().evaluate_batch(batch)
+
+    batch = _batch([({"country": 1}, {}), ({"country": "RU"}, {})])
+    assert LocationSignalAgent().evaluate_batch(batch) == _row_by_row(
+        LocationSignalAgent(), batch
+    )
+
+    batch = _batch([({}, {"timestamp": 5})])
+    with pytest.raises(TypeError):
+        TimeWindowSignalAgent().evaluate_batch(batch)
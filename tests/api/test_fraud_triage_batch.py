@@ -0,0 +1,138 @@
+import json
+import os
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.fraud_api import router
+from platform10.agents.location_signal_agent import LocationSignalAgent
+from platform10.agents.velocity_signal_agent import VelocitySignalAgent
+from platform10.contracts.case_batch import CaseBatch
+from platform10.contracts.fraud_case import FraudCase
+from tracing.trace_store import TraceStore
+from workflows.fraud_triage_workflow import (
+    BATCH_SIZE,
+    run_fraud_triage_batch,
+    run_fraud_triage_workflow,
+)
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    # TraceStore writes under ./data/traces
+    monkeypatch.chdir(tmp_path)
+    app = FastAPI()
+    app.include_router(router)
+    # Entering the client runs the router lifespan (app runtime)
+    with TestClient(app) as client:
+        yield client
+
+
+def _transactions(n):
+    return [{"transaction_id": f"txn_{i}", "tx_count": i % 70} for i in range(n)]
+
+
+def _expected_decision(tx_count):
+    if tx_count >= 50:
+        return "HOLD_TRANSACTION"
+    if tx_count >= 20:
+        return "REVIEW"
+    return "APPROVE"
+
+
+def test_evaluate_batch_matches_evaluate():
+    transactions = _transactions(100) + [{"country": "RU"}, {}]
+    batch = CaseBatch(
+        case_ids=[f"case-{i}" for i in range(len(transactions))],
+        transactions=transactions,
+    )
+
+    for agent in (VelocitySignalAgent(), LocationSignalAgent()):
+        expected = [agent.evaluate(batch.case(i)) for i in range(len(batch))]
+        assert agent.evaluate_batch(batch) == expected
+
+    cases = [FraudCase(case_id="a", transaction={"tx_count": 55}, context={})]
+    assert CaseBatch.from_cases(cases).column("tx_count") == [55]
+
+
+def test_case_batch_columns_accept_unhashable_defaults():
+    batch = CaseBatch(case_ids=["a", "b"], transactions=[{"tags": ["x"]}, {}])
+
+    assert batch.column("tags", []) == [["x"], []]
+    assert batch.column("tags") == [["x"], None]
+    assert batch.context_column("seen", {}) == [{}, {}]
+
+
+def test_batch_workflow_matches_single_workflow(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    transactions = _transactions(25)
+
+    single = [run_fraud_triage_workflow(tx) for tx in transactions]
+    batched = list(
+        run_fraud_triage_batch(transactions, trace_store=TraceStore(), batch_size=10)
+    )
+
+    strip = lambda r: (r["decision"], r["confidence"])
+    assert [strip(r) for r in batched] == [strip(r) for r in single]
+    assert len({r["workflow_execution_id"] for r in batched}) == 25
+    assert len(os.listdir(tmp_path / "data/traces/workflows")) == 50
+
+
+def test_batch_endpoint_json_array(client):
+    items = [{"transaction": tx} for tx in _transactions(1200)]
+    items.insert(3, {"context": {}})  # missing transaction
+
+    response = client.post("/fraud/triage/batch", json=items)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["index"] for line in lines] == list(range(1201))
+    assert "error" in lines[3]
+
+    valid = lines[:3] + lines[4:]
+    assert [line["decision"] for line in valid] == [
+        _expected_decision(i % 70) for i in range(1200)
+    ]
+
+
+def test_batch_endpoint_reports_rows_that_fail_to_score(client):
+    items = [{"transaction": tx} for tx in _transactions(BATCH_SIZE + 10)]
+    items[1] = {"transaction": {"tx_count": "x"}}  # passes the schema
+    items.insert(2, {"bad": 1})
+
+    response = client.post("/fraud/triage/batch", json=items)
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["index"] for line in lines] == list(range(len(items)))
+    assert [i for i, line in enumerate(lines) if "error" in line] == [1, 2]
+    assert lines[0]["decision"] == "APPROVE"
+    assert [line["decision"] for line in lines[3:]] == [
+        _expected_decision(i % 70) for i in range(2, BATCH_SIZE + 10)
+    ]
+
+
+def test_batch_endpoint_ndjson_stream(client):
+    body = "\n".join(
+        json.dumps({"transaction": tx, "context": {"channel": "card"}})
+        for tx in _transactions(30)
+    ) + "\nnot json\n"
+
+    response = client.post(
+        "/fraud/triage/batch",
+        content=body.encode(),
+        headers={"content-type": "application/x-ndjson"},
+    )
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert len(lines) == 31
+    assert lines[0]["decision"] == "APPROVE"
+    assert lines[25]["decision"] == "REVIEW"
+    assert "error" in lines[30]
+
+
+def test_batch_endpoint_rejects_non_array(client):
+    response = client.post("/fraud/triage/batch", json={"transaction": {}})
+    assert response.status_code == 422
@@ -0,0 +1,111 @@
+import os
+import threading
+
+from fastapi.testclient import TestClient
+
+from main import app
+from tracing.trace_store import TraceStore
+from tracing.trace_writer import BackgroundTraceWriter
+from workflows.fraud_triage_runtime import FraudTriageConfig, FraudTriageRuntime
+from workflows.fraud_triage_workflow import run_fraud_triage_workflow
+
+
+def test_runtime_is_created_at_startup_and_flushed_at_shutdown(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    with TestClient(app) as client:
+        runtime = app.state.fraud_triage_runtime
+        ids = []
+        for tx_count in (5, 25, 55):
+            response = client.post(
+                "/fraud/triage",
+                json={"transaction": {"tx_count": tx_count}},
+            )
+            assert response.status_code == 200
+            ids.append(response.json()["workflow_execution_id"])
+
+        # Every request used the one runtime built at startup
+        assert app.state.fraud_triage_runtime is runtime
+
+    # Shutdown wrote every queued trace
+    assert runtime.trace_writer.pending == 0
+    written = os.listdir(tmp_path / "data/traces/workflows")
+    assert sorted(written) == sorted(f"{i}.json" for i in ids)
+
+
+def test_background_writer_matches_inline_store(tmp_path):
+    config = FraudTriageConfig(trace_dir=str(tmp_path / "traces"))
+
+    with FraudTriageRuntime(config) as runtime:
+        result = run_fraud_triage_workflow({"tx_count": 30}, runtime=runtime)
+        runtime.flush()
+        path = runtime.trace_store.workflow_path(result["workflow_execution_id"])
+        assert os.path.exists(path)
+
+    assert result["decision"] == "REVIEW"
+    assert runtime.trace_writer.written == 2
+
+
+def test_background_writer_survives_failed_writes(tmp_path):
+    store = TraceStore(str(tmp_path))
+    writer = BackgroundTraceWriter(store, max_pending=2)
+
+    writer.write_agent_trace("bad", {"value": object()})  # not JSON
+    path = writer.write_agent_trace("good", {"value": 1})
+    writer.close()
+
+    assert (writer.written, writer.failed) == (1, 1)
+    assert isinstance(writer.last_error, TypeError)
+    assert os.path.exists(path)
+
+
+def test_writer_close_closes_the_store_index(tmp_path):
+    store = TraceStore(str(tmp_path))
+    writer = BackgroundTraceWriter(store)
+    writer.write_workflow_trace("wf-1", {"value": 1})
+    store.query()  # opens an index connection on this thread
+
+    writer.close()
+
+    assert len(store.index._pool) == 0
+
+
+def test_standalone_workflow_closes_its_runtime(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    closed = []
+    close = FraudTriageRuntime.close
+    monkeypatch.setattr(
+        FraudTriageRuntime, "close", lambda self: closed.append(self) or close(self)
+    )
+
+    run_fraud_triage_workflow({"tx_count": 5})
+
+    assert len(closed) == 1
+
+
+def test_writes_racing_close_are_written_or_rejected(tmp_path):
+    writer = BackgroundTraceWriter(TraceStore(str(tmp_path)), batch_size=4)
+    accepted = []
+    start = threading.Barrier(5)
+
+    def submit(worker):
+        start.wait()
+        for i in range(200):
+            try:
+                writer.write_agent_trace(f"{worker}-{i}", {"i": i})
+            except RuntimeError:
+                return
+            accepted.append(f"{worker}-{i}")
+
+    threads = [threading.Thread(target=submit, args=(w,)) for w in range(4)]
+    for thread in threads:
+        thread.start()
+    start.wait()
+    writer.close()
+    for thread in threads:
+        thread.join()
+
+    assert writer.written == len(accepted)
+    assert sorted(os.listdir(tmp_path / "agents")) == sorted(
+        f"{trace_id}.json" for trace_id in accepted
+    )
@@ -0,0 +1,128 @@
+import math
+import random
+from dataclasses import asdict, replace
+from datetime import datetime, timezone
+
+import pytest
+
+from platform10.core.codec import CodecError, packb, record_hash, unpackb
+from platform10.governance.audit_log import AuditEvent
+from tracing.agent_trace import AgentTrace
+from tracing.trace_store import TraceStore
+from tracing.workflow_trace import WorkflowTrace
+
+
+@pytest.mark.parametrize("value, encoded", [
+    (None, "c0"),
+    (False, "c2"),
+    (True, "c3"),
+    (0, "00"),
+    (127, "7f"),
+    (128, "cc80"),
+    (65536, "ce00010000"),
+    (2**64 - 1, "cf" + "ff" * 8),
+    (-1, "ff"),
+    (-33, "d0df"),
+    (-2**63, "d3" + "80" + "00" * 7),
+    (1.0, "cb3ff0000000000000"),
+    ("a", "a161"),
+    ("x" * 32, "d920" + "78" * 32),
+    (b"\x01", "c40101"),
+    ([1, [2]], "920191" + "02"),
+    ({"b": 1, "a": 2}, "82a16102a16201"),
+])
+def test_encodings_follow_msgpack_spec(value, encoded):
+    assert packb(value).hex() == encoded
+    assert unpackb(packb(value)) == value
+
+
+def test_canonical_bytes_ignore_insertion_order():
+    keys = [f"k{i}" for i in range(40)]
+    shuffled = keys[:]
+    random.Random(1).shuffle(shuffled)
+
+    a = {k: {"nested": i, "z": 1, "a": [1.5]} for i, k in enumerate(keys)}
+    b = {k: {"a": [1.5], "z": 1, "nested": keys.index(k)} for k in shuffled}
+
+    assert packb(a) == packb(b)
+    assert record_hash(packb(a)) == record_hash(packb(b))
+
+
+def test_floats_and_nan_are_canonical():
+    assert packb(float("nan")) == packb(-float("nan"))
+    assert math.isnan(unpackb(packb(float("nan"))))
+    assert unpackb(packb(-0.0)) == 0.0
+
+
+def test_round_trip_of_mixed_values():
+    value = {
+        "s": "héllo" * 100,
+        "big": list(range(-40, 70000, 997)),
+        "map": {str(i): i / 3 for i in range(20)},
+        "bytes": bytes(range(256)) * 300,
+        "none": None,
+        "tuple": (1, "two"),
+    }
+    decoded = unpackb(packb(value))
+    assert decoded == {**value, "tuple": [1, "two"]}
+
+
+def test_errors():
+    with pytest.raises(TypeError):
+        packb(object())
+    with pytest.raises(OverflowError):
+        packb(2**64)
+    with pytest.raises(CodecError):
+        unpackb(packb([1, 2])[:-1])
+    with pytest.raises(CodecError):
+        unpackb(packb(1) + b"\x00")
+    assert unpackb(packb({"t": object()}, default=lambda o: "obj")) == {"t": "obj"}
+
+
+def test_audit_event_round_trip():
+    event = AuditEvent(
+        event_id="e1",
+        trace_id="t1",
+        timestamp=datetime(2024, 5, 6, 7, 8, 9, 123456),
+        component="agent",
+        action="RUN",
+        input_data={"amount": 12.5, "items": [1, 2]},
+        output_data={"risk": "HIGH"},
+        metadata={"v": None},
+    )
+    data = event.to_bytes()
+
+    assert AuditEvent.from_bytes(data) == event
+    assert len(data) < len(str(asdict(event)))
+
+    aware = replace(event, timestamp=event.timestamp.replace(tzinfo=timezone.utc))
+    assert aware.to_bytes() == data
+
+
+def test_trace_round_trips_and_rejects_other_records():
+    agent = AgentTrace.start("velocity-signal-agent", "fraud", {"tx_count": 3})
+    agent.record_signals({"risk": "LOW"})
+    agent.finalize("LOW", "count = 3", 0.3)
+    assert AgentTrace.from_bytes(agent.to_bytes()) == agent
+
+    workflow = WorkflowTrace.start("fraud-triage-workflow")
+    workflow.record_agent_result("velocity", agent.execution_id, "LOW", 0.3, {"x": 1})
+    workflow.finalize("APPROVE", 0.3, {"agents": {"velocity": "LOW"}})
+    assert WorkflowTrace.from_bytes(workflow.to_bytes()) == workflow
+
+    with pytest.raises(CodecError):
+        AgentTrace.from_bytes(workflow.to_bytes())
+
+
+def test_trace_store_msgpack_encoding(tmp_path):
+    store = TraceStore(str(tmp_path), encoding="msgpack")
+    trace = WorkflowTrace.start("wf")
+
+    path = store.write_workflow_trace(trace.workflow_execution_id, trace.to_dict())
+
+    assert path.endswith(".msgpack")
+    with open(path, "rb") as f:
+        assert unpackb(f.read()) == trace.to_dict()
+
+    with pytest.raises(ValueError):
+        TraceStore(str(tmp_path), encoding="xml")
@@ -0,0 +1,30 @@
+import sqlite3
+import threading
+
+import pytest
+
+from platform10.core.sqlite_pool import ThreadConnectionPool, connect
+
+
+def test_one_connection_per_thread_closed_together(tmp_path):
+    pool = ThreadConnectionPool(lambda: connect(str(tmp_path / "pool.db")))
+
+    main = pool.get()
+    assert pool.get() is main
+    assert main.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(pool.get()))
+    thread.start()
+    thread.join()
+
+    assert other[0] is not main
+    assert len(pool) == 2
+
+    pool.close()
+
+    assert len(pool) == 0
+    with pytest.raises(sqlite3.ProgrammingError):
+        main.execute("SELECT 1")
+    assert pool.get() is not main
+    pool.close()
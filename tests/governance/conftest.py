@@ -0,0 +1,19 @@
+import pytest
+
+from platform10.governance.signing.key_manager import KeyManager
+
+
+@pytest.fixture
+def signing_keys(tmp_path, monkeypatch):
+    """
+    Fresh Ed25519 key pair isolated from the repository keys.
+    """
+    monkeypatch.setattr(
+        KeyManager, "PRIVATE_KEY_PATH", str(tmp_path / "private.pem")
+    )
+    monkeypatch.setattr(
+        KeyManager, "PUBLIC_KEY_PATH", str(tmp_path / "public.pem")
+    )
+    monkeypatch.setattr(KeyManager, "KEYRING_DIR", str(tmp_path / "keyring"))
+    KeyManager.generate_keys()
+    return tmp_path
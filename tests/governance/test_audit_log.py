@@ -0,0 +1,111 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from platform10.governance.audit_log import (
+    AuditEvent,
+    AuditLog,
+    InMemoryAuditLog,
+    SQLiteAuditLog,
+    set_audit_log,
+)
+
+
+T0 = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def _event(n, trace_id, seconds, component="agent", action="RUN"):
+    return AuditEvent(
+        event_id=f"e{n}",
+        trace_id=trace_id,
+        timestamp=T0 + timedelta(seconds=seconds),
+        component=component,
+        action=action,
+        input_data={"n": n},
+        output_data={"ok": True},
+        metadata={},
+    )
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        yield InMemoryAuditLog()
+    else:
+        log = SQLiteAuditLog(str(tmp_path / "audit.db"))
+        yield log
+        log.close()
+
+
+def test_fetch_events_is_per_trace_and_time_ordered(backend):
+    events = [
+        _event(0, "a", 5),
+        _event(1, "b", 1),
+        _event(2, "a", 2),  # recorded late, earlier timestamp
+        _event(3, "a", 5),  # timestamp tie: record order kept
+    ]
+    for event in events:
+        backend.append(event)
+
+    assert [e.event_id for e in backend.fetch_events("a")] == ["e2", "e0", "e3"]
+    assert backend.fetch_events("missing") == []
+    assert backend.all_events() == events
+
+
+def test_fetch_by_action(backend):
+    backend.append(_event(0, "a", 3, action="RUN"))
+    backend.append(_event(1, "a", 1, action="FAIL"))
+    backend.append(_event(2, "b", 2, action="RUN"))
+    backend.append(_event(3, "b", 0, component="policy", action="RUN"))
+
+    assert [e.event_id for e in backend.fetch_by_action("agent", "RUN")] == ["e2", "e0"]
+    assert [e.event_id for e in backend.fetch_by_action("agent")] == ["e1", "e2", "e0"]
+
+
+def test_record_event_through_executor_facade(backend):
+    AuditLog(backend).record("exec-1", "AGENT_FAILURE", {"agent": "X"})
+
+    [event] = backend.fetch_events("exec-1")
+    assert (event.component, event.action) == ("executor", "AGENT_FAILURE")
+    assert event.output_data == {"agent": "X"}
+
+
+def test_facade_follows_backend_installed_after_construction():
+    facade = AuditLog()
+    installed = InMemoryAuditLog()
+    previous = set_audit_log(installed)
+    try:
+        facade.record("exec-1", "AGENT_SUCCESS", {})
+    finally:
+        set_audit_log(previous)
+
+    assert [e.action for e in installed.fetch_events("exec-1")] == ["AGENT_SUCCESS"]
+
+
+def test_in_memory_retention_bound():
+    log = InMemoryAuditLog(max_events=3)
+    for n in range(5):
+        log.append(_event(n, "a" if n % 2 else "b", n))
+
+    assert [e.event_id for e in log.all_events()] == ["e2", "e3", "e4"]
+    assert [e.event_id for e in log.fetch_events("b")] == ["e2", "e4"]
+    assert [e.event_id for e in log.fetch_by_action("agent", "RUN")] == ["e2", "e3", "e4"]
+
+
+def test_sqlite_is_durable_and_indexed(tmp_path):
+    path = str(tmp_path / "audit.db")
+    log = SQLiteAuditLog(path)
+    log.append_many([_event(0, "a", 0), _event(1, "a", 1)])
+    log.close()
+
+    reopened = SQLiteAuditLog(path)
+    assert [e.event_id for e in reopened.fetch_events("a")] == ["e0", "e1"]
+    assert reopened.fetch_events("a")[0].input_data == {"n": 0}
+
+    plan = reopened._connection().execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM audit_events "
+        "WHERE trace_id = ? ORDER BY timestamp",
+        ("a",),
+    ).fetchall()
+    assert "idx_audit_trace_timestamp" in str(plan)
+    reopened.close()
@@ -0,0 +1,198 @@
+import json
+import os
+import subprocess
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+from platform10.governance.audit_log import (
+    AuditEvent,
+    InMemoryAuditLog,
+    SQLiteAuditLog,
+    event_to_row,
+)
+from platform10.governance.audit_sink import AsyncAuditSink
+
+
+class GatedAuditLog(InMemoryAuditLog):
+    """
+    Backend whose writes wait until the gate opens.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.gate = threading.Event()
+        self.batches = []
+
+    def append_many(self, events):
+        self.gate.wait()
+        self.batches.append(len(events))
+        super().append_many(events)
+
+
+class FailingAuditLog(InMemoryAuditLog):
+    def append_many(self, events):
+        raise OSError("disk full")
+
+
+def _record(sink, n, trace_id="t"):
+    for i in range(n):
+        sink.record_event(trace_id, "agent", f"A{i}", {}, {"i": i})
+
+
+def _actions(events):
+    return [e.action for e in events]
+
+
+def test_events_reach_backend_in_batches(tmp_path):
+    backend = SQLiteAuditLog(str(tmp_path / "audit.db"))
+
+    with AsyncAuditSink(backend, batch_size=100, max_delay_ms=1000) as sink:
+        _record(sink, 250)
+        assert sink.flush(timeout=5)
+        assert backend.fetch_events("t")[-1].output_data == {"i": 249}
+
+        # Reads through the sink see everything recorded so far
+        _record(sink, 1, trace_id="u")
+        assert _actions(sink.fetch_events("u")) == ["A0"]
+
+    assert sink.written == 251
+    backend.close()
+
+
+def test_drop_policy_counts_and_never_blocks():
+    backend = GatedAuditLog()
+    sink = AsyncAuditSink(backend, capacity=5, batch_size=1, policy="drop")
+
+    start = time.perf_counter()
+    _record(sink, 50)
+    assert time.perf_counter() - start < 1
+
+    backend.gate.set()
+    sink.close()
+
+    assert sink.dropped > 0
+    assert sink.written + sink.dropped == 50
+    assert len(backend.all_events()) == sink.written
+
+
+def test_spill_policy_keeps_every_event_in_order(tmp_path):
+    backend = GatedAuditLog()
+    sink = AsyncAuditSink(
+        backend,
+        capacity=5,
+        batch_size=3,
+        policy="spill",
+        spill_dir=str(tmp_path / "spill"),
+    )
+
+    _record(sink, 40)
+    assert sink.spilled > 0
+
+    backend.gate.set()
+    assert sink.flush(timeout=5)
+    _record(sink, 1, trace_id="after")
+    sink.close()
+
+    assert _actions(backend.fetch_events("t")) == [f"A{i}" for i in range(40)]
+    assert _actions(backend.all_events())[-1] == "A0"  # the "after" event
+    assert os.listdir(tmp_path / "spill") == []
+
+
+def test_block_policy_waits_for_space():
+    backend = GatedAuditLog()
+    sink = AsyncAuditSink(backend, capacity=2, batch_size=1, policy="block")
+
+    producer = threading.Thread(target=_record, args=(sink, 20))
+    producer.start()
+    producer.join(0.2)
+    assert producer.is_alive()  # buffer full, backend stalled
+
+    backend.gate.set()
+    producer.join(5)
+    assert not producer.is_alive()
+
+    sink.close()
+    assert sink.dropped == 0
+    assert _actions(backend.fetch_events("t")) == [f"A{i}" for i in range(20)]
+
+
+def test_close_flushes_and_rejects_new_events():
+    backend = InMemoryAuditLog()
+    sink = AsyncAuditSink(backend, max_delay_ms=10_000)
+
+    _record(sink, 10)
+    sink.close()
+
+    assert len(backend.all_events()) == 10
+    with pytest.raises(RuntimeError):
+        _record(sink, 1)
+
+
+def test_backend_failure_surfaces_on_flush():
+    sink = AsyncAuditSink(FailingAuditLog())
+    _record(sink, 3)
+
+    with pytest.raises(RuntimeError):
+        sink.flush(timeout=5)
+
+    assert sink.failed == 3
+    sink.close()
+
+
+def test_invalid_policy():
+    with pytest.raises(ValueError):
+        AsyncAuditSink(InMemoryAuditLog(), policy="ignore")
+
+
+def _orphan_spill(spill_dir, lines):
+    """
+    Spill file of a process that died before replaying it.
+    """
+    dead = subprocess.Popen(["true"])
+    dead.wait()
+
+    os.makedirs(spill_dir, exist_ok=True)
+    path = os.path.join(spill_dir, f"audit-spill-{dead.pid}-1-1.jsonl")
+    with open(path, "w") as f:
+        f.writelines(lines)
+    return path
+
+
+def _spilled_line(i):
+    event = AuditEvent(f"e{i}", "t", datetime.utcnow(), "agent", f"A{i}", {}, {})
+    return json.dumps(event_to_row(event)) + "\n"
+
+
+def test_orphaned_spill_files_are_replayed_at_startup(tmp_path):
+    spill_dir = str(tmp_path / "spill")
+    path = _orphan_spill(spill_dir, [_spilled_line(i) for i in range(3)])
+
+    backend = InMemoryAuditLog()
+    with AsyncAuditSink(backend, policy="spill", spill_dir=spill_dir) as sink:
+        _record(sink, 1, trace_id="new")
+        assert sink.flush(timeout=5)
+
+    assert _actions(backend.fetch_events("t")) == ["A0", "A1", "A2"]
+    assert not os.path.exists(path)
+
+
+def test_corrupt_spill_file_fails_flush_instead_of_hanging(tmp_path):
+    spill_dir = str(tmp_path / "spill")
+    path = _orphan_spill(spill_dir, [_spilled_line(0), '{"torn": \n'])
+
+    backend = InMemoryAuditLog()
+    sink = AsyncAuditSink(backend, batch_size=1, spill_dir=spill_dir)
+
+    with pytest.raises(RuntimeError):
+        sink.flush(timeout=5)
+
+    _record(sink, 1, trace_id="new")
+    assert sink.flush(timeout=5)
+    sink.close()
+
+    assert sink.failed == 1
+    assert _actions(backend.fetch_events("t")) == ["A0"]
+    assert os.path.exists(f"{path}.failed")
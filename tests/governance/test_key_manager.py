@@ -0,0 +1,107 @@
+import json
+import os
+import shutil
+
+import pytest
+
+from platform10.governance.replay.regulator_replay import RegulatorReplay
+from platform10.governance.signing.key_manager import KeyManager
+
+
+def _record(replay, trace_id):
+    replay.record(
+        trace_id=trace_id,
+        input_snapshot={"case": {"case_id": trace_id}},
+        steps=[],
+        final_context={"risk": "LOW"},
+    )
+
+
+def test_keys_are_cached_until_the_file_changes(signing_keys, tmp_path):
+    first = KeyManager.load_private_key()
+    assert KeyManager.load_private_key() is first
+
+    # Replace the PEM on disk from "another process"
+    other = tmp_path / "other"
+    other.mkdir()
+    original = KeyManager.PRIVATE_KEY_PATH, KeyManager.PUBLIC_KEY_PATH
+    KeyManager.PRIVATE_KEY_PATH = str(other / "private.pem")
+    KeyManager.PUBLIC_KEY_PATH = str(other / "public.pem")
+    KeyManager.generate_keys()
+    KeyManager.PRIVATE_KEY_PATH, KeyManager.PUBLIC_KEY_PATH = original
+
+    os.replace(other / "private.pem", KeyManager.PRIVATE_KEY_PATH)
+
+    reloaded = KeyManager.load_private_key()
+    assert reloaded is not first
+    assert KeyManager.compute_key_id(reloaded.public_key()) != (
+        KeyManager.compute_key_id(first.public_key())
+    )
+
+
+def test_records_carry_key_id_and_survive_rotation(signing_keys, tmp_path):
+    replay = RegulatorReplay(storage_dir=str(tmp_path / "replay_logs"))
+
+    _record(replay, "before")
+    old_id = KeyManager.current_key_id()
+
+    new_id = KeyManager.rotate_keys()
+    _record(replay, "after")
+
+    assert new_id != old_id
+    assert replay.load_record("before")["key_id"] == old_id
+    assert replay.load_record("after")["key_id"] == new_id
+
+    assert replay.verify_signature("before")
+    assert replay.verify_signature("after")
+    assert replay.verify_integrity("before")
+    assert replay.verify_chain()
+
+    assert replay.verify_signatures(["before", "after", "missing"]) == {
+        "before": True,
+        "after": True,
+        "missing": False,
+    }
+
+    # Without the retired key the old record can no longer be verified
+    shutil.rmtree(KeyManager.KEYRING_DIR)
+    assert not replay.verify_signature("before")
+    assert replay.verify_signatures(["before", "after"]) == {
+        "before": False,
+        "after": True,
+    }
+
+
+def test_tampered_key_id_fails_signature_not_integrity(signing_keys, tmp_path):
+    replay = RegulatorReplay(storage_dir=str(tmp_path / "replay_logs"))
+    _record(replay, "t1")
+
+    path = os.path.join(replay.STORAGE_DIR, "t1.json")
+    with open(path) as f:
+        payload = json.load(f)
+    payload["key_id"] = "0" * 16
+    with open(path, "w") as f:
+        json.dump(payload, f)
+
+    assert replay.verify_integrity("t1")
+    assert not replay.verify_signature("t1")
+
+
+def test_key_ids_that_are_not_fingerprints_are_rejected(signing_keys, tmp_path):
+    old_id = KeyManager.current_key_id()
+    KeyManager.rotate_keys()
+
+    # An attacker-controlled PEM outside the keyring, reachable by path
+    shutil.copy(KeyManager.PUBLIC_KEY_PATH, tmp_path / "planted.pem")
+
+    for key_id in ("../planted", "../public", old_id.upper(), old_id + "0", 7):
+        with pytest.raises(KeyError):
+            KeyManager.load_public_key_by_id(key_id)
+
+    # A keyring file must hold the key it is named after
+    planted = os.path.join(KeyManager.KEYRING_DIR, "0" * 16 + ".pem")
+    shutil.copy(KeyManager.PUBLIC_KEY_PATH, planted)
+    with pytest.raises(KeyError):
+        KeyManager.load_public_key_by_id("0" * 16)
+
+    assert KeyManager.load_public_key_by_id(old_id) is not None
@@ -0,0 +1,168 @@
+import hashlib
+import json
+import math
+import os
+
+import pytest
+
+from platform10.governance.replay.merkle import (
+    build_levels,
+    inclusion_proof,
+    verify_inclusion,
+)
+from platform10.governance.replay.regulator_replay import RegulatorReplay
+
+
+def _hash(i):
+    return "sha256:" + hashlib.sha256(str(i).encode()).hexdigest()
+
+
+def _record(replay, trace_id):
+    replay.record(
+        trace_id=trace_id,
+        input_snapshot={"case": {"case_id": trace_id}},
+        steps=[],
+        final_context={"risk": "LOW"},
+    )
+
+
+@pytest.fixture
+def replay(tmp_path, signing_keys):
+    return RegulatorReplay(
+        storage_dir=str(tmp_path / "replay_logs"),
+        sealing="merkle",
+        seal_window=4,
+    )
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 5, 8, 13])
+def test_every_leaf_proves_against_the_root(size):
+    hashes = [_hash(i) for i in range(size)]
+    levels = build_levels(hashes)
+    root = levels[-1][0].hex()
+
+    for i, h in enumerate(hashes):
+        path = inclusion_proof(levels, i)
+        assert len(path) <= math.ceil(math.log2(size))
+        assert verify_inclusion(h, path, root)
+        assert not verify_inclusion(_hash(size + 1), path, root)
+
+
+def test_windows_are_sealed_with_one_signature_each(replay):
+    for i in range(10):
+        _record(replay, f"t{i}")
+
+    assert replay.sealer.batches() == [1, 2]
+    assert replay.sealer.pending_count() == 2
+    assert "signature" not in replay.load_record("t0")
+
+    # Pending records are not covered by any signature yet
+    assert replay.verify_signature("t3")
+    assert not replay.verify_signature("t9")
+    assert replay.verify_integrity("t9")
+
+    header = replay.seal()
+    assert header["size"] == 2
+    assert replay.seal() is None
+
+    ids = [f"t{i}" for i in range(10)]
+    assert all(replay.verify_signatures(ids).values())
+    assert all(replay.verify_integrity(t) for t in ids)
+    assert replay.verify_chain()
+
+
+def test_tampered_record_or_proof_is_detected(replay):
+    for i in range(4):
+        _record(replay, f"t{i}")
+
+    record_path = os.path.join(replay.STORAGE_DIR, "t1.json")
+    with open(record_path) as f:
+        payload = json.load(f)
+    payload["final_context"]["risk"] = "HIGH"
+    with open(record_path, "w") as f:
+        json.dump(payload, f)
+
+    assert not replay.verify_integrity("t1")
+
+    # Swap t2's proof for t3's: inclusion no longer reaches the root
+    proofs_path = replay.sealer._proofs_path(1)
+    with open(proofs_path) as f:
+        lines = [json.loads(line) for line in f]
+    lines[2]["path"] = lines[3]["path"]
+    with open(proofs_path, "w") as f:
+        f.write("".join(json.dumps(line) + "\n" for line in lines))
+    replay.sealer._index.clear()
+    replay.sealer._index_loaded = 0
+
+    assert not replay.verify_signature("t2")
+    assert not replay.verify_integrity("t2")
+    assert replay.verify_signature("t0")
+
+
+def test_record_mode_instance_verifies_merkle_records(replay, tmp_path):
+    for i in range(4):
+        _record(replay, f"t{i}")
+
+    reader = RegulatorReplay(storage_dir=replay.STORAGE_DIR)
+    assert reader.verify_signature("t2")
+
+
+def _reopen(replay):
+    return RegulatorReplay(
+        storage_dir=replay.STORAGE_DIR, sealing="merkle", seal_window=4
+    )
+
+
+def test_seal_interrupted_before_index_lines_is_recovered(replay):
+    for i in range(4):
+        _record(replay, f"t{i}")
+
+    # Crash after the header: index.tsv holds one and a half lines of
+    # batch 1 and the window was never truncated
+    sealer = replay.sealer
+    index_path = sealer._path("index.tsv")
+    with open(index_path, "rb") as f:
+        first, second = f.readlines()[:2]
+    with open(index_path, "wb") as f:
+        f.write(first + second[:5])
+    with open(sealer._path("pending.jsonl"), "w") as f:
+        for i in range(4):
+            record = replay.load_record(f"t{i}")
+            f.write(json.dumps({
+                "trace_id": f"t{i}", "integrity_hash": record["integrity_hash"],
+            }) + "\n")
+
+    restarted = _reopen(replay)
+
+    # The window is full again with t4: only t4 goes into batch 2,
+    # batch 1 is not sealed a second time
+    _record(restarted, "t4")
+    assert restarted.sealer.batches() == [1, 2]
+    assert restarted.sealer.lookup("t4")[0]["size"] == 1
+    assert all(restarted.verify_signatures([f"t{i}" for i in range(5)]).values())
+    with open(index_path) as f:
+        assert all(len(line.split("\t")) == 3 for line in f)
+
+
+def test_record_committed_by_roll_forward_is_still_sealed(replay, monkeypatch):
+    _record(replay, "t0")
+
+    def crash(trace_id, integrity_hash):
+        raise KeyboardInterrupt
+
+    # Crash after the record is written, before it joins the window
+    monkeypatch.setattr(replay.sealer, "add", crash)
+    with pytest.raises(KeyboardInterrupt):
+        _record(replay, "t1")
+
+    restarted = _reopen(replay)
+    _record(restarted, "t2")
+    assert restarted.chain_tip()["sequence"] == 3
+
+    restarted.seal()
+    assert all(restarted.verify_signatures(["t0", "t1", "t2"]).values())
+
+
+def test_unknown_sealing_mode_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        RegulatorReplay(storage_dir=str(tmp_path), sealing="bulk")
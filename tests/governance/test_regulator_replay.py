@@ -0,0 +1,102 @@
+import json
+import multiprocessing
+import os
+import threading
+
+import pytest
+
+from platform10.governance.replay.regulator_replay import RegulatorReplay
+
+
+def _record(replay, trace_id):
+    replay.record(
+        trace_id=trace_id,
+        input_snapshot={"case": {"case_id": trace_id}},
+        steps=[{"step": 1, "agent": "velocity-signal-agent", "output_snapshot": {}}],
+        final_context={"risk": "LOW"},
+    )
+
+
+def _record_many(storage_dir, prefix, count):
+    replay = RegulatorReplay(storage_dir=storage_dir)
+    for i in range(count):
+        _record(replay, f"{prefix}-{i}")
+
+
+@pytest.fixture
+def replay(tmp_path, signing_keys):
+    return RegulatorReplay(storage_dir=str(tmp_path / "replay_logs"))
+
+
+def test_chain_follows_append_order_not_file_names(replay):
+    # Reverse-sorted ids: file-name order disagrees with append order
+    for trace_id in ("trace-c", "trace-b", "trace-a"):
+        _record(replay, trace_id)
+
+    assert replay.chain_tip()["sequence"] == 3
+    assert replay.verify_chain()
+    assert replay.verify_integrity("trace-b")
+    assert replay.verify_signature("trace-b")
+
+
+def test_tampered_record_breaks_chain(replay):
+    for trace_id in ("t1", "t2"):
+        _record(replay, trace_id)
+
+    path = os.path.join(replay.STORAGE_DIR, "t1.json")
+    with open(path) as f:
+        payload = json.load(f)
+    payload["final_context"]["risk"] = "HIGH"
+    with open(path, "w") as f:
+        json.dump(payload, f)
+
+    assert not replay.verify_integrity("t1")
+    assert not replay.verify_chain()
+
+
+def test_interrupted_append_is_rolled_forward(replay):
+    _record(replay, "t1")
+    tip = replay.chain_tip()
+
+    # Simulate a crash after the record write but before the tip update
+    _record(replay, "t2")
+    with open(os.path.join(replay.STORAGE_DIR, "t2.json")) as f:
+        t2_hash = json.load(f)["integrity_hash"]
+    replay._write_chain_tip(
+        {**tip, "pending": {"sequence": 2, "trace_id": "t2", "integrity_hash": t2_hash}}
+    )
+
+    _record(replay, "t3")
+
+    assert replay.chain_tip()["sequence"] == 3
+    assert replay.verify_chain()
+
+
+def test_concurrent_writers_produce_one_linear_chain(replay):
+    threads = [
+        threading.Thread(target=_record_many, args=(replay.STORAGE_DIR, f"thr{n}", 10))
+        for n in range(4)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    if "fork" in multiprocessing.get_all_start_methods():
+        ctx = multiprocessing.get_context("fork")
+        procs = [
+            ctx.Process(target=_record_many, args=(replay.STORAGE_DIR, f"proc{n}", 10))
+            for n in range(3)
+        ]
+        for p in procs:
+            p.start()
+        for p in procs:
+            p.join()
+        assert all(p.exitcode == 0 for p in procs)
+
+    records = replay.store.record_files()
+    expected = 40 + (30 if "fork" in multiprocessing.get_all_start_methods() else 0)
+
+    assert len(records) == expected
+    assert replay.chain_tip()["sequence"] == expected
+    assert replay.verify_chain()
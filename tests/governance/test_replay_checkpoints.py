@@ -0,0 +1,132 @@
+import json
+import os
+
+import pytest
+
+from platform10.governance.replay.ledger import SegmentedLedger
+from platform10.governance.replay.regulator_replay import RegulatorReplay
+
+
+def _record(replay, trace_id):
+    replay.record(
+        trace_id=trace_id,
+        input_snapshot={"case": {"case_id": trace_id}},
+        steps=[],
+        final_context={"risk": "LOW"},
+    )
+
+
+def _tamper(replay, trace_id):
+    path = os.path.join(replay.STORAGE_DIR, f"{trace_id}.json")
+    with open(path) as f:
+        payload = json.load(f)
+    payload["final_context"]["risk"] = "HIGH"
+    with open(path, "w") as f:
+        json.dump(payload, f)
+
+
+def _checkpoints(replay):
+    path = os.path.join(replay.STORAGE_DIR, replay.CHECKPOINT_FILE)
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.fixture
+def replay(tmp_path, signing_keys):
+    return RegulatorReplay(
+        storage_dir=str(tmp_path / "replay_logs"),
+        checkpoint_interval=5,
+    )
+
+
+@pytest.fixture
+def ledger_replay(tmp_path, signing_keys):
+    storage_dir = str(tmp_path / "ledger_logs")
+    return RegulatorReplay(
+        storage_dir=storage_dir,
+        store=SegmentedLedger(
+            os.path.join(storage_dir, "ledger"),
+            max_segment_bytes=2048,
+            fsync=False,
+        ),
+        checkpoint_interval=5,
+    )
+
+
+def test_verify_writes_signed_checkpoints_once(replay):
+    for i in range(12):
+        _record(replay, f"t{i:02d}")
+
+    assert replay.verify_chain()
+    assert [c["sequence"] for c in _checkpoints(replay)] == [5, 10]
+
+    # A second pass resumes at 10 and adds nothing
+    assert replay.verify_chain()
+    assert [c["sequence"] for c in _checkpoints(replay)] == [5, 10]
+    assert replay.latest_checkpoint()["sequence"] == 10
+
+
+def test_incremental_verify_trusts_checkpointed_prefix_only(replay):
+    for i in range(12):
+        _record(replay, f"t{i:02d}")
+    assert replay.verify_chain()
+
+    _tamper(replay, "t02")
+    assert replay.verify_chain()
+    assert not replay.verify_chain(full=True)
+
+    _tamper(replay, "t11")
+    assert not replay.verify_chain()
+
+
+def test_forged_checkpoint_is_ignored(replay):
+    for i in range(12):
+        _record(replay, f"t{i:02d}")
+    assert replay.verify_chain()
+
+    forged = dict(_checkpoints(replay)[-1], sequence=12, integrity_hash="sha256:00")
+    with open(os.path.join(replay.STORAGE_DIR, replay.CHECKPOINT_FILE), "a") as f:
+        f.write(json.dumps(forged) + "\n")
+
+    assert replay.latest_checkpoint()["sequence"] == 10
+    assert replay.verify_chain()
+
+
+def test_parallel_verify_matches_serial(replay, ledger_replay):
+    for r in (replay, ledger_replay):
+        for i in range(30):
+            _record(r, f"t{i:02d}")
+
+    assert len(ledger_replay.store.segments()) > 2
+
+    for r in (replay, ledger_replay):
+        assert r.verify_chain(full=True, workers=3)
+        assert r.verify_chain(workers=3)
+
+    _tamper(replay, "t17")
+    assert not replay.verify_chain(full=True, workers=3)
+
+
+def test_ledger_resumes_from_checkpoint_position(ledger_replay):
+    for i in range(30):
+        _record(ledger_replay, f"t{i:02d}")
+    assert ledger_replay.verify_chain()
+
+    checkpoint = ledger_replay.latest_checkpoint()
+    segment, offset = checkpoint["resume"]
+    partitions = ledger_replay.store.chain_partitions(checkpoint, 1)
+
+    assert partitions[0][1:] == (segment, offset)
+    assert all(p[1] >= segment for p in partitions)
+
+
+def test_parallel_verify_detects_corrupt_segment(ledger_replay):
+    for i in range(30):
+        _record(ledger_replay, f"t{i:02d}")
+
+    first = ledger_replay.store._segment_path(ledger_replay.store.segments()[0])
+    with open(first, "r+b") as f:
+        f.seek(40)
+        f.write(b"X")
+
+    assert not ledger_replay.verify_chain(full=True, workers=3)
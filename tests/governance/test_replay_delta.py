@@ -0,0 +1,89 @@
+import json
+import os
+
+import pytest
+
+from platform10.agents.location_signal_agent import LocationSignalAgent
+from platform10.agents.risk_classifier_agent import RiskClassifierAgent
+from platform10.agents.velocity_signal_agent import VelocitySignalAgent
+from platform10.governance.replay.delta import apply_patch, diff
+from platform10.governance.replay.regulator_replay import RegulatorReplay
+from platform10.runtime.engine import ExecutionEngine
+
+
+def _initial_input():
+    return {
+        "case": {
+            "case_id": "CASE-001",
+            "transaction": {"amount": 25000, "tx_count": 35},
+            "context": {"location_mismatch": True},
+        },
+        "signals": [],
+        "trace_id": "trace-1",
+    }
+
+
+def _agents(count=1):
+    agents = [VelocitySignalAgent(), LocationSignalAgent()] * count
+    return agents + [RiskClassifierAgent()]
+
+
+@pytest.mark.parametrize("old, new", [
+    ({"a": 1, "b": [1, 2, 3]}, {"a": 2, "b": [1, 5], "c": {"d": None}}),
+    ({"x/y": {"m~n": [1]}}, {"x/y": {"m~n": [1, {"k": True}]}}),
+    ({"a": [1, 2]}, {"a": {"0": 1}}),
+    ({"a": 1}, {"a": True}),
+    ([1, 2], {"root": "replaced"}),
+])
+def test_patch_round_trip(old, new):
+    ops = diff(old, new)
+    assert apply_patch(json.loads(json.dumps(old)), ops) == new
+    assert diff(new, new) == []
+
+
+def test_every_step_is_reconstructed_from_deltas(tmp_path, signing_keys):
+    delta = RegulatorReplay(storage_dir=str(tmp_path / "delta"))
+    full = RegulatorReplay(storage_dir=str(tmp_path / "full"), step_encoding="full")
+
+    for replay in (delta, full):
+        ExecutionEngine(replay=replay).execute_sequence(
+            _agents(), _initial_input(), "trace-1"
+        )
+
+    stored_full = full.load_record("trace-1")
+    stored_delta = delta.load_record("trace-1")
+    assert stored_delta["step_encoding"] == "delta"
+    assert all("output_snapshot" not in s for s in stored_delta["steps"])
+
+    assert delta.reconstruct_step("trace-1", 0) == _initial_input()
+    for step in stored_full["steps"]:
+        index = step["step"]
+        assert delta.reconstruct_step("trace-1", index) == step["output_snapshot"]
+        assert full.reconstruct_step("trace-1", index) == step["output_snapshot"]
+        assert delta.step_hash("trace-1", index) == full.step_hash("trace-1", index)
+
+    with pytest.raises(IndexError):
+        delta.reconstruct_step("trace-1", len(stored_full["steps"]) + 1)
+
+    assert delta.verify_integrity("trace-1")
+    assert delta.verify_chain()
+
+
+def test_delta_records_grow_linearly(tmp_path, signing_keys):
+    delta = RegulatorReplay(storage_dir=str(tmp_path / "delta"))
+    full = RegulatorReplay(storage_dir=str(tmp_path / "full"), step_encoding="full")
+
+    for replay in (delta, full):
+        ExecutionEngine(replay=replay).execute_sequence(
+            _agents(count=10), _initial_input(), "trace-1"
+        )
+
+    def size(replay):
+        return os.path.getsize(os.path.join(replay.STORAGE_DIR, "trace-1.json"))
+
+    assert size(delta) * 4 < size(full)
+
+
+def test_unknown_step_encoding_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        RegulatorReplay(storage_dir=str(tmp_path), step_encoding="zip")
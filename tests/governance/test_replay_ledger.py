@@ -0,0 +1,125 @@
+import os
+
+import pytest
+
+from platform10.governance.replay.ledger import SegmentedLedger
+from platform10.governance.replay.pdf_exporter import ReplayPDFExporter
+from platform10.governance.replay.regulator_replay import RegulatorReplay
+
+
+def _record(replay, trace_id):
+    replay.record(
+        trace_id=trace_id,
+        input_snapshot={"case": {"case_id": trace_id}},
+        steps=[],
+        final_context={"risk": "HIGH", "signals": []},
+    )
+
+
+@pytest.fixture
+def replay(tmp_path, signing_keys):
+    storage_dir = str(tmp_path / "replay_logs")
+    return RegulatorReplay(
+        storage_dir=storage_dir,
+        store=SegmentedLedger(
+            os.path.join(storage_dir, "ledger"),
+            max_segment_bytes=2048,
+            fsync=False,
+        ),
+    )
+
+
+def test_ledger_rolls_segments_and_keeps_verification_api(replay):
+    for i in range(20):
+        _record(replay, f"trace-{i}")
+
+    assert len(replay.store.segments()) > 1
+    assert replay.verify_chain()
+    assert replay.verify_integrity("trace-7")
+    assert replay.verify_signature("trace-7")
+
+    with pytest.raises(FileNotFoundError):
+        replay.verify_integrity("unknown")
+
+
+def test_single_record_is_read_by_offset(replay):
+    for i in range(5):
+        _record(replay, f"trace-{i}")
+
+    # A fresh reader resolves the trace through the on-disk index
+    reader = SegmentedLedger(replay.store.directory)
+    position = reader.locate("trace-3")
+
+    assert position is not None
+    assert reader.read_at(position)["trace_id"] == "trace-3"
+
+
+def test_torn_tail_is_recovered_on_next_append(replay):
+    for i in range(3):
+        _record(replay, f"trace-{i}")
+
+    last_segment = replay.store._segment_path(replay.store.segments()[-1])
+    with open(last_segment, "ab") as f:
+        f.write(b"\x00\x00\x01\x00partial")
+
+    _record(replay, "trace-3")
+
+    assert replay.verify_chain()
+    assert replay.load_record("trace-3")["sequence"] == 4
+
+
+def test_corrupted_sealed_segment_fails_chain(replay):
+    for i in range(20):
+        _record(replay, f"trace-{i}")
+
+    first_segment = replay.store._segment_path(replay.store.segments()[0])
+    with open(first_segment, "r+b") as f:
+        f.seek(20)
+        f.write(b"X")
+
+    assert not replay.verify_chain()
+
+
+def test_pdf_exporter_reads_from_ledger(replay):
+    pytest.importorskip("reportlab")
+    _record(replay, "trace-pdf")
+
+    path = ReplayPDFExporter(replay).export("trace-pdf")
+
+    assert os.path.exists(path)
+
+
+def test_crash_between_frame_and_index_line_keeps_one_chain(replay):
+    for i in range(3):
+        _record(replay, f"trace-{i}")
+    tip = replay.chain_tip()
+
+    # Crash after the trace-3 frame was written, before its .idx line
+    # and before the tip update
+    _record(replay, "trace-3")
+    store = replay.store
+    index_path = store._index_path(store.segments()[-1])
+    with open(index_path) as f:
+        lines = f.readlines()
+    with open(index_path, "w") as f:
+        f.writelines(lines[:-1])
+    replay._write_chain_tip({
+        **tip,
+        "pending": {
+            "sequence": 4,
+            "trace_id": "trace-3",
+            "integrity_hash": store.load("trace-3")["integrity_hash"],
+        },
+    })
+
+    restarted = RegulatorReplay(
+        storage_dir=replay.STORAGE_DIR,
+        store=SegmentedLedger(store.directory, max_segment_bytes=2048, fsync=False),
+    )
+    _record(restarted, "trace-4")
+
+    assert restarted.chain_tip()["sequence"] == 5
+    assert restarted.load_record("trace-4")["previous_hash"] == (
+        restarted.load_record("trace-3")["integrity_hash"]
+    )
+    assert restarted.verify_chain(full=True)
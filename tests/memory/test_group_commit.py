@@ -0,0 +1,104 @@
+import sqlite3
+import time
+
+import pytest
+
+from platform10.memory.group_commit import GroupCommitWriter
+from platform10.memory.memory_manager import MemoryManager
+
+
+@pytest.fixture
+def memory(tmp_path):
+    manager = MemoryManager(db_path=str(tmp_path / "memory.db"))
+    yield manager
+    manager.close()
+
+
+def test_flush_commits_everything_submitted(memory):
+    batches = []
+
+    with GroupCommitWriter(
+        memory,
+        max_batch_size=64,
+        max_delay_ms=10_000,
+        on_commit=batches.append,
+    ) as writer:
+        for i in range(200):
+            writer.submit("fraud_assessment", {"i": i})
+
+        assert writer.flush(timeout=5)
+        assert writer.committed == 200
+
+    assert len(memory.recall_by_type("fraud_assessment")) == 200
+    assert max(batches) <= 64
+
+
+def _visible_rows(db_path):
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM episodic_memory").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_time_threshold_commits_without_explicit_flush(memory):
+    writer = GroupCommitWriter(memory, max_batch_size=1000, max_delay_ms=20)
+    writer.submit("fraud_assessment", {"i": 1})
+
+    # Past max_delay_ms the batch is committed by the timer alone;
+    # poll from a separate connection, before flush() or close()
+    time.sleep(0.05)
+    deadline = time.monotonic() + 5
+    while _visible_rows(memory.db_path) == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert _visible_rows(memory.db_path) == 1
+
+    writer.close()
+
+
+def test_close_drains_buffered_decisions(memory):
+    writer = GroupCommitWriter(memory, max_batch_size=1000, max_delay_ms=10_000)
+    writer.submit("fraud_assessment", {"i": 1})
+
+    writer.close()
+
+    assert len(memory.recall_by_type("fraud_assessment")) == 1
+
+
+def test_submit_after_close_is_rejected(memory):
+    writer = GroupCommitWriter(memory)
+    writer.close()
+
+    with pytest.raises(RuntimeError):
+        writer.submit("fraud_assessment", {})
+
+
+def test_commit_failure_surfaces_on_flush(memory):
+    writer = GroupCommitWriter(memory, max_delay_ms=1)
+    writer.submit("fraud_assessment", {"bad": object()})
+
+    with pytest.raises(RuntimeError):
+        writer.flush(timeout=5)
+
+    writer.close()
+
+
+def test_failing_on_commit_callback_surfaces_and_keeps_the_worker(memory):
+    def on_commit(size):
+        raise ValueError("callback failed")
+
+    writer = GroupCommitWriter(memory, max_delay_ms=1, on_commit=on_commit)
+    writer.submit("fraud_assessment", {"i": 1})
+
+    with pytest.raises(RuntimeError) as exc:
+        writer.flush(timeout=5)
+    assert isinstance(exc.value.__cause__, ValueError)
+
+    writer.on_commit = None
+    writer.submit("fraud_assessment", {"i": 2})
+    assert writer.flush(timeout=5)
+    assert writer.committed == 2
+
+    writer.close()
+    assert len(memory.recall_by_type("fraud_assessment")) == 2
@@ -0,0 +1,133 @@
+import threading
+
+import pytest
+
+from platform10.memory.memory_manager import MemoryManager
+
+
+@pytest.fixture
+def memory(tmp_path):
+    manager = MemoryManager(db_path=str(tmp_path / "memory.db"))
+    yield manager
+    manager.close()
+
+
+def test_store_and_recall_round_trip(memory):
+    memory.store_decision("fraud_assessment", {"score": 0.9})
+    memory.store_decision("vendor_review", {"score": 0.1})
+
+    assert memory.recall_by_type("fraud_assessment")[0]["data"] == {"score": 0.9}
+    assert len(memory.recall_recent(limit=10)) == 2
+
+
+def test_semantic_memory_round_trip(memory):
+    memory.learn_pattern("threshold", {"high": 0.8})
+
+    assert memory.recall_knowledge("threshold") == {"high": 0.8}
+    assert memory.recall_knowledge("missing") is None
+    assert memory.knowledge_summary() == {"threshold": {"high": 0.8}}
+
+
+def test_connections_are_pooled_per_thread_in_wal_mode(memory):
+    conn = memory._connection()
+
+    assert memory._connection() is conn
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    seen = []
+    thread = threading.Thread(target=lambda: seen.append(memory._connection()))
+    thread.start()
+    thread.join()
+
+    assert seen[0] is not conn
+
+
+def test_concurrent_writers_do_not_lose_decisions(memory):
+    def writer():
+        for i in range(50):
+            memory.store_decision("fraud_assessment", {"i": i})
+
+    threads = [threading.Thread(target=writer) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(memory.recall_by_type("fraud_assessment")) == 200
+
+
+def test_rejects_unknown_synchronous_level(tmp_path):
+    with pytest.raises(ValueError):
+        MemoryManager(db_path=str(tmp_path / "x.db"), synchronous="SOMETIMES")
+
+
+def test_store_decisions_bulk_writes_all_rows(memory):
+    written = memory.store_decisions_bulk(
+        ("fraud_assessment", {"i": i}) for i in range(100)
+    )
+
+    assert written == 100
+    assert memory.store_decisions_bulk([]) == 0
+    assert len(memory.recall_by_type("fraud_assessment")) == 100
+
+
+def test_schema_is_migrated_to_latest_version(memory):
+    from platform10.memory.migrations import MIGRATIONS
+
+    conn = memory._connection()
+    indexes = {
+        row[0]
+        for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index'"
+        )
+    }
+
+    assert memory.schema_version == MIGRATIONS[-1].version
+    assert "idx_episodic_type_timestamp" in indexes
+
+    plan = conn.execute(
+        "EXPLAIN QUERY PLAN SELECT data FROM episodic_memory "
+        "WHERE event_type = ? ORDER BY timestamp DESC",
+        ("fraud_assessment",),
+    ).fetchall()
+    assert "idx_episodic_type_timestamp" in str(plan)
+
+
+def test_recall_by_type_since_and_limit_cursor(memory):
+    conn = memory._connection()
+    with conn:
+        conn.executemany(
+            "INSERT INTO episodic_memory (event_type, data, timestamp) "
+            "VALUES (?, ?, ?)",
+            [
+                ("fraud_assessment", f'{{"i": {i}}}', f"2026-01-01 00:00:0{i}")
+                for i in range(5)
+            ],
+        )
+
+    newest_two = memory.recall_by_type("fraud_assessment", limit=2)
+    assert [e["data"]["i"] for e in newest_two] == [4, 3]
+
+    after_cursor = memory.recall_by_type(
+        "fraud_assessment", since="2026-01-01 00:00:02"
+    )
+    assert [e["data"]["i"] for e in after_cursor] == [3, 4]
+
+
+def test_keyset_cursor_pages_through_same_second_bulk_insert(memory):
+    memory.store_decisions_bulk(
+        ("fraud_assessment", {"i": i}) for i in range(25)
+    )
+    rows = memory.recall_by_type("fraud_assessment")
+    assert len({row["timestamp"] for row in rows}) == 1
+
+    seen = []
+    cursor = ("", 0)
+    while True:
+        page = memory.recall_by_type("fraud_assessment", since=cursor, limit=10)
+        if not page:
+            break
+        seen.extend(row["data"]["i"] for row in page)
+        cursor = (page[-1]["timestamp"], page[-1]["id"])
+
+    assert seen == list(range(25))
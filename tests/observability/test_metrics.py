@@ -0,0 +1,114 @@
+import random
+
+import pytest
+
+from platform10.governance.audit_log import InMemoryAuditLog
+from platform10.observability.metrics import LatencyHistogram, MetricsRegistry
+from platform10.policies.execution_policy import ExecutionPolicy
+from platform10.runtime.engine import ExecutionEngine
+from platform10.runtime.executor import Executor
+
+
+class _Agent:
+    def __init__(self, tokens=0, fail=False):
+        self.tokens = tokens
+        self.fail = fail
+
+    def run(self, context):
+        if self.fail:
+            raise ValueError("boom")
+        return {"tokens": self.tokens}
+
+
+class Scorer(_Agent):
+    pass
+
+
+class Enricher(_Agent):
+    pass
+
+
+class _Workflow:
+    name = "fraud_triage"
+
+    def __init__(self, agents):
+        self.agents = agents
+        self.execution_policy = ExecutionPolicy(max_latency_ms=10_000)
+        self.execution_id = "TEST-METRICS-001"
+
+
+def test_histogram_percentiles_are_within_relative_error():
+    histogram = LatencyHistogram()
+    values = [random.uniform(0.05, 5000) for _ in range(20_000)]
+    for value in values:
+        histogram.record(value)
+
+    values.sort()
+    for q in LatencyHistogram.QUANTILES:
+        exact = values[int(q * len(values)) - 1]
+        assert histogram.percentile(q) == pytest.approx(exact, rel=0.02)
+
+    assert histogram.summary()["max"] == pytest.approx(values[-1], abs=0.001)
+    assert LatencyHistogram().percentile(0.99) == 0.0
+
+
+def test_executor_records_agent_and_workflow_series():
+    executor = Executor()
+    executor.audit_log.backend = InMemoryAuditLog()
+    executor.metrics = MetricsRegistry()
+
+    executor.execute(_Workflow([Enricher(tokens=5), Scorer(tokens=7)]), {})
+    with pytest.raises(RuntimeError):
+        executor.execute(_Workflow([Enricher(tokens=5), Scorer(fail=True)]), {})
+
+    snapshot = executor.metrics.snapshot()
+    workflow = snapshot["workflows"]["fraud_triage"]
+    enricher = snapshot["agents"][("fraud_triage", "Enricher")]
+    scorer = snapshot["agents"][("fraud_triage", "Scorer")]
+
+    assert (workflow["runs"], workflow["errors"], workflow["tokens"]) == (2, 1, 17)
+    assert (enricher["runs"], enricher["tokens"], enricher["error_rate"]) == (2, 10, 0)
+    assert (scorer["runs"], scorer["errors"], scorer["error_rate"]) == (2, 1, 0.5)
+    assert 0 <= scorer["p50"] <= scorer["p99"] <= scorer["max"]
+
+
+def test_engine_records_sequence_and_graph_runs():
+    registry = MetricsRegistry()
+    engine = ExecutionEngine(regulator_mode=False, metrics=registry)
+
+    engine.execute_sequence([Enricher(tokens=3)], {}, "T-1", workflow_name="wf")
+    engine.execute_graph([Enricher(tokens=3)], {}, "T-2", workflow_name="wf")
+    with pytest.raises(ValueError):
+        engine.execute_sequence([Scorer(fail=True)], {}, "T-3", workflow_name="wf")
+
+    snapshot = registry.snapshot()
+    assert snapshot["workflows"]["wf"]["runs"] == 3
+    assert snapshot["workflows"]["wf"]["errors"] == 1
+    assert snapshot["agents"][("wf", "Enricher")]["tokens"] == 6
+    assert snapshot["agents"][("wf", "Scorer")]["errors"] == 1
+
+
+def test_prometheus_exposition():
+    registry = MetricsRegistry()
+    registry.observe_workflow("wf", 12.5, tokens=4)
+    registry.observe_agent("wf", 'odd"agent', 2.0, error=True)
+
+    text = registry.render_prometheus()
+
+    assert "# TYPE platform10_workflow_latency_seconds summary" in text
+    assert 'platform10_workflow_latency_seconds{workflow="wf",quantile="0.99"} 0.012500' in text
+    assert 'platform10_workflow_tokens_total{workflow="wf"} 4' in text
+    assert 'platform10_agent_errors_total{workflow="wf",agent="odd\\"agent"} 1' in text
+    assert text.endswith("\n")
+
+
+def test_metrics_endpoint():
+    from fastapi.testclient import TestClient
+
+    import main
+
+    response = TestClient(main.app).get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "platform10_agent_latency_seconds" in response.text
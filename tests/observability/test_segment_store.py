@@ -0,0 +1,114 @@
+import json
+import os
+import threading
+
+import pytest
+
+from tracing.segment_store import SegmentTraceStore
+from workflows.fraud_triage_runtime import FraudTriageConfig, FraudTriageRuntime
+from workflows.fraud_triage_workflow import run_fraud_triage_workflow
+
+
+def _agent(i, size=0):
+    return {"execution_id": f"a{i}", "pad": "x" * size}
+
+
+def test_traces_are_appended_and_found_by_id(tmp_path):
+    with SegmentTraceStore(str(tmp_path), fsync="batch") as store:
+        partition = store.write_agent_trace("a1", _agent(1))
+        store.write_workflow_trace("w1", {"workflow_execution_id": "w1"})
+
+        assert store.read_agent_trace("a1") == _agent(1)
+        assert store.read_workflow_trace("w1") == {"workflow_execution_id": "w1"}
+        assert store.read_workflow_trace("a1") is None
+        assert store.read_agent_trace("missing") is None
+
+        (segment,) = store.segments("agent")
+        assert os.path.dirname(segment) == partition
+        with open(segment) as f:
+            assert [json.loads(line) for line in f] == [_agent(1)]
+
+
+def test_segments_roll_by_size_and_resume_after_restart(tmp_path):
+    with SegmentTraceStore(str(tmp_path), max_segment_bytes=100) as store:
+        for i in range(6):
+            store.write_agent_trace(f"a{i}", _agent(i, size=40))
+            store.flush()   # the size limit is checked per batch
+        assert len(list(store.segments("agent"))) == 3
+
+    with SegmentTraceStore(str(tmp_path), max_segment_bytes=100) as store:
+        store.write_agent_trace("a6", _agent(6))
+        store.flush()
+
+        assert len(list(store.segments("agent"))) == 4
+        assert store.read_agent_trace("a0") == _agent(0, size=40)
+        assert store.read_agent_trace("a6") == _agent(6)
+
+
+def test_rebuild_index_recovers_unindexed_lines(tmp_path):
+    with SegmentTraceStore(str(tmp_path)) as store:
+        store.write_agent_trace("a1", _agent(1))
+        store.flush()
+        (segment,) = store.segments("agent")
+
+        # Lines written before a crash, never indexed
+        with open(segment, "ab") as f:
+            f.write(json.dumps(_agent(2)).encode() + b"\n")
+        assert store.read_agent_trace("a2") is None
+
+        assert store.rebuild_index() == 2
+        assert store.read_agent_trace("a2") == _agent(2)
+
+
+def test_unencodable_trace_fails_alone(tmp_path):
+    store = SegmentTraceStore(str(tmp_path), fsync="interval", fsync_interval_s=0.01)
+    store.write_agent_trace("bad", {"execution_id": "bad", "value": object()})
+    store.write_agent_trace("good", _agent(1))
+    store.close()
+
+    assert (store.written, store.failed) == (1, 1)
+    assert isinstance(store.last_error, TypeError)
+
+    with pytest.raises(RuntimeError):
+        store.write_agent_trace("late", _agent(2))
+    with pytest.raises(ValueError):
+        SegmentTraceStore(str(tmp_path), fsync="always")
+
+
+def test_writes_racing_close_are_written_or_rejected(tmp_path):
+    store = SegmentTraceStore(str(tmp_path), batch_size=4)
+    accepted = []
+    start = threading.Barrier(5)
+
+    def submit(worker):
+        start.wait()
+        for i in range(200):
+            try:
+                store.write_agent_trace(f"a{worker}-{i}", _agent(i))
+            except RuntimeError:
+                return
+            accepted.append(f"a{worker}-{i}")
+
+    threads = [threading.Thread(target=submit, args=(w,)) for w in range(4)]
+    for thread in threads:
+        thread.start()
+    start.wait()
+    store.close()
+    for thread in threads:
+        thread.join()
+
+    assert (store.written, store.failed) == (len(accepted), 0)
+    lines = sum(len(open(path).readlines()) for path in store.segments("agent"))
+    assert lines == len(accepted)
+
+
+def test_runtime_with_segment_layout(tmp_path):
+    config = FraudTriageConfig(trace_dir=str(tmp_path), trace_layout="segments")
+
+    with FraudTriageRuntime(config) as runtime:
+        result = run_fraud_triage_workflow({"tx_count": 55}, runtime=runtime)
+        trace = runtime.trace_store.read_workflow_trace(result["workflow_execution_id"])
+
+    assert runtime.trace_writer is None
+    assert trace["final_decision"] == result["decision"] == "HOLD_TRANSACTION"
+    assert trace["agents_invoked"][0]["agent"] == "velocity-signal-agent"
@@ -0,0 +1,106 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from tracing.segment_store import SegmentTraceStore
+from tracing.trace_store import TraceStore
+from tracing.workflow_trace import WorkflowTrace
+from workflows.fraud_triage_runtime import FraudTriageConfig, FraudTriageRuntime
+from workflows.fraud_triage_workflow import run_fraud_triage_workflow
+
+
+HOUR_NS = 3600 * 10**9
+
+
+def _trace(name, decision, confidence, started_ns):
+    trace = WorkflowTrace.start(name)
+    trace.started_ns = started_ns
+    trace.finalize(decision, confidence)
+    return trace
+
+
+def _write(store, traces):
+    for trace in traces:
+        store.write_workflow_trace(trace.workflow_execution_id, trace.to_dict())
+
+
+@pytest.fixture
+def traces():
+    base = 1_700_000_000 * 10**9
+    return [
+        _trace("fraud-triage-workflow", "HOLD_TRANSACTION", 0.9, base),
+        _trace("fraud-triage-workflow", "APPROVE", 0.3, base + HOUR_NS),
+        _trace("fraud-triage-workflow", "HOLD_TRANSACTION", 0.95, base + 2 * HOUR_NS),
+        _trace("vendor-onboarding", "HOLD_TRANSACTION", 0.86, base + 3 * HOUR_NS),
+    ]
+
+
+def _ids(summaries):
+    return [s["workflow_execution_id"] for s in summaries]
+
+
+@pytest.mark.parametrize("store_cls", [TraceStore, SegmentTraceStore])
+def test_query_filters(tmp_path, traces, store_cls):
+    store = store_cls(str(tmp_path))
+    _write(store, traces)
+    store.flush()
+
+    ids = [t.workflow_execution_id for t in traces]
+    start = traces[0].started_ns
+
+    assert _ids(store.query(decision="HOLD_TRANSACTION")) == [ids[0], ids[2], ids[3]]
+    assert _ids(store.query(
+        workflow_name="fraud-triage-workflow", decision="HOLD_TRANSACTION",
+    )) == [ids[0], ids[2]]
+    assert _ids(store.query(min_confidence=0.9)) == [ids[0], ids[2]]
+    assert _ids(store.query(since=start + HOUR_NS, until=start + 3 * HOUR_NS)) == ids[1:3]
+    assert _ids(store.query(limit=1)) == ids[:1]
+    assert store.query(decision="REVIEW") == []
+
+    # datetime (naive UTC or aware) and ISO bounds select the same rows
+    since = datetime.utcfromtimestamp(start // 10**9) + timedelta(hours=2)
+    assert _ids(store.query(since=since)) == ids[2:]
+    assert _ids(store.query(since=since.replace(tzinfo=timezone.utc))) == ids[2:]
+    assert _ids(store.query(since=since.isoformat() + "Z")) == ids[2:]
+
+    summary = store.query(until=start + 1)[0]
+    assert summary == {
+        "workflow_execution_id": ids[0],
+        "workflow_name": "fraud-triage-workflow",
+        "final_decision": "HOLD_TRANSACTION",
+        "final_confidence": 0.9,
+        "started_at": traces[0].started_at,
+        "ended_at": traces[0].ended_at,
+        "human_review_required": False,
+        "status": "COMPLETED",
+    }
+    assert store.read_workflow_trace(ids[0]) == traces[0].to_dict()
+    store.close()
+
+
+def test_rebuild_index_covers_traces_written_without_one(tmp_path, traces):
+    _write(TraceStore(str(tmp_path), encoding="msgpack", index=False), traces[:2])
+    _write(TraceStore(str(tmp_path), index=False), traces[2:])
+
+    store = TraceStore(str(tmp_path))
+    assert store.query() == []
+    assert store.rebuild_index() == 4
+    assert len(store.query()) == 4
+
+    with pytest.raises(RuntimeError):
+        TraceStore(str(tmp_path), index=False).query()
+
+
+def test_runtime_query_sees_queued_traces(tmp_path):
+    config = FraudTriageConfig(trace_dir=str(tmp_path))
+
+    with FraudTriageRuntime(config) as runtime:
+        results = [
+            run_fraud_triage_workflow({"tx_count": n}, runtime=runtime)
+            for n in (5, 55, 60)
+        ]
+        held = runtime.query_traces(decision="HOLD_TRANSACTION", min_confidence=0.85)
+
+    assert sorted(_ids(held)) == sorted(
+        r["workflow_execution_id"] for r in results[1:]
+    )
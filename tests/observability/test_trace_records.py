@@ -0,0 +1,130 @@
+import uuid
+from datetime import datetime
+
+import pytest
+
+from platform10.contracts.fraud_case import FraudCase
+from platform10.core.codec import pack_record
+from platform10.governance.audit_log import AuditEvent
+from tracing.agent_trace import AgentTrace
+from tracing.confidence_aggregator import ConfidenceSignal
+from tracing.stamps import iso_from_ns, new_id, now_ns, ns_from_iso
+from tracing.workflow_trace import AgentInvocation, WorkflowTrace
+
+
+@pytest.mark.parametrize("cls, args", [
+    (AgentTrace, ("e", "agent")),
+    (WorkflowTrace, ("w", "wf")),
+    (AgentInvocation, ("agent", "e", "LOW", 0.3)),
+    (ConfidenceSignal, ("agent", 0.5, 1.0)),
+    (FraudCase, ("c", {}, {})),
+    (AuditEvent, ("e", "t", datetime(2024, 1, 1), "agent", "RUN", {}, {})),
+])
+def test_records_are_slotted(cls, args):
+    record = cls(*args)
+    assert not hasattr(record, "__dict__")
+    with pytest.raises((AttributeError, TypeError)):
+        record.unexpected = 1
+
+
+def test_new_id_is_a_uuid4():
+    ids = {new_id() for _ in range(2000)}
+    assert len(ids) == 2000
+
+    for value in list(ids)[:200]:
+        parsed = uuid.UUID(value)
+        assert parsed.version == 4
+        assert parsed.variant == uuid.RFC_4122
+        assert str(parsed) == value
+
+
+def test_timestamps_render_like_utcnow():
+    ns = now_ns()
+    rendered = iso_from_ns(ns)
+
+    assert rendered.endswith("Z")
+    drift = datetime.fromisoformat(rendered[:-1]) - datetime.utcnow()
+    assert abs(drift.total_seconds()) < 1
+    assert ns_from_iso(rendered) == ns // 1000 * 1000
+
+    assert iso_from_ns(1_715_000_000_000_000_000) == (
+        datetime.utcfromtimestamp(1_715_000_000).isoformat() + "Z"
+    )
+
+
+def test_to_dict_keeps_the_public_shape():
+    agent = AgentTrace.start("velocity", "fraud", {"tx_count": 3})
+    agent.finalize("LOW", "count = 3", 0.3)
+    data = agent.to_dict()
+
+    assert list(data) == [
+        "execution_id", "agent_name", "task_type", "started_at", "ended_at",
+        "inputs", "signals", "decision", "reasoning", "confidence",
+        "outcome", "status",
+    ]
+    assert data["started_at"] == agent.started_at
+    assert ns_from_iso(data["ended_at"]) <= agent.ended_ns
+
+    workflow = WorkflowTrace.start("wf")
+    workflow.record_agent_result("velocity", agent.execution_id, "LOW", 0.3)
+    assert workflow.ended_at is None
+    assert workflow.to_dict()["agents_invoked"] == [{
+        "agent": "velocity",
+        "execution_id": agent.execution_id,
+        "decision": "LOW",
+        "confidence": 0.3,
+        "metadata": {},
+    }]
+
+
+def test_iso_keywords_are_still_accepted():
+    agent = AgentTrace(
+        execution_id="a1",
+        agent_name="velocity",
+        started_at="2024-01-01T00:00:00.000001Z",
+        ended_at="2024-01-01T00:00:01Z",
+    )
+    assert agent.started_ns == ns_from_iso("2024-01-01T00:00:00.000001Z")
+    assert agent.ended_at == "2024-01-01T00:00:01Z"
+
+    workflow = WorkflowTrace("w1", "wf", started_at="2024-01-01T00:00:00Z")
+    assert workflow.started_at == "2024-01-01T00:00:00Z"
+    assert workflow.ended_ns is None
+
+
+def test_to_dict_does_not_alias_nested_payloads():
+    agent = AgentTrace.start("velocity", "fraud", {"history": [1, 2]})
+    agent.record_signals({"scores": {"velocity": 0.3}})
+    data = agent.to_dict()
+
+    agent.inputs["history"].append(3)
+    agent.signals["scores"]["velocity"] = 0.9
+    assert data["inputs"] == {"history": [1, 2]}
+    assert data["signals"] == {"scores": {"velocity": 0.3}}
+
+    workflow = WorkflowTrace.start("wf")
+    workflow.record_agent_result("velocity", "a1", "LOW", 0.3, {"tags": ["x"]})
+    workflow.finalize("APPROVE", 0.3, {"agents": {"velocity": "LOW"}})
+    data = workflow.to_dict()
+
+    workflow.agents_invoked[0].metadata["tags"].append("y")
+    workflow.explainability["agents"]["velocity"] = "HIGH"
+    assert data["agents_invoked"][0]["metadata"] == {"tags": ["x"]}
+    assert data["explainability"] == {"agents": {"velocity": "LOW"}}
+
+
+def test_version_1_records_still_decode():
+    started = "2024-05-06T07:08:09.123456Z"
+    v1 = pack_record("AgentTrace", 1, [
+        "e1", "velocity", None, started, None,
+        {}, {}, None, None, None, None, "RUNNING",
+    ])
+
+    trace = AgentTrace.from_bytes(v1)
+    assert trace.started_at == started
+    assert trace.ended_ns is None
+
+    v1 = pack_record("WorkflowTrace", 1, [
+        "w1", "wf", started, started, [], "APPROVE", 0.5, {}, False, "COMPLETED",
+    ])
+    assert WorkflowTrace.from_bytes(v1).ended_at == started
@@ -0,0 +1,121 @@
+import asyncio
+
+from platform10.governance.audit_log import InMemoryAuditLog
+from platform10.patterns.async_parallel import AsyncParallelFanOut
+from platform10.patterns.async_routing import AsyncConditionalRouter, AsyncRoute
+from platform10.patterns.async_sequence import AsyncAgentPipeline
+from platform10.patterns.parallel import ParallelStep
+from platform10.patterns.retry import RetryPolicy
+from platform10.patterns.sequence import PipelineStep
+from platform10.runtime.async_executor import AsyncExecutor
+
+
+class _FailsTwice:
+    name = "fails-twice"
+
+    def __init__(self):
+        self.calls = 0
+
+    async def arun(self, context):
+        self.calls += 1
+        if self.calls <= 2:
+            raise RuntimeError("transient")
+        return {"attempts": self.calls}
+
+
+class _Sleeper:
+    def __init__(self, name, delay):
+        self.name = name
+        self.delay = delay
+
+    async def arun(self, context):
+        await asyncio.sleep(self.delay)
+        return {"agent": self.name}
+
+
+class _Static:
+    def __init__(self, output):
+        self.output = output
+
+    def run(self, context):
+        return self.output
+
+
+def _executor():
+    executor = AsyncExecutor()
+    executor.audit_log.backend = InMemoryAuditLog()
+    return executor
+
+
+def test_pipeline_retries_then_propagates_output():
+    agent = _FailsTwice()
+    pipeline = AsyncAgentPipeline(
+        _executor(),
+        [PipelineStep(name="flaky", agent=agent, retry_policy=RetryPolicy(retries=2))],
+    )
+
+    result = asyncio.run(pipeline.arun({"request_id": "1"}))
+
+    assert result["final_context"]["flaky_output"] == {"attempts": 3}
+    assert [r.status for r in result["results"]] == ["FAILURE", "FAILURE", "SUCCESS"]
+
+
+def test_pipeline_falls_back():
+    pipeline = AsyncAgentPipeline(
+        _executor(),
+        [
+            PipelineStep(
+                name="flaky",
+                agent=_FailsTwice(),
+                retry_policy=RetryPolicy(retries=0, fallback_agent=_Static({"ok": 1})),
+            )
+        ],
+    )
+
+    result = asyncio.run(pipeline.arun({}))
+    assert result["final_context"]["flaky_output"] == {"ok": 1}
+
+
+def test_fan_out_is_concurrent_and_merged_in_step_order():
+    fan_out = AsyncParallelFanOut(
+        _executor(),
+        [
+            ParallelStep(name="slow", agent=_Sleeper("slow", 0.2)),
+            ParallelStep(name="fast", agent=_Sleeper("fast", 0.01)),
+            ParallelStep(name="broken", agent=_FailsTwice()),
+        ],
+    )
+
+    result = asyncio.run(fan_out.arun({}))
+
+    assert [r.agent for r in result["results"]] == ["slow", "fast", "fails-twice"]
+    assert result["final_context"]["slow_output"] == {"agent": "slow"}
+    assert result["final_context"]["broken_error"] == {"error": "transient"}
+
+
+def test_router_selects_matching_pipeline():
+    executor = _executor()
+
+    def pipeline(output):
+        return AsyncAgentPipeline(
+            executor, [PipelineStep(name="decision", agent=_Static(output))]
+        )
+
+    router = AsyncConditionalRouter(
+        executor,
+        routes={
+            "high": AsyncRoute(
+                name="high",
+                condition=lambda c: c["risk"] == "HIGH",
+                pipeline=pipeline({"action": "HOLD"}),
+            ),
+        },
+        default_pipeline=pipeline({"action": "APPROVE"}),
+    )
+
+    high = asyncio.run(router.arun({"risk": "HIGH"}))
+    low = asyncio.run(router.arun({"risk": "LOW"}))
+
+    assert high["selected_route"] == "high"
+    assert high["final_context"]["decision_output"] == {"action": "HOLD"}
+    assert low["selected_route"] == "default"
@@ -0,0 +1,173 @@
+import time
+
+import pytest
+
+from platform10.governance.audit_log import InMemoryAuditLog
+from platform10.patterns.governor import AgentCostHistory, ExecutionGovernor
+from platform10.policies.execution_policy import ExecutionPolicy
+from platform10.runtime.executor import Executor
+
+
+class _Agent:
+    def __init__(self, tokens=0, **declared):
+        self.tokens = tokens
+        self.calls = 0
+        for key, value in declared.items():
+            setattr(self, key, value)
+
+    def run(self, context):
+        self.calls += 1
+        return {"ran": context.get("ran", []) + [self.__class__.__name__],
+                "tokens": self.tokens}
+
+
+class Enrichment(_Agent):
+    pass
+
+
+class CheapEnrichment(_Agent):
+    pass
+
+
+class Decision(_Agent):
+    pass
+
+
+class SlowEnrichment:
+    # Learned history is keyed by this name, not the class name
+    name = "slow-enrichment"
+    timeout_ms = 30
+    on_budget_breach = "skip"
+
+    def __init__(self):
+        self.calls = 0
+
+    def run(self, context):
+        self.calls += 1
+        time.sleep(0.2)
+
+
+class _Workflow:
+    def __init__(self, agents, policy):
+        self.agents = agents
+        self.execution_policy = policy
+        self.execution_id = "TEST-GOV-001"
+
+
+def _executor():
+    executor = Executor()
+    executor.audit_log.backend = InMemoryAuditLog()
+    return executor
+
+
+def _actions(executor):
+    return [e.action for e in executor.audit_log.backend.all_events()]
+
+
+def test_declared_cost_aborts_before_agent_starts():
+    executor = _executor()
+    slow = Enrichment(expected_latency_ms=500)
+
+    with pytest.raises(RuntimeError, match="policy"):
+        executor.execute(
+            _Workflow([slow], ExecutionPolicy(max_latency_ms=100)), {}
+        )
+
+    assert slow.calls == 0
+    [event] = executor.audit_log.backend.all_events()
+    assert event.action == "EXECUTION_POLICY_VIOLATION"
+    assert event.output_data["predicted"] is True
+    assert "latency" in event.output_data["reason"]
+
+
+def test_skip_and_degrade():
+    executor = _executor()
+    policy = ExecutionPolicy(max_latency_ms=100, on_predicted_breach="degrade")
+
+    optional = Enrichment(expected_latency_ms=500, on_budget_breach="skip")
+    degradable = Enrichment(
+        expected_latency_ms=500,
+        fallback_agent=CheapEnrichment(expected_latency_ms=5),
+    )
+
+    result = executor.execute(_Workflow([optional, Decision()], policy), {})
+    assert result["ran"] == ["Decision"]
+    assert optional.calls == 0
+
+    result = executor.execute(_Workflow([degradable, Decision()], policy), {})
+    assert result["ran"] == ["CheapEnrichment", "Decision"]
+    assert degradable.calls == 0
+
+    assert _actions(executor) == ["AGENT_SKIPPED", "AGENT_DEGRADED"]
+
+
+def test_degrade_without_fallback_aborts():
+    governor = ExecutionGovernor(max_latency_ms=100, on_breach="degrade")
+    admission = governor.admit(Enrichment(expected_latency_ms=500), {})
+
+    assert admission.action == "ABORT"
+    assert "no fallback_agent" in admission.reason
+
+
+def test_learned_percentiles_drive_admission():
+    executor = _executor()
+    generous = ExecutionPolicy(max_tokens=1000, max_latency_ms=10_000)
+
+    for _ in range(AgentCostHistory.MIN_SAMPLES):
+        executor.execute(_Workflow([Enrichment(tokens=30)], generous), {})
+
+    estimate = ExecutionGovernor(history=executor.cost_history).estimate(
+        Enrichment()
+    )
+    assert estimate.source == "learned"
+    assert estimate.tokens == 30
+
+    late = Enrichment(tokens=30)
+    with pytest.raises(RuntimeError, match="policy"):
+        executor.execute(
+            _Workflow([Decision(tokens=30), late], ExecutionPolicy(max_tokens=50)),
+            {},
+        )
+    assert late.calls == 0
+
+
+def test_timed_out_agent_is_later_skipped_preemptively():
+    executor = _executor()
+    executor.cost_history = AgentCostHistory(min_samples=3)
+    generous = ExecutionPolicy(max_latency_ms=10_000)
+
+    for _ in range(3):
+        with pytest.raises(RuntimeError, match="timed out"):
+            executor.execute(_Workflow([SlowEnrichment()], generous), {})
+
+    slow = SlowEnrichment()
+    result = executor.execute(
+        _Workflow([slow, Decision()], ExecutionPolicy(max_latency_ms=20)), {}
+    )
+
+    assert slow.calls == 0
+    assert result["ran"] == ["Decision"]
+    assert _actions(executor)[-1] == "AGENT_SKIPPED"
+    skipped = executor.audit_log.backend.all_events()[-1]
+    assert skipped.output_data["agent"] == "slow-enrichment"
+
+
+def test_history_percentile():
+    history = AgentCostHistory(window=100, min_samples=10)
+
+    for latency in range(1, 10):
+        history.observe("agent", latency)
+    assert history.estimate("agent", 95) is None
+
+    for latency in range(10, 101):
+        history.observe("agent", latency)
+
+    assert history.count("agent") == 100
+    assert history.estimate("agent", 50).latency_ms == 51
+    assert history.estimate("agent", 95).latency_ms == 96
+    assert history.estimate("agent", 100).latency_ms == 100
+
+
+def test_unknown_breach_action():
+    with pytest.raises(ValueError):
+        ExecutionGovernor(on_breach="ignore")
@@ -0,0 +1,178 @@
+import math
+from datetime import datetime, timedelta
+
+import pytest
+
+from platform10.memory.memory_manager import MemoryManager
+from platform10.patterns.reflection_pattern import ReflectionPattern
+
+
+def full_scan_risk_density(memory, now, decay_lambda=0.15):
+    """
+    Reference: the original per-reflection full-history computation.
+    """
+    weighted_high_risk = 0.0
+    weighted_total = 0.0
+
+    for event in memory.recall_by_type("fraud_assessment"):
+        score = event["data"].get("score", 0.0)
+        event_time = datetime.fromisoformat(event["timestamp"])
+        age_hours = (now - event_time).total_seconds() / 3600.0
+        weight = math.exp(-decay_lambda * age_hours)
+
+        weighted_total += weight
+        if score >= 0.8:
+            weighted_high_risk += weight
+
+    if weighted_total > 0:
+        return weighted_high_risk / weighted_total
+    return None
+
+
+@pytest.fixture
+def memory(tmp_path):
+    manager = MemoryManager(db_path=str(tmp_path / "memory.db"))
+    yield manager
+    manager.close()
+
+
+def _insert_history(memory, events):
+    conn = memory._connection()
+    with conn:
+        conn.executemany(
+            "INSERT INTO episodic_memory (event_type, data, timestamp) "
+            "VALUES ('fraud_assessment', ?, ?)",
+            events,
+        )
+
+
+def test_accumulator_matches_full_scan(memory):
+    base = datetime.utcnow() - timedelta(hours=48)
+
+    # Pre-existing history (backfilled on registration), deliberately
+    # out of chronological order.
+    _insert_history(
+        memory,
+        [
+            (
+                f'{{"score": {0.95 if i % 3 == 0 else 0.2}}}',
+                (base + timedelta(minutes=37 * ((i * 7) % 60))).strftime(
+                    "%Y-%m-%d %H:%M:%S"
+                ),
+            )
+            for i in range(60)
+        ],
+    )
+
+    reflection = ReflectionPattern(memory_manager=memory)
+
+    # Incremental updates through the normal write paths
+    memory.store_decision("fraud_assessment", {"score": 0.9})
+    memory.store_decisions_bulk(
+        [("fraud_assessment", {"score": 0.1}), ("vendor_review", {"score": 1.0})]
+    )
+
+    for offset_hours in (0, 1, 24):
+        now = datetime.utcnow() + timedelta(hours=offset_hours)
+        expected = full_scan_risk_density(memory, now)
+
+        assert reflection.risk_density(now) == pytest.approx(expected, rel=1e-9)
+
+
+def test_accumulator_folds_rows_written_by_other_processes(memory):
+    reflection = ReflectionPattern(memory_manager=memory)
+    memory.store_decision("fraud_assessment", {"score": 0.1})
+
+    # Another process sharing the file does not maintain the accumulator
+    other = MemoryManager(db_path=memory.db_path)
+    other.store_decisions_bulk(
+        [("fraud_assessment", {"score": s}) for s in (0.95, 0.9, 0.2)]
+    )
+    other.close()
+
+    now = datetime.utcnow()
+    assert reflection.risk_density(now) == pytest.approx(
+        full_scan_risk_density(memory, now), rel=1e-9
+    )
+
+    # Later writes here fold on top without counting those rows twice
+    memory.store_decision("fraud_assessment", {"score": 0.85})
+    assert reflection.risk_density(now) == pytest.approx(
+        full_scan_risk_density(memory, now), rel=1e-9
+    )
+
+
+def test_reflect_adjusts_confidence_from_accumulated_density(memory):
+    reflection = ReflectionPattern(memory_manager=memory)
+
+    for _ in range(3):
+        memory.store_decision("fraud_assessment", {"score": 0.95})
+
+    result = reflection.reflect({"fraud_score": 0.9, "confidence": 0.9})
+
+    assert result["adjusted_confidence"] == pytest.approx(0.65)
+    assert result["reflection_flag"] == "High Systemic Risk Environment"
+
+
+def test_reflect_without_memory_leaves_confidence_unchanged():
+    result = ReflectionPattern().reflect({"confidence": 0.7})
+
+    assert result["adjusted_confidence"] == 0.7
+    assert result["reflection_flag"] is None
+
+
+def test_reflect_batch_matches_point_in_time_full_scan():
+    base = datetime(2026, 1, 1)
+    history = [
+        {
+            "data": {"score": 0.9 if i % 4 == 0 else 0.3},
+            "timestamp": (base + timedelta(minutes=45 * i)).isoformat(),
+        }
+        for i in range(200)
+    ]
+    decisions = [
+        {
+            "confidence": 0.8,
+            "timestamp": (base + timedelta(minutes=90 * i + 5)).isoformat(),
+        }
+        for i in range(-2, 110)
+    ]
+
+    results = ReflectionPattern().reflect_batch(decisions, history)
+
+    for decision, result in zip(decisions, results):
+        now = datetime.fromisoformat(decision["timestamp"])
+        weighted_total = weighted_high = 0.0
+        for event in history:
+            event_time = datetime.fromisoformat(event["timestamp"])
+            if event_time > now:
+                continue
+            weight = math.exp(-0.15 * (now - event_time).total_seconds() / 3600.0)
+            weighted_total += weight
+            if event["data"]["score"] >= 0.8:
+                weighted_high += weight
+
+        expected = 0.8
+        if weighted_total > 0:
+            expected = max(0.0, min(1.0, 0.8 - 0.25 * weighted_high / weighted_total))
+
+        assert result["adjusted_confidence"] == pytest.approx(expected, rel=1e-9)
+
+
+def test_reflect_batch_without_timestamps_matches_reflect(memory):
+    reflection = ReflectionPattern(memory_manager=memory)
+    memory.store_decisions_bulk(
+        [("fraud_assessment", {"score": s}) for s in (0.95, 0.9, 0.1)]
+    )
+
+    decisions = [{"confidence": c, "verdict": "REVIEW"} for c in (0.2, 0.6, 0.95)]
+
+    batch = reflection.reflect_batch(decisions)
+
+    for decision, result in zip(decisions, batch):
+        expected = reflection.reflect(decision)
+
+        assert result["adjusted_confidence"] == pytest.approx(
+            expected["adjusted_confidence"], rel=1e-9
+        )
+        assert result["reflection_flag"] == expected["reflection_flag"]
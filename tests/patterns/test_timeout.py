@@ -0,0 +1,238 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from platform10.governance.audit_log import InMemoryAuditLog
+from platform10.patterns import timeout
+from platform10.policies.execution_policy import ExecutionPolicy
+from platform10.patterns.timeout import (
+    Deadline,
+    TimeoutExceeded,
+    awith_timeout,
+    deadline_scope,
+    remaining_budget_ms,
+    with_process_timeout,
+    with_timeout,
+)
+from platform10.runtime.async_executor import AsyncExecutor
+from platform10.runtime.executor import Executor
+
+
+def _sleep_then_return(seconds, value):
+    time.sleep(seconds)
+    return value
+
+
+def _raise_value_error():
+    raise ValueError("bad case")
+
+
+class _HungAgent:
+    name = "hung-agent"
+    timeout_ms = 50
+
+    def run(self, context):
+        time.sleep(2)
+        return {"late": True}
+
+
+class _BudgetProbe:
+    name = "budget-probe"
+
+    def run(self, context):
+        return {"budget_seen": remaining_budget_ms()}
+
+
+class _ThreadProbe:
+    def run(self, context):
+        return {"thread": threading.get_ident()}
+
+
+class _MutatingHungAgent:
+    timeout_ms = 50
+
+    def run(self, context):
+        time.sleep(0.2)
+        context["late_write"] = True
+        context["signals"]["velocity"] = "HIGH"
+
+
+class _Workflow:
+    def __init__(self, agents, policy):
+        self.agents = agents
+        self.execution_policy = policy
+        self.execution_id = "TEST-TIMEOUT-001"
+
+
+def _executor(cls=Executor):
+    executor = cls()
+    executor.audit_log.backend = InMemoryAuditLog()
+    return executor
+
+
+def test_with_timeout_abandons_slow_work():
+    assert with_timeout(_sleep_then_return, 1000, 0, "ok") == "ok"
+
+    start = time.perf_counter()
+    with pytest.raises(TimeoutExceeded) as exc:
+        with_timeout(_sleep_then_return, 50, 2, "late")
+
+    assert time.perf_counter() - start < 0.5
+    assert exc.value.timeout_ms == 50
+
+    with pytest.raises(ValueError):
+        with_timeout(_raise_value_error, 1000)
+
+
+def test_deadline_scope_tightens_and_propagates():
+    with deadline_scope(Deadline(80)):
+        # Enclosing deadline wins over a looser timeout
+        with pytest.raises(TimeoutExceeded):
+            with_timeout(_sleep_then_return, 10_000, 2, "late")
+
+    with deadline_scope(Deadline(1000)):
+        with deadline_scope(Deadline(60_000)):
+            seen = with_timeout(remaining_budget_ms, None)
+
+    assert 0 < seen <= 1000
+    assert remaining_budget_ms() is None
+
+
+def test_awith_timeout_cancels_coroutine():
+    cancelled = []
+
+    async def slow():
+        try:
+            await asyncio.sleep(2)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    with pytest.raises(TimeoutExceeded):
+        asyncio.run(awith_timeout(slow(), 50))
+
+    assert cancelled == [True]
+
+
+def test_process_timeout_kills_child():
+    assert with_process_timeout(_sleep_then_return, 5000, 0, 42) == 42
+
+    start = time.perf_counter()
+    with pytest.raises(TimeoutExceeded):
+        with_process_timeout(_sleep_then_return, 100, 5, "late")
+    assert time.perf_counter() - start < 2
+
+    with pytest.raises(ValueError, match="bad case"):
+        with_process_timeout(_raise_value_error, 5000)
+
+
+def test_executor_stops_hung_agent_and_audits_timeout():
+    executor = _executor()
+    policy = ExecutionPolicy(max_tokens=100, max_latency_ms=5000)
+
+    start = time.perf_counter()
+    with pytest.raises(RuntimeError, match="timed out"):
+        executor.execute(_Workflow([_HungAgent()], policy), {})
+    assert time.perf_counter() - start < 0.5
+
+    [event] = executor.audit_log.backend.all_events()
+    assert event.action == "AGENT_TIMEOUT"
+    assert event.output_data["agent"] == "hung-agent"
+    assert event.output_data["timeout_ms"] == 50
+
+
+def test_downstream_agents_see_remaining_budget():
+    policy = ExecutionPolicy(max_tokens=100, max_latency_ms=2000)
+    result = _executor().execute(_Workflow([_BudgetProbe()], policy), {})
+
+    assert 0 < result["budget_seen"] <= 2000
+
+
+def test_run_agent_reports_timeout():
+    for executor in (_executor(), _executor(AsyncExecutor)):
+        if isinstance(executor, AsyncExecutor):
+            result = asyncio.run(executor.arun_agent(_HungAgent(), {}))
+        else:
+            result = executor.run_agent(_HungAgent(), {})
+
+        assert result.status == "TIMEOUT"
+        assert result.output["timeout_ms"] == 50
+        actions = [e.action for e in executor.audit_log.backend.all_events()]
+        assert actions == ["AGENT_TIMEOUT"]
+
+
+def test_aexecute_enforces_workflow_deadline():
+    executor = _executor(AsyncExecutor)
+    policy = ExecutionPolicy(max_tokens=100, max_latency_ms=5000)
+
+    class _SlowAsync:
+        timeout_ms = 50
+
+        async def arun(self, context):
+            await asyncio.sleep(2)
+
+    with pytest.raises(RuntimeError, match="timed out"):
+        asyncio.run(executor.aexecute(_Workflow([_SlowAsync()], policy), {}))
+
+    budget = asyncio.run(
+        executor.aexecute(_Workflow([_BudgetProbe()], policy), {})
+    )["budget_seen"]
+    assert 0 < budget <= 5000
+
+
+def test_with_timeout_reuses_pooled_threads():
+    with_timeout(_sleep_then_return, 1000, 0, "warm")
+    before = threading.active_count()
+
+    for _ in range(50):
+        assert with_timeout(_sleep_then_return, 1000, 0, "ok") == "ok"
+
+    assert threading.active_count() <= before + 1
+
+
+def test_agents_without_timeout_run_inline_only_without_a_deadline():
+    unbounded = ExecutionPolicy(max_tokens=100)
+    result = _executor().execute(_Workflow([_ThreadProbe()], unbounded), {})
+    assert result["thread"] == threading.get_ident()
+
+    expired = ExecutionPolicy(max_tokens=100, max_latency_ms=0)
+    with pytest.raises(RuntimeError, match="timed out"):
+        _executor().execute(_Workflow([_ThreadProbe()], expired), {})
+
+
+def test_workflow_deadline_preempts_agent_without_timeout():
+    class _SleepingAgent:
+        def run(self, context):
+            time.sleep(2)
+
+    policy = ExecutionPolicy(max_tokens=100, max_latency_ms=100)
+
+    start = time.perf_counter()
+    with pytest.raises(RuntimeError, match="timed out"):
+        _executor().execute(_Workflow([_SleepingAgent()], policy), {})
+    assert time.perf_counter() - start < 0.5
+
+
+def test_abandoned_agent_writes_to_its_own_context_copy():
+    context = {"case": 1, "signals": {"velocity": "LOW"}}
+    result = _executor().run_agent(_MutatingHungAgent(), context)
+    time.sleep(0.3)
+
+    assert result.status == "TIMEOUT"
+    assert context == {"case": 1, "signals": {"velocity": "LOW"}}
+
+
+def test_hung_runs_do_not_exhaust_the_pool(monkeypatch):
+    monkeypatch.setattr(timeout, "_pool", timeout._DaemonPool(max_workers=2))
+    release = threading.Event()
+
+    try:
+        for _ in range(5):
+            with pytest.raises(TimeoutExceeded):
+                with_timeout(release.wait, 20)
+
+        assert with_timeout(_sleep_then_return, 1000, 0, "ran") == "ran"
+    finally:
+        release.set()
@@ -0,0 +1,119 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from platform10.agents.base.async_agent import SyncAgentAdapter, as_async
+from platform10.agents.velocity_signal_agent import VelocitySignalAgent
+from platform10.governance.audit_log import InMemoryAuditLog
+from platform10.policies.execution_policy import ExecutionPolicy
+from platform10.runtime.async_executor import AsyncExecutor
+from platform10.runtime.executor import Executor
+
+
+class _SyncAgent:
+    name = "sync-agent"
+
+    def __init__(self, tokens=0):
+        self.tokens = tokens
+        self.thread = None
+
+    def run(self, context):
+        self.thread = threading.get_ident()
+        return {"agent": self.name, "tokens": self.tokens}
+
+
+class _IOAgent:
+    name = "io-agent"
+
+    def run(self, context):
+        time.sleep(0.05)
+        return {"io_done": True, "seen": context.get("n")}
+
+    async def arun(self, context):
+        await asyncio.sleep(0.05)
+        return {"io_done": True, "seen": context.get("n")}
+
+
+class _FailingAgent:
+    name = "failing-agent"
+
+    async def arun(self, context):
+        raise ValueError("upstream unavailable")
+
+
+class _Workflow:
+    def __init__(self, agents, policy=None):
+        self.agents = agents
+        self.execution_policy = policy
+        self.execution_id = "TEST-ASYNC-001"
+
+
+def _executor():
+    executor = AsyncExecutor()
+    executor.audit_log.backend = InMemoryAuditLog()
+    return executor
+
+
+def test_sync_agents_are_adapted_and_run_off_the_loop():
+    agent = _SyncAgent()
+    adapted = as_async(agent)
+
+    assert isinstance(adapted, SyncAgentAdapter)
+    assert adapted.name == "sync-agent"
+    assert as_async(_IOAgent()).__class__ is _IOAgent
+    # SignalAgent has a native arun
+    assert isinstance(as_async(VelocitySignalAgent()), VelocitySignalAgent)
+
+    asyncio.run(adapted.arun({}))
+    assert agent.thread != threading.get_ident()
+
+
+def test_aexecute_matches_execute():
+    workflow = _Workflow(
+        [_SyncAgent(tokens=10), _IOAgent()],
+        ExecutionPolicy(max_tokens=100, max_latency_ms=10_000),
+    )
+
+    expected = Executor().execute(workflow, {"n": 1})
+    actual = asyncio.run(_executor().aexecute(workflow, {"n": 1}))
+
+    assert actual == expected
+
+
+def test_aexecute_enforces_policy_and_audits_failures():
+    executor = _executor()
+
+    with pytest.raises(RuntimeError, match="policy"):
+        asyncio.run(executor.aexecute(
+            _Workflow(
+                [_SyncAgent(tokens=60), _SyncAgent(tokens=60)],
+                ExecutionPolicy(max_tokens=100, max_latency_ms=10_000),
+            ),
+            {},
+        ))
+
+    with pytest.raises(RuntimeError, match="failing-agent"):
+        asyncio.run(executor.aexecute(_Workflow([_FailingAgent()]), {}))
+
+    actions = [e.action for e in executor.audit_log.backend.all_events()]
+    assert actions == ["EXECUTION_POLICY_VIOLATION", "AGENT_FAILURE"]
+
+
+def test_many_executions_are_multiplexed():
+    executor = _executor()
+    workflow = _Workflow([_IOAgent(), _IOAgent()])
+
+    async def run_all():
+        return await asyncio.gather(*(
+            executor.aexecute(workflow, {"n": n}) for n in range(1000)
+        ))
+
+    start = time.perf_counter()
+    results = asyncio.run(run_all())
+    elapsed = time.perf_counter() - start
+
+    # 1000 x 2 x 50 ms sequentially would take 100 s
+    assert elapsed < 5
+    assert [r["seen"] for r in results] == list(range(1000))
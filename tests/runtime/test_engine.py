@@ -0,0 +1,115 @@
+import json
+from copy import deepcopy
+
+import pytest
+
+from platform10.agents.location_signal_agent import LocationSignalAgent
+from platform10.agents.risk_classifier_agent import RiskClassifierAgent
+from platform10.agents.velocity_signal_agent import VelocitySignalAgent
+from platform10.runtime.engine import ExecutionEngine
+from platform10.runtime.snapshot import FrozenDict, FrozenList, freeze, thaw
+
+
+class _RecordingReplay:
+    def record(self, **kwargs):
+        self.recorded = kwargs
+
+
+class _CaseMutatingAgent:
+    name = "case-mutating-agent"
+
+    def run(self, context):
+        context["case"]["transaction"]["amount"] = 0
+        return context
+
+
+def _initial_input():
+    return {
+        "case": {
+            "case_id": "CASE-001",
+            "transaction": {"amount": 25000, "tx_count": 35},
+            "context": {"location_mismatch": True},
+        },
+        "signals": [],
+        "trace_id": "trace-1",
+    }
+
+
+def _legacy_steps(agents, initial_input):
+    current = deepcopy(initial_input)
+    steps = []
+    for index, agent in enumerate(agents, start=1):
+        current = agent.run(current)
+        steps.append({
+            "step": index,
+            "agent": agent.name,
+            "output_snapshot": deepcopy(current),
+        })
+    return steps, current
+
+
+@pytest.fixture
+def agents():
+    return [VelocitySignalAgent(), LocationSignalAgent(), RiskClassifierAgent()]
+
+
+def test_snapshots_match_deepcopy_engine_and_share_structure(agents):
+    replay = _RecordingReplay()
+    engine = ExecutionEngine(replay=replay)
+    initial_input = _initial_input()
+
+    final_context = engine.execute_sequence(agents, initial_input, "trace-1")
+    legacy_steps, legacy_final = _legacy_steps(agents, _initial_input())
+
+    recorded = replay.recorded
+    assert json.dumps(recorded["steps"], sort_keys=True) == json.dumps(
+        legacy_steps, sort_keys=True
+    )
+    assert final_context == legacy_final
+    assert initial_input == _initial_input()
+
+    # The case is copied once and shared by every snapshot
+    snapshots = [s["output_snapshot"] for s in recorded["steps"]]
+    assert all(s["case"] is recorded["input_snapshot"]["case"] for s in snapshots)
+    assert snapshots[1]["signals"][0] is snapshots[0]["signals"][0]
+
+
+def test_earlier_snapshots_cannot_be_changed(agents):
+    replay = _RecordingReplay()
+    ExecutionEngine(replay=replay).execute_sequence(
+        agents, _initial_input(), "trace-1"
+    )
+    first = replay.recorded["steps"][0]["output_snapshot"]
+
+    assert len(first["signals"]) == 1
+    with pytest.raises(TypeError):
+        first["signals"].append({})
+    with pytest.raises(TypeError):
+        first["case"]["case_id"] = "other"
+
+
+def test_in_place_mutation_of_shared_state_fails_loudly():
+    engine = ExecutionEngine(regulator_mode=False)
+
+    with pytest.raises(TypeError, match="immutable"):
+        engine.execute_sequence([_CaseMutatingAgent()], _initial_input(), "t")
+
+
+def test_final_context_is_plain_and_mutable(agents):
+    engine = ExecutionEngine(regulator_mode=False)
+    final_context = engine.execute_sequence(agents, _initial_input(), "t")
+
+    final_context["signals"].append({})
+    final_context["case"]["transaction"]["amount"] = 1
+    assert type(final_context["case"]) is dict
+
+
+def test_freeze_reuses_equal_previous_snapshot():
+    previous = freeze({"a": {"b": [1, 2]}, "c": 1})
+    rebuilt = freeze({"a": {"b": [1, 2]}, "c": 2}, previous=previous)
+
+    assert isinstance(rebuilt, FrozenDict)
+    assert isinstance(rebuilt["a"]["b"], FrozenList)
+    assert rebuilt["a"] is previous["a"]
+    assert thaw(rebuilt) == {"a": {"b": [1, 2]}, "c": 2}
+    assert type(deepcopy(rebuilt)) is dict
@@ -0,0 +1,133 @@
+import json
+import threading
+import time
+
+import pytest
+
+from platform10.agents.location_signal_agent import LocationSignalAgent
+from platform10.agents.risk_classifier_agent import RiskClassifierAgent
+from platform10.agents.time_window_velocity_signal_agent import (
+    TimeWindowVelocitySignalAgent,
+)
+from platform10.agents.velocity_signal_agent import VelocitySignalAgent
+from platform10.runtime.dag import build_dependency_graph
+from platform10.runtime.engine import ExecutionEngine
+
+
+class _RecordingReplay:
+    def record(self, **kwargs):
+        self.recorded = kwargs
+
+
+class _SlowSignalAgent:
+    reads = ("case",)
+    appends = ("signals",)
+
+    def __init__(self, name, delay, barrier=None):
+        self.name = name
+        self.delay = delay
+        self.barrier = barrier
+
+    def run(self, context):
+        if self.barrier:
+            # Only passes if all slow agents are running at once
+            self.barrier.wait(timeout=5)
+        time.sleep(self.delay)
+        context["signals"].append({"agent": self.name, "risk": "LOW"})
+        return context
+
+
+class _UndeclaredWriter:
+    name = "undeclared-writer"
+    reads = ("case",)
+
+    def run(self, context):
+        context["risk"] = "HIGH"
+        return context
+
+
+class _Legacy:
+    name = "legacy-agent"
+
+    def run(self, context):
+        context["legacy"] = True
+        return context
+
+
+def _initial_input():
+    return {
+        "case": {
+            "case_id": "CASE-001",
+            "transaction": {"amount": 25000, "tx_count": 35},
+            "context": {"tx_count_last_10_min": 12, "location_mismatch": True},
+        },
+        "signals": [],
+        "trace_id": "trace-1",
+    }
+
+
+def _fraud_agents():
+    return [
+        VelocitySignalAgent(),
+        TimeWindowVelocitySignalAgent(),
+        LocationSignalAgent(),
+        RiskClassifierAgent(),
+    ]
+
+
+def test_signal_agents_are_independent_and_classifier_waits():
+    assert build_dependency_graph(_fraud_agents()) == [
+        set(), set(), set(), {0, 1, 2},
+    ]
+
+
+def test_undeclared_agent_is_a_barrier():
+    agents = [VelocitySignalAgent(), _Legacy(), LocationSignalAgent()]
+    assert build_dependency_graph(agents) == [set(), {0}, {1}]
+
+
+def test_graph_execution_matches_sequence():
+    sequential, concurrent = _RecordingReplay(), _RecordingReplay()
+
+    expected = ExecutionEngine(replay=sequential).execute_sequence(
+        _fraud_agents(), _initial_input(), "trace-1"
+    )
+    actual = ExecutionEngine(replay=concurrent).execute_graph(
+        _fraud_agents(), _initial_input(), "trace-1"
+    )
+
+    assert actual == expected
+    assert json.dumps(concurrent.recorded, sort_keys=True) == json.dumps(
+        sequential.recorded, sort_keys=True
+    )
+
+
+def test_independent_agents_overlap_but_commit_in_declared_order():
+    barrier = threading.Barrier(3)
+    replay = _RecordingReplay()
+    agents = [
+        # First agent finishes last
+        _SlowSignalAgent("a", 0.3, barrier),
+        _SlowSignalAgent("b", 0.2, barrier),
+        _SlowSignalAgent("c", 0.1, barrier),
+        RiskClassifierAgent(),
+    ]
+
+    final_context = ExecutionEngine(replay=replay).execute_graph(
+        agents, _initial_input(), "trace-1"
+    )
+
+    assert [s["agent"] for s in final_context["signals"]] == ["a", "b", "c"]
+    assert [s["agent"] for s in replay.recorded["steps"]] == [
+        "a", "b", "c", "risk-classifier-agent",
+    ]
+    first_step = replay.recorded["steps"][0]["output_snapshot"]
+    assert [s["agent"] for s in first_step["signals"]] == ["a"]
+    assert final_context["risk_summary"]["total_signals"] == 3
+
+
+def test_undeclared_write_is_rejected():
+    engine = ExecutionEngine(regulator_mode=False)
+
+    with pytest.raises(ValueError, match="undeclared context key 'risk'"):
+        engine.execute_graph([_UndeclaredWriter()], _initial_input(), "t")